@@ -0,0 +1,44 @@
+"""add keyset pagination indexes
+
+Revision ID: 7b1e4c92a5d3
+Revises: d291c8ef7fa0
+Create Date: 2026-10-16 10:12:41.227314
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1e4c92a5d3"
+down_revision: Union[str, Sequence[str], None] = "d291c8ef7fa0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Composite (owner, sort key, id) indexes backing cursor pagination
+    op.create_index(
+        "idx_coaching_session_user_date",
+        "coaching_session",
+        ["user_id", "session_date", "id"],
+    )
+    op.create_index(
+        "idx_coaching_session_user_fee",
+        "coaching_session",
+        ["user_id", "fee_currency", "fee_amount", "id"],
+    )
+    op.create_index("idx_client_user_name", "client", ["user_id", "name", "id"])
+    op.create_index(
+        "idx_session_user_created", "session", ["user_id", "created_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_session_user_created", table_name="session")
+    op.drop_index("idx_client_user_name", table_name="client")
+    op.drop_index("idx_coaching_session_user_fee", table_name="coaching_session")
+    op.drop_index("idx_coaching_session_user_date", table_name="coaching_session")
@@ -0,0 +1,109 @@
+"""add analytics rollup tables
+
+Revision ID: c41d8e27f9b3
+Revises: 7b1e4c92a5d3
+Create Date: 2026-10-16 21:40:12.581904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d8e27f9b3"
+down_revision: Union[str, Sequence[str], None] = "7b1e4c92a5d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns():
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "usage_rollups",
+        *_base_columns(),
+        sa.Column("period_type", sa.String(length=20), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("user_plan", sa.String(length=20), nullable=False),
+        sa.Column("stt_provider", sa.String(length=50), nullable=False),
+        sa.Column("transcriptions", sa.Integer(), nullable=False),
+        sa.Column("billable_transcriptions", sa.Integer(), nullable=False),
+        sa.Column("original_transcriptions", sa.Integer(), nullable=False),
+        sa.Column("free_retries", sa.Integer(), nullable=False),
+        sa.Column("paid_retranscriptions", sa.Integer(), nullable=False),
+        sa.Column("total_minutes", sa.Integer(), nullable=False),
+        sa.Column("total_cost_usd", sa.DECIMAL(precision=14, scale=6), nullable=False),
+        sa.Column("active_users", sa.Integer(), nullable=False),
+        sa.Column("new_users", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "period_type",
+            "period_start",
+            "user_plan",
+            "stt_provider",
+            name="uq_usage_rollup_period",
+        ),
+    )
+
+    money = sa.DECIMAL(precision=14, scale=4)
+    total = sa.DECIMAL(precision=14, scale=2)
+    op.create_table(
+        "billing_analytics_rollups",
+        *_base_columns(),
+        sa.Column("period_type", sa.String(length=20), nullable=False),
+        sa.Column("period_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("period_end", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("plan_name", sa.String(length=20), nullable=False),
+        sa.Column("user_segment", sa.String(length=20), nullable=False),
+        sa.Column("users", sa.Integer(), nullable=False),
+        sa.Column("total_revenue_usd", money, nullable=False),
+        sa.Column("subscription_revenue_usd", money, nullable=False),
+        sa.Column("usage_overage_usd", money, nullable=False),
+        sa.Column("one_time_fees_usd", money, nullable=False),
+        sa.Column("total_provider_cost_usd", money, nullable=False),
+        sa.Column("sessions_created", sa.Integer(), nullable=False),
+        sa.Column("transcriptions_completed", sa.Integer(), nullable=False),
+        sa.Column("total_minutes_processed", total, nullable=False),
+        sa.Column("plan_utilization_total", total, nullable=False),
+        sa.Column("success_rate_total", total, nullable=False),
+        sa.Column("success_rate_count", sa.Integer(), nullable=False),
+        sa.Column("health_score_total", total, nullable=False),
+        sa.Column("churn_risk_users", sa.Integer(), nullable=False),
+        sa.Column("at_risk_users", sa.Integer(), nullable=False),
+        sa.Column("power_users", sa.Integer(), nullable=False),
+        sa.Column("health_excellent", sa.Integer(), nullable=False),
+        sa.Column("health_good", sa.Integer(), nullable=False),
+        sa.Column("health_average", sa.Integer(), nullable=False),
+        sa.Column("health_poor", sa.Integer(), nullable=False),
+        sa.Column("health_critical", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "period_type",
+            "period_start",
+            "plan_name",
+            "user_segment",
+            name="uq_billing_analytics_rollup_period",
+        ),
+    )
+
+    # Backs the first-log-of-period checks made for every new usage log
+    op.create_index(
+        "idx_usage_logs_user_created", "usage_logs", ["user_id", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_usage_logs_user_created", table_name="usage_logs")
+    op.drop_table("billing_analytics_rollups")
+    op.drop_table("usage_rollups")
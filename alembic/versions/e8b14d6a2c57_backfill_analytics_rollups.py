@@ -0,0 +1,39 @@
+"""backfill analytics rollups
+
+Revision ID: e8b14d6a2c57
+Revises: c41d8e27f9b3
+Create Date: 2026-10-17 09:12:48.306215
+
+"""
+
+from typing import Sequence, Union
+
+from sqlalchemy.orm import Session
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b14d6a2c57"
+down_revision: Union[str, Sequence[str], None] = "c41d8e27f9b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Sum existing usage logs and billing records into the rollup tables."""
+    # The admin reports read only the rollups, and the nightly reconcile
+    # only rebuilds recent periods, so history must be summed before deploy
+    from src.coaching_assistant.services.analytics_rollups import backfill_rollups
+
+    # The session joins the migration's transaction; its commits don't end it
+    session = Session(bind=op.get_bind())
+    try:
+        backfill_rollups(session)
+    finally:
+        session.close()
+
+
+def downgrade() -> None:
+    """Empty the rollup tables."""
+    op.execute("DELETE FROM billing_analytics_rollups")
+    op.execute("DELETE FROM usage_rollups")
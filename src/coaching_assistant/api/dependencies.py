@@ -68,7 +68,7 @@ def require_super_admin(
     return current_user
 
 
-async def get_current_user_with_permissions(
+def get_current_user_with_permissions(
     request: Request,
     current_user: User = Depends(get_current_user_dependency),
     db: Session = Depends(get_db),
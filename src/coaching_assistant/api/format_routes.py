@@ -4,7 +4,6 @@ Format transcript routes for the Coaching Transcript Tool Backend API.
 重構後的檔案處理 API，改進了錯誤處理和日誌記錄。
 """
 
-import io
 import logging
 from pathlib import Path
 from typing import Optional
@@ -12,8 +11,8 @@ from typing import Optional
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
 from fastapi.responses import FileResponse, StreamingResponse
 
-from ..core.processor import format_transcript
-from ..parser import UnrecognizedFormatError
+from ..core.processor import stream_transcript
+from ..parser import READ_CHUNK_SIZE, UnrecognizedFormatError
 
 logger = logging.getLogger(__name__)
 
@@ -84,19 +83,10 @@ async def format_transcript_endpoint(
         if file.content_type and not file.content_type.startswith("text/"):
             logger.warning(f"Potentially unsupported content type: {file.content_type}")
 
-        file_content = await file.read()
-
-        if not file_content:
+        # 只讀取開頭確認非空檔案，其餘內容交由 parser 串流處理
+        if not await file.read(READ_CHUNK_SIZE):
             raise HTTPException(status_code=400, detail="Empty file uploaded")
-
-        result = format_transcript(
-            file_content=file_content,
-            original_filename=file.filename,
-            output_format=output_format,
-            coach_name=coach_name,
-            client_name=client_name,
-            convert_to_traditional_chinese=convert_to_traditional_chinese,
-        )
+        await file.seek(0)
 
         filename = file.filename or "transcript"
         base_filename = filename.rsplit(".", 1)[0] if "." in filename else filename
@@ -111,11 +101,9 @@ async def format_transcript_endpoint(
             media_type = (
                 "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
-            content_stream = io.BytesIO(result)
         elif output_format.lower() == "markdown":
             output_filename = f"{safe_filename}.md"
             media_type = "text/markdown; charset=utf-8"
-            content_stream = io.BytesIO(result.encode("utf-8"))
         else:
             raise HTTPException(
                 status_code=400,
@@ -125,6 +113,16 @@ async def format_transcript_endpoint(
                 ),
             )
 
+        # 解析在回傳前完成，輸出以 chunk 方式串流給 client
+        content_stream = stream_transcript(
+            file_content=file.file,
+            original_filename=file.filename,
+            output_format=output_format,
+            coach_name=coach_name,
+            client_name=client_name,
+            convert_to_traditional_chinese=convert_to_traditional_chinese,
+        )
+
         logger.info(
             f"Successfully processed file '{file.filename}' -> '{output_filename}'"
         )
@@ -1,7 +1,7 @@
 """Admin API endpoints for role management and system administration."""
 
 from datetime import UTC, datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 from ...core.database import get_db
 from ...core.models.user import User, UserRole
 from ...services.permissions import PermissionService
+from ...services.user_principal_cache import get_user_principal_cache
 from .dependencies import (
     get_current_user_with_permissions,
     require_admin,
@@ -230,6 +231,20 @@ async def get_admin_stats(
     return AdminStatsResponse(**stats)
 
 
+@router.get("/auth-cache/stats", response_model=Dict[str, Any])
+async def get_auth_cache_stats(current_user: User = Depends(require_admin)):
+    """
+    Get hit/miss counters of the authenticated-user cache (Admin only).
+
+    Counters cover this API process only.
+    """
+
+    cache = get_user_principal_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
 @router.get("/users/{user_id}/role", response_model=UserRoleInfo)
 async def get_user_role_info(
     user_id: UUID,
@@ -30,6 +30,12 @@ from ...core.config import settings
 from ...core.database import get_db
 from ...core.models.user import UserPlan
 from ...models.user import User  # Infrastructure model for SQLAlchemy queries
+from ...services.user_principal_cache import (
+    get_user_principal_cache,
+    invalidate_user_principal,
+    restore_user,
+    snapshot_user,
+)
 
 router = APIRouter(tags=["authentication"])
 
@@ -80,8 +86,9 @@ def get_password_hash(password):
 
 def create_access_token(user_id: str) -> str:
     """建立 Access Token"""
-    expire = datetime.now(UTC) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode = {"sub": user_id, "exp": expire, "type": "access"}
+    issued_at = datetime.now(UTC)
+    expire = issued_at + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode = {"sub": user_id, "iat": issued_at, "exp": expire, "type": "access"}
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
@@ -328,6 +335,7 @@ async def google_callback(
         existing_user.google_id = google_user.get("id")
         existing_user.avatar_url = google_user.get("picture")
         existing_user.updated_at = datetime.now(UTC)
+        invalidate_user_principal(existing_user.id, db)
         db.commit()
         user = existing_user
     else:
@@ -406,7 +414,7 @@ async def get_authorization_header(
 
 
 # 依賴注入：獲取當前用戶
-async def get_current_user_dependency(
+def get_current_user_dependency(
     authorization: str = Depends(get_authorization_header),
     db: Session = Depends(get_db),
 ) -> User:
@@ -462,13 +470,24 @@ async def get_current_user_dependency(
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
 
-        # 獲取用戶
-        stmt = select(User).where(User.id == UUID(user_id))
+        # 獲取用戶（先查快取，同一 token 在 TTL 內不重複查詢）
+        user_uuid = UUID(user_id)
+        cache = get_user_principal_cache()
+        # Tokens issued before "iat" was added are keyed by their expiry
+        token_key = str(payload.get("iat", payload.get("exp")))
+        if cache is not None:
+            snapshot = cache.get(str(user_uuid), token_key)
+            if snapshot is not None:
+                return restore_user(db, snapshot)
+
+        stmt = select(User).where(User.id == user_uuid)
         user = db.execute(stmt).scalar_one_or_none()
 
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
+        if cache is not None:
+            cache.set(str(user_uuid), token_key, snapshot_user(user))
         return user
 
     except JWTError:
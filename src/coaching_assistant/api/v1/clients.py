@@ -72,10 +72,11 @@ class ClientResponse(BaseModel):
 
 class ClientListResponse(BaseModel):
     items: List[ClientResponse]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 # Helper function to convert domain model to response model
@@ -115,21 +116,45 @@ def _client_to_response(client) -> ClientResponse:
 
 
 @router.get("", response_model=ClientListResponse)
-async def list_clients(
+def list_clients(
     query: Optional[str] = Query(None, description="Search by name or email"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page's next_cursor"
+    ),
+    include_total: bool = Query(True, description="Compute total and total_pages"),
     client_retrieval: ClientRetrievalUseCase = Depends(get_client_retrieval_use_case),
     current_user: User = Depends(get_current_user_dependency),
 ):
-    """List clients for the current user."""
+    """List clients for the current user.
+
+    The first page and every request with a cursor use keyset pagination and
+    return next_cursor for the following page; page numbers above 1 without a
+    cursor fall back to OFFSET paging for existing clients.
+    """
     try:
-        clients, total, total_pages = client_retrieval.list_clients_paginated(
-            coach_id=current_user.id,
-            query=query,
-            page=page,
-            page_size=page_size,
-        )
+        next_cursor = None
+        if cursor or page == 1:
+            client_page = client_retrieval.list_clients_by_cursor(
+                coach_id=current_user.id,
+                query=query,
+                cursor=cursor,
+                page_size=page_size,
+                include_total=include_total,
+            )
+            clients, total = client_page.items, client_page.total
+            next_cursor = client_page.next_cursor
+            total_pages = None
+            if total is not None:
+                total_pages = (total + page_size - 1) // page_size
+        else:
+            clients, total, total_pages = client_retrieval.list_clients_paginated(
+                coach_id=current_user.id,
+                query=query,
+                page=page,
+                page_size=page_size,
+            )
 
         # Convert domain entities to response models
         client_responses = [_client_to_response(client) for client in clients]
@@ -140,6 +165,7 @@ async def list_clients(
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -149,7 +175,7 @@ async def list_clients(
 
 # Statistics endpoints must be before /{client_id} to avoid path conflicts
 @router.get("/statistics")
-async def get_client_statistics(
+def get_client_statistics(
     client_retrieval: ClientRetrievalUseCase = Depends(get_client_retrieval_use_case),
     current_user: User = Depends(get_current_user_dependency),
 ) -> dict:
@@ -184,7 +210,7 @@ async def get_client_statistics(
 
 
 @router.get("/{client_id}", response_model=ClientResponse)
-async def get_client(
+def get_client(
     client_id: UUID,
     client_retrieval: ClientRetrievalUseCase = Depends(get_client_retrieval_use_case),
     current_user: User = Depends(get_current_user_dependency),
@@ -205,7 +231,7 @@ async def get_client(
 
 
 @router.post("", response_model=ClientResponse)
-async def create_client(
+def create_client(
     client_data: ClientCreate,
     client_creation: ClientCreationUseCase = Depends(get_client_creation_use_case),
     current_user: User = Depends(get_current_user_dependency),
@@ -238,7 +264,7 @@ async def create_client(
 
 
 @router.patch("/{client_id}", response_model=ClientResponse)
-async def update_client(
+def update_client(
     client_id: UUID,
     client_data: ClientUpdate,
     client_update: ClientUpdateUseCase = Depends(get_client_update_use_case),
@@ -281,7 +307,7 @@ async def update_client(
 
 
 @router.delete("/{client_id}")
-async def delete_client(
+def delete_client(
     client_id: UUID,
     client_deletion: ClientDeletionUseCase = Depends(get_client_deletion_use_case),
     current_user: User = Depends(get_current_user_dependency),
@@ -311,7 +337,7 @@ async def delete_client(
 
 
 @router.post("/{client_id}/anonymize")
-async def anonymize_client(
+def anonymize_client(
     client_id: UUID,
     client_deletion: ClientDeletionUseCase = Depends(get_client_deletion_use_case),
     current_user: User = Depends(get_current_user_dependency),
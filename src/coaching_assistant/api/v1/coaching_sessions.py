@@ -2,7 +2,6 @@
 
 import json
 import logging
-import re
 from datetime import date
 from typing import List, Optional
 from uuid import UUID, uuid4
@@ -42,6 +41,7 @@ from ...models import (
 from ...models import (
     Session as TranscriptionSession,
 )
+from ...transcript_ingest import ingest_transcript
 from ...utils.chinese_converter import convert_to_traditional
 from .auth import get_current_user_dependency
 from .dependencies import (
@@ -148,10 +148,11 @@ class CoachingSessionResponse(BaseModel):
 
 class CoachingSessionListResponse(BaseModel):
     items: List[CoachingSessionResponse]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class SessionSourceOption(BaseModel):
@@ -274,7 +275,7 @@ def _coaching_session_to_response_from_data(
 
 
 @router.get("", response_model=CoachingSessionListResponse)
-async def list_coaching_sessions(
+def list_coaching_sessions(
     from_date: Optional[date] = Query(None, alias="from"),
     to_date: Optional[date] = Query(None, alias="to"),
     client_id: Optional[UUID] = None,
@@ -282,25 +283,53 @@ async def list_coaching_sessions(
     sort: str = Query("-session_date", pattern="^-?(session_date|fee)$"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page's next_cursor"
+    ),
+    include_total: bool = Query(True, description="Compute total and total_pages"),
     current_user: User = Depends(get_current_user_dependency),
     retrieval_use_case: CoachingSessionRetrievalUseCase = Depends(
         get_coaching_session_retrieval_use_case
     ),
 ):
-    """List coaching sessions for the current user."""
+    """List coaching sessions for the current user.
+
+    The first page and every request with a cursor use keyset pagination and
+    return next_cursor for the following page; page numbers above 1 without a
+    cursor fall back to OFFSET paging for existing clients.
+    """
     try:
-        sessions_with_data, total, total_pages = (
-            retrieval_use_case.get_sessions_with_response_data(
+        next_cursor = None
+        if cursor or page == 1:
+            session_page = retrieval_use_case.get_sessions_page_with_response_data(
                 coach_id=current_user.id,
                 from_date=from_date,
                 to_date=to_date,
                 client_id=client_id,
                 currency=currency,
                 sort=sort,
-                page=page,
+                cursor=cursor,
                 page_size=page_size,
+                include_total=include_total,
+            )
+            sessions_with_data, total = session_page.items, session_page.total
+            next_cursor = session_page.next_cursor
+            total_pages = None
+            if total is not None:
+                total_pages = (total + page_size - 1) // page_size
+        else:
+            sessions_with_data, total, total_pages = (
+                retrieval_use_case.get_sessions_with_response_data(
+                    coach_id=current_user.id,
+                    from_date=from_date,
+                    to_date=to_date,
+                    client_id=client_id,
+                    currency=currency,
+                    sort=sort,
+                    page=page,
+                    page_size=page_size,
+                )
             )
-        )
 
         # Convert to response models
         session_responses = []
@@ -318,6 +347,7 @@ async def list_coaching_sessions(
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -326,7 +356,7 @@ async def list_coaching_sessions(
 
 
 @router.get("/{session_id}", response_model=CoachingSessionResponse)
-async def get_coaching_session(
+def get_coaching_session(
     session_id: UUID,
     current_user: User = Depends(get_current_user_dependency),
     retrieval_use_case: CoachingSessionRetrievalUseCase = Depends(
@@ -353,7 +383,7 @@ async def get_coaching_session(
 
 
 @router.post("", response_model=CoachingSessionResponse)
-async def create_coaching_session(
+def create_coaching_session(
     session_data: CoachingSessionCreate,
     current_user: User = Depends(get_current_user_dependency),
     creation_use_case: CoachingSessionCreationUseCase = Depends(
@@ -397,7 +427,7 @@ async def create_coaching_session(
 
 
 @router.patch("/{session_id}", response_model=CoachingSessionResponse)
-async def update_coaching_session(
+def update_coaching_session(
     session_id: UUID,
     session_data: CoachingSessionUpdate,
     current_user: User = Depends(get_current_user_dependency),
@@ -459,7 +489,7 @@ async def update_coaching_session(
 
 
 @router.delete("/{session_id}")
-async def delete_coaching_session(
+def delete_coaching_session(
     session_id: UUID,
     current_user: User = Depends(get_current_user_dependency),
     deletion_use_case: CoachingSessionDeletionUseCase = Depends(
@@ -482,7 +512,7 @@ async def delete_coaching_session(
 
 
 @router.get("/clients/{client_id}/last-session")
-async def get_client_last_session(
+def get_client_last_session(
     client_id: UUID,
     current_user: User = Depends(get_current_user_dependency),
     retrieval_use_case: CoachingSessionRetrievalUseCase = Depends(
@@ -520,7 +550,7 @@ async def get_currencies(
 
 
 @router.post("/{session_id}/transcript")
-async def upload_session_transcript(
+def upload_session_transcript(
     session_id: UUID,
     file: UploadFile = FastAPIFile(...),
     speaker_roles: Optional[str] = Form(None),
@@ -598,16 +628,16 @@ async def upload_session_transcript(
         )
 
     try:
-        # Read file content
-        content = await file.read()
+        # Read the spooled upload synchronously; this route runs in the
+        # threadpool with the rest of its database work
+        content = file.file.read()
         content_str = content.decode("utf-8")
 
         # Parse the transcript with speaker role mapping
-        segments = []
-        if file_extension == "vtt":
-            segments = _parse_vtt_content(content_str, speaker_role_mapping)
-        elif file_extension == "srt":
-            segments = _parse_srt_content(content_str, speaker_role_mapping)
+        segments = [
+            segment.to_dict()
+            for segment in ingest_transcript(content_str, speaker_role_mapping)
+        ]
 
         if not segments:
             raise HTTPException(
@@ -713,319 +743,6 @@ async def upload_session_transcript(
         )
 
 
-def _parse_vtt_content(content: str, speaker_role_mapping: dict = None) -> List[dict]:
-    """Parse VTT file content and return segments."""
-    segments = []
-    lines = content.strip().split("\n")
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Skip header and empty lines
-        if line == "WEBVTT" or line == "" or line.startswith("NOTE"):
-            i += 1
-            continue
-
-        # Look for timestamp line
-        if "-->" in line:
-            # Parse timestamp - support multiple formats
-            timestamp_patterns = [
-                # HH:MM:SS.mmm
-                r"(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})",
-                # HH:MM:SS,mmm (SRT format)
-                r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})",
-                # H:MM:SS.mmm
-                r"(\d{1,2}:\d{2}:\d{2}\.\d{3}) --> "
-                r"(\d{1,2}:\d{2}:\d{2}\.\d{3})",
-                # H:MM:SS (no milliseconds)
-                r"(\d{1,2}:\d{2}:\d{2}) --> (\d{1,2}:\d{2}:\d{2})",
-            ]
-
-            timestamp_match = None
-            for pattern in timestamp_patterns:
-                timestamp_match = re.match(pattern, line)
-                if timestamp_match:
-                    break
-
-            if timestamp_match:
-                try:
-                    start_time = _parse_timestamp(
-                        timestamp_match.group(1).replace(",", ".")
-                    )
-                    end_time = _parse_timestamp(
-                        timestamp_match.group(2).replace(",", ".")
-                    )
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Failed to parse timestamp: {line}, error: {e}")
-                    i += 1
-                    continue
-
-                # Get the content (next line)
-                i += 1
-                if i < len(lines):
-                    content_line = lines[i].strip()
-
-                    # Extract speaker and content from different formats
-                    speaker_id = 1
-                    content_text = content_line
-                    speaker_key = None
-                    speaker_name = None
-
-                    # Format 1: VTT format like "<v jolly shih>content</v>" or
-                    # "<v Speaker>content</v>"
-                    speaker_match = re.match(
-                        r"<v\s+([^>]+)>\s*(.*?)(?:</v>)?$", content_line
-                    )
-                    if speaker_match:
-                        speaker_name = speaker_match.group(1).strip()
-                        content_text = speaker_match.group(2)
-                        # Create speaker key matching frontend format:
-                        # remove non-alphanumeric chars
-                        # Frontend: speakerKey =
-                        # `speaker_${speakerName.toLowerCase()...}`
-                        normalized_name = re.sub(
-                            r"[^\w_]",
-                            "",
-                            speaker_name.lower().replace(" ", "_"),
-                        )
-                        speaker_key = f"speaker_{normalized_name}"
-
-                    # Format 2: Simple prefix format like "Coach: content" or
-                    # "Client: content"
-                    elif ":" in content_line:
-                        prefix_match = re.match(r"^([^:]+):\s*(.+)$", content_line)
-                        if prefix_match:
-                            speaker_name = prefix_match.group(1).strip()
-                            content_text = prefix_match.group(2).strip()
-                            # Create speaker key matching frontend format:
-                            # remove non-alphanumeric chars
-                            normalized_name = re.sub(
-                                r"[^\w_]",
-                                "",
-                                speaker_name.lower().replace(" ", "_"),
-                            )
-                            speaker_key = f"speaker_{normalized_name}"
-
-                    # Apply role mapping if provided
-                    final_speaker_id = speaker_id
-                    final_speaker_role = "coach"  # default
-                    if speaker_role_mapping and speaker_key:
-                        # Use the speaker key to look up the role
-                        final_speaker_role = speaker_role_mapping.get(
-                            speaker_key, "coach"
-                        )
-                        final_speaker_id = 1 if final_speaker_role == "coach" else 2
-                        logger.info(
-                            f"Applied role mapping: {speaker_key} -> "
-                            f"{final_speaker_role} "
-                            f"(speaker_id: {final_speaker_id})"
-                        )
-                    elif speaker_name:
-                        # Fallback to name-based assignment when no role
-                        # mapping is provided
-                        if any(
-                            keyword in speaker_name.lower()
-                            for keyword in ["client", "客戶", "學員"]
-                        ):
-                            final_speaker_id = 2
-                            final_speaker_role = "client"
-                        elif any(
-                            keyword in speaker_name.lower()
-                            for keyword in ["coach", "教練", "老師"]
-                        ):
-                            final_speaker_id = 1
-                            final_speaker_role = "coach"
-                        else:
-                            # Default assignment based on order
-                            final_speaker_id = 1  # Default to coach if unclear
-                            final_speaker_role = "coach"
-                        logger.info(
-                            f"Name-based assignment: {speaker_name} -> "
-                            f"{final_speaker_role} "
-                            f"(speaker_id: {final_speaker_id})"
-                        )
-
-                    segments.append(
-                        {
-                            "start_seconds": start_time,
-                            "end_seconds": end_time,
-                            "content": content_text,
-                            "speaker_id": final_speaker_id,
-                            "speaker_role": final_speaker_role,
-                        }
-                    )
-                    logger.debug(
-                        f"Parsed segment: {start_time:.2f}-{end_time:.2f}s, "
-                        f"speaker_id: {final_speaker_id}, content: {content_text[:50]}..."
-                    )
-            else:
-                logger.warning(f"Could not parse timestamp line: {line}")
-
-        i += 1
-
-    return segments
-
-
-def _parse_srt_content(content: str, speaker_role_mapping: dict = None) -> List[dict]:
-    """Parse SRT file content and return segments."""
-    segments = []
-
-    # Split by double newline to get individual subtitle blocks
-    blocks = re.split(r"\n\s*\n", content.strip())
-
-    for block in blocks:
-        lines = block.strip().split("\n")
-        if len(lines) < 3:
-            continue
-
-        # Skip sequence number (line 0)
-        # Parse timestamp (line 1)
-        timestamp_line = lines[1].strip()
-
-        # Support multiple timestamp formats for SRT
-        timestamp_patterns = [
-            # HH:MM:SS,mmm (standard SRT)
-            r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})",
-            # H:MM:SS,mmm
-            r"(\d{1,2}:\d{2}:\d{2},\d{3}) --> (\d{1,2}:\d{2}:\d{2},\d{3})",
-            # HH:MM:SS.mmm (VTT format in SRT)
-            r"(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})",
-            # H:MM:SS (no milliseconds)
-            r"(\d{1,2}:\d{2}:\d{2}) --> (\d{1,2}:\d{2}:\d{2})",
-        ]
-
-        timestamp_match = None
-        for pattern in timestamp_patterns:
-            timestamp_match = re.match(pattern, timestamp_line)
-            if timestamp_match:
-                break
-
-        if timestamp_match:
-            try:
-                start_time = _parse_timestamp(
-                    timestamp_match.group(1).replace(",", ".")
-                )
-                end_time = _parse_timestamp(timestamp_match.group(2).replace(",", "."))
-            except (ValueError, IndexError) as e:
-                logger.warning(
-                    f"Failed to parse SRT timestamp: {timestamp_line}, error: {e}"
-                )
-                continue
-
-            # Content (lines 2+)
-            content_lines = lines[2:]
-            content_text = " ".join(content_lines).strip()
-
-            # Extract speaker info if present
-            speaker_id = 1
-            speaker_name = None
-            speaker_key = None
-
-            # Look for speaker prefix like "Coach: ", "Client: ", "教練: ", "客戶:
-            # "
-            speaker_match = re.match(r"^([^:]+):\s*(.+)$", content_text)
-            if speaker_match:
-                speaker_name = speaker_match.group(1).strip()
-                content_text = speaker_match.group(2).strip()
-                # Create speaker key matching frontend format: remove
-                # non-alphanumeric chars
-                normalized_name = re.sub(
-                    r"[^\w_]", "", speaker_name.lower().replace(" ", "_")
-                )
-                speaker_key = f"speaker_{normalized_name}"
-
-            # Apply role mapping if provided
-            final_speaker_id = speaker_id
-            final_speaker_role = "coach"  # default
-            if speaker_role_mapping and speaker_key:
-                # Use the speaker key to look up the role
-                final_speaker_role = speaker_role_mapping.get(speaker_key, "coach")
-                final_speaker_id = 1 if final_speaker_role == "coach" else 2
-                logger.info(
-                    f"Applied SRT role mapping: {speaker_key} -> "
-                    f"{final_speaker_role} (speaker_id: {final_speaker_id})"
-                )
-            elif speaker_name:
-                # Fallback to name-based assignment when no role mapping is
-                # provided
-                if any(
-                    keyword in speaker_name.lower()
-                    for keyword in ["client", "客戶", "學員"]
-                ):
-                    final_speaker_id = 2
-                    final_speaker_role = "client"
-                elif any(
-                    keyword in speaker_name.lower()
-                    for keyword in ["coach", "教練", "老師"]
-                ):
-                    final_speaker_id = 1
-                    final_speaker_role = "coach"
-                else:
-                    # Try to extract speaker ID from name (like "說話者 1",
-                    # "Speaker 2")
-                    speaker_num_match = re.search(r"(\d+)", speaker_name)
-                    if speaker_num_match:
-                        extracted_id = int(speaker_num_match.group(1))
-                        final_speaker_id = extracted_id if extracted_id in [1, 2] else 1
-                        final_speaker_role = (
-                            "coach" if final_speaker_id == 1 else "client"
-                        )
-                    else:
-                        final_speaker_id = 1  # Default to coach if unclear
-                        final_speaker_role = "coach"
-                logger.info(
-                    f"SRT name-based assignment: {speaker_name} -> "
-                    f"{final_speaker_role} (speaker_id: {final_speaker_id})"
-                )
-
-            segments.append(
-                {
-                    "start_seconds": start_time,
-                    "end_seconds": end_time,
-                    "content": content_text,
-                    "speaker_id": final_speaker_id,
-                    "speaker_role": final_speaker_role,
-                }
-            )
-            logger.debug(
-                f"Parsed SRT segment: {start_time:.2f}-{end_time:.2f}s, "
-                f"speaker_id: {final_speaker_id}, content: {content_text[:50]}..."
-            )
-        else:
-            logger.warning(f"Could not parse SRT timestamp line: {timestamp_line}")
-
-    return segments
-
-
-def _parse_timestamp(timestamp_str: str) -> float:
-    """Convert timestamp string to seconds."""
-    # Handle multiple formats: HH:MM:SS.mmm, H:MM:SS.mmm, HH:MM:SS, etc.
-    time_parts = timestamp_str.split(":")
-    if len(time_parts) != 3:
-        raise ValueError(f"Invalid timestamp format: {timestamp_str}")
-
-    try:
-        hours = int(time_parts[0])
-        minutes = int(time_parts[1])
-        seconds_str = time_parts[2]
-
-        # Handle seconds with milliseconds
-        if "." in seconds_str:
-            seconds_part, milliseconds_part = seconds_str.split(".")
-            seconds = int(seconds_part)
-            # Pad or truncate milliseconds to 3 digits
-            milliseconds_part = milliseconds_part.ljust(3, "0")[:3]
-            milliseconds = int(milliseconds_part)
-            total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000
-        else:
-            total_seconds = hours * 3600 + minutes * 60 + int(seconds_str)
-
-        return total_seconds
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Failed to parse timestamp '{timestamp_str}': {e}")
-
-
 class DeleteTranscriptRequest(BaseModel):
     """Request body for deleting transcript."""
 
@@ -1033,7 +750,7 @@ class DeleteTranscriptRequest(BaseModel):
 
 
 @router.delete("/{session_id}/transcript")
-async def delete_session_transcript(
+def delete_session_transcript(
     session_id: UUID,
     request: Optional[DeleteTranscriptRequest] = Body(None),
     current_user: User = Depends(get_current_user_dependency),
@@ -13,7 +13,6 @@ from sqlalchemy.orm import Session
 
 from coaching_assistant.core.config import settings
 from coaching_assistant.core.services.plan_management_use_case import (
-    PlanRetrievalUseCase,
     PlanValidationUseCase,
 )
 from coaching_assistant.core.services.usage_tracking_use_case import (
@@ -23,9 +22,9 @@ from coaching_assistant.core.services.usage_tracking_use_case import (
 
 from ...core.database import get_db
 from ...core.models.user import User
+from ...services.usage_quota import get_usage_quota
 from .auth import get_current_user_dependency
 from .dependencies import (
-    get_plan_retrieval_use_case,
     get_plan_validation_use_case,
     get_usage_log_use_case,
     get_user_usage_use_case,
@@ -85,12 +84,13 @@ class ValidateActionResponse(BaseModel):
 
 
 @router.post("/validate-action", response_model=ValidateActionResponse)
-async def validate_action(
+def validate_action(
     request: ValidateActionRequest,
     current_user: User = Depends(get_current_user_dependency),
     plan_validation_use_case: PlanValidationUseCase = Depends(
         get_plan_validation_use_case
     ),
+    db: Session = Depends(get_db),
 ) -> ValidateActionResponse:
     """
     Validate if a user can perform a specific action based on their plan
@@ -112,111 +112,88 @@ async def validate_action(
             reset_date = datetime(now.year, now.month + 1, 1)
         reset_date_str = reset_date.isoformat() + "Z"
 
-        # Handle different validation types using the use case
+        # Upload and minutes checks are served from the quota counters;
+        # other actions still go through the use case
+        quota = get_usage_quota()
         if request.action == "upload_file":
             file_size_mb = (
                 request.params.get("file_size_mb", 0) if request.params else 0
             )
-            # Use file size validation from the use case
-            file_validation = plan_validation_use_case.validate_file_size(
-                current_user.id, file_size_mb
+            check = quota.check_upload(
+                db, current_user.id, current_user.plan, file_size_mb
             )
 
             response = ValidateActionResponse(
-                allowed=file_validation["valid"],
-                message=file_validation["message"],
-                limit_info=(
-                    LimitInfo(
-                        type="file_size",
-                        current=int(file_validation.get("actual", file_size_mb)),
-                        limit=int(file_validation.get("limit", 60)),
-                        reset_date=reset_date_str,
-                    )
-                    if not file_validation["valid"]
-                    else LimitInfo(
-                        type="file_size",
-                        current=int(file_size_mb),
-                        limit=int(file_validation.get("limit", 60)),
-                        reset_date=reset_date_str,
+                allowed=check.allowed,
+                message=check.message or "File size within limits",
+                limit_info=LimitInfo(
+                    type=check.limit_type,
+                    current=int(check.current),
+                    limit=int(check.limit),
+                    reset_date=reset_date_str,
+                ),
+            )
+        elif request.action in ["create_session", "transcribe"]:
+            # These are now unlimited in the new plan system
+            response = ValidateActionResponse(
+                allowed=True,
+                message=None,
+                limit_info=LimitInfo(
+                    type=request.action.replace("create_", "").replace(
+                        "transcribe", "transcription"
+                    ),
+                    current=getattr(
+                        current_user,
+                        (
+                            "session_count"
+                            if request.action == "create_session"
+                            else "transcription_count"
+                        ),
+                        0,
                     )
+                    or 0,
+                    limit=-1,  # Unlimited
+                    reset_date=reset_date_str,
+                ),
+            )
+        elif request.action == "check_minutes":
+            # Minutes validation based on requested duration
+            requested_minutes = (
+                request.params.get("duration_min", 0) if request.params else 0
+            )
+            check = quota.check_minutes(
+                db, current_user.id, current_user.plan, requested_minutes
+            )
+
+            response = ValidateActionResponse(
+                allowed=check.allowed,
+                message=check.message,
+                limit_info=LimitInfo(
+                    type="minutes",
+                    current=int(check.current),
+                    limit=check.limit,
+                    reset_date=reset_date_str,
                 ),
             )
         else:
-            # For other actions, use general usage validation
+            # Default case for export_transcript or other actions
             usage_validation = plan_validation_use_case.validate_user_limits(
                 current_user.id
             )
-
-            # Determine current usage and limits based on action
-            if request.action in ["create_session", "transcribe"]:
-                # These are now unlimited in the new plan system
-                response = ValidateActionResponse(
-                    allowed=True,
-                    message=None,
-                    limit_info=LimitInfo(
-                        type=request.action.replace("create_", "").replace(
-                            "transcribe", "transcription"
-                        ),
-                        current=getattr(
-                            current_user,
-                            (
-                                "session_count"
-                                if request.action == "create_session"
-                                else "transcription_count"
-                            ),
-                            0,
-                        )
-                        or 0,
-                        limit=-1,  # Unlimited
-                        reset_date=reset_date_str,
-                    ),
-                )
-            elif request.action == "check_minutes":
-                # Minutes validation based on requested duration
-                requested_minutes = (
-                    request.params.get("duration_min", 0) if request.params else 0
-                )
-                current_minutes = getattr(current_user, "usage_minutes", 0) or 0
-
-                # Check if any violations would occur with the additional
-                # minutes
-                allowed = usage_validation["valid"]
-                message = "Action permitted"
-
-                if usage_validation["violations"]:
-                    for violation in usage_validation["violations"]:
-                        if violation["type"] == "total_minutes":
-                            if current_minutes + requested_minutes > violation["limit"]:
-                                allowed = False
-                                message = violation["message"]
-                            break
-
-                response = ValidateActionResponse(
-                    allowed=allowed,
-                    message=message if not allowed else None,
-                    limit_info=LimitInfo(
-                        type="minutes",
-                        current=current_minutes,
-                        limit=usage_validation["limits"].get("maxMinutes", -1),
-                        reset_date=reset_date_str,
-                    ),
-                )
-            else:
-                # Default case for export_transcript or other actions
-                response = ValidateActionResponse(
-                    allowed=usage_validation["valid"],
-                    message=(
-                        usage_validation.get("message", "Action permitted")
-                        if not usage_validation["valid"]
-                        else None
-                    ),
-                    limit_info=LimitInfo(
-                        type=request.action.replace("export_", ""),
-                        current=0,  # Would need specific tracking
-                        limit=50,  # Default export limit
-                        reset_date=reset_date_str,
-                    ),
-                )
+            response = ValidateActionResponse(
+                allowed=usage_validation["valid"],
+                message=(
+                    usage_validation.get("message", "Action permitted")
+                    if not usage_validation["valid"]
+                    else None
+                ),
+                limit_info=LimitInfo(
+                    type=request.action.replace("export_", ""),
+                    current=0,  # Would need specific tracking
+                    limit=50,  # Default export limit
+                    reset_date=reset_date_str,
+                ),
+            )
 
         # Add upgrade suggestions based on current plan
         current_plan_value = (
@@ -269,16 +246,15 @@ async def validate_action(
 
 
 @router.get("/current-usage")
-async def get_current_usage(
+def get_current_usage(
     current_user: User = Depends(get_current_user_dependency),
-    plan_retrieval_use_case: PlanRetrievalUseCase = Depends(
-        get_plan_retrieval_use_case
-    ),
+    db: Session = Depends(get_db),
 ) -> Dict[str, Any]:
-    """Get current usage statistics for the authenticated user using Clean Architecture."""
+    """Get current usage statistics for the authenticated user from the quota counters."""
     try:
-        # Get user's current plan information using the use case
-        plan_info = plan_retrieval_use_case.get_user_current_plan(current_user.id)
+        quota = get_usage_quota()
+        plan_limit = quota.plan_limit(current_user.plan)
+        used_minutes = quota.used_minutes(db, current_user.id)
 
         # Calculate reset date
         now = datetime.now(UTC)
@@ -287,23 +263,19 @@ async def get_current_usage(
         else:
             reset_date = datetime(now.year, now.month + 1, 1)
 
-        # Get plan limits from the plan configuration
-        plan_limits = plan_info.get("limits", {})
-
         return {
-            "plan": plan_info.get("id", "FREE"),
+            "plan": getattr(current_user.plan, "value", current_user.plan) or "free",
             "usage": {
                 # Phase 2: Only minutes-based limits, sessions/transcriptions
                 # unlimited
                 "minutes": {
-                    "current": current_user.usage_minutes or 0,
-                    "limit": plan_limits.get("maxTotalMinutes", -1),
+                    "current": used_minutes,
+                    "limit": plan_limit.max_minutes,
                     "percentage": calculate_percentage(
-                        current_user.usage_minutes or 0,
-                        plan_limits.get("maxTotalMinutes", -1),
+                        used_minutes, plan_limit.max_minutes
                     ),
                 },
-                "file_size_mb": {"limit": plan_limits.get("maxFileSizeMb", 60)},
+                "file_size_mb": {"limit": plan_limit.max_file_size_mb},
             },
             "reset_date": reset_date.isoformat() + "Z",
             "days_until_reset": (reset_date - now).days,
@@ -318,7 +290,7 @@ async def get_current_usage(
 
 
 @router.post("/increment-usage")
-async def increment_usage(
+def increment_usage(
     metric: str,
     amount: int = 1,
     current_user: User = Depends(get_current_user_dependency),
@@ -393,7 +365,7 @@ async def increment_usage(
 
 
 @router.post("/reset-monthly-usage")
-async def reset_monthly_usage(
+def reset_monthly_usage(
     admin_key: str,
     user_usage_use_case: GetUserUsageUseCase = Depends(get_user_usage_use_case),
     db: Session = Depends(get_db),
@@ -425,6 +397,7 @@ async def reset_monthly_usage(
         reset_result = bulk_reset_use_case.reset_all_monthly_usage()
 
         if reset_result["success"]:
+            get_usage_quota().clear()
             logger.info(
                 f"✅ Reset monthly usage for {reset_result['users_reset']} users"
             )
@@ -1,11 +1,9 @@
 """Session API endpoints for audio transcription."""
 
-import io
 import json
 import logging
-import re
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
 from uuid import UUID, uuid4
 
 from fastapi import (
@@ -13,12 +11,15 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Request,
     UploadFile,
     status,
 )
 from fastapi import File as FastAPIFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy.orm import Session as DBSession
 
 from ...api.v1.dependencies import (
     get_segment_role_assignment_use_case,
@@ -34,13 +35,23 @@ from ...api.v1.dependencies import (
     get_speaker_role_retrieval_use_case,
 )
 from ...core.config import settings
+from ...core.database import get_db
 
 # TEMPORARY: Still needed for legacy endpoints that haven't been migrated
 # to Clean Architecture
 from ...core.models.session import Session, SessionStatus
 from ...core.models.transcript import TranscriptSegment
 from ...core.models.user import User
-from ...exporters.excel import generate_excel
+from ...core.repositories.pagination import InvalidCursorError
+from ...exporters.excel import iter_excel
+from ...services.progress_events import (
+    TERMINAL_STATUSES,
+    ProgressBroker,
+    build_progress_event,
+    format_sse,
+    get_progress_broker,
+)
+from ...services.usage_quota import QuotaCheck, get_usage_quota
 from ...tasks.transcription_tasks import transcribe_audio
 from ...utils.gcs_uploader import GCSUploader
 from .auth import get_current_user_dependency
@@ -113,6 +124,11 @@ class SessionResponse(BaseModel):
         )
 
 
+class SessionListResponse(BaseModel):
+    items: List[SessionResponse]
+    next_cursor: Optional[str] = None
+
+
 class UploadUrlResponse(BaseModel):
     upload_url: str
     gcs_path: str
@@ -162,7 +178,7 @@ class ProvidersResponse(BaseModel):
 
 
 @router.post("", response_model=SessionResponse)
-async def create_session(
+def create_session(
     session_data: SessionCreate,
     current_user: User = Depends(get_current_user_dependency),
     session_creation_use_case=Depends(get_session_creation_use_case),
@@ -266,27 +282,53 @@ async def get_available_providers():
     )
 
 
-@router.get("", response_model=List[SessionResponse])
-async def list_sessions(
+@router.get("", response_model=SessionListResponse)
+def list_sessions(
     status: Optional[SessionStatus] = None,
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(
+        default=None, description="Cursor from the previous page's next_cursor"
+    ),
     current_user: User = Depends(get_current_user_dependency),
     session_retrieval_use_case=Depends(get_session_retrieval_use_case),
 ):
-    """List user's transcription sessions."""
-    sessions = session_retrieval_use_case.get_user_sessions(
-        user_id=current_user.id,
-        status=status,
-        limit=limit,
-        offset=offset,
-    )
+    """List user's transcription sessions.
+
+    The first page and requests with a cursor use keyset pagination and
+    return next_cursor when more sessions follow. Non-zero offsets without a
+    cursor still use OFFSET.
+    """
+    next_cursor = None
+    if cursor or offset == 0:
+        try:
+            session_page = session_retrieval_use_case.get_user_sessions_page(
+                user_id=current_user.id,
+                status=status,
+                cursor=cursor,
+                limit=limit,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-    return [SessionResponse.from_session(session) for session in sessions]
+        sessions = session_page.items
+        next_cursor = session_page.next_cursor
+    else:
+        sessions = session_retrieval_use_case.get_user_sessions(
+            user_id=current_user.id,
+            status=status,
+            limit=limit,
+            offset=offset,
+        )
+
+    return SessionListResponse(
+        items=[SessionResponse.from_session(session) for session in sessions],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
-async def get_session(
+def get_session(
     session_id: UUID,
     current_user: User = Depends(get_current_user_dependency),
     session_retrieval_use_case=Depends(get_session_retrieval_use_case),
@@ -304,7 +346,7 @@ async def get_session(
 
 
 @router.post("/{session_id}/upload-url", response_model=UploadUrlResponse)
-async def get_upload_url(
+def get_upload_url(
     session_id: UUID,
     filename: str = Query(..., pattern=r"^[^\/\\]+\.(mp3|wav|flac|ogg|mp4|m4a)$"),
     file_size_mb: float = Query(
@@ -312,6 +354,7 @@ async def get_upload_url(
     ),
     current_user: User = Depends(get_current_user_dependency),
     upload_management_use_case=Depends(get_session_upload_management_use_case),
+    db: DBSession = Depends(get_db),
 ):
     """Get signed URL for audio file upload."""
     from ...exceptions import DomainException
@@ -321,6 +364,13 @@ async def get_upload_url(
         f"User: {current_user.id}, Filename: {filename}, Size: {file_size_mb}MB"
     )
 
+    # Admission check from the quota counters, before any database work
+    admission = get_usage_quota().check_upload(
+        db, current_user.id, current_user.plan, file_size_mb
+    )
+    if not admission.allowed:
+        raise _quota_exceeded(admission, current_user)
+
     try:
         # Use case validates plan limits, session ownership, and status
         result = upload_management_use_case.generate_upload_url(
@@ -422,7 +472,7 @@ async def get_upload_url(
 
 
 @router.post("/{session_id}/confirm-upload", response_model=UploadConfirmResponse)
-async def confirm_upload(
+def confirm_upload(
     session_id: UUID,
     current_user: User = Depends(get_current_user_dependency),
     upload_management_use_case=Depends(get_session_upload_management_use_case),
@@ -529,18 +579,23 @@ async def confirm_upload(
 
 
 @router.post("/{session_id}/start-transcription")
-async def start_transcription(
+def start_transcription(
     session_id: UUID,
     current_user: User = Depends(get_current_user_dependency),
     transcription_management_use_case=Depends(
         get_session_transcription_management_use_case
     ),
+    db: DBSession = Depends(get_db),
 ):
     """Start transcription processing for uploaded audio."""
     # Note: Transcription limits removed in Phase 2 - now unlimited
     # Only minutes-based limits are enforced
     from ...exceptions import DomainException
 
+    admission = get_usage_quota().check_minutes(db, current_user.id, current_user.plan)
+    if not admission.allowed:
+        raise _quota_exceeded(admission, current_user)
+
     try:
         # Use case validates session ownership, status, and file existence
         transcription_data = transcription_management_use_case.start_transcription(
@@ -611,7 +666,7 @@ async def start_transcription(
 
 
 @router.post("/{session_id}/retry-transcription")
-async def retry_transcription(
+def retry_transcription(
     session_id: UUID,
     current_user: User = Depends(get_current_user_dependency),
     transcription_management_use_case=Depends(
@@ -694,7 +749,7 @@ async def retry_transcription(
 
 
 @router.get("/{session_id}/transcript")
-async def export_transcript(
+def export_transcript(
     session_id: UUID,
     format: str = Query("json", pattern="^(json|vtt|srt|txt|xlsx)$"),
     current_user: User = Depends(get_current_user_dependency),
@@ -705,50 +760,55 @@ async def export_transcript(
     from ...exceptions import DomainException
 
     try:
-        # Use case validates session ownership, status, and gets transcript
-        # data
-        export_data = export_use_case.export_transcript(
+        # Use case validates session ownership, status, and opens a chunked
+        # segment stream (keyset-paginated in the repository)
+        export_data = export_use_case.stream_transcript(
             session_id=session_id,
             user_id=current_user.id,
             format=format,
         )
 
         session = export_data["session"]
-        segments = export_data["segments"]
+        segment_chunks = export_data["segment_chunks"]
+
+        # Role assignments are small and loaded up front; segments are pulled
+        # lazily while the response is being sent, from the request's DB
+        # session (FastAPI >= 0.118 closes it only after the body is sent)
+        role_assignments = speaker_role_use_case.get_session_speaker_roles(
+            session_id=session.id, user_id=current_user.id
+        )
+        segment_roles = speaker_role_use_case.get_segment_roles(
+            session_id=session.id, user_id=current_user.id
+        )
 
         # Generate transcript content based on format
         if format == "json":
-            content = _export_json(
-                session, segments, speaker_role_use_case, current_user.id
+            response_io = _export_json(
+                session, segment_chunks, role_assignments, segment_roles
             )
             media_type = "application/json"
-            response_io = io.StringIO(content)
         elif format == "vtt":
-            content = _export_vtt(
-                session, segments, speaker_role_use_case, current_user.id
+            response_io = _export_vtt(
+                session, segment_chunks, role_assignments, segment_roles
             )
             media_type = "text/vtt"
-            response_io = io.StringIO(content)
         elif format == "srt":
-            content = _export_srt(
-                session, segments, speaker_role_use_case, current_user.id
+            response_io = _export_srt(
+                session, segment_chunks, role_assignments, segment_roles
             )
             media_type = "text/srt"
-            response_io = io.StringIO(content)
         elif format == "txt":
-            content = _export_txt(
-                session, segments, speaker_role_use_case, current_user.id
+            response_io = _export_txt(
+                session, segment_chunks, role_assignments, segment_roles
             )
             media_type = "text/plain"
-            response_io = io.StringIO(content)
         elif format == "xlsx":
-            excel_buffer = _export_xlsx(
-                session, segments, speaker_role_use_case, current_user.id
+            response_io = _export_xlsx(
+                session, segment_chunks, role_assignments, segment_roles
             )
             media_type = (
                 "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
-            response_io = excel_buffer
         else:
             raise HTTPException(status_code=400, detail="Invalid format")
 
@@ -790,7 +850,7 @@ async def export_transcript(
 
 
 @router.get("/{session_id}/status", response_model=SessionStatusResponse)
-async def get_session_status(
+def get_session_status(
     session_id: UUID,
     current_user: User = Depends(get_current_user_dependency),
     status_retrieval_use_case=Depends(get_session_status_retrieval_use_case),
@@ -836,6 +896,90 @@ async def get_session_status(
             raise HTTPException(status_code=400, detail=str(e))
 
 
+def _release_db_session(db: DBSession) -> None:
+    db.commit()
+    db.close()
+
+
+@router.get("/{session_id}/events")
+async def stream_session_progress(
+    session_id: UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user_dependency),
+    status_retrieval_use_case=Depends(get_session_status_retrieval_use_case),
+    broker: Optional[ProgressBroker] = Depends(get_progress_broker),
+    db: DBSession = Depends(get_db),
+):
+    """
+    Stream processing progress as Server-Sent Events.
+
+    Sends the current status first, then every update the transcription task
+    publishes, and closes once the session completes or fails. Comment lines
+    keep idle connections open. Without a progress broker (no REDIS_URL) the
+    endpoint answers 503 and clients keep polling ``/status``.
+    """
+    if broker is None:
+        raise HTTPException(status_code=503, detail="Progress events are not available")
+
+    try:
+        status_data = await run_in_threadpool(
+            status_retrieval_use_case.get_detailed_status,
+            session_id=session_id,
+            user_id=current_user.id,
+        )
+    except ValueError as e:
+        if "Session not found" in str(e):
+            raise HTTPException(status_code=404, detail="Session not found")
+        raise HTTPException(status_code=400, detail=str(e))
+    # The request's DB session (shared with the user and use case
+    # dependencies) is only torn down after the stream ends; give its
+    # connection back to the pool now instead of holding it for hours
+    await run_in_threadpool(_release_db_session, db)
+
+    session = status_data["session"]
+    processing_status = status_data["processing_status"]
+    # Subscribe before reading the latest event so nothing published in
+    # between is lost
+    subscription = await broker.subscribe(session_id)
+    initial = build_progress_event(
+        session_id,
+        status=session.status.value,
+        progress=processing_status["progress_percentage"],
+        message=processing_status["message"],
+        duration_processed=processing_status["duration_processed"],
+        duration_total=processing_status["duration_total"],
+    )
+    if session.status == SessionStatus.PROCESSING:
+        latest = await broker.latest(session_id)
+        # A terminal event left over from an earlier run must not end the stream
+        if latest and latest["status"] not in TERMINAL_STATUSES:
+            initial = latest
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            yield format_sse(initial)
+            if initial["status"] in TERMINAL_STATUSES:
+                return
+            while not await request.is_disconnected():
+                event = await subscription.next_event(
+                    timeout=settings.PROGRESS_EVENTS_HEARTBEAT_SECONDS
+                )
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(event)
+                if event["status"] in TERMINAL_STATUSES:
+                    return
+        finally:
+            await subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 class SpeakerRoleUpdateRequest(BaseModel):
     speaker_roles: dict[int, str]
 
@@ -849,7 +993,7 @@ class SegmentContentUpdateRequest(BaseModel):
 
 
 @router.patch("/{session_id}/speaker-roles")
-async def update_speaker_roles(
+def update_speaker_roles(
     session_id: UUID,
     request: SpeakerRoleUpdateRequest,
     current_user: User = Depends(get_current_user_dependency),
@@ -881,7 +1025,7 @@ async def update_speaker_roles(
 
 
 @router.patch("/{session_id}/segment-roles")
-async def update_segment_roles(
+def update_segment_roles(
     session_id: UUID,
     request: SegmentRoleUpdateRequest,
     current_user: User = Depends(get_current_user_dependency),
@@ -913,7 +1057,7 @@ async def update_segment_roles(
 
 
 @router.patch("/{session_id}/segment-content")
-async def update_segment_content(
+def update_segment_content(
     session_id: UUID,
     request: SegmentContentUpdateRequest,
     current_user: User = Depends(get_current_user_dependency),
@@ -1016,23 +1160,67 @@ async def update_segment_content(
         )
 
 
-def _export_json(
-    session: Session,
-    segments: List[TranscriptSegment],
-    speaker_role_use_case,
-    user_id: UUID,
-) -> str:
-    """Export transcript as JSON."""
-    # Get role assignments using the speaker role use case
-    role_assignments = speaker_role_use_case.get_session_speaker_roles(
-        session_id=session.id, user_id=user_id
+def _quota_exceeded(check: QuotaCheck, current_user: User) -> HTTPException:
+    """Build the error response for a failed upload or transcription admission."""
+    plan = current_user.plan.value if current_user.plan else "free"
+    if check.limit_type == "file_size":
+        return HTTPException(
+            status_code=413,
+            detail={
+                "error": "file_size_exceeded",
+                "message": check.message,
+                "file_size_mb": check.current,
+                "plan": plan,
+            },
+        )
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail={
+            "error": "transcription_limit_exceeded",
+            "message": check.message,
+            "plan": plan,
+            "current_usage": check.current,
+            "limit": check.limit,
+        },
     )
 
-    # Get segment-level role assignments
-    segment_roles = speaker_role_use_case.get_segment_roles(
-        session_id=session.id, user_id=user_id
+
+def _localized_roles(roles: dict) -> dict:
+    """Map raw role values to the Chinese labels used in text exports."""
+    return {
+        key: "教練" if role.upper() == "COACH" else "客戶"
+        for key, role in roles.items()
+    }
+
+
+def _speaker_label(
+    seg: TranscriptSegment, role_assignments: dict, segment_roles: dict
+) -> str:
+    """Use segment-level role if available, otherwise use speaker-level role."""
+    return segment_roles.get(
+        str(seg.id),
+        role_assignments.get(seg.speaker_id, f"Speaker {seg.speaker_id}"),
     )
 
+
+def _encode_line_chunks(line_chunks: Iterable[List[str]]) -> Iterator[bytes]:
+    """Encode chunks of lines as if all lines were joined with newlines."""
+    first = True
+    for lines in line_chunks:
+        if not lines:
+            continue
+        text = "\n".join(lines)
+        yield (text if first else "\n" + text).encode("utf-8")
+        first = False
+
+
+def _export_json(
+    session: Session,
+    segment_chunks: Iterable[List[TranscriptSegment]],
+    role_assignments: dict,
+    segment_roles: dict,
+) -> Iterator[bytes]:
+    """Export transcript as JSON, one segment chunk at a time."""
     data = {
         "session_id": str(session.id),
         "title": session.title,
@@ -1043,222 +1231,169 @@ def _export_json(
             role_assignments
         ),  # Speaker-level roles (for compatibility)
         "segment_roles": segment_roles,  # Segment-level roles (new)
-        "segments": [
-            {
-                "id": str(seg.id),
-                "speaker_id": seg.speaker_id,
-                "start_sec": seg.start_seconds,  # Frontend expects start_sec
-                "end_sec": seg.end_seconds,  # Frontend expects end_sec
-                "content": seg.content,
-                "confidence": seg.confidence,
-                "role": segment_roles.get(
-                    str(seg.id),
-                    role_assignments.get(seg.speaker_id, "unknown"),
-                ),
-            }
-            for seg in segments
-        ],
+        "segments": [],
     }
-    return json.dumps(data, ensure_ascii=False, indent=2)
+    # Emit the document head, then splice the segment array in chunk by chunk
+    head = json.dumps(data, ensure_ascii=False, indent=2)
+    yield (head[: -len("[]\n}")] + "[").encode("utf-8")
+
+    separator = "\n"
+    for segments in segment_chunks:
+        parts = []
+        for seg in segments:
+            item = json.dumps(
+                {
+                    "id": str(seg.id),
+                    "speaker_id": seg.speaker_id,
+                    "start_sec": seg.start_seconds,  # Frontend expects start_sec
+                    "end_sec": seg.end_seconds,  # Frontend expects end_sec
+                    "content": seg.content,
+                    "confidence": seg.confidence,
+                    "role": segment_roles.get(
+                        str(seg.id),
+                        role_assignments.get(seg.speaker_id, "unknown"),
+                    ),
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+            parts.append(separator + "    " + item.replace("\n", "\n    "))
+            separator = ",\n"
+        yield "".join(parts).encode("utf-8")
+
+    yield ("\n  ]\n}" if separator == ",\n" else "]\n}").encode("utf-8")
 
 
 def _export_vtt(
     session: Session,
-    segments: List[TranscriptSegment],
-    speaker_role_use_case,
-    user_id: UUID,
-) -> str:
-    """Export transcript as WebVTT."""
-    # Get role assignments using the speaker role use case
-    role_assignments_raw = speaker_role_use_case.get_session_speaker_roles(
-        session_id=session.id, user_id=user_id
-    )
-    role_assignments = {
-        speaker_id: "教練" if role.upper() == "COACH" else "客戶"
-        for speaker_id, role in role_assignments_raw.items()
-    }
-
-    # Get segment-level role assignments
-    segment_roles_raw = speaker_role_use_case.get_segment_roles(
-        session_id=session.id, user_id=user_id
-    )
-    segment_roles = {
-        segment_id: "教練" if role.upper() == "COACH" else "客戶"
-        for segment_id, role in segment_roles_raw.items()
-    }
-
-    lines = ["WEBVTT", f"NOTE {session.title}", ""]
-
-    for seg in segments:
-        start = _format_timestamp_vtt(seg.start_seconds)
-        end = _format_timestamp_vtt(seg.end_seconds)
-        # Use segment-level role if available, otherwise use speaker-level role
-        speaker_label = segment_roles.get(
-            str(seg.id),
-            role_assignments.get(seg.speaker_id, f"Speaker {seg.speaker_id}"),
-        )
-        lines.append(f"{start} --> {end}")
-        lines.append(f"<v {speaker_label}>{seg.content}")
-        lines.append("")
+    segment_chunks: Iterable[List[TranscriptSegment]],
+    role_assignments: dict,
+    segment_roles: dict,
+) -> Iterator[bytes]:
+    """Export transcript as WebVTT, one segment chunk at a time."""
+    role_assignments = _localized_roles(role_assignments)
+    segment_roles = _localized_roles(segment_roles)
+
+    def line_chunks() -> Iterator[List[str]]:
+        yield ["WEBVTT", f"NOTE {session.title}", ""]
+        for segments in segment_chunks:
+            lines = []
+            for seg in segments:
+                start = _format_timestamp_vtt(seg.start_seconds)
+                end = _format_timestamp_vtt(seg.end_seconds)
+                speaker_label = _speaker_label(seg, role_assignments, segment_roles)
+                lines.append(f"{start} --> {end}")
+                lines.append(f"<v {speaker_label}>{seg.content}")
+                lines.append("")
+            yield lines
 
-    return "\n".join(lines)
+    return _encode_line_chunks(line_chunks())
 
 
 def _export_srt(
     session: Session,
-    segments: List[TranscriptSegment],
-    speaker_role_use_case,
-    user_id: UUID,
-) -> str:
-    """Export transcript as SRT."""
-    # Get role assignments using the speaker role use case
-    role_assignments_raw = speaker_role_use_case.get_session_speaker_roles(
-        session_id=session.id, user_id=user_id
-    )
-    role_assignments = {
-        speaker_id: "教練" if role.upper() == "COACH" else "客戶"
-        for speaker_id, role in role_assignments_raw.items()
-    }
-
-    # Get segment-level role assignments
-    segment_roles_raw = speaker_role_use_case.get_segment_roles(
-        session_id=session.id, user_id=user_id
-    )
-    segment_roles = {
-        segment_id: "教練" if role.upper() == "COACH" else "客戶"
-        for segment_id, role in segment_roles_raw.items()
-    }
-
-    lines = []
-
-    for i, seg in enumerate(segments, 1):
-        start = _format_timestamp_srt(seg.start_seconds)
-        end = _format_timestamp_srt(seg.end_seconds)
-        # Use segment-level role if available, otherwise use speaker-level role
-        speaker_label = segment_roles.get(
-            str(seg.id),
-            role_assignments.get(seg.speaker_id, f"Speaker {seg.speaker_id}"),
-        )
-        lines.append(str(i))
-        lines.append(f"{start} --> {end}")
-        lines.append(f"{speaker_label}: {seg.content}")
-        lines.append("")
+    segment_chunks: Iterable[List[TranscriptSegment]],
+    role_assignments: dict,
+    segment_roles: dict,
+) -> Iterator[bytes]:
+    """Export transcript as SRT, one segment chunk at a time."""
+    role_assignments = _localized_roles(role_assignments)
+    segment_roles = _localized_roles(segment_roles)
+
+    def line_chunks() -> Iterator[List[str]]:
+        index = 0
+        for segments in segment_chunks:
+            lines = []
+            for seg in segments:
+                index += 1
+                start = _format_timestamp_srt(seg.start_seconds)
+                end = _format_timestamp_srt(seg.end_seconds)
+                speaker_label = _speaker_label(seg, role_assignments, segment_roles)
+                lines.append(str(index))
+                lines.append(f"{start} --> {end}")
+                lines.append(f"{speaker_label}: {seg.content}")
+                lines.append("")
+            yield lines
 
-    return "\n".join(lines)
+    return _encode_line_chunks(line_chunks())
 
 
 def _export_txt(
     session: Session,
-    segments: List[TranscriptSegment],
-    speaker_role_use_case,
-    user_id: UUID,
-) -> str:
-    """Export transcript as plain text."""
-    # Get role assignments using the speaker role use case
-    role_assignments_raw = speaker_role_use_case.get_session_speaker_roles(
-        session_id=session.id, user_id=user_id
-    )
-    role_assignments = {
-        speaker_id: "教練" if role.upper() == "COACH" else "客戶"
-        for speaker_id, role in role_assignments_raw.items()
-    }
-
-    # Get segment-level role assignments
-    segment_roles_raw = speaker_role_use_case.get_segment_roles(
-        session_id=session.id, user_id=user_id
-    )
-    segment_roles = {
-        segment_id: "教練" if role.upper() == "COACH" else "客戶"
-        for segment_id, role in segment_roles_raw.items()
-    }
-
-    lines = [f"Transcript: {session.title}", ""]
-
-    current_speaker_label = None
-    for seg in segments:
-        # Use segment-level role if available, otherwise use speaker-level role
-        speaker_label = segment_roles.get(
-            str(seg.id),
-            role_assignments.get(seg.speaker_id, f"Speaker {seg.speaker_id}"),
-        )
-
-        if speaker_label != current_speaker_label:
-            if current_speaker_label is not None:
-                lines.append("")
-            lines.append(f"{speaker_label}:")
-            current_speaker_label = speaker_label
-
-        lines.append(seg.content)
-
-    return "\n".join(lines)
+    segment_chunks: Iterable[List[TranscriptSegment]],
+    role_assignments: dict,
+    segment_roles: dict,
+) -> Iterator[bytes]:
+    """Export transcript as plain text, one segment chunk at a time."""
+    role_assignments = _localized_roles(role_assignments)
+    segment_roles = _localized_roles(segment_roles)
+
+    def line_chunks() -> Iterator[List[str]]:
+        yield [f"Transcript: {session.title}", ""]
+        current_speaker_label = None
+        for segments in segment_chunks:
+            lines = []
+            for seg in segments:
+                speaker_label = _speaker_label(seg, role_assignments, segment_roles)
+                if speaker_label != current_speaker_label:
+                    if current_speaker_label is not None:
+                        lines.append("")
+                    lines.append(f"{speaker_label}:")
+                    current_speaker_label = speaker_label
+                lines.append(seg.content)
+            yield lines
+
+    return _encode_line_chunks(line_chunks())
 
 
 def _export_xlsx(
     session: Session,
-    segments: List[TranscriptSegment],
-    speaker_role_use_case,
-    user_id: UUID,
-) -> io.BytesIO:
-    """Export transcript as Excel file."""
-    # Get role assignments using the speaker role use case
-    role_assignments_raw = speaker_role_use_case.get_session_speaker_roles(
-        session_id=session.id, user_id=user_id
-    )
+    segment_chunks: Iterable[List[TranscriptSegment]],
+    role_assignments: dict,
+    segment_roles: dict,
+) -> Iterator[bytes]:
+    """Export transcript as Excel file, yielded in chunks."""
     # Normalize to English labels for the Excel dataset; map later to Chinese
     role_assignments = {
         speaker_id: "Coach" if role.upper() == "COACH" else "Client"
-        for speaker_id, role in role_assignments_raw.items()
+        for speaker_id, role in role_assignments.items()
     }
-
-    # Get segment-level role assignments
-    segment_roles_raw = speaker_role_use_case.get_segment_roles(
-        session_id=session.id, user_id=user_id
-    )
     segment_roles = {
         segment_id: "Coach" if role.upper() == "COACH" else "Client"
-        for segment_id, role in segment_roles_raw.items()
+        for segment_id, role in segment_roles.items()
     }
 
-    # Prepare data for Excel export
-    data = []
-    for seg in segments:
-        # Use segment-level role if available, otherwise use speaker-level role
-        speaker_role = segment_roles.get(
-            str(seg.id), role_assignments.get(seg.speaker_id)
-        )
-
-        # Convert role to proper Chinese labels with explicit fallback
-        if speaker_role == "Coach":
-            speaker_label = "教練"
-        elif speaker_role == "Client":
-            speaker_label = "客戶"
-        elif speaker_role == "教練":
-            speaker_label = "教練"
-        elif speaker_role == "客戶":
-            speaker_label = "客戶"
-        else:
-            # Explicit fallback: make it clear no role is assigned
-            speaker_label = f"Speaker {seg.speaker_id} (未指定角色)"
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                f"No role assigned for speaker {seg.speaker_id} in session {session.id}"
-            )
+    def rows() -> Iterator[dict]:
+        for segments in segment_chunks:
+            for seg in segments:
+                # Use segment-level role if available, otherwise speaker-level
+                speaker_role = segment_roles.get(
+                    str(seg.id), role_assignments.get(seg.speaker_id)
+                )
 
-        # Format timestamp - only show start time
-        start_time = _format_timestamp_vtt(seg.start_seconds)
+                # Convert role to proper Chinese labels with explicit fallback
+                if speaker_role == "Coach":
+                    speaker_label = "教練"
+                elif speaker_role == "Client":
+                    speaker_label = "客戶"
+                else:
+                    # Explicit fallback: make it clear no role is assigned
+                    speaker_label = f"Speaker {seg.speaker_id} (未指定角色)"
+                    logger.warning(
+                        f"No role assigned for speaker {seg.speaker_id} "
+                        f"in session {session.id}"
+                    )
 
-        data.append(
-            {
-                "time": start_time,
-                "speaker": speaker_label,
-                "content": seg.content,
-            }
-        )
+                # Format timestamp - only show start time
+                yield {
+                    "time": _format_timestamp_vtt(seg.start_seconds),
+                    "speaker": speaker_label,
+                    "content": seg.content,
+                }
 
-    # Generate Excel file using the existing excel exporter
-    return generate_excel(data)
+    # Stream the workbook from the write-only excel exporter; column widths
+    # need every row, so xlsx keeps the compact row tuples in memory
+    return iter_excel(rows())
 
 
 def _format_timestamp_vtt(seconds: float) -> str:
@@ -1278,7 +1413,7 @@ def _format_timestamp_srt(seconds: float) -> str:
 
 
 @router.post("/{session_id}/transcript")
-async def upload_session_transcript(
+def upload_session_transcript(
     session_id: UUID,
     file: UploadFile = FastAPIFile(...),
     current_user: User = Depends(get_current_user_dependency),
@@ -1292,8 +1427,9 @@ async def upload_session_transcript(
     )
 
     try:
-        # Read file content
-        content = await file.read()
+        # Read the spooled upload synchronously; this route runs in the
+        # threadpool with the rest of its database work
+        content = file.file.read()
         content_str = content.decode("utf-8")
 
         # Use case validates session ownership and file format, parses content
@@ -1350,138 +1486,3 @@ async def upload_session_transcript(
         raise HTTPException(
             status_code=500, detail=f"Failed to process transcript: {str(e)}"
         )
-
-
-def _parse_vtt_content(content: str) -> List[dict]:
-    """Parse VTT file content and return segments."""
-    segments = []
-    lines = content.strip().split("\n")
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Skip header and empty lines
-        if line == "WEBVTT" or line == "" or line.startswith("NOTE"):
-            i += 1
-            continue
-
-        # Look for timestamp line
-        if "-->" in line:
-            # Parse timestamp
-            timestamp_match = re.match(
-                r"(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})",
-                line,
-            )
-            if timestamp_match:
-                start_time = _parse_timestamp(timestamp_match.group(1))
-                end_time = _parse_timestamp(timestamp_match.group(2))
-
-                # Get the content (next line)
-                i += 1
-                if i < len(lines):
-                    content_line = lines[i].strip()
-
-                    # Extract speaker and content from VTT format like "<v
-                    # Speaker>Content"
-                    speaker_id = 1
-                    content_text = content_line
-
-                    speaker_match = re.match(r"<v\s+([^>]+)>\s*(.*)", content_line)
-                    if speaker_match:
-                        speaker_name = speaker_match.group(1)
-                        content_text = speaker_match.group(2)
-                        # Simple speaker ID assignment based on name
-                        speaker_id = (
-                            2
-                            if "客戶" in speaker_name or "Client" in speaker_name
-                            else 1
-                        )
-
-                    segments.append(
-                        {
-                            "start_seconds": start_time,
-                            "end_seconds": end_time,
-                            "content": content_text,
-                            "speaker_id": speaker_id,
-                        }
-                    )
-
-        i += 1
-
-    return segments
-
-
-def _parse_srt_content(content: str) -> List[dict]:
-    """Parse SRT file content and return segments."""
-    segments = []
-
-    # Split by double newline to get individual subtitle blocks
-    blocks = re.split(r"\n\s*\n", content.strip())
-
-    for block in blocks:
-        lines = block.strip().split("\n")
-        if len(lines) < 3:
-            continue
-
-        # Skip sequence number (line 0)
-        # Parse timestamp (line 1)
-        timestamp_line = lines[1].strip()
-        timestamp_match = re.match(
-            r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})",
-            timestamp_line,
-        )
-
-        if timestamp_match:
-            start_time = _parse_timestamp(timestamp_match.group(1).replace(",", "."))
-            end_time = _parse_timestamp(timestamp_match.group(2).replace(",", "."))
-
-            # Content (lines 2+)
-            content_lines = lines[2:]
-            content_text = " ".join(content_lines)
-
-            # Extract speaker info if present
-            speaker_id = 1
-
-            # Look for speaker prefix like "教練: " or "Coach: "
-            speaker_match = re.match(r"(.*?):\s*(.*)", content_text)
-            if speaker_match:
-                speaker_name = speaker_match.group(1)
-                content_text = speaker_match.group(2)
-                speaker_id = (
-                    2 if "客戶" in speaker_name or "Client" in speaker_name else 1
-                )
-
-            segments.append(
-                {
-                    "start_seconds": start_time,
-                    "end_seconds": end_time,
-                    "content": content_text,
-                    "speaker_id": speaker_id,
-                }
-            )
-
-    return segments
-
-
-def _parse_timestamp(timestamp_str: str) -> float:
-    """Convert timestamp string to seconds."""
-    # Handle format: HH:MM:SS.mmm
-    time_parts = timestamp_str.split(":")
-    if len(time_parts) != 3:
-        raise ValueError(f"Invalid timestamp format: {timestamp_str}")
-
-    hours = int(time_parts[0])
-    minutes = int(time_parts[1])
-    seconds_str = time_parts[2]
-
-    # Handle seconds with milliseconds
-    if "." in seconds_str:
-        seconds, milliseconds = seconds_str.split(".")
-        total_seconds = (
-            hours * 3600 + minutes * 60 + int(seconds) + int(milliseconds) / 1000
-        )
-    else:
-        total_seconds = hours * 3600 + minutes * 60 + int(seconds_str)
-
-    return total_seconds
@@ -10,23 +10,25 @@ import time
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session as DBSession
 
 from ...core.database import get_db
 from ...core.models.coaching_session import CoachingSession
 from ...core.models.session import Session
-from ...core.models.transcript import (
-    TranscriptSegment as TranscriptSegmentModel,
-)
+from ...infrastructure.db.bulk import bulk_update
+from ...infrastructure.db.models.transcript_model import TranscriptSegmentModel
+from ...services.lemur_cache import get_lemur_cache
+from ...services.lemur_scheduler import get_lemur_scheduler
 from ...services.lemur_transcript_smoother import (
     smooth_transcript_with_lemur,
 )
 from ...services.transcript_smoother import (
     MissingWordsError,
     TranscriptProcessingError,
+    TranscriptSmoothingService,
     UnsupportedLanguageError,
-    smooth_and_punctuate,
 )
 from .auth import get_current_user_dependency
 
@@ -99,6 +101,71 @@ def resolve_transcript_session_id(
     )
 
 
+def _load_session_segments(
+    session_id: str, user_id: str, db: DBSession
+) -> tuple[list, Session]:
+    """
+    Load a session's transcript segments and the session itself.
+
+    Blocking; the async LeMUR endpoints run it in the threadpool.
+
+    Raises:
+        HTTPException: If the session or its segments cannot be found
+    """
+    # Resolve session ID (coaching -> transcript mapping)
+    transcript_session_id, _ = resolve_transcript_session_id(session_id, user_id, db)
+
+    # Load segments from database using the transcript session ID
+    db_segments = (
+        db.query(TranscriptSegmentModel)
+        .filter(TranscriptSegmentModel.session_id == transcript_session_id)
+        .order_by(TranscriptSegmentModel.start_seconds)
+        .all()
+    )
+
+    if not db_segments:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "No transcript segments found for this session",
+                "error_type": "no_segments",
+                "success": False,
+            },
+        )
+
+    # Fetch the session to get language information
+    session = (
+        db.query(Session)
+        .filter(
+            Session.id == transcript_session_id,
+            Session.user_id == user_id,
+        )
+        .first()
+    )
+
+    if not session:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "Session not found",
+                "error_type": "session_not_found",
+                "success": False,
+            },
+        )
+
+    return db_segments, session
+
+
+def _write_segment_changes(db: DBSession, changes: list) -> None:
+    """
+    Apply a diff of per-segment column changes and commit it.
+
+    Blocking; the async LeMUR endpoints run it in the threadpool.
+    """
+    bulk_update(db, TranscriptSegmentModel.__table__, changes)
+    db.commit()
+
+
 # Request/Response Models
 class TranscriptSmoothingRequest(BaseModel):
     """Request model for transcript smoothing."""
@@ -288,7 +355,7 @@ class CombinedProcessingRequest(TranscriptSmoothingRequest):
     for different languages and use cases.
     """,
 )
-async def smooth_transcript(
+def smooth_transcript(
     request: TranscriptSmoothingRequest,
     current_user=Depends(get_current_user_dependency),
 ) -> TranscriptSmoothingResponse:
@@ -316,8 +383,8 @@ async def smooth_transcript(
         # Prepare configuration
         config_params = request.config or {}
 
-        # Process transcript
-        result = smooth_and_punctuate(
+        # Process transcript (trusted fast path: validated once, no per-word models)
+        result = TranscriptSmoothingService().smooth_and_punctuate_fast(
             transcript_json=request.transcript,
             language=request.language,
             **config_params,
@@ -326,10 +393,20 @@ async def smooth_transcript(
         processing_time_ms = int((time.time() - start_time) * 1000)
 
         # Convert to response format
-        segments = [ProcessedSegment(**segment) for segment in result["segments"]]
+        segments = [
+            ProcessedSegment(
+                speaker=segment.speaker,
+                start_ms=segment.start_ms,
+                end_ms=segment.end_ms,
+                text=segment.text,
+                source_utterance_indices=segment.source_utterance_indices,
+                note=segment.note,
+            )
+            for segment in result.segments
+        ]
 
         stats = ProcessingStats(
-            **result["stats"], processing_time_ms=processing_time_ms
+            **result.stats.model_dump(), processing_time_ms=processing_time_ms
         )
 
         logger.info(
@@ -1178,6 +1255,51 @@ async def get_supported_languages(
     }
 
 
+@router.get(
+    "/lemur/cache/stats",
+    response_model=Dict[str, Any],
+    summary="Get LeMUR cache statistics",
+    description="Get hit/miss counters for the LeMUR result cache.",
+)
+def get_lemur_cache_stats(
+    current_user=Depends(get_current_user_dependency),
+) -> Dict[str, Any]:
+    """
+    Get LeMUR result cache statistics.
+
+    Args:
+        current_user: Authenticated user
+
+    Returns:
+        Hit/miss counters for this process, or a disabled marker
+    """
+    cache = get_lemur_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get(
+    "/lemur/scheduler/stats",
+    response_model=Dict[str, Any],
+    summary="Get LeMUR scheduler statistics",
+    description="Get concurrency state and per-batch latency histograms for LeMUR.",
+)
+async def get_lemur_scheduler_stats(
+    current_user=Depends(get_current_user_dependency),
+) -> Dict[str, Any]:
+    """
+    Get LeMUR scheduler statistics.
+
+    Args:
+        current_user: Authenticated user
+
+    Returns:
+        Current concurrency limit, queue depth, counters and latency histograms
+    """
+    return get_lemur_scheduler().stats()
+
+
 @router.post(
     "/session/{session_id}/lemur-speaker-identification",
     response_model=LeMURSmoothingResponse,
@@ -1224,49 +1346,11 @@ async def lemur_speaker_identification_from_db(
         # Extract custom prompts from request
         custom_prompts = request.custom_prompts or {}
 
-        # Resolve session ID (coaching -> transcript mapping)
-        transcript_session_id, is_coaching = resolve_transcript_session_id(
-            session_id, current_user.id, db
-        )
-
-        # Load segments from database using the transcript session ID
-        db_segments = (
-            db.query(TranscriptSegmentModel)
-            .filter(TranscriptSegmentModel.session_id == transcript_session_id)
-            .order_by(TranscriptSegmentModel.start_seconds)
-            .all()
+        # Load segments and the session off the event loop
+        db_segments, session = await run_in_threadpool(
+            _load_session_segments, session_id, current_user.id, db
         )
 
-        if not db_segments:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "No transcript segments found for this session",
-                    "error_type": "no_segments",
-                    "success": False,
-                },
-            )
-
-        # Fetch the session to get language information
-        session = (
-            db.query(Session)
-            .filter(
-                Session.id == transcript_session_id,
-                Session.user_id == current_user.id,
-            )
-            .first()
-        )
-
-        if not session:
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "error": "Session not found",
-                    "error_type": "session_not_found",
-                    "success": False,
-                },
-            )
-
         # Convert database segments to LeMUR format
         lemur_segments = []
         for segment in db_segments:
@@ -1308,8 +1392,8 @@ async def lemur_speaker_identification_from_db(
             speaker_identification_only=True,
         )
 
-        # Update database segments with corrected speakers
-        segment_updates = 0
+        # Collect the speaker changes to write back
+        speaker_changes = []
         speaker_comparisons_logged = 0
         for i, corrected_segment in enumerate(smoothed_result.segments):
             if i < len(db_segments):
@@ -1338,12 +1422,14 @@ async def lemur_speaker_identification_from_db(
                     speaker_comparisons_logged += 1
 
                 if db_segment.speaker_id != new_speaker_id:
-                    db_segment.speaker_id = new_speaker_id
-                    segment_updates += 1
+                    speaker_changes.append(
+                        {"id": db_segment.id, "speaker_id": new_speaker_id}
+                    )
 
-        # Commit changes to database
+        # Write all changed speakers back in one statement
+        segment_updates = len(speaker_changes)
         if segment_updates > 0:
-            db.commit()
+            await run_in_threadpool(_write_segment_changes, db, speaker_changes)
             logger.info(
                 f"Updated {segment_updates} segments with corrected speaker assignments"
             )
@@ -1441,49 +1527,11 @@ async def lemur_punctuation_optimization_from_db(
         # Extract custom prompts from request
         custom_prompts = request.custom_prompts or {}
 
-        # Resolve session ID (coaching -> transcript mapping)
-        transcript_session_id, is_coaching = resolve_transcript_session_id(
-            session_id, current_user.id, db
-        )
-
-        # Load segments from database using the transcript session ID
-        db_segments = (
-            db.query(TranscriptSegmentModel)
-            .filter(TranscriptSegmentModel.session_id == transcript_session_id)
-            .order_by(TranscriptSegmentModel.start_seconds)
-            .all()
+        # Load segments and the session off the event loop
+        db_segments, session = await run_in_threadpool(
+            _load_session_segments, session_id, current_user.id, db
         )
 
-        if not db_segments:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "No transcript segments found for this session",
-                    "error_type": "no_segments",
-                    "success": False,
-                },
-            )
-
-        # Fetch the session to get language information
-        session = (
-            db.query(Session)
-            .filter(
-                Session.id == transcript_session_id,
-                Session.user_id == current_user.id,
-            )
-            .first()
-        )
-
-        if not session:
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "error": "Session not found",
-                    "error_type": "session_not_found",
-                    "success": False,
-                },
-            )
-
         # Convert database segments to LeMUR format
         lemur_segments = []
         for segment in db_segments:
@@ -1525,12 +1573,16 @@ async def lemur_punctuation_optimization_from_db(
             punctuation_optimization_only=True,
         )
 
-        # Update database segments with improved text
-        segment_updates = 0
+        # Collect the content changes to write back. Results are matched to
+        # rows by the index of the segment they came from, not by position:
+        # oversized segments are split into pieces for LeMUR and joined back
+        # afterwards, and LeMUR may return more or fewer lines than it was sent
+        content_changes = []
         content_comparisons_logged = 0
         for i, improved_segment in enumerate(smoothed_result.segments):
-            if i < len(db_segments):
-                db_segment = db_segments[i]
+            source_index = improved_segment.source_index
+            if source_index is not None and 0 <= source_index < len(db_segments):
+                db_segment = db_segments[source_index]
 
                 # Debug: Log first few content comparisons to show what LeMUR
                 # changed
@@ -1548,12 +1600,14 @@ async def lemur_punctuation_optimization_from_db(
                     content_comparisons_logged += 1
 
                 if db_segment.content != improved_segment.text:
-                    db_segment.content = improved_segment.text
-                    segment_updates += 1
+                    content_changes.append(
+                        {"id": db_segment.id, "content": improved_segment.text}
+                    )
 
-        # Commit changes to database
+        # Write all changed content back in one statement
+        segment_updates = len(content_changes)
         if segment_updates > 0:
-            db.commit()
+            await run_in_threadpool(_write_segment_changes, db, content_changes)
             logger.info(f"Updated {segment_updates} segments with improved punctuation")
         else:
             logger.info("No text content needed updating")
@@ -1609,7 +1663,7 @@ async def lemur_punctuation_optimization_from_db(
     summary="Get raw AssemblyAI data for smoothing",
     description="Get the raw AssemblyAI transcript data for a session to use with the smoothing API.",
 )
-async def get_raw_assemblyai_data(
+def get_raw_assemblyai_data(
     session_id: str,
     current_user=Depends(get_current_user_dependency),
     db: DBSession = Depends(get_db),
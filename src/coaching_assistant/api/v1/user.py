@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 
 from ...core.database import get_db
 from ...core.models.user import User, UserPlan
+from ...services.user_principal_cache import invalidate_user_principal
 from .auth import get_current_user_dependency
 
 logger = logging.getLogger(__name__)
@@ -91,6 +92,7 @@ async def update_user_profile(
     """
     if profile_data.name is not None:
         current_user.name = profile_data.name
+        invalidate_user_principal(current_user.id, db)
 
     db.commit()
     db.refresh(current_user)
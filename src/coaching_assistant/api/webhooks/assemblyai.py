@@ -0,0 +1,66 @@
+"""AssemblyAI webhook handler for completed transcription jobs."""
+
+import hmac
+import logging
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from pydantic import BaseModel
+
+from ...core.config import settings
+from ...services.assemblyai_stt import AssemblyAIProvider
+from ...tasks.transcription_tasks import complete_assemblyai_transcription
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["Webhooks"])
+
+# Job statuses AssemblyAI reports once a transcript will no longer change
+FINAL_TRANSCRIPT_STATUSES = {"completed", "error"}
+
+
+class AssemblyAIWebhookPayload(BaseModel):
+    """Body AssemblyAI POSTs to webhook_url when a job finishes."""
+
+    transcript_id: str
+    status: str
+
+
+@router.post("/assemblyai")
+def handle_transcript_webhook(
+    payload: AssemblyAIWebhookPayload,
+    session_id: UUID = Query(...),
+    webhook_secret: Optional[str] = Header(
+        None, alias=AssemblyAIProvider.WEBHOOK_AUTH_HEADER
+    ),
+):
+    """
+    Queue the fetch of a finished AssemblyAI transcript.
+
+    The payload only names the job, so nothing here touches the database:
+    complete_assemblyai_transcription re-reads the job from AssemblyAI and
+    ignores it unless it is the session's pending one.
+    """
+    expected_secret = settings.ASSEMBLYAI_WEBHOOK_SECRET
+    if expected_secret and not hmac.compare_digest(
+        (webhook_secret or "").encode(), expected_secret.encode()
+    ):
+        logger.warning(
+            f"⚠️ Rejected AssemblyAI webhook for session {session_id}: bad secret"
+        )
+        raise HTTPException(status_code=401, detail="Invalid webhook secret")
+
+    if payload.status not in FINAL_TRANSCRIPT_STATUSES:
+        logger.info(
+            f"AssemblyAI transcript {payload.transcript_id} is {payload.status}, "
+            f"nothing to fetch yet"
+        )
+        return {"status": "ignored"}
+
+    complete_assemblyai_transcription.delay(str(session_id), payload.transcript_id)
+    logger.info(
+        f"📥 AssemblyAI transcript {payload.transcript_id} {payload.status} "
+        f"for session {session_id}, fetch queued"
+    )
+    return {"status": "queued"}
@@ -9,6 +9,7 @@ from ..core.config import settings
 from ..core.database import create_database_engine
 from ..models.user import User, UserRole
 from ..services.permissions import PermissionService
+from ..services.user_principal_cache import invalidate_user_principal
 
 
 def get_db_session() -> Session:
@@ -56,6 +57,7 @@ def grant_role(email: str, role: str, reason: str, force: bool):
                     "⚠️  No super administrator found. Creating first super admin..."
                 )
                 user.role = UserRole.SUPER_ADMIN
+                invalidate_user_principal(user.id, db)
                 db.commit()
                 click.echo(f"✅ First super admin created: {email}")
                 return
@@ -248,6 +250,7 @@ def create_super_admin(email: str):
 
         # Grant super admin role
         user.role = UserRole.SUPER_ADMIN
+        invalidate_user_principal(user.id, db)
         db.commit()
 
         click.echo(f"✅ Super admin role granted to {email}")
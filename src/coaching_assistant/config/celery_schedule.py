@@ -1,7 +1,9 @@
-"""Celery beat schedule configuration for admin reports and subscription maintenance."""
+"""Celery beat schedule for admin reports, subscription maintenance and STT jobs."""
 
 from celery.schedules import crontab
 
+from ..core.config import settings
+
 # Celery Beat Schedule Configuration
 CELERYBEAT_SCHEDULE = {
     # Daily report at 8:00 AM UTC (covers previous day)
@@ -38,21 +40,20 @@ CELERYBEAT_SCHEDULE = {
             },
         },
     },
-    # Health check report (optional) - every 6 hours
-    "system-health-check": {
-        "task": (
-            "coaching_assistant.tasks.admin_report_tasks.generate_and_send_daily_report"
-        ),
-        "schedule": crontab(minute=0, hour="*/6"),  # Every 6 hours
-        "kwargs": {
-            "target_date_str": None,  # Current day
-            "recipient_emails": None,  # Use default admin emails
-        },
-        "options": {
-            "expires": 1800,  # Expire after 30 minutes
-            "enabled": False,  # Disabled by default - enable if needed
-        },
-    },
+    # Health check report (optional) - every 6 hours. Disabled by default;
+    # celery beat has no per-entry switch, so uncomment to enable.
+    # "system-health-check": {
+    #     "task": (
+    #         "coaching_assistant.tasks.admin_report_tasks."
+    #         "generate_and_send_daily_report"
+    #     ),
+    #     "schedule": crontab(minute=0, hour="*/6"),  # Every 6 hours
+    #     "kwargs": {
+    #         "target_date_str": None,  # Current day
+    #         "recipient_emails": None,  # Use default admin emails
+    #     },
+    #     "options": {"expires": 1800},  # Expire after 30 minutes
+    # },
     # Subscription maintenance - runs every 6 hours
     "subscription-maintenance": {
         "task": (
@@ -73,6 +74,39 @@ CELERYBEAT_SCHEDULE = {
             },
         },
     },
+    # Google STT batch operations - checks every pending job each tick
+    "google-stt-operation-sweep": {
+        "task": (
+            "coaching_assistant.tasks.transcription_tasks.sweep_google_stt_operations"
+        ),
+        "schedule": settings.GOOGLE_STT_SWEEP_INTERVAL_SECONDS,
+        "options": {
+            # A missed tick is covered by the next one; don't let them pile up
+            "expires": settings.GOOGLE_STT_SWEEP_INTERVAL_SECONDS,
+            "retry": False,
+        },
+    },
+    # Analytics rollup reconciliation - runs daily at 1:00 AM UTC
+    "analytics-rollup-reconciliation": {
+        "task": (
+            "coaching_assistant.tasks.analytics_rollup_tasks."
+            "reconcile_analytics_rollups"
+        ),
+        "schedule": crontab(hour=1, minute=0),  # 1:00 AM UTC daily
+        "options": {
+            "expires": 3600,  # Expire after 1 hour
+            "retry": False,  # The next night's run covers the same periods
+        },
+    },
+    # Usage quota counter reconciliation - runs every 5 minutes
+    "usage-quota-reconciliation": {
+        "task": "coaching_assistant.tasks.usage_quota_tasks.reconcile_usage_quotas",
+        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+        "options": {
+            "expires": 240,  # Expire before the next run is due
+            "retry": False,  # Runs again in 5 minutes
+        },
+    },
     # Webhook log cleanup - runs daily at 2:00 AM UTC
     "webhook-log-cleanup": {
         "task": (
@@ -109,12 +143,8 @@ CELERYBEAT_SCHEDULE = {
 # Timezone for schedule
 CELERY_TIMEZONE = "UTC"
 
-# Beat scheduler settings
-CELERYBEAT_SCHEDULER = (
-    "django_celery_beat.schedulers:DatabaseScheduler"  # If using Django
-)
-# For pure Celery without Django:
-# CELERYBEAT_SCHEDULER = 'celery.beat:PersistentScheduler'
+# Beat scheduler settings (no Django here, so the schedule lives in this file)
+CELERYBEAT_SCHEDULER = "celery.beat:PersistentScheduler"
 
 # Additional Celery configurations for admin reports and subscription tasks
 CELERY_TASK_ROUTES = {
@@ -143,6 +173,16 @@ CELERY_TASK_ROUTES = {
         "routing_key": "notifications",
         "priority": 6,  # Medium-high priority
     },
+    "coaching_assistant.tasks.analytics_rollup_tasks.reconcile_analytics_rollups": {
+        "queue": "maintenance",
+        "routing_key": "maintenance",
+        "priority": 3,  # Low priority
+    },
+    "coaching_assistant.tasks.usage_quota_tasks.reconcile_usage_quotas": {
+        "queue": "maintenance",
+        "routing_key": "maintenance",
+        "priority": 3,  # Low priority
+    },
     "coaching_assistant.tasks.subscription_maintenance_tasks.cleanup_old_webhook_logs": {
         "queue": "maintenance",
         "routing_key": "maintenance",
@@ -37,6 +37,9 @@ class PerformanceSettings:
     max_batch_chars: int = 3000
     max_batch_size: int = 10
     min_batch_size: int = 1
+    max_batch_tokens: int = 3000
+    max_batch_segments: int = 40
+    overlap_segments: int = 1
     large_transcript_threshold: int = 15000
     medium_transcript_threshold: int = 8000
     max_concurrent_batches: int = 3
@@ -169,6 +172,9 @@ class LeMURConfigLoader:
                 max_batch_chars=batch_config.get("max_batch_chars", 3000),
                 max_batch_size=batch_config.get("max_batch_size", 10),
                 min_batch_size=batch_config.get("min_batch_size", 1),
+                max_batch_tokens=batch_config.get("max_batch_tokens", 3000),
+                max_batch_segments=batch_config.get("max_batch_segments", 40),
+                overlap_segments=batch_config.get("overlap_segments", 1),
                 large_transcript_threshold=adaptive_config.get(
                     "large_transcript_threshold", 15000
                 ),
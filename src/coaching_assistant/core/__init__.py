@@ -1,5 +1,5 @@
 """Coaching Assistant Core Module."""
 
-from .processor import format_transcript
+from .processor import format_transcript, stream_transcript
 
-__all__ = ["format_transcript"]
+__all__ = ["format_transcript", "stream_transcript"]
@@ -5,6 +5,7 @@ import os
 
 from celery import Celery, signals
 
+from ..config.celery_schedule import CELERYBEAT_SCHEDULE, CELERYBEAT_SCHEDULER
 from .config import settings
 
 
@@ -37,8 +38,18 @@ def setup_celery_worker_logging():
 
 logger = logging.getLogger(__name__)
 
-# Create Celery app
-celery_app = Celery("coaching_assistant")
+# Create Celery app. Modules with tasks sent by celery beat are listed here
+# so the worker registers them however it is started.
+celery_app = Celery(
+    "coaching_assistant",
+    include=[
+        "coaching_assistant.tasks.transcription_tasks",
+        "coaching_assistant.tasks.admin_report_tasks",
+        "coaching_assistant.tasks.subscription_maintenance_tasks",
+        "coaching_assistant.tasks.analytics_rollup_tasks",
+        "coaching_assistant.tasks.usage_quota_tasks",
+    ],
+)
 
 # Configure Celery
 celery_app.conf.update(
@@ -75,6 +86,9 @@ celery_app.conf.update(
     result_expires=3600,  # 1 hour
     # Error handling
     task_ignore_result=False,
+    # Periodic tasks
+    beat_schedule=CELERYBEAT_SCHEDULE,
+    beat_scheduler=CELERYBEAT_SCHEDULER,
 )
 
 # Auto-discover tasks
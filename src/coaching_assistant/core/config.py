@@ -72,11 +72,22 @@ class Settings(BaseSettings):
 
     # 資料庫設定
     DATABASE_URL: str = ""
+    # Worker threads for sync routes and dependencies. A request holds its
+    # connection from the auth lookup until it responds, and needs another
+    # thread for its route in between. If every thread is waiting on pool
+    # checkout, those requests stall until pool_timeout, which takes a burst
+    # of about this many requests plus pool_size + max_overflow (30), so keep
+    # it well above the pool
+    THREADPOOL_MAX_WORKERS: int = 100
 
     # JWT 認證設定
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    AUTH_USER_CACHE_ENABLED: bool = True  # Cache authenticated user principals
+    AUTH_USER_CACHE_BACKEND: str = "memory"  # "memory" or "redis" (needs REDIS_URL)
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60  # Bounds staleness across processes
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10000  # In-memory backend only
 
     # Google Cloud 設定
     GOOGLE_PROJECT_ID: str = ""
@@ -115,6 +126,12 @@ class Settings(BaseSettings):
     REDIS_URL: str = ""
     CELERY_BROKER_URL: str = ""
     CELERY_RESULT_BACKEND: str = ""
+    # Transcription progress push channel (Redis pub/sub → SSE, needs REDIS_URL)
+    PROGRESS_EVENTS_TTL_SECONDS: int = 3600  # Keep each session's last event
+    PROGRESS_EVENTS_HEARTBEAT_SECONDS: int = 15  # SSE keep-alive interval
+    # Monthly minute counters for upload/transcription admission checks
+    USAGE_QUOTA_BACKEND: str = "memory"  # "memory" or "redis" (needs REDIS_URL)
+    USAGE_QUOTA_MEMORY_TTL_SECONDS: int = 60  # Bounds staleness across processes
 
     # 監控設定
     SENTRY_DSN: str = ""
@@ -124,12 +141,24 @@ class Settings(BaseSettings):
     SPEECH_API_VERSION: str = "v2"  # Google Speech-to-Text API version
     GOOGLE_STT_MODEL: str = "chirp_2"  # Default model (chirp supports more languages)
     GOOGLE_STT_LOCATION: str = "asia-southeast1"  # Default location for STT
+    # Submit batchRecognize jobs and let the beat sweeper track them instead of
+    # a worker waiting on each one (requires celery beat)
+    GOOGLE_STT_ASYNC_BATCH: bool = False
+    GOOGLE_STT_SWEEP_INTERVAL_SECONDS: int = 30
+    GOOGLE_STT_SWEEP_BATCH_SIZE: int = 200  # Operations checked per sweep
+    GOOGLE_STT_MAX_WAIT_SECONDS: int = 7200  # Fail operations unfinished after this
 
     # AssemblyAI 設定
     ASSEMBLYAI_API_KEY: str = ""
     ASSEMBLYAI_MODEL: str = "best"  # "best" or "nano"
     ASSEMBLYAI_SPEAKERS_EXPECTED: int = 2  # Number of speakers expected for diarization
-    ASSEMBLYAI_WEBHOOK_URL: str = ""  # Optional webhook URL for notifications
+    ASSEMBLYAI_BASE_URL: str = "https://api.assemblyai.com/v2"
+    # Public URL of /api/webhooks/assemblyai; when set, jobs are submitted with a
+    # webhook and no worker waits on them
+    ASSEMBLYAI_WEBHOOK_URL: str = ""
+    ASSEMBLYAI_WEBHOOK_SECRET: str = ""  # Sent back by AssemblyAI in a header
+    ASSEMBLYAI_RECHECK_SECONDS: int = 900  # Fallback poll in case a webhook is lost
+    ASSEMBLYAI_MAX_WAIT_SECONDS: int = 7200  # Fail jobs still unfinished after this
 
     # LeMUR (Large Language Model) 設定
     LEMUR_MODEL: str = "claude_sonnet_4_20250514"  # Claude 4 Sonnet as default
@@ -137,6 +166,16 @@ class Settings(BaseSettings):
     LEMUR_MAX_OUTPUT_SIZE: int = 4000  # Maximum output size for LeMUR responses
     LEMUR_COMBINED_MODE: bool = True  # Enable combined speaker + punctuation processing
     LEMUR_PROMPTS_PATH: str = ""  # Custom path to prompts YAML file (optional)
+    LEMUR_CACHE_ENABLED: bool = True  # Reuse responses for unchanged LeMUR requests
+    LEMUR_CACHE_BACKEND: str = "sqlite"  # "sqlite" or "redis" (requires REDIS_URL)
+    LEMUR_CACHE_PATH: str = ""  # SQLite file path (defaults to the temp directory)
+    LEMUR_CACHE_TTL_SECONDS: int = 7 * 24 * 3600  # 7 days
+    LEMUR_CACHE_MAX_ENTRIES: int = 5000
+    LEMUR_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # SQLite backend only
+    LEMUR_MAX_CONCURRENCY: int = 6  # Process-wide cap on in-flight LeMUR requests
+    LEMUR_MIN_CONCURRENCY: int = 1  # Floor for adaptive backoff on 429/5xx
+    LEMUR_MAX_RETRIES: int = 2  # Retries for throttled LeMUR requests
+    LEMUR_BACKOFF_SECONDS: float = 2.0  # Base delay, doubled on each retry
 
     # Language-specific STT configurations (JSON format)
     # Example: {"zh-TW": {"location": "asia-southeast1", "model": "latest_long"}}
@@ -3,25 +3,79 @@ Core processing logic for handling transcript files.
 """
 
 import logging
-from typing import Optional, Union
+from typing import Iterable, Iterator, Optional, Union
 
-from ..exporters.excel import generate_excel
+from ..cue_table import CueTable
+from ..exporters.excel import generate_excel, iter_excel
 from ..exporters.markdown import generate_markdown
 from ..parser import (
+    TranscriptSource,
     UnrecognizedFormatError,
     VTTFormat,
-    consolidate_speakers,
-    parse_vtt,
-    replace_names,
+    iter_chunks,
+    parse_vtt_table,
 )
 from ..utils.chinese_converter import convert_to_traditional
 from ..utils.s3_uploader import upload_snippet_to_s3
 
 logger = logging.getLogger(__name__)
 
+# Bytes kept from the start of the upload for unrecognized-format review
+SNIPPET_SIZE = 1024
+
+
+def _record_head(
+    source: TranscriptSource, head: bytearray
+) -> Iterable[Union[str, bytes]]:
+    """Pass chunks through while keeping the first SNIPPET_SIZE bytes."""
+    for chunk in iter_chunks(source):
+        if len(head) < SNIPPET_SIZE:
+            data = chunk.encode("utf-8") if isinstance(chunk, str) else bytes(chunk)
+            head.extend(data[: SNIPPET_SIZE - len(head)])
+        yield chunk
+
+
+def _build_cue_table(
+    file_content: TranscriptSource,
+    original_filename: str,
+    coach_name: Optional[str],
+    client_name: Optional[str],
+    convert_to_traditional_chinese: bool,
+    format_type: Optional[VTTFormat],
+) -> CueTable:
+    """Parse, consolidate and post-process a transcript into a CueTable."""
+    head = bytearray()
+    try:
+        # Parse the VTT content as a stream into a compact cue table;
+        # decoding errors surface as UnrecognizedFormatError
+        parsed_table = parse_vtt_table(_record_head(file_content, head), format_type)
+        logger.debug(f"Successfully parsed {len(parsed_table)} entries")
+    except UnrecognizedFormatError as e:
+        logger.warning(f"Unrecognized format for file '{original_filename}': {e}")
+        # Upload a snippet of the file for review
+        upload_snippet_to_s3(bytes(head), original_filename)
+        # Re-raise the exception to be handled by the API layer
+        raise
+
+    # Consolidate consecutive speeches from the same speaker
+    processed_data = parsed_table.consolidate()
+    logger.debug(f"Consolidated to {len(processed_data)} entries")
+
+    # Replace names with roles if coach and client names are provided
+    if coach_name and client_name:
+        logger.debug(f"Replacing names - Coach: {coach_name}, Client: {client_name}")
+        processed_data.rename_speakers({coach_name: "Coach", client_name: "Client"})
+
+    # Convert to Traditional Chinese if requested
+    if convert_to_traditional_chinese:
+        logger.info("Converting content to Traditional Chinese")
+        processed_data = convert_to_traditional(processed_data)
+
+    return processed_data
+
 
 def format_transcript(
-    file_content: bytes,  # Changed from str to bytes
+    file_content: TranscriptSource,
     original_filename: str,
     output_format: str = "markdown",
     coach_name: Optional[str] = None,
@@ -33,7 +87,8 @@ def format_transcript(
     Processes the content of a transcript file and returns the formatted output.
 
     Args:
-        file_content: The string content of the input VTT file.
+        file_content: The VTT content as bytes, a binary file-like object or an
+            iterator of byte chunks. It is decoded and parsed as a stream.
         output_format: Output format ('markdown' or 'excel').
         coach_name: Name of the coach in the transcript.
         client_name: Name of the client in the transcript.
@@ -44,34 +99,14 @@ def format_transcript(
         The formatted transcript as a string (for Markdown) or bytes (for Excel).
     """
     try:
-        # Decode file content to string for parsing
-        try:
-            content_str = file_content.decode("utf-8")
-        except UnicodeDecodeError:
-            # If decoding fails, it's likely not a valid text file.
-            raise UnrecognizedFormatError("File is not valid UTF-8 text.")
-
-        # Parse the VTT content
-        parsed_data = parse_vtt(content_str, format_type)
-        logger.debug(f"Successfully parsed {len(parsed_data)} entries")
-
-        # Consolidate consecutive speeches from the same speaker
-        consolidated_data = consolidate_speakers(parsed_data)
-        logger.debug(f"Consolidated to {len(consolidated_data)} entries")
-
-        # Replace names with roles if coach and client names are provided
-        if coach_name and client_name:
-            logger.debug(
-                f"Replacing names - Coach: {coach_name}, Client: {client_name}"
-            )
-            processed_data = replace_names(consolidated_data, coach_name, client_name)
-        else:
-            processed_data = consolidated_data
-
-        # Convert to Traditional Chinese if requested
-        if convert_to_traditional_chinese:
-            logger.info("Converting content to Traditional Chinese")
-            processed_data = convert_to_traditional(processed_data)
+        processed_data = _build_cue_table(
+            file_content,
+            original_filename,
+            coach_name,
+            client_name,
+            convert_to_traditional_chinese,
+            format_type,
+        )
 
         # Generate output in the specified format
         logger.info(f"Generating {output_format} output")
@@ -85,14 +120,44 @@ def format_transcript(
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
 
-    except UnrecognizedFormatError as e:
-        logger.warning(f"Unrecognized format for file '{original_filename}': {e}")
-        # Upload a snippet of the file for review
-        upload_snippet_to_s3(file_content, original_filename)
-        # Re-raise the exception to be handled by the API layer
+    except UnrecognizedFormatError:
         raise
 
     except Exception as e:
         logger.error(f"Error processing transcript content: {str(e)}")
         logger.exception("Detailed error:")
         raise
+
+
+def stream_transcript(
+    file_content: TranscriptSource,
+    original_filename: str,
+    output_format: str = "markdown",
+    coach_name: Optional[str] = None,
+    client_name: Optional[str] = None,
+    convert_to_traditional_chinese: bool = False,
+    format_type: Optional[VTTFormat] = None,
+) -> Iterator[bytes]:
+    """
+    Process a transcript and return an iterator of encoded output chunks.
+
+    Takes the same arguments as format_transcript. Parsing happens before this
+    function returns, so format errors are raised to the caller instead of
+    surfacing half-way through a streamed response.
+    """
+    if output_format.lower() not in ("markdown", "excel"):
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+    processed_data = _build_cue_table(
+        file_content,
+        original_filename,
+        coach_name,
+        client_name,
+        convert_to_traditional_chinese,
+        format_type,
+    )
+
+    logger.info(f"Streaming {output_format} output")
+    if output_format.lower() == "excel":
+        return iter_excel(processed_data)
+    return iter([generate_markdown(processed_data).encode("utf-8")])
@@ -0,0 +1,87 @@
+"""Keyset (cursor) pagination primitives shared by repository ports.
+
+A cursor records the sort values of the last row of a page, so the next page
+is read with ``WHERE (sort key, id) > (last sort key, last id)`` instead of
+``OFFSET``. Deep pages then cost the same as the first one, and rows inserted
+or deleted while a client pages through a list never cause duplicates or gaps.
+
+Cursors are opaque to API clients: URL-safe base64 of a small JSON document
+holding the sort parameter and the last row's key values. Repositories pass
+the column types back in when decoding, so tampered or stale cursors are
+rejected with InvalidCursorError instead of reaching the database.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+# Parses one JSON-encoded key value back into its column type
+KeyParser = Callable[[Any], Any]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded for a list query."""
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """One page of a keyset-paginated list."""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """Build an opaque cursor from a sort parameter and a row's key values."""
+    payload = json.dumps(
+        {"s": sort, "k": [_encode_value(value) for value in values]},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, parsers: Sequence[KeyParser]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous page.
+        sort: Sort parameter of the current request; a cursor issued for a
+            different sort order is rejected.
+        parsers: One parser per key column, e.g. date.fromisoformat or UUID.
+
+    Returns:
+        The key values, converted by their parsers.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match the
+            requested sort order.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = payload["k"]
+        if payload["s"] != sort or len(values) != len(parsers):
+            raise InvalidCursorError("Cursor does not match the requested sort order")
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, Iterator, List, Optional, Protocol
 from uuid import UUID
 
 from ..models.client import Client
@@ -32,6 +32,7 @@ from ..models.usage_log import UsageLog
 
 # Domain types - using pure domain models only (Clean Architecture compliant)
 from ..models.user import User, UserPlan
+from .pagination import CursorPage
 
 
 class UserRepoPort(Protocol):
@@ -83,6 +84,16 @@ class SessionRepoPort(Protocol):
         """Get sessions by user ID with optional filtering."""
         ...
 
+    def get_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[SessionStatus] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> CursorPage[Session]:
+        """Get a keyset-paginated page of a user's sessions, newest first."""
+        ...
+
     def save(self, session: Session) -> Session:
         """Save or update session entity."""
         ...
@@ -279,6 +290,17 @@ class ClientRepoPort(Protocol):
         """Search clients by name or email for a coach."""
         ...
 
+    def get_clients_cursor_page(
+        self,
+        coach_id: UUID,
+        query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+    ) -> CursorPage[Client]:
+        """Get a keyset-paginated page of a coach's clients ordered by name."""
+        ...
+
 
 class CoachingSessionRepoPort(Protocol):
     """Repository interface for CoachingSession entity operations."""
@@ -333,6 +355,36 @@ class CoachingSessionRepoPort(Protocol):
         """Get paginated coaching sessions with filtering and sorting."""
         ...
 
+    def get_paginated_with_summaries(
+        self,
+        coach_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        client_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+        sort: str = "-session_date",
+        page: int = 1,
+        page_size: int = 20,
+        include_total: bool = True,
+    ) -> tuple[List[Dict[str, Any]], Optional[int]]:
+        """Get a page of sessions with client and transcription summaries."""
+        ...
+
+    def get_cursor_page_with_summaries(
+        self,
+        coach_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        client_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+        sort: str = "-session_date",
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+    ) -> CursorPage[Dict[str, Any]]:
+        """Get a keyset-paginated page of sessions with their summaries."""
+        ...
+
     def get_last_session_by_client(
         self, coach_id: UUID, client_id: UUID
     ) -> Optional[CoachingSession]:
@@ -402,6 +454,12 @@ class TranscriptRepoPort(Protocol):
         """Get all transcript segments for a session."""
         ...
 
+    def iter_by_session_id(
+        self, session_id: UUID, chunk_size: int = 500
+    ) -> Iterator[List[TranscriptSegment]]:
+        """Yield a session's segments in start-time order, one chunk at a time."""
+        ...
+
     def save_segments(
         self, segments: List[TranscriptSegment]
     ) -> List[TranscriptSegment]:
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from ..models.client import Client
+from ..repositories.pagination import CursorPage
 from ..repositories.ports import ClientRepoPort, UserRepoPort
 
 
@@ -67,6 +68,38 @@ class ClientRetrievalUseCase:
         total_pages = (total + page_size - 1) // page_size
         return clients, total, total_pages
 
+    def list_clients_by_cursor(
+        self,
+        coach_id: UUID,
+        query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+    ) -> CursorPage[Client]:
+        """List clients for a coach with keyset pagination and optional search.
+
+        Args:
+            coach_id: UUID of the coach
+            query: Optional search term for name or email
+            cursor: Cursor from the previous page, or None for the first page
+            page_size: Number of clients per page
+            include_total: Whether to compute the total count
+
+        Returns:
+            CursorPage of clients with the next page's cursor
+
+        Raises:
+            ValueError: If the coach does not exist or the cursor is invalid
+        """
+        # Verify coach exists
+        coach = self.user_repo.get_by_id(coach_id)
+        if not coach:
+            raise ValueError(f"Coach with ID {coach_id} not found")
+
+        return self.client_repo.get_clients_cursor_page(
+            coach_id, query, cursor, page_size, include_total
+        )
+
     def get_client_statistics(self, coach_id: UUID) -> Dict[str, List[Dict[str, Any]]]:
         """Get client statistics for charts and analytics.
 
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from ..models.coaching_session import CoachingSession, SessionSource
+from ..repositories.pagination import CursorPage
 from ..repositories.ports import (
     ClientRepoPort,
     CoachingSessionRepoPort,
@@ -231,7 +232,13 @@ class CoachingSessionRetrievalUseCase:
         Returns:
             Tuple of (sessions_with_data, total_count, total_pages)
         """
-        sessions, total, total_pages = self.list_sessions_paginated(
+        # Verify coach exists
+        coach = self.user_repo.get_by_id(coach_id)
+        if not coach:
+            raise ValueError(f"Coach with ID {coach_id} not found")
+
+        # Sessions, client and transcription summaries come back in one query
+        sessions_with_data, total = self.session_repo.get_paginated_with_summaries(
             coach_id,
             from_date,
             to_date,
@@ -242,27 +249,56 @@ class CoachingSessionRetrievalUseCase:
             page_size,
         )
 
-        sessions_with_data = []
-        for session in sessions:
-            # Get client data
-            client_summary = self.get_client_summary(session.client_id)
+        total_pages = (total + page_size - 1) // page_size
+        return sessions_with_data, total, total_pages
 
-            # Get transcription session data
-            transcription_session_summary = None
-            if session.transcription_session_id:
-                transcription_session_summary = self.get_transcription_session_summary(
-                    session.transcription_session_id
-                )
+    def get_sessions_page_with_response_data(
+        self,
+        coach_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        client_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+        sort: str = "-session_date",
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+    ) -> CursorPage[Dict[str, Any]]:
+        """Get a keyset-paginated page of sessions with response data.
 
-            sessions_with_data.append(
-                {
-                    "session": session,
-                    "client_summary": client_summary,
-                    "transcription_session_summary": (transcription_session_summary),
-                }
-            )
+        Args:
+            coach_id: UUID of the coach
+            from_date: Start date for filtering sessions
+            to_date: End date for filtering sessions
+            client_id: Optional client ID filter
+            currency: Optional currency filter
+            sort: Sort field and direction
+            cursor: Cursor from the previous page, or None for the first page
+            page_size: Number of items per page
+            include_total: Whether to compute the total count
 
-        return sessions_with_data, total, total_pages
+        Returns:
+            CursorPage of session dicts with the next page's cursor
+
+        Raises:
+            ValueError: If the coach does not exist or the cursor is invalid
+        """
+        # Verify coach exists
+        coach = self.user_repo.get_by_id(coach_id)
+        if not coach:
+            raise ValueError(f"Coach with ID {coach_id} not found")
+
+        return self.session_repo.get_cursor_page_with_summaries(
+            coach_id,
+            from_date,
+            to_date,
+            client_id,
+            currency,
+            sort,
+            cursor,
+            page_size,
+            include_total,
+        )
 
 
 class CoachingSessionCreationUseCase:
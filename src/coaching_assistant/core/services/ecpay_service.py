@@ -17,6 +17,7 @@ from ...models.ecpay_subscription import (
 from ...models.ecpay_subscription import (
     SubscriptionPayment as SubscriptionPaymentORM,
 )
+from ...services.user_principal_cache import invalidate_user_principal
 from ..config import Settings
 from ..models.subscription import (
     ECPayAuthStatus,
@@ -296,6 +297,7 @@ class ECPaySubscriptionService:
                         "ENTERPRISE": UserPlan.ENTERPRISE,
                     }
                     user.plan = plan_mapping.get(subscription.plan_id, UserPlan.FREE)
+                    invalidate_user_principal(user.id, self.db)
 
                 self.db.commit()
 
@@ -599,6 +601,7 @@ class ECPaySubscriptionService:
         if user:
             user.plan = "FREE"
             user.updated_at = datetime.now()
+            invalidate_user_principal(user.id, self.db)
 
         logger.info(
             f"📉 Subscription {subscription.id} downgraded to FREE plan due to payment failures"
@@ -7,19 +7,21 @@ operations. All external dependencies are injected through repository ports.
 from __future__ import annotations
 
 import logging
-import re
 from copy import deepcopy
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
+from itertools import chain
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from ...exceptions import DomainException
+from ...transcript_ingest import ingest_transcript
 from ..config import settings
 from ..models.session import Session, SessionStatus
 from ..models.transcript import TranscriptSegment
 from ..models.usage_log import TranscriptionType, UsageLog
 from ..models.user import User
+from ..repositories.pagination import CursorPage
 from ..repositories.ports import (
     PlanConfigurationRepoPort,
     SessionRepoPort,
@@ -205,6 +207,29 @@ class SessionRetrievalUseCase:
         """
         return self.session_repo.get_by_user_id(user_id, status, limit, offset)
 
+    def get_user_sessions_page(
+        self,
+        user_id: UUID,
+        status: Optional[SessionStatus] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> CursorPage[Session]:
+        """Get a keyset-paginated page of a user's sessions, newest first.
+
+        Args:
+            user_id: User ID
+            status: Optional status filter
+            cursor: Cursor from the previous page, or None for the first page
+            limit: Maximum number of sessions to return
+
+        Returns:
+            CursorPage of session domain models
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid
+        """
+        return self.session_repo.get_page_by_user_id(user_id, status, cursor, limit)
+
     def get_session_with_transcript(
         self, session_id: UUID, user_id: UUID
     ) -> Optional[Dict[str, Any]]:
@@ -877,6 +902,55 @@ class SessionExportUseCase:
             "format": format,
         }
 
+    def stream_transcript(
+        self,
+        session_id: UUID,
+        user_id: UUID,
+        format: str = "json",
+        chunk_size: int = 500,
+    ) -> Dict[str, Any]:
+        """Prepare a chunked transcript export.
+
+        Performs the same validation as export_transcript, but instead of
+        loading every segment it returns an iterator of segment chunks read
+        from the repository with keyset pagination. The first chunk is read
+        eagerly so an empty transcript is reported before streaming starts.
+
+        Returns:
+            Dictionary with session, segment_chunks iterator, and format info
+
+        Raises:
+            ValueError: If session not found or not owned by user
+            DomainException: If transcript not available or format invalid
+        """
+        session = self.session_repo.get_by_id(session_id)
+        if not session or session.user_id != user_id:
+            raise ValueError("Session not found or access denied")
+
+        if session.status != SessionStatus.COMPLETED:
+            raise DomainException(
+                f"Transcript not available. Session status: {session.status.value}"
+            )
+
+        valid_formats = ["json", "vtt", "srt", "txt", "xlsx"]
+        if format not in valid_formats:
+            raise DomainException(
+                f"Invalid format. Supported: {', '.join(valid_formats)}"
+            )
+
+        chunks = self.transcript_repo.iter_by_session_id(
+            session_id, chunk_size=chunk_size
+        )
+        first_chunk = next(chunks, None)
+        if not first_chunk:
+            raise DomainException("No transcript segments found")
+
+        return {
+            "session": session,
+            "segment_chunks": chain([first_chunk], chunks),
+            "format": format,
+        }
+
 
 class SessionStatusRetrievalUseCase:
     """Use case for retrieving detailed session processing status."""
@@ -1134,12 +1208,8 @@ class SessionTranscriptUploadUseCase:
                 "Invalid file format. Only VTT and SRT files are supported."
             )
 
-        # Parse the transcript content
-        segments = []
-        if file_extension == "vtt":
-            segments = self._parse_vtt_content(content)
-        elif file_extension == "srt":
-            segments = self._parse_srt_content(content)
+        # Parse the transcript content; one engine handles both formats
+        segments = [segment.to_dict() for segment in ingest_transcript(content)]
 
         if not segments:
             raise DomainException("No valid transcript segments found in file")
@@ -1208,139 +1278,3 @@ class SessionTranscriptUploadUseCase:
             "segments_count": len(saved_segments),
             "duration_seconds": total_duration,
         }
-
-    def _parse_vtt_content(self, content: str) -> List[Dict[str, Any]]:
-        """Parse VTT file content and return segments."""
-        segments = []
-        lines = content.strip().split("\n")
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip header and empty lines
-            if line == "WEBVTT" or line == "" or line.startswith("NOTE"):
-                i += 1
-                continue
-
-            # Look for timestamp line
-            if "-->" in line:
-                # Parse timestamp
-                timestamp_match = re.match(
-                    r"(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})",
-                    line,
-                )
-                if timestamp_match:
-                    start_time = self._parse_timestamp(timestamp_match.group(1))
-                    end_time = self._parse_timestamp(timestamp_match.group(2))
-
-                    # Get the content (next line)
-                    i += 1
-                    if i < len(lines):
-                        content_line = lines[i].strip()
-
-                        # Extract speaker and content from VTT format like "<v
-                        # Speaker>Content"
-                        speaker_id = 1
-                        content_text = content_line
-
-                        speaker_match = re.match(r"<v\s+([^>]+)>\s*(.*)", content_line)
-                        if speaker_match:
-                            speaker_name = speaker_match.group(1)
-                            content_text = speaker_match.group(2)
-                            # Simple speaker ID assignment based on name
-                            speaker_id = (
-                                2
-                                if "客戶" in speaker_name or "Client" in speaker_name
-                                else 1
-                            )
-
-                        segments.append(
-                            {
-                                "start_seconds": start_time,
-                                "end_seconds": end_time,
-                                "content": content_text,
-                                "speaker_id": speaker_id,
-                            }
-                        )
-
-            i += 1
-
-        return segments
-
-    def _parse_srt_content(self, content: str) -> List[Dict[str, Any]]:
-        """Parse SRT file content and return segments."""
-        segments = []
-
-        # Split by double newline to get individual subtitle blocks
-        blocks = re.split(r"\n\s*\n", content.strip())
-
-        for block in blocks:
-            lines = block.strip().split("\n")
-            if len(lines) < 3:
-                continue
-
-            # Skip sequence number (line 0)
-            # Parse timestamp (line 1)
-            timestamp_line = lines[1].strip()
-            timestamp_match = re.match(
-                r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})",
-                timestamp_line,
-            )
-
-            if timestamp_match:
-                start_time = self._parse_timestamp(
-                    timestamp_match.group(1).replace(",", ".")
-                )
-                end_time = self._parse_timestamp(
-                    timestamp_match.group(2).replace(",", ".")
-                )
-
-                # Content (lines 2+)
-                content_lines = lines[2:]
-                content_text = " ".join(content_lines)
-
-                # Extract speaker info if present
-                speaker_id = 1
-
-                # Look for speaker prefix like "教練: " or "Coach: "
-                speaker_match = re.match(r"(.*?):\s*(.*)", content_text)
-                if speaker_match:
-                    speaker_name = speaker_match.group(1)
-                    content_text = speaker_match.group(2)
-                    speaker_id = (
-                        2 if "客戶" in speaker_name or "Client" in speaker_name else 1
-                    )
-
-                segments.append(
-                    {
-                        "start_seconds": start_time,
-                        "end_seconds": end_time,
-                        "content": content_text,
-                        "speaker_id": speaker_id,
-                    }
-                )
-
-        return segments
-
-    def _parse_timestamp(self, timestamp_str: str) -> float:
-        """Convert timestamp string to seconds."""
-        # Handle format: HH:MM:SS.mmm
-        time_parts = timestamp_str.split(":")
-        if len(time_parts) != 3:
-            raise ValueError(f"Invalid timestamp format: {timestamp_str}")
-
-        hours = int(time_parts[0])
-        minutes = int(time_parts[1])
-        seconds_str = time_parts[2]
-
-        # Handle seconds with milliseconds
-        if "." in seconds_str:
-            seconds, milliseconds = seconds_str.split(".")
-            total_seconds = (
-                hours * 3600 + minutes * 60 + int(seconds) + int(milliseconds) / 1000
-            )
-        else:
-            total_seconds = hours * 3600 + minutes * 60 + int(seconds_str)
-
-        return total_seconds
@@ -5,11 +5,11 @@ creating transcription sessions, and linking them to coaching sessions.
 """
 
 import logging
-import re
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
+from ...transcript_ingest import ingest_transcript
 from ..models.session import Session as TranscriptionSession
 from ..models.session import SessionStatus
 from ..models.transcript import SpeakerRole, TranscriptSegment
@@ -52,217 +52,29 @@ class TranscriptParsingService:
         self, content: str, speaker_role_mapping: Dict[str, str] = None
     ) -> List[ParsedSegment]:
         """Parse VTT file content and return segments."""
-        segments = []
-        lines = content.strip().split("\n")
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip header and empty lines
-            if line == "WEBVTT" or line == "" or line.startswith("NOTE"):
-                i += 1
-                continue
-
-            # Look for timestamp line
-            if "-->" in line:
-                timestamp_match = self._parse_timestamp_line(line)
-                if timestamp_match:
-                    start_time, end_time = timestamp_match
-
-                    # Get the content (next line)
-                    i += 1
-                    if i < len(lines):
-                        content_line = lines[i].strip()
-                        parsed_segment = self._parse_content_line(
-                            content_line,
-                            start_time,
-                            end_time,
-                            speaker_role_mapping,
-                        )
-                        if parsed_segment:
-                            segments.append(parsed_segment)
-                            logger.debug(
-                                f"Parsed VTT segment: {start_time:.2f}-{end_time:.2f}s, "
-                                f"speaker_id: {parsed_segment.speaker_id}, content: {parsed_segment.content[:50]}..."
-                            )
-            i += 1
-
-        return segments
+        return self._parse(content, speaker_role_mapping)
 
     def parse_srt_content(
         self, content: str, speaker_role_mapping: Dict[str, str] = None
     ) -> List[ParsedSegment]:
         """Parse SRT file content and return segments."""
-        segments = []
-
-        # Split by double newline to get individual subtitle blocks
-        blocks = re.split(r"\n\s*\n", content.strip())
-
-        for block in blocks:
-            lines = block.strip().split("\n")
-            if len(lines) < 3:
-                continue
-
-            # Parse timestamp (line 1)
-            timestamp_line = lines[1].strip()
-            timestamp_match = self._parse_timestamp_line(timestamp_line)
-
-            if timestamp_match:
-                start_time, end_time = timestamp_match
-
-                # Content (lines 2+)
-                content_lines = lines[2:]
-                content_text = " ".join(content_lines).strip()
-
-                parsed_segment = self._parse_content_line(
-                    content_text, start_time, end_time, speaker_role_mapping
-                )
-                if parsed_segment:
-                    segments.append(parsed_segment)
-                    logger.debug(
-                        f"Parsed SRT segment: {start_time:.2f}-{end_time:.2f}s, "
-                        f"speaker_id: {parsed_segment.speaker_id}, content: {parsed_segment.content[:50]}..."
-                    )
-
-        return segments
-
-    def _parse_timestamp_line(self, line: str) -> Optional[tuple[float, float]]:
-        """Parse timestamp line and return start/end times in seconds."""
-        timestamp_patterns = [
-            # HH:MM:SS.mmm
-            r"(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})",
-            # HH:MM:SS,mmm (SRT format)
-            r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})",
-            # H:MM:SS.mmm
-            r"(\d{1,2}:\d{2}:\d{2}\.\d{3}) --> (\d{1,2}:\d{2}:\d{2}\.\d{3})",
-            # H:MM:SS (no milliseconds)
-            r"(\d{1,2}:\d{2}:\d{2}) --> (\d{1,2}:\d{2}:\d{2})",
-        ]
+        return self._parse(content, speaker_role_mapping)
 
-        for pattern in timestamp_patterns:
-            timestamp_match = re.match(pattern, line)
-            if timestamp_match:
-                try:
-                    start_time = self._parse_timestamp(
-                        timestamp_match.group(1).replace(",", ".")
-                    )
-                    end_time = self._parse_timestamp(
-                        timestamp_match.group(2).replace(",", ".")
-                    )
-                    return start_time, end_time
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Failed to parse timestamp: {line}, error: {e}")
-                    break
-
-        return None
-
-    def _parse_content_line(
-        self,
-        content_line: str,
-        start_time: float,
-        end_time: float,
-        speaker_role_mapping: Dict[str, str] = None,
-    ) -> Optional[ParsedSegment]:
-        """Parse content line and extract speaker info."""
-        speaker_id = 1
-        content_text = content_line
-        speaker_key = None
-        speaker_name = None
-
-        # Format 1: VTT format like "<v jolly shih>content</v>" or "<v
-        # Speaker>content</v>"
-        speaker_match = re.match(r"<v\s+([^>]+)>\s*(.*?)(?:</v>)?$", content_line)
-        if speaker_match:
-            speaker_name = speaker_match.group(1).strip()
-            content_text = speaker_match.group(2)
-            # Create speaker key matching frontend format
-            normalized_name = re.sub(
-                r"[^\w_]", "", speaker_name.lower().replace(" ", "_")
-            )
-            speaker_key = f"speaker_{normalized_name}"
-
-        # Format 2: Simple prefix format like "Coach: content" or "Client:
-        # content"
-        elif ":" in content_line:
-            prefix_match = re.match(r"^([^:]+):\s*(.+)$", content_line)
-            if prefix_match:
-                speaker_name = prefix_match.group(1).strip()
-                content_text = prefix_match.group(2).strip()
-                normalized_name = re.sub(
-                    r"[^\w_]", "", speaker_name.lower().replace(" ", "_")
-                )
-                speaker_key = f"speaker_{normalized_name}"
-
-        # Apply role mapping if provided
-        final_speaker_id = speaker_id
-        final_speaker_role = "coach"  # default
-
-        if speaker_role_mapping and speaker_key:
-            final_speaker_role = speaker_role_mapping.get(speaker_key, "coach")
-            final_speaker_id = 1 if final_speaker_role == "coach" else 2
-            logger.info(
-                f"Applied role mapping: {speaker_key} -> {final_speaker_role} "
-                f"(speaker_id: {final_speaker_id})"
-            )
-        elif speaker_name:
-            # Fallback to name-based assignment when no role mapping is
-            # provided
-            if any(
-                keyword in speaker_name.lower()
-                for keyword in ["client", "客戶", "學員"]
-            ):
-                final_speaker_id = 2
-                final_speaker_role = "client"
-            elif any(
-                keyword in speaker_name.lower() for keyword in ["coach", "教練", "老師"]
-            ):
-                final_speaker_id = 1
-                final_speaker_role = "coach"
-            else:
-                final_speaker_id = 1  # Default to coach if unclear
-                final_speaker_role = "coach"
-
-            logger.info(
-                f"Name-based assignment: {speaker_name} -> {final_speaker_role} (speaker_id: {final_speaker_id})"
+    def _parse(
+        self, content: str, speaker_role_mapping: Optional[Dict[str, str]]
+    ) -> List[ParsedSegment]:
+        """Parse either format with the shared ingest engine."""
+        return [
+            ParsedSegment(
+                start_seconds=segment.start_seconds,
+                end_seconds=segment.end_seconds,
+                content=segment.content,
+                speaker_id=segment.speaker_id,
+                speaker_role=segment.speaker_role,
+                speaker_name=segment.speaker_name,
             )
-
-        return ParsedSegment(
-            start_seconds=start_time,
-            end_seconds=end_time,
-            content=content_text,
-            speaker_id=final_speaker_id,
-            speaker_role=final_speaker_role,
-            speaker_name=speaker_name,
-        )
-
-    def _parse_timestamp(self, timestamp_str: str) -> float:
-        """Convert timestamp string to seconds."""
-        time_parts = timestamp_str.split(":")
-        if len(time_parts) != 3:
-            raise ValueError(f"Invalid timestamp format: {timestamp_str}")
-
-        try:
-            hours = int(time_parts[0])
-            minutes = int(time_parts[1])
-            seconds_str = time_parts[2]
-
-            # Handle seconds with milliseconds
-            if "." in seconds_str:
-                seconds_part, milliseconds_part = seconds_str.split(".")
-                seconds = int(seconds_part)
-                # Pad or truncate milliseconds to 3 digits
-                milliseconds_part = milliseconds_part.ljust(3, "0")[:3]
-                milliseconds = int(milliseconds_part)
-                total_seconds = (
-                    hours * 3600 + minutes * 60 + seconds + milliseconds / 1000
-                )
-            else:
-                total_seconds = hours * 3600 + minutes * 60 + int(seconds_str)
-
-            return total_seconds
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Failed to parse timestamp '{timestamp_str}': {e}")
+            for segment in ingest_transcript(content, speaker_role_mapping)
+        ]
 
 
 class TranscriptUploadUseCase:
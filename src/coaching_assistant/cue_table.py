@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Compact columnar representation of transcript cues.
+
+A CueTable keeps cues in parallel arrays instead of one dictionary per cue:
+start times as integer milliseconds, speakers as indices into an interned name
+list, and the cue text. The parser, the Chinese converter and both exporters
+share this container, so the format pipeline never builds per-cue dicts.
+"""
+
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+)
+
+CueRow = Tuple[str, str, str]
+
+
+def parse_timestamp_ms(timestamp: str) -> int:
+    """Convert an 'HH:MM:SS.mmm' (or 'HH:MM:SS,mmm') timestamp to milliseconds."""
+    hms, _, millis = timestamp.replace(",", ".").partition(".")
+    hours, minutes, seconds = hms.split(":")
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(
+        millis or 0
+    )
+
+
+def format_timestamp_ms(ms: int) -> str:
+    """Convert milliseconds to an 'HH:MM:SS.mmm' timestamp."""
+    seconds, millis = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+
+
+class CueTable:
+    """Array-backed table of (start, speaker, content) cues."""
+
+    __slots__ = ("start_ms", "speaker_ids", "contents", "speakers", "_speaker_index")
+
+    def __init__(self) -> None:
+        self.start_ms = array("q")
+        self.speaker_ids = array("I")
+        self.contents: List[str] = []
+        self.speakers: List[str] = []
+        self._speaker_index: Dict[str, int] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[str, str, str]]) -> "CueTable":
+        """Build a table from (time, speaker, content) tuples."""
+        table = cls()
+        for time, speaker, content in records:
+            table.append(parse_timestamp_ms(time), speaker, content)
+        return table
+
+    @classmethod
+    def from_dicts(cls, data: Iterable[Dict[str, Any]]) -> "CueTable":
+        """Build a table from {'time', 'speaker', 'content'} dictionaries."""
+        return cls.from_records(
+            (item["time"], item["speaker"], item["content"]) for item in data
+        )
+
+    def intern_speaker(self, speaker: str) -> int:
+        """Return the id for a speaker name, adding it if it is new."""
+        speaker_id = self._speaker_index.get(speaker)
+        if speaker_id is None:
+            speaker_id = len(self.speakers)
+            self.speakers.append(speaker)
+            self._speaker_index[speaker] = speaker_id
+        return speaker_id
+
+    def append(self, start_ms: int, speaker: str, content: str) -> None:
+        self.start_ms.append(start_ms)
+        self.speaker_ids.append(self.intern_speaker(speaker))
+        self.contents.append(content)
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def speaker_at(self, index: int) -> str:
+        return self.speakers[self.speaker_ids[index]]
+
+    def iter_rows(self) -> Iterator[CueRow]:
+        """Yield (time, speaker, content) tuples with formatted timestamps."""
+        speakers = self.speakers
+        for start, speaker_id, content in zip(
+            self.start_ms, self.speaker_ids, self.contents
+        ):
+            yield format_timestamp_ms(start), speakers[speaker_id], content
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize the table as the legacy list of cue dictionaries."""
+        return [
+            {"time": time, "speaker": speaker, "content": content}
+            for time, speaker, content in self.iter_rows()
+        ]
+
+    def consolidate(self) -> "CueTable":
+        """
+        Merge consecutive cues from the same speaker.
+
+        Runs are found with a single pass over the speaker id array; each run's
+        text is joined once.
+        """
+        result = CueTable()
+        result.speakers = list(self.speakers)
+        result._speaker_index = dict(self._speaker_index)
+
+        ids = self.speaker_ids
+        count = len(ids)
+        run_start = 0
+        while run_start < count:
+            run_end = run_start + 1
+            speaker_id = ids[run_start]
+            while run_end < count and ids[run_end] == speaker_id:
+                run_end += 1
+            result.start_ms.append(self.start_ms[run_start])
+            result.speaker_ids.append(speaker_id)
+            if run_end - run_start == 1:
+                result.contents.append(self.contents[run_start])
+            else:
+                result.contents.append(" ".join(self.contents[run_start:run_end]))
+            run_start = run_end
+        return result
+
+    def rename_speakers(self, mapping: Mapping[str, str]) -> "CueTable":
+        """
+        Rename speakers in place.
+
+        Only the interned name list is rewritten; speaker ids are remapped only
+        when two names collapse into one.
+        """
+        renamed = [mapping.get(name, name) for name in self.speakers]
+        index: Dict[str, int] = {}
+        remap = array("I")
+        speakers: List[str] = []
+        for name in renamed:
+            if name not in index:
+                index[name] = len(speakers)
+                speakers.append(name)
+            remap.append(index[name])
+
+        if len(speakers) != len(renamed):
+            self.speaker_ids = array(
+                "I", (remap[speaker_id] for speaker_id in self.speaker_ids)
+            )
+        self.speakers = speakers
+        self._speaker_index = index
+        return self
+
+    def map_text(self, convert: Callable[[str], str]) -> "CueTable":
+        """Apply a text conversion to every speaker name and cue content in place."""
+        self.contents = [convert(content) for content in self.contents]
+        return self.rename_speakers({name: convert(name) for name in self.speakers})
+
+
+def iter_rows(data: Union[CueTable, Iterable[Dict[str, Any]]]) -> Iterator[CueRow]:
+    """Yield (time, speaker, content) rows from a CueTable or cue dictionaries."""
+    if isinstance(data, CueTable):
+        return data.iter_rows()
+    return ((item["time"], item["speaker"], item["content"]) for item in data)
@@ -1,51 +1,179 @@
 #!/usr/bin/env python3
 """
 Module for exporting transcript data to Excel format.
+
+The workbook is produced with openpyxl's write-only worksheet: rows are
+serialized as they are appended, every cell references one of three shared
+named styles, and column widths are computed from string lengths before the
+first row is written. Row heights are derived while the rows are emitted, so
+the data is walked exactly once after the width pass.
 """
 
 import io
-from typing import Any, Dict, List
+import tempfile
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Sequence, Union
 
 from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
 
+from ..cue_table import CueRow, CueTable, iter_rows
 
-def calculate_column_widths(worksheet) -> None:
-    """
-    Calculate and set optimal column widths based on content.
+HEADERS = ["時間", "角色", "內容"]
+COACH_LABELS = ("Coach", "教練")
 
-    Args:
-        worksheet: The worksheet to adjust column widths for
+MIN_COLUMN_WIDTH = 8
+MAX_COLUMN_WIDTH = 50
+HEADER_ROW_HEIGHT = 30
+
+# Size of the chunks yielded by iter_excel
+EXCEL_CHUNK_SIZE = 64 * 1024
+# In-memory threshold before the rendered workbook spills to a temp file
+EXCEL_SPOOL_SIZE = 8 * 1024 * 1024
+
+_COLUMN_LETTERS = ("A", "B", "C")
+
+
+def calculate_column_widths(rows: Iterable[CueRow]) -> List[float]:
     """
-    # Set minimum and maximum column widths
-    min_width = 8
-    max_width = 50
+    Calculate optimal column widths based on content length.
 
-    # Iterate through all columns
-    for column in worksheet.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
+    Args:
+        rows: The (time, speaker, content) rows that will be written
 
-        # Find the maximum length of content in the column
-        for cell in column:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
+    Returns:
+        One width per column, padded and clamped to the min/max width.
+    """
+    max_lengths = [len(header) for header in HEADERS]
+    for row in rows:
+        for col_idx, value in enumerate(row):
+            if value:
+                length = len(str(value))
+                if length > max_lengths[col_idx]:
+                    max_lengths[col_idx] = length
+
+    widths = []
+    for max_length in max_lengths:
+        # Add some padding and a little extra
+        adjusted_width = (max_length + 2) * 1.1
+        widths.append(min(max(adjusted_width, MIN_COLUMN_WIDTH), MAX_COLUMN_WIDTH))
+    return widths
+
+
+def _row_height(row: CueRow, widths: Sequence[float]) -> float:
+    """Estimate a row's height from its content length and the column widths."""
+    max_lines = 1
+    for value, col_width in zip(row, widths):
+        if value and col_width > 0:
+            # Rough estimate: ~10 characters per inch, 1 line per 2 inches
+            estimated_lines = max(1, int((len(str(value)) / (col_width * 1.5)) + 0.5))
+            max_lines = max(max_lines, estimated_lines)
+
+    # 15 points per line, minimum 30 points, maximum 300 points
+    return min(max(30, max_lines * 15), 300)
+
+
+def _register_styles(
+    wb: Workbook, font_size: int, coach_color: str, client_color: str
+) -> None:
+    """Register the shared named styles used by every cell."""
+    header = NamedStyle(name="transcript_header")
+    header.font = Font(bold=True, size=font_size + 2, color="FFFFFF")
+    header.fill = PatternFill(
+        start_color="4F81BD", end_color="4F81BD", fill_type="solid"
+    )
+    header.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    wb.add_named_style(header)
+
+    for name, color in (
+        ("transcript_coach", coach_color),
+        ("transcript_client", client_color),
+    ):
+        style = NamedStyle(name=name)
+        style.font = Font(size=font_size)
+        style.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+        style.alignment = Alignment(wrap_text=True, vertical="top")
+        wb.add_named_style(style)
+
+
+def write_excel(
+    data: Union[CueTable, Iterable[Dict[str, Any]]],
+    output: BinaryIO,
+    coach_color: str = "D8E4F0",
+    client_color: str = "F0F0F0",  # Light gray for client rows
+    font_size: int = 16,  # Slightly smaller default font size
+) -> None:
+    """
+    Write the transcript as an xlsx workbook into a binary file object.
 
-        # Add some padding and set the column width
-        adjusted_width = (max_length + 2) * 1.1  # Add padding and a little extra
+    Args:
+        data: CueTable or iterable of dictionaries with time, speaker, and content.
+        output: Writable binary file object receiving the workbook.
+        coach_color: Hex color code to highlight coach rows (default: light blue D8E4F0).
+        client_color: Hex color code for client rows (default: light gray F0F0F0).
+        font_size: Default font size for all cells (default: 16).
+    """
+    if isinstance(data, CueTable):
+        # Widths only need string lengths; the table rows are regenerated below
+        widths = calculate_column_widths(data.iter_rows())
+        rows: Iterable[CueRow] = data.iter_rows()
+    else:
+        rows = list(iter_rows(data))
+        widths = calculate_column_widths(rows)
+
+    wb = Workbook(write_only=True)
+    _register_styles(wb, font_size, coach_color, client_color)
+    ws = wb.create_sheet(title="Transcript")
+
+    # Column widths and frozen header must be set before the first row
+    for letter, width in zip(_COLUMN_LETTERS, widths):
+        ws.column_dimensions[letter].width = width
+    ws.freeze_panes = "A2"
 
-        # Apply min and max width constraints
-        if adjusted_width < min_width:
-            adjusted_width = min_width
-        elif adjusted_width > max_width:
-            adjusted_width = max_width
+    ws.row_dimensions[1].height = HEADER_ROW_HEIGHT  # Fixed height for header
+    header_cells = []
+    for header in HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = "transcript_header"
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for row_idx, row in enumerate(rows, start=2):
+        style = "transcript_coach" if row[1] in COACH_LABELS else "transcript_client"
+        ws.row_dimensions[row_idx].height = _row_height(row, widths)
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style
+            cells.append(cell)
+        ws.append(cells)
+
+    wb.save(output)
+
+
+def iter_excel(
+    data: Union[CueTable, Iterable[Dict[str, Any]]],
+    chunk_size: int = EXCEL_CHUNK_SIZE,
+    **style_options: Any,
+) -> Iterator[bytes]:
+    """
+    Render the workbook and yield it in chunks for a StreamingResponse.
 
-        # Set the column width
-        worksheet.column_dimensions[column_letter].width = adjusted_width
+    The workbook is rendered into a spooled temporary file so large exports
+    spill to disk instead of being held in memory.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_SIZE) as spool:
+        write_excel(data, spool, **style_options)
+        spool.seek(0)
+        while True:
+            chunk = spool.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
 
 
 def generate_excel(
-    data: List[Dict[str, Any]],
+    data: Union[CueTable, Iterable[Dict[str, Any]]],
     coach_color: str = "D8E4F0",
     client_color: str = "F0F0F0",  # Light gray for client rows
     font_size: int = 16,  # Slightly smaller default font size
@@ -54,102 +182,15 @@ def generate_excel(
     Generate an Excel file from the parsed data with formatting.
 
     Args:
-        data: List of dictionaries with time, speaker, and content.
+        data: CueTable or iterable of dictionaries with time, speaker, and content.
         coach_color: Hex color code to highlight coach rows (default: light blue D8E4F0).
         client_color: Hex color code for client rows (default: light gray F0F0F0).
-        font_size: Default font size for all cells (default: 14).
+        font_size: Default font size for all cells (default: 16).
 
     Returns:
         An in-memory BytesIO buffer containing the Excel file.
     """
-    # Create a new workbook and select the active worksheet
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Transcript"
-
-    # Add headers
-    headers = ["時間", "角色", "內容"]
-    ws.append(headers)
-
-    # Add data rows
-    for item in data:
-        ws.append([item["time"], item["speaker"], item["content"]])
-
-    # Set initial column widths
-    ws.column_dimensions["A"].width = 15
-    ws.column_dimensions["B"].width = 15
-    ws.column_dimensions["C"].width = 40
-
-    # Apply styles and formatting
-    _apply_styles(ws, data, font_size, coach_color, client_color)
-
-    # Adjust column widths based on content
-    calculate_column_widths(ws)
-
-    # Calculate and set row heights based on content
-    for row_idx, row in enumerate(
-        ws.iter_rows(min_row=2), start=2
-    ):  # Start from row 2 (skip header)
-        max_lines = 1
-        for cell in row:
-            if cell.value:
-                # Estimate number of lines based on content length and column
-                # width
-                col_width = ws.column_dimensions[cell.column_letter].width
-                if col_width > 0:  # Make sure column width is valid
-                    # Rough estimate: ~10 characters per inch, 1 line per 2
-                    # inches
-                    content_length = len(str(cell.value))
-                    estimated_lines = max(
-                        1, int((content_length / (col_width * 1.5)) + 0.5)
-                    )
-                    max_lines = max(max_lines, estimated_lines)
-
-        # Set row height (15 points per line, minimum 30 points, maximum 300
-        # points)
-        row_height = min(max(30, max_lines * 15), 300)
-        ws.row_dimensions[row_idx].height = row_height
-
-    # Set header row height
-    ws.row_dimensions[1].height = 30  # Fixed height for header
-
-    # Freeze the header row
-    ws.freeze_panes = "A2"
-
-    # Save the workbook to an in-memory buffer
     buffer = io.BytesIO()
-    wb.save(buffer)
+    write_excel(data, buffer, coach_color, client_color, font_size)
     buffer.seek(0)
     return buffer
-
-
-def _apply_styles(ws, data, font_size, coach_color, client_color):
-    """Helper function to apply styles to the worksheet."""
-    header_font = Font(bold=True, size=font_size + 2, color="FFFFFF")
-    cell_font = Font(size=font_size)
-    alignment = Alignment(wrap_text=True, vertical="top")
-
-    header_fill = PatternFill(
-        start_color="4F81BD", end_color="4F81BD", fill_type="solid"
-    )
-    coach_fill = PatternFill(
-        start_color=coach_color, end_color=coach_color, fill_type="solid"
-    )
-    client_fill = PatternFill(
-        start_color=client_color, end_color=client_color, fill_type="solid"
-    )
-
-    for cell in ws[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(
-            horizontal="center", vertical="center", wrap_text=True
-        )
-
-    for row_idx, item in enumerate(data, start=2):
-        fill = coach_fill if item["speaker"] in ["Coach", "教練"] else client_fill
-        for col_idx in range(1, 4):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            cell.font = cell_font
-            cell.fill = fill
-            cell.alignment = alignment
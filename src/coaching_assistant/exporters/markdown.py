@@ -3,7 +3,9 @@
 Module for exporting transcript data to Markdown format.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Union
+
+from ..cue_table import CueTable, iter_rows
 
 
 def _wrap_content(content: str, max_width: int) -> str:
@@ -36,21 +38,23 @@ def _format_table_row(time: str, speaker: str, content: str) -> str:
     return f"| {time} | {speaker_formatted} | {content} |\n"
 
 
-def generate_markdown(data: List[Dict[str, Any]], content_width: int = 80) -> str:
+def generate_markdown(
+    data: Union[CueTable, Iterable[Dict[str, Any]]], content_width: int = 80
+) -> str:
     """
     Generate a Markdown table from the parsed data.
 
     Args:
-        data: List of dictionaries with time, speaker, and content
+        data: CueTable or iterable of dictionaries with time, speaker, and content
         content_width: Maximum width for content column before wrapping (default: 80)
 
     Returns:
         Markdown table as a string
     """
-    markdown = "| Time | Role | Content |\n| ---- | ---- | ------- |\n"
+    rows = ["| Time | Role | Content |\n| ---- | ---- | ------- |\n"]
 
-    for item in data:
-        content = _wrap_content(item["content"], content_width)
-        markdown += _format_table_row(item["time"], item["speaker"], content)
+    for time, speaker, content in iter_rows(data):
+        content = _wrap_content(content, content_width)
+        rows.append(_format_table_row(time, speaker, content))
 
-    return markdown
+    return "".join(rows)
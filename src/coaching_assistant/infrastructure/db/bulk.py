@@ -0,0 +1,226 @@
+"""Bulk write helpers for tables written thousands of rows at a time.
+
+Inserted rows are completed in Python (primary key, timestamps and any
+other client-side defaults) before they are sent, so the caller already
+holds every stored value and never needs RETURNING or a refresh to read
+them back. Updates send a whole diff of per-row changes in one statement,
+and upserts merge a batch of rows with INSERT ... ON CONFLICT, either
+overwriting the stored values or adding to them.
+"""
+
+import enum
+import io
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Sequence
+
+from sqlalchemy import Table, bindparam, cast, column, values
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+# Below this many rows a multi-row INSERT is as quick as COPY
+COPY_MIN_ROWS = 500
+
+
+def bulk_insert(
+    db_session: Session, table: Table, rows: Iterable[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Insert rows into a table in one round trip and return them completed.
+
+    On PostgreSQL with psycopg2, batches of COPY_MIN_ROWS or more are
+    streamed with COPY FROM STDIN. Everything else, including the SQLite test
+    database, goes through a single executemany INSERT that SQLAlchemy sends
+    as multi-row VALUES. Both run on the session's connection, so the rows
+    commit or roll back with the session.
+    """
+    rows = [_with_defaults(table, row) for row in rows]
+    if not rows:
+        return rows
+
+    # Parent rows added through the ORM must exist before their children
+    db_session.flush()
+    connection = db_session.connection()
+    if (
+        connection.dialect.name == "postgresql"
+        and connection.dialect.driver == "psycopg2"
+        and len(rows) >= COPY_MIN_ROWS
+    ):
+        _copy_rows(connection, table, rows)
+    else:
+        connection.execute(table.insert(), rows)
+    return rows
+
+
+def bulk_update(
+    db_session: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    key: str = "id",
+) -> None:
+    """
+    Apply per-row column changes, each row keyed by its primary key.
+
+    Every row names the same columns. Callers pass only rows whose values
+    changed; columns with an onupdate default, such as updated_at, are
+    refreshed for those rows. On PostgreSQL the diff is one
+    ``UPDATE ... FROM (VALUES ...)`` statement. Other databases, including
+    the SQLite test database, run one executemany UPDATE.
+    """
+    rows = list(rows)
+    if not rows:
+        return
+
+    db_session.flush()
+    connection = db_session.connection()
+    columns = list(rows[0])
+    changed = [name for name in columns if name != key]
+
+    if connection.dialect.name == "postgresql":
+        changes = values(
+            *(column(name, table.c[name].type) for name in columns), name="changes"
+        ).data([tuple(row[name] for name in columns) for row in rows])
+        connection.execute(
+            table.update()
+            .where(table.c[key] == cast(changes.c[key], table.c[key].type))
+            .values(
+                {name: cast(changes.c[name], table.c[name].type) for name in changed}
+            )
+        )
+    else:
+        connection.execute(
+            table.update()
+            .where(table.c[key] == bindparam(f"_{key}"))
+            .values({name: bindparam(f"_{name}") for name in changed}),
+            [{f"_{name}": value for name, value in row.items()} for row in rows],
+        )
+
+
+def bulk_upsert(
+    db_session: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+) -> None:
+    """
+    Insert rows, updating update_columns where conflict_columns already match.
+
+    Runs one INSERT ... ON CONFLICT DO UPDATE over all rows, which both
+    PostgreSQL and SQLite support. The ON CONFLICT update skips onupdate
+    defaults, so include updated_at in update_columns to refresh it.
+    """
+    _upsert(
+        db_session,
+        table,
+        rows,
+        conflict_columns,
+        lambda excluded: {name: excluded[name] for name in update_columns},
+    )
+
+
+def bulk_increment(
+    db_session: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    increment_columns: Sequence[str],
+    update_columns: Sequence[str] = (),
+) -> None:
+    """
+    Insert rows, adding increment_columns onto rows that already exist.
+
+    The addition happens in the ON CONFLICT clause, so concurrent writers
+    bumping the same row queue on its row lock instead of overwriting each
+    other's totals. update_columns are overwritten as in bulk_upsert.
+    """
+    _upsert(
+        db_session,
+        table,
+        rows,
+        conflict_columns,
+        lambda excluded: {
+            **{name: table.c[name] + excluded[name] for name in increment_columns},
+            **{name: excluded[name] for name in update_columns},
+        },
+    )
+
+
+def _upsert(
+    db_session: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    build_set: Callable[[Any], Dict[str, Any]],
+) -> None:
+    """Run INSERT ... ON CONFLICT DO UPDATE SET build_set(excluded)."""
+    rows = [_with_defaults(table, row) for row in rows]
+    if not rows:
+        return
+
+    db_session.flush()
+    connection = db_session.connection()
+    dialect_inserts = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+    if connection.dialect.name not in dialect_inserts:
+        raise NotImplementedError(
+            f"bulk upserts do not support the {connection.dialect.name} dialect"
+        )
+
+    statement = dialect_inserts[connection.dialect.name](table)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_=build_set(statement.excluded),
+    )
+    connection.execute(statement, rows)
+
+
+def _with_defaults(table: Table, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill every column the row leaves out with its Python-side default."""
+    completed = {}
+    for table_column in table.columns:
+        name = table_column.name
+        default = table_column.default
+        if name in row:
+            completed[name] = row[name]
+        elif default is not None and default.is_callable:
+            completed[name] = default.arg(None)
+        elif default is not None and default.is_scalar:
+            completed[name] = default.arg
+        elif table_column.server_default is None:
+            completed[name] = None
+    return completed
+
+
+def _copy_rows(connection: Connection, table: Table, rows: List[Dict]) -> None:
+    """Stream rows through COPY FROM STDIN in PostgreSQL's text format."""
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(row[column]) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    preparer = connection.dialect.identifier_preparer
+    column_list = ", ".join(preparer.quote(column) for column in columns)
+    statement = f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN"
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(statement, buffer)
+
+
+def _copy_value(value: Any) -> str:
+    """Encode one value for COPY's text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
@@ -0,0 +1,21 @@
+"""SQL expressions that differ between PostgreSQL and the SQLite test database."""
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def seconds_between(db_session: Session, start, end) -> ColumnElement:
+    """Seconds from start to end, NULL when either timestamp is NULL."""
+    if db_session.get_bind().dialect.name == "postgresql":
+        return func.extract("epoch", end - start)
+    return (func.julianday(end) - func.julianday(start)) * 86400
+
+
+def period_start_key(db_session: Session, value, period_type: str) -> ColumnElement:
+    """The day or month containing value, as a 'YYYY-MM-DD' start date."""
+    monthly = period_type == "monthly"
+    if db_session.get_bind().dialect.name == "postgresql":
+        truncated = func.date_trunc("month" if monthly else "day", value)
+        return func.to_char(truncated, "YYYY-MM-DD")
+    return func.strftime("%Y-%m-01" if monthly else "%Y-%m-%d", value)
@@ -0,0 +1,47 @@
+"""SQLAlchemy helpers for keyset (cursor) pagination.
+
+A sort key is a list of (column, descending) pairs that ends with a unique
+column, normally the primary key, so every row has a distinct position.
+"""
+
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import and_, asc, desc, literal, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+SortKey = Sequence[Tuple[Any, bool]]
+
+
+def keyset_order(sort_key: SortKey) -> List[ColumnElement]:
+    """Build the ORDER BY clauses for a sort key."""
+    return [
+        desc(column) if descending else asc(column) for column, descending in sort_key
+    ]
+
+
+def keyset_after(sort_key: SortKey, values: Sequence[Any]) -> ColumnElement:
+    """
+    Build the predicate selecting rows that sort after the given key values.
+
+    When every column sorts in the same direction this is a row-value
+    comparison, ``(a, b, id) > (:a, :b, :id)``, which PostgreSQL answers with
+    a single range scan on a matching composite index. Mixed directions fall
+    back to the equivalent expanded form
+    ``a > :a OR (a = :a AND (b > :b OR ...))``.
+    """
+    directions = {descending for _, descending in sort_key}
+    if len(directions) == 1:
+        columns = [column for column, _ in sort_key]
+        bound = tuple_(
+            *(literal(value, column.type) for column, value in zip(columns, values))
+        )
+        columns = tuple_(*columns)
+        return columns < bound if directions.pop() else columns > bound
+
+    predicate = None
+    for (column, descending), value in reversed(list(zip(sort_key, values))):
+        after = column < value if descending else column > value
+        if predicate is not None:
+            after = or_(after, and_(column == value, predicate))
+        predicate = after
+    return predicate
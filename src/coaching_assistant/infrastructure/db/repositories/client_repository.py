@@ -13,8 +13,18 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from ....core.models.client import Client as DomainClient
+from ....core.repositories.pagination import (
+    CursorPage,
+    decode_cursor,
+    encode_cursor,
+)
 from ....core.repositories.ports import ClientRepoPort
 from ....models.client import Client as ClientModel
+from ..keyset import keyset_after, keyset_order
+
+# Client lists are ordered by name; the id breaks ties between equal names
+_CLIENT_SORT_KEY = [(ClientModel.name, False), (ClientModel.id, False)]
+_CLIENT_SORT = "name"
 
 
 class SQLAlchemyClientRepository(ClientRepoPort):
@@ -205,6 +215,18 @@ class SQLAlchemyClientRepository(ClientRepoPort):
                 f"Database error searching clients for coach {coach_id}"
             ) from e
 
+    def _list_filter(self, coach_id: UUID, query: Optional[str] = None):
+        """Build the WHERE clause shared by the client list queries."""
+        base_filter = ClientModel.user_id == coach_id
+        if not query:
+            return base_filter
+
+        search_filter = or_(
+            ClientModel.name.ilike(f"%{query}%"),
+            ClientModel.email.ilike(f"%{query}%"),
+        )
+        return and_(base_filter, search_filter)
+
     def get_clients_paginated(
         self,
         coach_id: UUID,
@@ -224,18 +246,7 @@ class SQLAlchemyClientRepository(ClientRepoPort):
             Tuple of (list of clients, total count)
         """
         try:
-            # Build base filter
-            base_filter = ClientModel.user_id == coach_id
-
-            # Add search filter if provided
-            if query:
-                search_filter = or_(
-                    ClientModel.name.ilike(f"%{query}%"),
-                    ClientModel.email.ilike(f"%{query}%"),
-                )
-                query_filter = and_(base_filter, search_filter)
-            else:
-                query_filter = base_filter
+            query_filter = self._list_filter(coach_id, query)
 
             # Get total count
             total = self.session.query(ClientModel).filter(query_filter).count()
@@ -245,7 +256,7 @@ class SQLAlchemyClientRepository(ClientRepoPort):
             orm_clients = (
                 self.session.query(ClientModel)
                 .filter(query_filter)
-                .order_by(ClientModel.name)
+                .order_by(*keyset_order(_CLIENT_SORT_KEY))
                 .offset(offset)
                 .limit(page_size)
                 .all()
@@ -259,6 +270,79 @@ class SQLAlchemyClientRepository(ClientRepoPort):
                 f"Database error getting paginated clients for coach {coach_id}"
             ) from e
 
+    def get_clients_cursor_page(
+        self,
+        coach_id: UUID,
+        query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+    ) -> CursorPage[DomainClient]:
+        """Get a keyset-paginated page of clients ordered by name.
+
+        Args:
+            coach_id: UUID of the coach (user)
+            query: Optional search term for name or email
+            cursor: Cursor from the previous page, or None for the first page
+            page_size: Number of clients per page
+            include_total: Whether to compute the total count. It comes from
+                a window function on the first page and a separate count
+                query on later pages.
+
+        Returns:
+            CursorPage of clients
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        after = None
+        if cursor:
+            after = decode_cursor(cursor, _CLIENT_SORT, [str, UUID])
+
+        try:
+            query_filter = self._list_filter(coach_id, query)
+            columns = [ClientModel]
+            if include_total and after is None:
+                columns.append(func.count().over().label("total_count"))
+
+            list_query = self.session.query(*columns).filter(query_filter)
+            if after is not None:
+                list_query = list_query.filter(keyset_after(_CLIENT_SORT_KEY, after))
+            rows = (
+                list_query.order_by(*keyset_order(_CLIENT_SORT_KEY))
+                .limit(page_size + 1)
+                .all()
+            )
+            orm_clients = [row[0] for row in rows] if len(columns) > 1 else rows
+
+            next_cursor = None
+            if len(orm_clients) > page_size:
+                orm_clients = orm_clients[:page_size]
+                last = orm_clients[-1]
+                next_cursor = encode_cursor(_CLIENT_SORT, [last.name, last.id])
+
+            total = None
+            if include_total:
+                if after is None:
+                    total = rows[0].total_count if rows else 0
+                else:
+                    total = (
+                        self.session.query(func.count(ClientModel.id))
+                        .filter(query_filter)
+                        .scalar()
+                    )
+
+            return CursorPage(
+                items=[self._to_domain(orm_client) for orm_client in orm_clients],
+                next_cursor=next_cursor,
+                total=total,
+            )
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error getting paginated clients for coach {coach_id}"
+            ) from e
+
     def get_client_with_ownership_check(
         self, client_id: UUID, coach_id: UUID
     ) -> Optional[DomainClient]:
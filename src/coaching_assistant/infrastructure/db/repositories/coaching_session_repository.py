@@ -6,10 +6,10 @@ following Clean Architecture principles.
 """
 
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, asc, desc
+from sqlalchemy import and_, desc, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -19,11 +19,24 @@ from ....core.models.coaching_session import (
 from ....core.models.coaching_session import (
     SessionSource as DomainSessionSource,
 )
+from ....core.repositories.pagination import (
+    CursorPage,
+    decode_cursor,
+    encode_cursor,
+)
 from ....core.repositories.ports import CoachingSessionRepoPort
 from ....models.client import Client as ClientModel
 from ....models.coaching_session import CoachingSession as CoachingSessionModel
 from ....models.coaching_session import SessionSource as DatabaseSessionSource
 from ....models.session import Session as TranscriptionSessionModel
+from ....models.transcript import TranscriptSegment as TranscriptSegmentModel
+from ..keyset import keyset_after, keyset_order
+
+# Cursor key value parsers per sort field; the session id always comes last
+_CURSOR_PARSERS = {
+    "session_date": [date.fromisoformat, UUID],
+    "fee": [str, int, UUID],
+}
 
 
 class SQLAlchemyCoachingSessionRepository(CoachingSessionRepoPort):
@@ -308,6 +321,70 @@ class SQLAlchemyCoachingSessionRepository(CoachingSessionRepoPort):
                 f"Database error retrieving session {session_id} for coach {coach_id}"
             ) from e
 
+    def _list_filter(
+        self,
+        coach_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        client_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+    ):
+        """Build the WHERE clause shared by the session list queries."""
+        query_filter = CoachingSessionModel.user_id == coach_id
+
+        if from_date:
+            query_filter = and_(
+                query_filter,
+                CoachingSessionModel.session_date >= from_date,
+            )
+        if to_date:
+            query_filter = and_(
+                query_filter, CoachingSessionModel.session_date <= to_date
+            )
+        if client_id:
+            query_filter = and_(
+                query_filter, CoachingSessionModel.client_id == client_id
+            )
+        if currency:
+            query_filter = and_(
+                query_filter, CoachingSessionModel.fee_currency == currency
+            )
+        return query_filter
+
+    @staticmethod
+    def _sort_key(sort: str) -> list:
+        """Map a sort parameter to (column, descending) pairs ending in the id."""
+        field = sort.lstrip("-")
+        columns = []
+        if field == "session_date":
+            columns = [CoachingSessionModel.session_date]
+        elif field == "fee":
+            columns = [
+                CoachingSessionModel.fee_currency,
+                CoachingSessionModel.fee_amount,
+            ]
+        descending = sort.startswith("-")
+        return [(column, descending) for column in [*columns, CoachingSessionModel.id]]
+
+    def _sort_order(self, sort: str) -> list:
+        """Map a sort parameter to ORDER BY clauses."""
+        return keyset_order(self._sort_key(sort))
+
+    def _list_query(self, query, query_filter):
+        """Apply the client and transcription session joins and the filter."""
+        return (
+            query.join(
+                ClientModel,
+                CoachingSessionModel.client_id == ClientModel.id,
+            )
+            .outerjoin(
+                TranscriptionSessionModel,
+                CoachingSessionModel.transcription_session_id
+                == TranscriptionSessionModel.id,
+            )
+            .filter(query_filter)
+        )
+
     def get_paginated_with_filters(
         self,
         coach_id: UUID,
@@ -335,58 +412,12 @@ class SQLAlchemyCoachingSessionRepository(CoachingSessionRepoPort):
             Tuple of (list of sessions, total count)
         """
         try:
-            # Build base filter
-            query_filter = CoachingSessionModel.user_id == coach_id
-
-            # Apply filters
-            if from_date:
-                query_filter = and_(
-                    query_filter,
-                    CoachingSessionModel.session_date >= from_date,
-                )
-            if to_date:
-                query_filter = and_(
-                    query_filter, CoachingSessionModel.session_date <= to_date
-                )
-            if client_id:
-                query_filter = and_(
-                    query_filter, CoachingSessionModel.client_id == client_id
-                )
-            if currency:
-                query_filter = and_(
-                    query_filter, CoachingSessionModel.fee_currency == currency
-                )
-
-            # Build query with joins
-            query = (
-                self.session.query(CoachingSessionModel)
-                .join(
-                    ClientModel,
-                    CoachingSessionModel.client_id == ClientModel.id,
-                )
-                .outerjoin(
-                    TranscriptionSessionModel,
-                    CoachingSessionModel.transcription_session_id
-                    == TranscriptionSessionModel.id,
-                )
-                .filter(query_filter)
+            query_filter = self._list_filter(
+                coach_id, from_date, to_date, client_id, currency
             )
-
-            # Apply sorting
-            if sort == "session_date":
-                query = query.order_by(asc(CoachingSessionModel.session_date))
-            elif sort == "-session_date":
-                query = query.order_by(desc(CoachingSessionModel.session_date))
-            elif sort == "fee":
-                query = query.order_by(
-                    asc(CoachingSessionModel.fee_currency),
-                    asc(CoachingSessionModel.fee_amount),
-                )
-            elif sort == "-fee":
-                query = query.order_by(
-                    desc(CoachingSessionModel.fee_currency),
-                    desc(CoachingSessionModel.fee_amount),
-                )
+            query = self._list_query(
+                self.session.query(CoachingSessionModel), query_filter
+            ).order_by(*self._sort_order(sort))
 
             # Get total count
             total = query.count()
@@ -403,6 +434,200 @@ class SQLAlchemyCoachingSessionRepository(CoachingSessionRepoPort):
                 f"Database error getting paginated sessions for coach {coach_id}"
             ) from e
 
+    @staticmethod
+    def _summary_columns(include_total: bool) -> list:
+        """Select the session with its client and transcription summaries."""
+        segments_count = (
+            select(func.count(TranscriptSegmentModel.id))
+            .where(TranscriptSegmentModel.session_id == TranscriptionSessionModel.id)
+            .correlate(TranscriptionSessionModel)
+            .scalar_subquery()
+        )
+        columns = [
+            CoachingSessionModel,
+            ClientModel.name.label("client_name"),
+            ClientModel.is_anonymized.label("client_is_anonymized"),
+            TranscriptionSessionModel.id.label("transcription_id"),
+            TranscriptionSessionModel.status.label("transcription_status"),
+            TranscriptionSessionModel.title.label("transcription_title"),
+            segments_count.label("segments_count"),
+        ]
+        if include_total:
+            columns.append(func.count().over().label("total_count"))
+        return columns
+
+    def get_paginated_with_summaries(
+        self,
+        coach_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        client_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+        sort: str = "-session_date",
+        page: int = 1,
+        page_size: int = 20,
+        include_total: bool = True,
+    ) -> tuple[List[Dict[str, Any]], Optional[int]]:
+        """Get a page of coaching sessions with client and transcription summaries.
+
+        The client and transcription session columns, the transcript segment
+        count and (optionally) a COUNT(*) OVER () window total are selected in
+        the same statement, so a page costs one round trip. A separate count
+        query only runs when a page past the end comes back empty.
+
+        Args:
+            coach_id: UUID of the coach
+            from_date: Optional start date filter
+            to_date: Optional end date filter
+            client_id: Optional client filter
+            currency: Optional currency filter
+            sort: Sort field and direction ("session_date", "fee", optionally "-")
+            page: Page number (1-based)
+            page_size: Number of sessions per page
+            include_total: Whether to compute the total count
+
+        Returns:
+            Tuple of (list of dicts with "session", "client_summary" and
+            "transcription_session_summary", total count or None)
+        """
+        try:
+            query_filter = self._list_filter(
+                coach_id, from_date, to_date, client_id, currency
+            )
+            columns = self._summary_columns(include_total)
+
+            offset = (page - 1) * page_size
+            rows = (
+                self._list_query(self.session.query(*columns), query_filter)
+                .order_by(*self._sort_order(sort))
+                .offset(offset)
+                .limit(page_size)
+                .all()
+            )
+
+            total = None
+            if include_total:
+                if rows:
+                    total = rows[0].total_count
+                elif offset > 0:
+                    total = self._list_query(
+                        self.session.query(CoachingSessionModel.id), query_filter
+                    ).count()
+                else:
+                    total = 0
+
+            return [self._row_to_summaries(row) for row in rows], total
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error getting paginated sessions for coach {coach_id}"
+            ) from e
+
+    def get_cursor_page_with_summaries(
+        self,
+        coach_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        client_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+        sort: str = "-session_date",
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+    ) -> CursorPage[Dict[str, Any]]:
+        """Get a keyset-paginated page of sessions with their summaries.
+
+        Rows after the cursor are selected with a (sort key, id) comparison
+        instead of OFFSET, so every page is an index range scan on the
+        composite list indexes. One extra row is fetched to tell whether
+        another page follows.
+
+        Args:
+            coach_id: UUID of the coach
+            from_date: Optional start date filter
+            to_date: Optional end date filter
+            client_id: Optional client filter
+            currency: Optional currency filter
+            sort: Sort field and direction ("session_date", "fee", optionally "-")
+            cursor: Cursor from the previous page, or None for the first page
+            page_size: Number of sessions per page
+            include_total: Whether to compute the total count. It comes from
+                a window function on the first page and a separate count
+                query on later pages.
+
+        Returns:
+            CursorPage of summary dicts (see get_paginated_with_summaries)
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded for this sort
+        """
+        sort_key = self._sort_key(sort)
+        after = None
+        if cursor:
+            after = decode_cursor(
+                cursor, sort, _CURSOR_PARSERS.get(sort.lstrip("-"), [UUID])
+            )
+
+        try:
+            query_filter = self._list_filter(
+                coach_id, from_date, to_date, client_id, currency
+            )
+            columns = self._summary_columns(include_total and after is None)
+            query = self._list_query(self.session.query(*columns), query_filter)
+            if after is not None:
+                query = query.filter(keyset_after(sort_key, after))
+            rows = query.order_by(*keyset_order(sort_key)).limit(page_size + 1).all()
+
+            next_cursor = None
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                last = rows[-1][0]
+                next_cursor = encode_cursor(
+                    sort, [getattr(last, column.key) for column, _ in sort_key]
+                )
+
+            total = None
+            if include_total:
+                if after is None:
+                    total = rows[0].total_count if rows else 0
+                else:
+                    total = self._list_query(
+                        self.session.query(CoachingSessionModel.id), query_filter
+                    ).count()
+
+            return CursorPage(
+                items=[self._row_to_summaries(row) for row in rows],
+                next_cursor=next_cursor,
+                total=total,
+            )
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error getting paginated sessions for coach {coach_id}"
+            ) from e
+
+    def _row_to_summaries(self, row) -> Dict[str, Any]:
+        """Convert a joined list row to the session and its summaries."""
+        orm_session = row[0]
+        transcription_session_summary = None
+        if row.transcription_id is not None:
+            transcription_session_summary = {
+                "id": row.transcription_id,
+                "status": row.transcription_status.value,
+                "title": row.transcription_title,
+                "segments_count": int(row.segments_count or 0),
+            }
+
+        return {
+            "session": self._to_domain(orm_session),
+            "client_summary": {
+                "id": orm_session.client_id,
+                "name": row.client_name,
+                "is_anonymized": row.client_is_anonymized,
+            },
+            "transcription_session_summary": transcription_session_summary,
+        }
+
     def get_last_session_by_client(
         self, coach_id: UUID, client_id: UUID
     ) -> Optional[DomainCoachingSession]:
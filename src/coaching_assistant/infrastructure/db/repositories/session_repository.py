@@ -9,17 +9,27 @@ from datetime import UTC, datetime
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session as DBSession
 
 from ....core.config import settings
 from ....core.models.session import Session, SessionStatus
+from ....core.repositories.pagination import (
+    CursorPage,
+    decode_cursor,
+    encode_cursor,
+)
 from ....core.repositories.ports import SessionRepoPort
 
 # TEMPORARY FIX: Use legacy model until database migration is complete
 # from ..models.session_model import SessionModel
 from ....models.session import Session as SessionModel
+from ..keyset import keyset_after, keyset_order
+
+# Session lists are newest first; the id breaks ties between equal timestamps
+_SESSION_SORT_KEY = [(SessionModel.created_at, True), (SessionModel.id, True)]
+_SESSION_SORT = "-created_at"
 
 
 class SQLAlchemySessionRepository(SessionRepoPort):
@@ -76,7 +86,7 @@ class SQLAlchemySessionRepository(SessionRepoPort):
                 query = query.filter(SessionModel.status == status)
 
             orm_sessions = (
-                query.order_by(desc(SessionModel.created_at))
+                query.order_by(*keyset_order(_SESSION_SORT_KEY))
                 .offset(offset)
                 .limit(limit)
                 .all()
@@ -87,6 +97,60 @@ class SQLAlchemySessionRepository(SessionRepoPort):
                 f"Database error retrieving sessions for user {user_id}"
             ) from e
 
+    def get_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[SessionStatus] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> CursorPage[Session]:
+        """Get a keyset-paginated page of a user's sessions, newest first.
+
+        Args:
+            user_id: UUID of the user
+            status: Optional session status filter
+            cursor: Cursor from the previous page, or None for the first page
+            limit: Maximum number of sessions to return
+
+        Returns:
+            CursorPage of Session domain entities (without a total)
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        after = None
+        if cursor:
+            after = decode_cursor(cursor, _SESSION_SORT, [datetime.fromisoformat, UUID])
+
+        try:
+            query = self.session.query(SessionModel).filter(
+                SessionModel.user_id == user_id
+            )
+
+            if status is not None:
+                query = query.filter(SessionModel.status == status)
+            if after is not None:
+                query = query.filter(keyset_after(_SESSION_SORT_KEY, after))
+
+            orm_sessions = (
+                query.order_by(*keyset_order(_SESSION_SORT_KEY)).limit(limit + 1).all()
+            )
+
+            next_cursor = None
+            if len(orm_sessions) > limit:
+                orm_sessions = orm_sessions[:limit]
+                last = orm_sessions[-1]
+                next_cursor = encode_cursor(_SESSION_SORT, [last.created_at, last.id])
+
+            sessions = [
+                self._legacy_to_domain(orm_session) for orm_session in orm_sessions
+            ]
+            return CursorPage(items=sessions, next_cursor=next_cursor)
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error retrieving sessions for user {user_id}"
+            ) from e
+
     def save(self, session: Session) -> Session:
         """Save or update session entity.
 
@@ -1,13 +1,15 @@
 """Transcript repository implementation using SQLAlchemy with Clean Architecture."""
 
 from datetime import UTC, datetime
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List
 from uuid import UUID
 
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from ....core.models.transcript import TranscriptSegment
 from ....core.repositories.ports import TranscriptRepoPort
+from ..bulk import bulk_insert, bulk_update
 from ..models.transcript_model import TranscriptSegmentModel
 
 
@@ -27,23 +29,75 @@ class TranscriptRepository(TranscriptRepoPort):
         )
         return [segment.to_domain() for segment in orm_segments]
 
+    def iter_by_session_id(
+        self, session_id: UUID, chunk_size: int = 500
+    ) -> Iterator[List[TranscriptSegment]]:
+        """Yield transcript segments in chunks using keyset pagination.
+
+        Each chunk is fetched with a (start_seconds, id) seek instead of
+        OFFSET, so every page costs the same regardless of its position.
+        """
+        last_start = None
+        last_id = None
+
+        while True:
+            query = self.db_session.query(TranscriptSegmentModel).filter(
+                TranscriptSegmentModel.session_id == session_id
+            )
+            if last_start is not None:
+                query = query.filter(
+                    or_(
+                        TranscriptSegmentModel.start_seconds > last_start,
+                        and_(
+                            TranscriptSegmentModel.start_seconds == last_start,
+                            TranscriptSegmentModel.id > last_id,
+                        ),
+                    )
+                )
+            orm_segments = (
+                query.order_by(
+                    TranscriptSegmentModel.start_seconds, TranscriptSegmentModel.id
+                )
+                .limit(chunk_size)
+                .all()
+            )
+            if not orm_segments:
+                return
+
+            yield [segment.to_domain() for segment in orm_segments]
+
+            if len(orm_segments) < chunk_size:
+                return
+            last_start = orm_segments[-1].start_seconds
+            last_id = orm_segments[-1].id
+
     def save_segments(
         self, segments: List[TranscriptSegment]
     ) -> List[TranscriptSegment]:
-        """Save multiple transcript segments."""
-        orm_segments = []
-        for segment in segments:
-            orm_segment = TranscriptSegmentModel.from_domain(segment)
-            self.db_session.add(orm_segment)
-            orm_segments.append(orm_segment)
-
-        self.db_session.flush()
-
-        # Refresh all ORM segments
-        for orm_segment in orm_segments:
-            self.db_session.refresh(orm_segment)
+        """Save multiple transcript segments in one bulk insert."""
+        rows = bulk_insert(
+            self.db_session,
+            TranscriptSegmentModel.__table__,
+            (self._segment_row(segment) for segment in segments),
+        )
 
-        return [orm_segment.to_domain() for orm_segment in orm_segments]
+        return [TranscriptSegmentModel(**row).to_domain() for row in rows]
+
+    @staticmethod
+    def _segment_row(segment: TranscriptSegment) -> Dict[str, Any]:
+        """Column values for a new segment; unset ids and timestamps default."""
+        row = {
+            "session_id": segment.session_id,
+            "speaker_id": segment.speaker_id,
+            "start_seconds": segment.start_seconds,
+            "end_seconds": segment.end_seconds,
+            "content": segment.content,
+            "confidence": segment.confidence,
+        }
+        for key in ("id", "created_at", "updated_at"):
+            if getattr(segment, key) is not None:
+                row[key] = getattr(segment, key)
+        return row
 
     def update_speaker_roles(
         self, session_id: UUID, role_mappings: Dict[str, str]
@@ -74,8 +128,10 @@ class TranscriptRepository(TranscriptRepoPort):
         if len(segment_ids) != len(segments):
             raise ValueError("All transcript segments must have an ID for update")
 
-        orm_segments = (
-            self.db_session.query(TranscriptSegmentModel)
+        stored_content = dict(
+            self.db_session.query(
+                TranscriptSegmentModel.id, TranscriptSegmentModel.content
+            )
             .filter(
                 TranscriptSegmentModel.session_id == session_id,
                 TranscriptSegmentModel.id.in_(segment_ids),
@@ -83,11 +139,10 @@ class TranscriptRepository(TranscriptRepoPort):
             .all()
         )
 
-        orm_segment_map = {orm_segment.id: orm_segment for orm_segment in orm_segments}
         missing_ids = [
             str(segment_id)
             for segment_id in segment_ids
-            if segment_id not in orm_segment_map
+            if segment_id not in stored_content
         ]
 
         if missing_ids:
@@ -96,12 +151,20 @@ class TranscriptRepository(TranscriptRepoPort):
                 f"Segments not found for session {session_id}: {missing_list}"
             )
 
-        for updated_segment in segments:
-            orm_segment = orm_segment_map[updated_segment.id]
-            orm_segment.content = updated_segment.content
-            orm_segment.updated_at = updated_segment.updated_at or datetime.now(UTC)
-
-        self.db_session.flush()
+        # Write back only the segments whose content actually changed
+        bulk_update(
+            self.db_session,
+            TranscriptSegmentModel.__table__,
+            (
+                {
+                    "id": segment.id,
+                    "content": segment.content,
+                    "updated_at": segment.updated_at or datetime.now(UTC),
+                }
+                for segment in segments
+                if segment.content != stored_content[segment.id]
+            ),
+        )
 
         # Return the domain segments that were supplied (already reflect new
         # state)
@@ -19,6 +19,7 @@ from ....core.models.usage_analytics import (
 )
 from ....core.repositories.ports import UsageAnalyticsRepoPort
 from ....models.usage_analytics import UsageAnalytics as UsageAnalyticsORM
+from ....models.usage_rollup import UsageRollup
 
 
 class SQLAlchemyUsageAnalyticsRepository(UsageAnalyticsRepoPort):
@@ -184,99 +185,66 @@ class SQLAlchemyUsageAnalyticsRepository(UsageAnalyticsRepoPort):
     def get_admin_analytics(self) -> Dict[str, Any]:
         """Get system-wide analytics for admin users.
 
+        Reads the monthly usage rollups, a few rows per month, instead of
+        every user's analytics records. Users are counted under the plan of
+        their first usage log.
+
         Returns:
             Dictionary containing admin analytics data
         """
         try:
-            # Get the latest 90 days of analytics data
-            total_users = (
-                self.session.query(
-                    func.count(func.distinct(UsageAnalyticsORM.user_id))
-                ).scalar()
-            ) or 0
-
-            total_transcriptions = (
+            rollups = (
                 self.session.query(
-                    func.sum(UsageAnalyticsORM.transcriptions_completed)
-                ).scalar()
-            ) or 0
-
-            total_minutes = (
-                self.session.query(
-                    func.sum(UsageAnalyticsORM.total_minutes_processed)
-                ).scalar()
-            ) or Decimal("0")
-
-            total_cost = (
-                self.session.query(func.sum(UsageAnalyticsORM.total_cost_usd)).scalar()
-            ) or Decimal("0")
-
-            # Plan breakdown
-            plan_breakdown = {}
-            plan_stats = (
-                self.session.query(
-                    UsageAnalyticsORM.primary_plan,
-                    func.count(func.distinct(UsageAnalyticsORM.user_id)).label("users"),
-                    func.sum(UsageAnalyticsORM.transcriptions_completed).label(
-                        "transcriptions"
-                    ),
-                    func.sum(UsageAnalyticsORM.total_minutes_processed).label(
-                        "minutes"
-                    ),
-                    func.sum(UsageAnalyticsORM.total_cost_usd).label("cost"),
+                    UsageRollup.user_plan,
+                    UsageRollup.stt_provider,
+                    func.sum(UsageRollup.new_users).label("users"),
+                    func.sum(UsageRollup.transcriptions).label("transcriptions"),
+                    func.sum(UsageRollup.total_minutes).label("minutes"),
+                    func.sum(UsageRollup.total_cost_usd).label("cost"),
                 )
-                .group_by(UsageAnalyticsORM.primary_plan)
+                .filter(UsageRollup.period_type == "monthly")
+                .group_by(UsageRollup.user_plan, UsageRollup.stt_provider)
                 .all()
             )
 
-            for plan, users, transcriptions, minutes, cost in plan_stats:
-                plan_breakdown[plan] = {
-                    "users": users or 0,
-                    "transcriptions": transcriptions or 0,
-                    "minutes": float(minutes or 0),
-                    "cost": float(cost or 0),
-                }
-
-            # Provider breakdown
-            total_google_minutes = (
-                self.session.query(
-                    func.sum(UsageAnalyticsORM.google_stt_minutes)
-                ).scalar()
-            ) or Decimal("0")
-
-            total_assemblyai_minutes = (
-                self.session.query(
-                    func.sum(UsageAnalyticsORM.assemblyai_minutes)
-                ).scalar()
-            ) or Decimal("0")
-
-            total_provider_minutes = total_google_minutes + total_assemblyai_minutes
-
+            plan_breakdown = {}
+            provider_minutes = {"google": Decimal("0"), "assemblyai": Decimal("0")}
+            for plan, provider, users, transcriptions, minutes, cost in rollups:
+                plan_stats = plan_breakdown.setdefault(
+                    plan,
+                    {"users": 0, "transcriptions": 0, "minutes": 0.0, "cost": 0.0},
+                )
+                plan_stats["users"] += users or 0
+                plan_stats["transcriptions"] += transcriptions or 0
+                plan_stats["minutes"] += float(minutes or 0)
+                plan_stats["cost"] += float(cost or 0)
+                if provider in provider_minutes:
+                    provider_minutes[provider] += Decimal(minutes or 0)
+
+            total_minutes = sum(stats["minutes"] for stats in plan_breakdown.values())
+            total_provider_minutes = sum(provider_minutes.values())
             provider_breakdown = {
-                "google": {
-                    "minutes": float(total_google_minutes),
-                    "percentage": (
-                        float(total_google_minutes / total_provider_minutes * 100)
-                        if total_provider_minutes > 0
-                        else 0
-                    ),
-                },
-                "assemblyai": {
-                    "minutes": float(total_assemblyai_minutes),
+                provider: {
+                    "minutes": float(minutes),
                     "percentage": (
-                        float(total_assemblyai_minutes / total_provider_minutes * 100)
+                        float(minutes / total_provider_minutes * 100)
                         if total_provider_minutes > 0
                         else 0
                     ),
-                },
+                }
+                for provider, minutes in provider_minutes.items()
             }
 
             return {
-                "total_users": total_users,
-                "total_transcriptions": total_transcriptions,
-                "total_minutes_processed": float(total_minutes),
-                "total_hours_processed": float(total_minutes) / 60.0,
-                "total_cost_usd": float(total_cost),
+                "total_users": sum(stats["users"] for stats in plan_breakdown.values()),
+                "total_transcriptions": sum(
+                    stats["transcriptions"] for stats in plan_breakdown.values()
+                ),
+                "total_minutes_processed": total_minutes,
+                "total_hours_processed": total_minutes / 60.0,
+                "total_cost_usd": sum(
+                    stats["cost"] for stats in plan_breakdown.values()
+                ),
                 "plan_breakdown": plan_breakdown,
                 "provider_breakdown": provider_breakdown,
                 "generated_at": datetime.now(UTC).isoformat(),
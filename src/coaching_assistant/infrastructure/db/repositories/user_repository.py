@@ -15,6 +15,7 @@ from ....core.models.user import User as DomainUser
 from ....core.models.user import UserPlan, UserRole
 from ....core.repositories.ports import UserRepoPort
 from ....models.user import User as UserModel
+from ....services.user_principal_cache import invalidate_user_principal
 
 
 class SQLAlchemyUserRepository(UserRepoPort):
@@ -240,6 +241,7 @@ class SQLAlchemyUserRepository(UserRepoPort):
                     if hasattr(orm_user, "subscription_status"):
                         orm_user.subscription_status = user.subscription_status
                     orm_user.updated_at = user.updated_at
+                    invalidate_user_principal(orm_user.id, self.session)
                 else:
                     # User ID exists but not found in DB - create new
                     orm_user = self._create_orm_user(user)
@@ -270,6 +272,7 @@ class SQLAlchemyUserRepository(UserRepoPort):
             if orm_user:
                 self.session.delete(orm_user)
                 self.session.flush()
+                invalidate_user_principal(user_id, self.session)
                 return True
             return False
         except SQLAlchemyError as e:
@@ -423,6 +426,7 @@ class SQLAlchemyUserRepository(UserRepoPort):
                 # Update plan directly (validation can be added later)
                 orm_user.plan = plan_value
                 self.session.flush()
+                invalidate_user_principal(user_id, self.session)
                 return self._to_domain(orm_user)
             return None
 
@@ -8,6 +8,7 @@ import logging
 import os
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
@@ -36,7 +37,7 @@ from .api.v1 import (
     usage_history,
     user,
 )
-from .api.webhooks import ecpay
+from .api.webhooks import assemblyai, ecpay
 from .core.config import settings
 from .core.env_validator import validate_environment
 from .middleware.error_handler import error_handler
@@ -95,6 +96,12 @@ async def lifespan(app: FastAPI):
         sql_logger.setLevel(logging.ERROR)
         sql_logger.propagate = False
 
+    # Sync routes and run_in_threadpool share anyio's default limiter, which
+    # has 40 threads unless configured
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.THREADPOOL_MAX_WORKERS
+    logger.info(f"Threadpool size: {limiter.total_tokens}")
+
     # Validate database connectivity on startup
     from .core.database import engine
 
@@ -173,6 +180,7 @@ app.include_router(
     tags=["subscriptions"],
 )
 app.include_router(ecpay.router, prefix="/api/webhooks", tags=["webhooks"])
+app.include_router(assemblyai.router, prefix="/api/webhooks", tags=["webhooks"])
 app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
 app.include_router(
     admin_reports.router, prefix="/admin/reports", tags=["admin-reports"]
@@ -1,5 +1,6 @@
 from .base import Base, TimestampMixin
 from .billing_analytics import BillingAnalytics
+from .billing_analytics_rollup import BillingAnalyticsRollup
 from .client import Client
 from .coach_profile import (
     CoachExperience,
@@ -32,6 +33,7 @@ from .transcript import SessionRole, SpeakerRole, TranscriptSegment
 from .usage_analytics import UsageAnalytics
 from .usage_history import UsageHistory
 from .usage_log import TranscriptionType, UsageLog
+from .usage_rollup import UsageRollup
 from .user import User, UserPlan, UserRole
 
 __all__ = [
@@ -59,7 +61,9 @@ __all__ = [
     "TranscriptionType",
     "UsageAnalytics",
     "UsageHistory",
+    "UsageRollup",
     "BillingAnalytics",
+    "BillingAnalyticsRollup",
     "RoleAuditLog",
     "PlanConfiguration",
     "SubscriptionHistory",
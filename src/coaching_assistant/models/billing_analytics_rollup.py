@@ -0,0 +1,73 @@
+"""Billing analytics rollup model for per-plan, per-segment period totals."""
+
+from sqlalchemy import (
+    DECIMAL,
+    Column,
+    DateTime,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+
+from .base import BaseModel
+
+
+class BillingAnalyticsRollup(BaseModel):
+    """BillingAnalytics records of one period summed by plan and segment."""
+
+    __tablename__ = "billing_analytics_rollups"
+
+    # Period and dimensions
+    period_type = Column(String(20), nullable=False)
+    period_start = Column(DateTime(timezone=True), nullable=False)
+    period_end = Column(DateTime(timezone=True), nullable=False)
+    plan_name = Column(String(20), nullable=False)
+    user_segment = Column(String(20), nullable=False)  # 'unknown' when unset
+
+    # Number of BillingAnalytics records summed into this row
+    users = Column(Integer, default=0, nullable=False)
+
+    # Revenue and cost totals
+    total_revenue_usd = Column(DECIMAL(14, 4), default=0, nullable=False)
+    subscription_revenue_usd = Column(DECIMAL(14, 4), default=0, nullable=False)
+    usage_overage_usd = Column(DECIMAL(14, 4), default=0, nullable=False)
+    one_time_fees_usd = Column(DECIMAL(14, 4), default=0, nullable=False)
+    total_provider_cost_usd = Column(DECIMAL(14, 4), default=0, nullable=False)
+
+    # Usage totals
+    sessions_created = Column(Integer, default=0, nullable=False)
+    transcriptions_completed = Column(Integer, default=0, nullable=False)
+    total_minutes_processed = Column(DECIMAL(14, 2), default=0, nullable=False)
+
+    # Sums and counts behind the per-user averages
+    plan_utilization_total = Column(DECIMAL(14, 2), default=0, nullable=False)
+    success_rate_total = Column(DECIMAL(14, 2), default=0, nullable=False)
+    success_rate_count = Column(Integer, default=0, nullable=False)
+    health_score_total = Column(DECIMAL(14, 2), default=0, nullable=False)
+
+    # Customer health counts
+    churn_risk_users = Column(Integer, default=0, nullable=False)
+    at_risk_users = Column(Integer, default=0, nullable=False)
+    power_users = Column(Integer, default=0, nullable=False)
+    health_excellent = Column(Integer, default=0, nullable=False)  # 90-100
+    health_good = Column(Integer, default=0, nullable=False)  # 70-89
+    health_average = Column(Integer, default=0, nullable=False)  # 50-69
+    health_poor = Column(Integer, default=0, nullable=False)  # 30-49
+    health_critical = Column(Integer, default=0, nullable=False)  # 0-29
+
+    __table_args__ = (
+        UniqueConstraint(
+            "period_type",
+            "period_start",
+            "plan_name",
+            "user_segment",
+            name="uq_billing_analytics_rollup_period",
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<BillingAnalyticsRollup(period_type={self.period_type}, "
+            f"period_start={self.period_start}, plan={self.plan_name}, "
+            f"segment={self.user_segment}, users={self.users})>"
+        )
@@ -1,6 +1,6 @@
 """Client model for coaching sessions."""
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -38,6 +38,9 @@ class Client(BaseModel):
     is_anonymized = Column(Boolean, nullable=False, default=False)
     anonymized_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Keyset pagination of the client list (name, id)
+    __table_args__ = (Index("idx_client_user_name", "user_id", "name", "id"),)
+
     # Relationships
     user = relationship("User", back_populates="clients")
     coaching_sessions = relationship(
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Date,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -71,6 +72,15 @@ class CoachingSession(BaseModel):
     __table_args__ = (
         CheckConstraint("duration_min > 0", name="duration_positive"),
         CheckConstraint("fee_amount >= 0", name="fee_non_negative"),
+        # Keyset pagination of the session list (sort key, id)
+        Index("idx_coaching_session_user_date", "user_id", "session_date", "id"),
+        Index(
+            "idx_coaching_session_user_fee",
+            "user_id",
+            "fee_currency",
+            "fee_amount",
+            "id",
+        ),
     )
 
     # Relationships
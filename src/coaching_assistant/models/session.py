@@ -2,7 +2,7 @@
 
 import enum
 
-from sqlalchemy import JSON, Column, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -62,6 +62,9 @@ class Session(BaseModel):
         JSON, default={}, nullable=False
     )  # Provider-specific metadata
 
+    # Keyset pagination of the session list (created_at, id)
+    __table_args__ = (Index("idx_session_user_created", "user_id", "created_at", "id"),)
+
     # Relationships
     user = relationship("User", back_populates="sessions")
     segments = relationship(
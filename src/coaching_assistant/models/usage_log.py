@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
 )
@@ -94,6 +95,8 @@ class UsageLog(BaseModel):
         "UsageLog", remote_side="UsageLog.id", backref="child_logs"
     )
 
+    __table_args__ = (Index("idx_usage_logs_user_created", "user_id", "created_at"),)
+
     def __repr__(self):
         return (
             f"<UsageLog(id={self.id}, user_id={self.user_id}, "
@@ -0,0 +1,56 @@
+"""Usage rollup model for per-plan, per-provider totals by day and month."""
+
+from sqlalchemy import (
+    DECIMAL,
+    Column,
+    Date,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+
+from .base import BaseModel
+
+
+class UsageRollup(BaseModel):
+    """Usage totals for one plan and STT provider over a day or a month."""
+
+    __tablename__ = "usage_rollups"
+
+    # Period and dimensions
+    period_type = Column(String(20), nullable=False)  # 'daily', 'monthly'
+    period_start = Column(Date, nullable=False)
+    user_plan = Column(String(20), nullable=False)
+    stt_provider = Column(String(50), nullable=False)
+
+    # Transcription counts
+    transcriptions = Column(Integer, default=0, nullable=False)
+    billable_transcriptions = Column(Integer, default=0, nullable=False)
+    original_transcriptions = Column(Integer, default=0, nullable=False)
+    free_retries = Column(Integer, default=0, nullable=False)
+    paid_retranscriptions = Column(Integer, default=0, nullable=False)
+
+    # Volume and cost
+    total_minutes = Column(Integer, default=0, nullable=False)
+    total_cost_usd = Column(DECIMAL(14, 6), default=0, nullable=False)
+
+    # Users whose first log of the period, or first log ever, is counted here
+    active_users = Column(Integer, default=0, nullable=False)
+    new_users = Column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "period_type",
+            "period_start",
+            "user_plan",
+            "stt_provider",
+            name="uq_usage_rollup_period",
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<UsageRollup(period_type={self.period_type}, "
+            f"period_start={self.period_start}, plan={self.user_plan}, "
+            f"provider={self.stt_provider}, transcriptions={self.transcriptions})>"
+        )
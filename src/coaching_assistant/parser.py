@@ -4,16 +4,45 @@ Module for parsing VTT files into a structured format.
 Supports multiple formats:
 1. MS Teams VTT format: <v Speaker Name>Text</v>
 2. MacWhisper VTT format: Speaker Name: Text
+
+The parser works in a single streaming pass: the input (str, bytes, a file-like
+object or an iterator of byte chunks) is decoded and split into cue blocks by
+the shared tokenizer in transcript_ingest, and each cue is yielded as soon as it
+has been read. The format is detected from the first cues instead of scanning
+the whole file.
 """
 
+import itertools
+import logging
 import re
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from typing import Any, Dict, List, Match, Optional
-
-
-class UnrecognizedFormatError(ValueError):
-    """Custom exception for when the VTT format cannot be determined."""
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from .cue_table import CueTable, format_timestamp_ms
+from .transcript_ingest import (  # noqa: F401 - re-exported for callers
+    READ_CHUNK_SIZE,
+    TranscriptSource,
+    UnrecognizedFormatError,
+    iter_chunks,
+    iter_cue_lines,
+    iter_lines,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of cues inspected before giving up on format detection
+DETECTION_CUE_LIMIT = 50
 
 
 class VTTFormat(Enum):
@@ -29,51 +58,50 @@ class BaseVTTParser(ABC):
 
     @classmethod
     @abstractmethod
-    def get_pattern(cls) -> str:
-        """Return the regex pattern for this format."""
+    def get_cue_pattern(cls) -> Pattern:
+        """Return the precompiled pattern matched against a single cue's text."""
 
     @classmethod
-    @abstractmethod
-    def extract_data(cls, match: Match) -> Dict[str, Any]:
-        """Extract data from regex match groups."""
+    def parse_cue_record(cls, time: str, text: str) -> Optional[Tuple[str, str, str]]:
+        """Parse one cue block into (time, speaker, content), or None if no match."""
+        match = cls.get_cue_pattern().match(text)
+        if match is None:
+            return None
+        speaker, content = cls.extract_cue(match)
+        return time, speaker, content
 
     @classmethod
-    def parse(cls, content: str) -> List[Dict[str, Any]]:
-        """Parse VTT content using this parser's format."""
-        matches = re.finditer(cls.get_pattern(), content, re.DOTALL)
-        return [cls.extract_data(match) for match in matches]
+    @abstractmethod
+    def extract_cue(cls, match: Match) -> Tuple[str, str]:
+        """Extract (speaker, content) from a cue pattern match."""
 
 
 class MSTeamsParser(BaseVTTParser):
     """Parser for MS Teams VTT format: <v Speaker>Text</v>"""
 
+    _CUE_PATTERN = re.compile(r"<v\s*([^>]+)>([^<]+)</v>")
+
     @classmethod
-    def get_pattern(cls) -> str:
-        return r"(?m)^(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*\d{2}:\d{2}:\d{2}\.\d{3}\s*\n<v\s*([^>]+)>([^<]+)</v>"
+    def get_cue_pattern(cls) -> Pattern:
+        return cls._CUE_PATTERN
 
     @classmethod
-    def extract_data(cls, match: Match) -> Dict[str, Any]:
-        return {
-            "time": match.group(1).strip(),
-            "speaker": match.group(2).strip(),
-            "content": match.group(3).strip().replace("\n", " "),
-        }
+    def extract_cue(cls, match: Match) -> Tuple[str, str]:
+        return match.group(1).strip(), match.group(2).strip().replace("\n", " ")
 
 
 class MacWhisperParser(BaseVTTParser):
     """Parser for MacWhisper VTT format: Speaker: Text"""
 
+    _CUE_PATTERN = re.compile(r"([^\n:]+):\s*([^\n]+)")
+
     @classmethod
-    def get_pattern(cls) -> str:
-        return r"(?m)^(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*\d{2}:\d{2}:\d{2}\.\d{3}\s*\n([^\n:]+):\s*([^\n]+)"
+    def get_cue_pattern(cls) -> Pattern:
+        return cls._CUE_PATTERN
 
     @classmethod
-    def extract_data(cls, match: Match) -> Dict[str, Any]:
-        return {
-            "time": match.group(1).strip(),
-            "speaker": match.group(2).strip(),
-            "content": match.group(3).strip(),
-        }
+    def extract_cue(cls, match: Match) -> Tuple[str, str]:
+        return match.group(1).strip(), match.group(2).strip()
 
 
 # Map of format names to their respective parsers
@@ -82,129 +110,138 @@ PARSERS = {
     "MAC_WHISPER": MacWhisperParser,
 }
 
+# Formats in detection priority order
+_DETECTION_ORDER = (VTTFormat.MS_TEAMS, VTTFormat.MAC_WHISPER)
+
+
+def iter_cue_blocks(source: TranscriptSource) -> Iterator[Tuple[str, str]]:
+    """
+    Split a transcript into cue blocks in a single pass.
+
+    Yields (start_time, text) tuples where text holds the cue's lines joined by
+    newlines. Header lines, cue identifiers and notes are skipped.
+    """
+    for start_ms, _, lines in iter_cue_lines(source):
+        yield format_timestamp_ms(start_ms), "\n".join(lines)
 
-def detect_format(content: str) -> Optional[VTTFormat]:
-    """Detect the VTT format from the content."""
-    # Check for MS Teams format
-    if re.search(r"<v\s*[^>]+>.*</v>", content, re.DOTALL):
-        return VTTFormat.MS_TEAMS
-    # Check for MacWhisper format (Speaker: Text pattern)
-    if re.search(
-        r"^\d{2}:\d{2}:\d{2}\.\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}\.\d{3}\s*\n[^\n:]+:",
-        content,
-        re.MULTILINE,
-    ):
-        return VTTFormat.MAC_WHISPER
 
+def _detect_block_format(text: str) -> Optional[VTTFormat]:
+    """Detect the format of a single cue's text."""
+    for format_type in _DETECTION_ORDER:
+        if PARSERS[format_type.name].get_cue_pattern().match(text):
+            return format_type
     return None
 
 
-def parse_vtt(
-    content: str, format_type: Optional[VTTFormat] = None
-) -> List[Dict[str, Any]]:
+def detect_format(content: TranscriptSource) -> Optional[VTTFormat]:
+    """Detect the VTT format from the content."""
+    for _, text in iter_cue_blocks(content):
+        format_type = _detect_block_format(text)
+        if format_type is not None:
+            return format_type
+    return None
+
+
+def _get_parser(format_type: Union[VTTFormat, str]):
+    format_name = format_type.name if hasattr(format_type, "name") else str(format_type)
+    parser = PARSERS.get(format_name)
+    if parser is None:
+        raise ValueError(f"No parser available for format: {format_name}")
+    return parser
+
+
+def iter_cue_records(
+    source: TranscriptSource,
+    format_type: Optional[VTTFormat] = None,
+    detection_limit: int = DETECTION_CUE_LIMIT,
+) -> Iterator[Tuple[str, str, str]]:
     """
-    Parse VTT content and return a list of dictionaries with time, speaker, and content.
+    Stream cues from a VTT source as (time, speaker, content) tuples.
 
     Args:
-        content: The string content of the VTT file.
-        format_type: Optional format type to force. If None, will auto-detect.
-
-    Returns:
-        List of dictionaries containing 'time', 'speaker', and 'content' keys.
+        source: str, bytes, a text/binary file-like object, or an iterator of
+            byte/str chunks.
+        format_type: Optional format type to force. If None, the format is
+            detected from the first cues.
+        detection_limit: Maximum number of cues buffered while detecting.
 
     Raises:
-        ValueError: If the format cannot be detected or is not supported.
+        UnrecognizedFormatError: If the format cannot be detected.
+        ValueError: If the format is not supported.
     """
+    blocks = iter_cue_blocks(source)
 
-    # If format not specified, try to detect it
     if format_type is None:
-        format_type = detect_format(content)
+        buffered: List[Tuple[str, str]] = []
+        for block in blocks:
+            buffered.append(block)
+            format_type = _detect_block_format(block[1])
+            if format_type is not None or len(buffered) >= detection_limit:
+                break
         if format_type is None:
             raise UnrecognizedFormatError(
                 "Could not detect VTT format. Please specify the format type."
             )
-        format_name = (
-            format_type.name if hasattr(format_type, "name") else str(format_type)
-        )
-        print(f"Detected VTT format: {format_name}")
-    else:
-        format_name = (
-            format_type.name if hasattr(format_type, "name") else str(format_type)
-        )
-        print(f"Using specified VTT format: {format_name}")
-
-    # Get the appropriate parser
-    parser = PARSERS.get(format_name)
-    if parser is None:
-        raise ValueError(f"No parser available for format: {format_name}")
+        logger.debug(f"Detected VTT format: {format_type.name}")
+        blocks = itertools.chain(buffered, blocks)
 
-    # Parse the content
-    try:
-        return parser.parse(content)
-    except Exception as e:
-        raise ValueError(f"Error parsing VTT file with format {format_name}: {str(e)}")
+    parser = _get_parser(format_type)
+    for time, text in blocks:
+        record = parser.parse_cue_record(time, text)
+        if record is not None:
+            yield record
 
 
-def consolidate_speakers(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def iter_cues(
+    source: TranscriptSource,
+    format_type: Optional[VTTFormat] = None,
+    detection_limit: int = DETECTION_CUE_LIMIT,
+) -> Iterator[Dict[str, Any]]:
     """
-    Consolidate consecutive speeches from the same speaker.
+    Stream cues from a VTT source one at a time.
 
-    Args:
-        data: List of parsed VTT entries
+    Accepts the same arguments as iter_cue_records.
 
-    Returns:
-        Consolidated list of entries
+    Yields:
+        Dictionaries containing 'time', 'speaker', and 'content' keys.
+    """
+    for time, speaker, content in iter_cue_records(
+        source, format_type, detection_limit
+    ):
+        yield {"time": time, "speaker": speaker, "content": content}
+
+
+def parse_vtt_table(
+    content: TranscriptSource, format_type: Optional[VTTFormat] = None
+) -> CueTable:
     """
-    consolidated = []
-    current_speaker = None
-    current_content = []
-    current_time = None
-
-    for item in data:
-        if item["speaker"] != current_speaker:
-            if current_speaker:
-                consolidated.append(
-                    {
-                        "time": current_time,
-                        "speaker": current_speaker,
-                        "content": " ".join(current_content),
-                    }
-                )
-            current_speaker = item["speaker"]
-            current_content = [item["content"]]
-            current_time = item["time"]
-        else:
-            current_content.append(item["content"])
-
-    if current_speaker:
-        consolidated.append(
-            {
-                "time": current_time,
-                "speaker": current_speaker,
-                "content": " ".join(current_content),
-            }
-        )
-
-    return consolidated
-
-
-def replace_names(
-    data: List[Dict[str, Any]], coach: str, client: str
+    Parse VTT content into a compact CueTable.
+
+    Cues are streamed straight into the table's columns, so no per-cue
+    dictionaries are created.
+    """
+    return CueTable.from_records(iter_cue_records(content, format_type))
+
+
+def parse_vtt(
+    content: TranscriptSource, format_type: Optional[VTTFormat] = None
 ) -> List[Dict[str, Any]]:
     """
-    Replace speaker names with 'Coach' or 'Client' based on provided names.
+    Parse VTT content and return a list of dictionaries with time, speaker, and content.
 
     Args:
-        data: List of VTT entries
-        coach: Name of the coach to be replaced with 'Coach'
-        client: Name of the client to be replaced with 'Client'
+        content: The content of the VTT file (str, bytes or a file-like object).
+        format_type: Optional format type to force. If None, will auto-detect.
 
     Returns:
-        List of entries with replaced names
+        List of dictionaries containing 'time', 'speaker', and 'content' keys.
+
+    Raises:
+        ValueError: If the format cannot be detected or is not supported.
     """
-    for item in data:
-        if item["speaker"] == coach:
-            item["speaker"] = "Coach"
-        elif item["speaker"] == client:
-            item["speaker"] = "Client"
-    return data
+    try:
+        return list(iter_cues(content, format_type))
+    except (UnrecognizedFormatError, ValueError):
+        raise
+    except Exception as e:
+        raise ValueError(f"Error parsing VTT file: {str(e)}")
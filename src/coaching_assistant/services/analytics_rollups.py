@@ -0,0 +1,452 @@
+"""Rollup tables behind the admin usage and billing reports.
+
+Admin reports read a handful of pre-summed rows per period instead of
+aggregating every user's records on each page load. UsageRollup rows are
+bumped by every new usage log and rebuilt from usage_logs each night to
+correct any drift. BillingAnalyticsRollup rows are recomputed from a
+period's BillingAnalytics records whenever that period is rebuilt.
+"""
+
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import and_, case, delete, exists, func, or_, select
+from sqlalchemy.orm import Session
+
+from ..infrastructure.db.bulk import bulk_increment, bulk_insert
+from ..infrastructure.db.expressions import period_start_key
+from ..models.billing_analytics import BillingAnalytics
+from ..models.billing_analytics_rollup import BillingAnalyticsRollup
+from ..models.usage_log import TranscriptionType, UsageLog
+from ..models.usage_rollup import UsageRollup
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_PERIOD_TYPES = ("daily", "monthly")
+USAGE_ROLLUP_KEY = ("period_type", "period_start", "user_plan", "stt_provider")
+USAGE_ROLLUP_COUNTERS = (
+    "transcriptions",
+    "billable_transcriptions",
+    "original_transcriptions",
+    "free_retries",
+    "paid_retranscriptions",
+    "total_minutes",
+    "total_cost_usd",
+    "active_users",
+    "new_users",
+)
+
+# Health score range labels and the rollup columns counting them
+HEALTH_SCORE_RANGES = {
+    "excellent (90-100)": "health_excellent",
+    "good (70-89)": "health_good",
+    "average (50-69)": "health_average",
+    "poor (30-49)": "health_poor",
+    "critical (0-29)": "health_critical",
+}
+
+
+def _period_start(day: date, period_type: str) -> date:
+    return day.replace(day=1) if period_type == "monthly" else day
+
+
+def _decimal(value: Any, places: int) -> Decimal:
+    return Decimal(str(round(float(value or 0), places)))
+
+
+def _capped(value, cap: float):
+    return case((value > cap, cap), else_=value)
+
+
+class UsageRollups:
+    """Maintain the daily and monthly UsageRollup tables."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, usage_log: UsageLog) -> None:
+        """
+        Add a newly flushed usage log to its daily and monthly rollups.
+
+        Both rows are bumped by one INSERT ... ON CONFLICT that adds to the
+        stored counters, so concurrent logs for the same plan and provider
+        never overwrite each other. The caller commits.
+        """
+        first_today, first_this_month, first_ever = self._first_logs(usage_log)
+        transcription_type = usage_log.transcription_type
+        counters = {
+            "transcriptions": 1,
+            "billable_transcriptions": int(bool(usage_log.is_billable)),
+            "original_transcriptions": int(
+                transcription_type == TranscriptionType.ORIGINAL
+            ),
+            "free_retries": int(transcription_type == TranscriptionType.RETRY_FAILED),
+            "paid_retranscriptions": int(
+                transcription_type == TranscriptionType.RETRY_SUCCESS
+            ),
+            "total_minutes": usage_log.duration_minutes or 0,
+            "total_cost_usd": usage_log.cost_usd or Decimal("0"),
+            "new_users": int(first_ever),
+        }
+        day = usage_log.created_at.date()
+        active_users = {"daily": first_today, "monthly": first_this_month}
+
+        bulk_increment(
+            self.db,
+            UsageRollup.__table__,
+            [
+                {
+                    "period_type": period_type,
+                    "period_start": _period_start(day, period_type),
+                    "user_plan": usage_log.user_plan,
+                    "stt_provider": usage_log.stt_provider,
+                    **counters,
+                    "active_users": int(active_users[period_type]),
+                }
+                for period_type in ROLLUP_PERIOD_TYPES
+            ],
+            conflict_columns=USAGE_ROLLUP_KEY,
+            increment_columns=USAGE_ROLLUP_COUNTERS,
+            update_columns=("updated_at",),
+        )
+
+    def reconcile(self, since: date) -> Dict[str, int]:
+        """
+        Rebuild the rollups from usage_logs, starting at since.
+
+        Daily rollups are rebuilt from since onwards and monthly rollups
+        from the start of since's month, in a single transaction. Logs
+        written while a reconciliation runs may be missed; the next one
+        picks them up.
+
+        Returns:
+            Rollup rows written per period type
+        """
+        written = {}
+        for period_type in ROLLUP_PERIOD_TYPES:
+            first_period = _period_start(since, period_type)
+            rows = self._aggregate(period_type, first_period)
+            self.db.execute(
+                delete(UsageRollup).where(
+                    UsageRollup.period_type == period_type,
+                    UsageRollup.period_start >= first_period,
+                )
+            )
+            bulk_insert(self.db, UsageRollup.__table__, rows)
+            written[period_type] = len(rows)
+
+        self.db.commit()
+        logger.info(f"🔄 Usage rollups reconciled since {since}: {written}")
+        return written
+
+    def _first_logs(self, usage_log: UsageLog) -> Tuple[bool, bool, bool]:
+        """Whether the log is its user's first of the day, of the month and ever."""
+        created_at = usage_log.created_at
+        day_start = datetime.combine(created_at.date(), time.min)
+        earlier = and_(
+            UsageLog.user_id == usage_log.user_id,
+            or_(
+                UsageLog.created_at < created_at,
+                and_(UsageLog.created_at == created_at, UsageLog.id < usage_log.id),
+            ),
+        )
+        seen_today, seen_this_month, seen_before = self.db.execute(
+            select(
+                exists().where(earlier, UsageLog.created_at >= day_start),
+                exists().where(
+                    earlier, UsageLog.created_at >= day_start.replace(day=1)
+                ),
+                exists().where(earlier),
+            )
+        ).one()
+        return not seen_today, not seen_this_month, not seen_before
+
+    def _aggregate(self, period_type: str, first_period: date) -> List[Dict[str, Any]]:
+        """Sum usage_logs into rollup rows for every period from first_period on."""
+        window_start = datetime.combine(first_period, time.min)
+        period = period_start_key(self.db, UsageLog.created_at, period_type)
+        ordering = (UsageLog.created_at, UsageLog.id)
+
+        # Ranks need each user's whole history, so filter by user here and
+        # by date only after ranking
+        ranked = (
+            select(
+                period.label("period"),
+                UsageLog.created_at,
+                UsageLog.user_plan,
+                UsageLog.stt_provider,
+                UsageLog.transcription_type,
+                UsageLog.is_billable,
+                UsageLog.duration_minutes,
+                UsageLog.cost_usd,
+                func.row_number()
+                .over(partition_by=(UsageLog.user_id, period), order_by=ordering)
+                .label("period_rank"),
+                func.row_number()
+                .over(partition_by=UsageLog.user_id, order_by=ordering)
+                .label("lifetime_rank"),
+            )
+            .where(
+                UsageLog.user_id.in_(
+                    select(UsageLog.user_id).where(UsageLog.created_at >= window_start)
+                )
+            )
+            .subquery()
+        )
+        transcription_type = ranked.c.transcription_type
+        query = (
+            select(
+                ranked.c.period,
+                ranked.c.user_plan,
+                ranked.c.stt_provider,
+                func.count().label("transcriptions"),
+                func.count()
+                .filter(ranked.c.is_billable)
+                .label("billable_transcriptions"),
+                func.count()
+                .filter(transcription_type == TranscriptionType.ORIGINAL)
+                .label("original_transcriptions"),
+                func.count()
+                .filter(transcription_type == TranscriptionType.RETRY_FAILED)
+                .label("free_retries"),
+                func.count()
+                .filter(transcription_type == TranscriptionType.RETRY_SUCCESS)
+                .label("paid_retranscriptions"),
+                func.sum(ranked.c.duration_minutes).label("total_minutes"),
+                func.sum(ranked.c.cost_usd).label("total_cost_usd"),
+                func.count().filter(ranked.c.period_rank == 1).label("active_users"),
+                func.count().filter(ranked.c.lifetime_rank == 1).label("new_users"),
+            )
+            .where(ranked.c.created_at >= window_start)
+            .group_by(ranked.c.period, ranked.c.user_plan, ranked.c.stt_provider)
+        )
+
+        rows = []
+        for row in self.db.execute(query):
+            values = row._asdict()
+            period_key = values.pop("period")
+            rows.append(
+                {
+                    **values,
+                    "period_type": period_type,
+                    "period_start": date.fromisoformat(period_key),
+                    "total_minutes": int(values["total_minutes"] or 0),
+                    "total_cost_usd": _decimal(values["total_cost_usd"], 6),
+                }
+            )
+        return rows
+
+
+class BillingAnalyticsRollups:
+    """Maintain the BillingAnalyticsRollup table."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh(self, period_type: str, period_start: datetime) -> int:
+        """
+        Recompute one period's rollups from its BillingAnalytics records.
+
+        Health scores and the at-risk and power-user flags are evaluated in
+        SQL with the formulas of the BillingAnalytics model. The caller
+        commits.
+
+        Returns:
+            Rollup rows written
+        """
+        self.db.execute(
+            delete(BillingAnalyticsRollup).where(
+                BillingAnalyticsRollup.period_type == period_type,
+                BillingAnalyticsRollup.period_start == period_start,
+            )
+        )
+        in_period = and_(
+            BillingAnalytics.period_type == period_type,
+            BillingAnalytics.period_start == period_start,
+        )
+        stored_start, period_end = self.db.execute(
+            select(
+                func.min(BillingAnalytics.period_start),
+                func.max(BillingAnalytics.period_end),
+            ).where(in_period)
+        ).one()
+        if period_end is None:
+            return 0
+
+        period_days = max((period_end - stored_start).days, 1)
+        records = self._scored_records(in_period, period_days)
+        query = select(
+            records.c.plan_name,
+            records.c.user_segment,
+            func.count().label("users"),
+            func.sum(records.c.total_revenue_usd).label("total_revenue_usd"),
+            func.sum(records.c.subscription_revenue_usd).label(
+                "subscription_revenue_usd"
+            ),
+            func.sum(records.c.usage_overage_usd).label("usage_overage_usd"),
+            func.sum(records.c.one_time_fees_usd).label("one_time_fees_usd"),
+            func.sum(records.c.total_provider_cost_usd).label(
+                "total_provider_cost_usd"
+            ),
+            func.sum(records.c.sessions_created).label("sessions_created"),
+            func.sum(records.c.transcriptions_completed).label(
+                "transcriptions_completed"
+            ),
+            func.sum(records.c.total_minutes_processed).label(
+                "total_minutes_processed"
+            ),
+            func.sum(records.c.plan_utilization_percentage).label(
+                "plan_utilization_total"
+            ),
+            func.sum(records.c.success_rate_percentage)
+            .filter(records.c.success_rate_percentage != 0)
+            .label("success_rate_total"),
+            func.count()
+            .filter(records.c.success_rate_percentage != 0)
+            .label("success_rate_count"),
+            func.sum(records.c.health_score).label("health_score_total"),
+            func.count()
+            .filter(records.c.churn_risk_score > 0.7)
+            .label("churn_risk_users"),
+            func.count().filter(records.c.at_risk).label("at_risk_users"),
+            func.count().filter(records.c.power_user).label("power_users"),
+            func.count().filter(records.c.health_score >= 90).label("health_excellent"),
+            func.count()
+            .filter(records.c.health_score >= 70, records.c.health_score < 90)
+            .label("health_good"),
+            func.count()
+            .filter(records.c.health_score >= 50, records.c.health_score < 70)
+            .label("health_average"),
+            func.count()
+            .filter(records.c.health_score >= 30, records.c.health_score < 50)
+            .label("health_poor"),
+            func.count().filter(records.c.health_score < 30).label("health_critical"),
+        ).group_by(records.c.plan_name, records.c.user_segment)
+
+        money = {
+            "total_revenue_usd",
+            "subscription_revenue_usd",
+            "usage_overage_usd",
+            "one_time_fees_usd",
+            "total_provider_cost_usd",
+        }
+        totals = {
+            "total_minutes_processed",
+            "plan_utilization_total",
+            "success_rate_total",
+            "health_score_total",
+        }
+        rows = []
+        for row in self.db.execute(query):
+            values = row._asdict()
+            for name in money:
+                values[name] = _decimal(values[name], 4)
+            for name in totals:
+                values[name] = _decimal(values[name], 2)
+            values["sessions_created"] = values["sessions_created"] or 0
+            values["transcriptions_completed"] = values["transcriptions_completed"] or 0
+            rows.append(
+                {
+                    **values,
+                    "period_type": period_type,
+                    "period_start": period_start,
+                    "period_end": period_end,
+                }
+            )
+
+        bulk_insert(self.db, BillingAnalyticsRollup.__table__, rows)
+        return len(rows)
+
+    def refresh_since(self, since: datetime) -> int:
+        """Refresh every period starting at or after since, then commit."""
+        periods = self.db.execute(
+            select(BillingAnalytics.period_type, BillingAnalytics.period_start)
+            .where(BillingAnalytics.period_start >= since)
+            .distinct()
+        ).all()
+        written = sum(
+            self.refresh(period_type, period_start)
+            for period_type, period_start in periods
+        )
+        self.db.commit()
+        logger.info(
+            f"🔄 Billing analytics rollups refreshed for {len(periods)} periods"
+        )
+        return written
+
+    @staticmethod
+    def _scored_records(in_period, period_days: int):
+        """The period's records with health score and risk flags attached."""
+        utilization = BillingAnalytics.plan_utilization_percentage
+        days_active = BillingAnalytics.days_active_in_period
+        sessions_per_day = BillingAnalytics.avg_sessions_per_active_day
+        success_rate = BillingAnalytics.success_rate_percentage
+        churn_risk = BillingAnalytics.churn_risk_score
+
+        # BillingAnalytics.calculate_customer_health_score, where a zero
+        # success rate counts as 100
+        health_score = _capped(
+            _capped(utilization, 100) * 0.3
+            + days_active * (100 * 0.3 / period_days)
+            + _capped(sessions_per_day * 10, 100) * 0.2
+            + case((success_rate == 0, 100), else_=success_rate) * 0.2,
+            100,
+        )
+
+        return (
+            select(
+                BillingAnalytics.plan_name,
+                func.coalesce(BillingAnalytics.user_segment, "unknown").label(
+                    "user_segment"
+                ),
+                BillingAnalytics.total_revenue_usd,
+                BillingAnalytics.subscription_revenue_usd,
+                BillingAnalytics.usage_overage_usd,
+                BillingAnalytics.one_time_fees_usd,
+                BillingAnalytics.total_provider_cost_usd,
+                BillingAnalytics.sessions_created,
+                BillingAnalytics.transcriptions_completed,
+                BillingAnalytics.total_minutes_processed,
+                utilization,
+                success_rate,
+                churn_risk,
+                health_score.label("health_score"),
+                or_(
+                    churn_risk > 0.7,
+                    days_active < period_days * 0.2,
+                    utilization < 10,
+                ).label("at_risk"),
+                and_(
+                    utilization > 70,
+                    days_active > period_days * 0.6,
+                    sessions_per_day > 3,
+                ).label("power_user"),
+            )
+            .where(in_period)
+            .subquery()
+        )
+
+
+def backfill_rollups(db: Session) -> Dict[str, Any]:
+    """
+    Build every rollup from the full usage_logs and billing_analytics history.
+
+    The nightly reconcile only looks back to the previous month, so records
+    written before the rollup tables existed are summed once by this pass.
+    Commits.
+
+    Returns:
+        Rollup rows written per table
+    """
+    first_log = db.execute(select(func.min(UsageLog.created_at))).scalar()
+    first_period = db.execute(select(func.min(BillingAnalytics.period_start))).scalar()
+    written = {"usage_rollups": {}, "billing_analytics_rollups": 0}
+    if first_log is not None:
+        written["usage_rollups"] = UsageRollups(db).reconcile(first_log.date())
+    if first_period is not None:
+        written["billing_analytics_rollups"] = BillingAnalyticsRollups(
+            db
+        ).refresh_since(first_period)
+    return written
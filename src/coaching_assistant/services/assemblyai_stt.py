@@ -45,13 +45,24 @@ class AssemblyAIProvider(STTProvider):
     """AssemblyAI Speech-to-Text provider implementation."""
 
     BASE_URL = "https://api.assemblyai.com/v2"
+    WEBHOOK_AUTH_HEADER = "X-AssemblyAI-Webhook-Secret"
 
-    def __init__(self):
-        """Initialize AssemblyAI client."""
+    def __init__(self, base_url: Optional[str] = None):
+        """
+        Initialize AssemblyAI client.
+
+        Args:
+            base_url: API root, e.g. a local fake server in tests; defaults to
+                ASSEMBLYAI_BASE_URL
+        """
         self.api_key = settings.ASSEMBLYAI_API_KEY
         if not self.api_key:
             raise STTProviderError("ASSEMBLYAI_API_KEY is not set in configuration")
 
+        self.base_url = base_url or getattr(
+            settings, "ASSEMBLYAI_BASE_URL", self.BASE_URL
+        )
+
         self.headers = {
             "authorization": self.api_key,
             "content-type": "application/json",
@@ -216,7 +227,7 @@ class AssemblyAIProvider(STTProvider):
 
         # If it's a local file path, upload it to AssemblyAI
         logger.info(f"Uploading local file to AssemblyAI: {audio_uri}")
-        upload_url = f"{self.BASE_URL}/upload"
+        upload_url = f"{self.base_url}/upload"
 
         try:
             with open(audio_uri, "rb") as f:
@@ -238,6 +249,7 @@ class AssemblyAIProvider(STTProvider):
         language_code: Optional[str],
         enable_diarization: bool,
         speakers_expected: int,
+        webhook_url: Optional[str] = None,
     ) -> str:
         """Submit transcription job to AssemblyAI."""
         transcript_request = {
@@ -260,9 +272,19 @@ class AssemblyAIProvider(STTProvider):
 
         logger.info(f"Submitting transcription request: {transcript_request}")
 
+        # AssemblyAI POSTs {"transcript_id", "status"} here once the job ends
+        if webhook_url:
+            transcript_request["webhook_url"] = webhook_url
+            webhook_secret = getattr(settings, "ASSEMBLYAI_WEBHOOK_SECRET", "")
+            if webhook_secret:
+                transcript_request["webhook_auth_header_name"] = (
+                    self.WEBHOOK_AUTH_HEADER
+                )
+                transcript_request["webhook_auth_header_value"] = webhook_secret
+
         try:
             response = requests.post(
-                f"{self.BASE_URL}/transcript",
+                f"{self.base_url}/transcript",
                 json=transcript_request,
                 headers=self.headers,
             )
@@ -295,7 +317,7 @@ class AssemblyAIProvider(STTProvider):
         self, transcript_id: str, progress_callback=None
     ) -> Dict[str, Any]:
         """Poll for transcription completion with optional progress updates."""
-        polling_url = f"{self.BASE_URL}/transcript/{transcript_id}"
+        polling_url = f"{self.base_url}/transcript/{transcript_id}"
         polling_interval = 30  # Poll every 30 seconds (reduced from 1 second)
         max_retries = 240  # Max 2 hours (240 * 30 seconds = 7200 seconds = 2 hours)
         retry_count = 0
@@ -324,67 +346,7 @@ class AssemblyAIProvider(STTProvider):
                         )
                     return result
                 elif status == "error":
-                    error_msg = result.get("error", "Unknown error")
-
-                    # Log detailed error information
-                    logger.error(
-                        f"AssemblyAI transcription failed for transcript "
-                        f"{transcript_id}"
-                    )
-                    logger.error(f"Error message: {error_msg}")
-                    logger.error(f"Full error response: {result}")
-
-                    # Check if it's a URL expiration/download error
-                    if (
-                        "download error" in error_msg.lower()
-                        and "unable to download" in error_msg.lower()
-                        and "x-goog-expires" in error_msg.lower()
-                    ):
-                        logger.warning("=" * 80)
-                        logger.warning("SIGNED URL EXPIRATION DETECTED")
-                        logger.warning("=" * 80)
-                        logger.warning(
-                            "The signed URL has expired and AssemblyAI cannot download the audio file."
-                        )
-                        logger.warning(f"Error: {error_msg}")
-                        logger.warning("This typically happens when:")
-                        logger.warning(
-                            "1. The transcription task is retrying after a long delay"
-                        )
-                        logger.warning(
-                            "2. AssemblyAI queue processing took longer than expected"
-                        )
-                        logger.warning("3. The audio file was uploaded hours ago")
-                        logger.warning("=" * 80)
-
-                        # This is a non-retryable error since the URL won't get
-                        # refreshed
-                        error_msg = f"Signed URL expired - audio file no longer accessible: {error_msg}"
-                    # Check if it's a server error that might be transient
-                    elif (
-                        "server error" in error_msg.lower()
-                        or "developers have been alerted" in error_msg.lower()
-                    ):
-                        logger.warning("=" * 80)
-                        logger.warning("AssemblyAI SERVICE ISSUE DETECTED")
-                        logger.warning("=" * 80)
-                        logger.warning("AssemblyAI is experiencing server issues.")
-                        logger.warning(f"Error: {error_msg}")
-                        logger.warning(
-                            "This is likely a temporary issue on AssemblyAI's side."
-                        )
-                        logger.warning(
-                            "The transcription will be retried automatically."
-                        )
-                        logger.warning(
-                            "Consider switching to Google STT if the issue persists."
-                        )
-                        logger.warning("=" * 80)
-
-                        # Mark as a temporary error that could be retried later
-                        error_msg = f"AssemblyAI temporary server error: {error_msg}"
-
-                    raise STTProviderError(f"Transcription failed: {error_msg}")
+                    self._raise_transcript_error(transcript_id, result)
 
                 # Update progress based on elapsed time (rough estimation)
                 if (
@@ -469,6 +431,59 @@ class AssemblyAIProvider(STTProvider):
 
         raise STTProviderError("Transcription timed out after 2 hours")
 
+    def _raise_transcript_error(self, transcript_id: str, result: Dict[str, Any]):
+        """Raise STTProviderError describing a transcript in "error" status."""
+        error_msg = result.get("error", "Unknown error")
+
+        # Log detailed error information
+        logger.error(f"AssemblyAI transcription failed for transcript {transcript_id}")
+        logger.error(f"Error message: {error_msg}")
+        logger.error(f"Full error response: {result}")
+
+        # Check if it's a URL expiration/download error
+        if (
+            "download error" in error_msg.lower()
+            and "unable to download" in error_msg.lower()
+            and "x-goog-expires" in error_msg.lower()
+        ):
+            logger.warning("=" * 80)
+            logger.warning("SIGNED URL EXPIRATION DETECTED")
+            logger.warning("=" * 80)
+            logger.warning(
+                "The signed URL has expired and AssemblyAI cannot download the audio file."
+            )
+            logger.warning(f"Error: {error_msg}")
+            logger.warning("This typically happens when:")
+            logger.warning("1. The transcription task is retrying after a long delay")
+            logger.warning("2. AssemblyAI queue processing took longer than expected")
+            logger.warning("3. The audio file was uploaded hours ago")
+            logger.warning("=" * 80)
+
+            # This is a non-retryable error since the URL won't get
+            # refreshed
+            error_msg = (
+                f"Signed URL expired - audio file no longer accessible: {error_msg}"
+            )
+        # Check if it's a server error that might be transient
+        elif (
+            "server error" in error_msg.lower()
+            or "developers have been alerted" in error_msg.lower()
+        ):
+            logger.warning("=" * 80)
+            logger.warning("AssemblyAI SERVICE ISSUE DETECTED")
+            logger.warning("=" * 80)
+            logger.warning("AssemblyAI is experiencing server issues.")
+            logger.warning(f"Error: {error_msg}")
+            logger.warning("This is likely a temporary issue on AssemblyAI's side.")
+            logger.warning("The transcription will be retried automatically.")
+            logger.warning("Consider switching to Google STT if the issue persists.")
+            logger.warning("=" * 80)
+
+            # Mark as a temporary error that could be retried later
+            error_msg = f"AssemblyAI temporary server error: {error_msg}"
+
+        raise STTProviderError(f"Transcription failed: {error_msg}")
+
     def _parse_transcript_result(
         self,
         result: Dict[str, Any],
@@ -720,6 +735,7 @@ class AssemblyAIProvider(STTProvider):
                 logger.info(
                     "🧠 Auto-applying LeMUR-based transcript smoothing for Chinese language"
                 )
+                from .lemur_scheduler import LeMURPriority
                 from .lemur_transcript_smoother import (
                     LeMURTranscriptSmoother,
                     smooth_transcript_with_lemur,
@@ -768,6 +784,7 @@ class AssemblyAIProvider(STTProvider):
                         is_coaching_session=True,
                         use_combined_processing=True,
                         # Force combined mode for comprehensive processing
+                        priority=LeMURPriority.BACKGROUND,
                     )
                 )
 
@@ -987,6 +1004,99 @@ class AssemblyAIProvider(STTProvider):
             logger.error(f"Unexpected error in AssemblyAI transcription: {e}")
             raise STTProviderError(f"Transcription failed: {e}")
 
+    def submit_transcription(
+        self,
+        audio_uri: str,
+        language: str = "auto",
+        enable_diarization: bool = True,
+        min_speakers: int = 2,
+        webhook_url: Optional[str] = None,
+    ) -> str:
+        """
+        Submit a transcription job without waiting for it to finish.
+
+        Args:
+            audio_uri: URI to audio file (HTTP/HTTPS URL, gs:// URI or local path)
+            language: Language code (cmn-Hant-TW, cmn-Hans-CN, en-US, auto)
+            enable_diarization: Enable speaker separation
+            min_speakers: Minimum number of speakers (used as speakers_expected)
+            webhook_url: URL AssemblyAI notifies when the job completes or fails
+
+        Returns:
+            AssemblyAI transcript ID, to pass to fetch_transcription_result
+        """
+        try:
+            transcript_id = self._submit_transcription(
+                audio_url=self._upload_audio(audio_uri),
+                language_code=self._map_language_code(language),
+                enable_diarization=enable_diarization,
+                speakers_expected=min_speakers or self.speakers_expected,
+                webhook_url=webhook_url,
+            )
+        except STTProviderError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error submitting AssemblyAI transcription: {e}")
+            raise STTProviderError(f"Failed to submit transcription: {e}")
+
+        logger.info(f"Submitted AssemblyAI transcript {transcript_id}")
+        return transcript_id
+
+    def fetch_transcription_result(
+        self,
+        transcript_id: str,
+        language: str = "auto",
+        enable_diarization: bool = True,
+    ) -> Optional[TranscriptionResult]:
+        """
+        Check a submitted job once and parse its transcript if it is done.
+
+        Args:
+            transcript_id: ID returned by submit_transcription
+            language: Language code the job was submitted with
+            enable_diarization: Whether speaker separation was requested
+
+        Returns:
+            Parsed TranscriptionResult, or None while the job is still queued
+            or processing
+
+        Raises:
+            STTProviderUnavailableError: AssemblyAI could not be reached; the
+                check can be repeated later
+            STTProviderError: The job failed or the transcript does not exist
+        """
+        try:
+            response = requests.get(
+                f"{self.base_url}/transcript/{transcript_id}",
+                headers=self.headers,
+                timeout=60,
+            )
+            response.raise_for_status()
+            result = response.json()
+        except requests.exceptions.HTTPError as e:
+            status_code = getattr(e.response, "status_code", None)
+            if status_code == 404:
+                raise STTProviderError(f"Transcript not found: {transcript_id}")
+            if status_code is not None and status_code >= 500:
+                raise STTProviderUnavailableError(
+                    f"AssemblyAI server error (HTTP {status_code}): {e}"
+                )
+            raise STTProviderError(f"Failed to fetch transcript: {e}")
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
+            raise STTProviderUnavailableError(f"AssemblyAI unreachable: {e}")
+
+        status = result["status"]
+        if status == "error":
+            self._raise_transcript_error(transcript_id, result)
+        if status != "completed":
+            logger.debug(f"AssemblyAI transcript {transcript_id} is {status}")
+            return None
+
+        return self._parse_transcript_result(result, language, enable_diarization)
+
     def estimate_cost(self, duration_seconds: int) -> Decimal:
         """
         Estimate transcription cost in USD.
@@ -0,0 +1,441 @@
+"""Set-based rebuild of BillingAnalytics records for every user in a period.
+
+Rather than refreshing users one at a time, each chunk of users gets its
+usage, session and segment figures from one grouped query per source table
+and is written back with a single INSERT ... ON CONFLICT DO UPDATE, so a
+rebuild costs a few statements per chunk instead of several per user.
+"""
+
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, func, select, union
+from sqlalchemy.orm import Session
+
+from ..infrastructure.db.bulk import bulk_upsert
+from ..infrastructure.db.expressions import seconds_between
+from ..models.billing_analytics import BillingAnalytics
+from ..models.session import Session as TranscriptionSession
+from ..models.usage_history import UsageHistory
+from ..models.usage_log import TranscriptionType, UsageLog
+from ..models.user import User
+from .analytics_rollups import BillingAnalyticsRollups
+from .plan_limits import PlanLimit, get_global_plan_limits
+
+logger = logging.getLogger(__name__)
+
+# Users aggregated and upserted per statement batch and commit
+DEFAULT_CHUNK_SIZE = 1000
+# Usage history window that decides a user's segment
+SEGMENT_LOOKBACK_DAYS = 90
+# Largest value DECIMAL(5, 2) percentage columns can hold
+MAX_PERCENTAGE = 999.99
+
+# Called with (users_done, users_total) after each chunk is committed
+ProgressCallback = Callable[[int, int], None]
+
+BILLING_ANALYTICS_KEY = ("user_id", "period_type", "period_start")
+REBUILT_COLUMNS = (
+    "recorded_at",
+    "period_end",
+    "plan_name",
+    "total_revenue_usd",
+    "subscription_revenue_usd",
+    "usage_overage_usd",
+    "sessions_created",
+    "transcriptions_completed",
+    "total_minutes_processed",
+    "unique_active_days",
+    "original_transcriptions",
+    "free_retries",
+    "paid_retranscriptions",
+    "overage_minutes",
+    "google_stt_cost_usd",
+    "assemblyai_cost_usd",
+    "total_provider_cost_usd",
+    "plan_utilization_percentage",
+    "days_active_in_period",
+    "avg_sessions_per_active_day",
+    "total_exports",
+    "api_calls_made",
+    "user_signup_date",
+    "user_tenure_days",
+    "user_segment",
+    "avg_processing_time_seconds",
+    "success_rate_percentage",
+    "user_timezone",
+    "user_country",
+    "user_language",
+    "updated_at",
+)
+
+
+def current_period(
+    period_type: str, now: Optional[datetime] = None
+) -> Tuple[datetime, datetime]:
+    """Return the start and end of the monthly or daily period containing now."""
+    now = now or datetime.now(UTC)
+    if period_type == "monthly":
+        period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        if period_start.month == 12:
+            period_end = period_start.replace(year=period_start.year + 1, month=1)
+        else:
+            period_end = period_start.replace(month=period_start.month + 1)
+    else:  # daily
+        period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        period_end = period_start + timedelta(days=1)
+    return period_start, period_end
+
+
+def plan_revenue(
+    plan_config: PlanLimit,
+    transcriptions_completed: int,
+    period_start: datetime,
+    period_end: datetime,
+) -> Dict[str, float]:
+    """Subscription revenue pro-rated to the period plus transcription overage."""
+    days_in_period = (period_end - period_start).days
+    monthly_price = getattr(plan_config, "monthly_price_usd", 0) or 0
+    subscription_revenue = (monthly_price * days_in_period) / 30
+
+    overage_revenue = 0
+    max_transcriptions = plan_config.max_transcriptions
+    if 0 <= max_transcriptions < transcriptions_completed:
+        overage_count = transcriptions_completed - max_transcriptions
+        overage_revenue = overage_count * 0.10  # $0.10 per overage
+
+    return {
+        "total_revenue": round(subscription_revenue + overage_revenue, 2),
+        "subscription_revenue": round(subscription_revenue, 2),
+        "overage_revenue": round(overage_revenue, 2),
+    }
+
+
+def _count_where(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _sum_where(condition, value):
+    return func.sum(case((condition, value), else_=0))
+
+
+def _plan_name(plan) -> str:
+    return plan.value if hasattr(plan, "value") else str(plan)
+
+
+def _preferences(raw: Optional[str]) -> Dict[str, Any]:
+    """Parse a user's JSON preferences the way User.get_preferences does."""
+    if not raw:
+        return {"language": "system"}
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return {"language": "system"}
+
+
+def _decimal(value: Any, places: int = 2) -> Decimal:
+    return Decimal(str(round(float(value or 0), places)))
+
+
+class BillingAnalyticsRebuilder:
+    """Recompute every user's BillingAnalytics record for the current period."""
+
+    def __init__(self, db: Session, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.plan_limits = get_global_plan_limits()
+        self._plan_configs: Dict[str, PlanLimit] = {}
+
+    def rebuild(
+        self,
+        period_type: str = "monthly",
+        incremental: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Rebuild the period's records, committing after every chunk of users.
+
+        In incremental mode only users with usage logs or sessions created
+        since the period's last rebuild are recomputed. The watermark is the
+        latest recorded_at, which every rebuild stamps with its start time,
+        so activity that lands while a rebuild runs is picked up by the next
+        one. Without a previous rebuild, incremental mode rebuilds everyone.
+        The period's admin rollups are refreshed once all chunks are written.
+        """
+        now = now or datetime.now(UTC)
+        period_start, period_end = current_period(period_type, now)
+        watermark = self._watermark(period_type, period_start) if incremental else None
+        user_ids = self._user_ids(watermark)
+        total = len(user_ids)
+        records_updated = 0
+
+        logger.info(
+            f"🔄 Rebuilding {period_type} billing analytics for {total} users"
+            + (f" active since {watermark}" if watermark else "")
+        )
+
+        for offset in range(0, total, self.chunk_size):
+            chunk = user_ids[offset : offset + self.chunk_size]
+            rows = self._build_rows(chunk, period_type, period_start, period_end, now)
+            bulk_upsert(
+                self.db,
+                BillingAnalytics.__table__,
+                rows,
+                conflict_columns=BILLING_ANALYTICS_KEY,
+                update_columns=REBUILT_COLUMNS,
+            )
+            self.db.commit()
+            records_updated += len(rows)
+
+            done = offset + len(chunk)
+            logger.info(f"📊 Billing analytics rebuilt for {done}/{total} users")
+            if progress:
+                progress(done, total)
+
+        BillingAnalyticsRollups(self.db).refresh(period_type, period_start)
+        self.db.commit()
+
+        return {
+            "users_processed": total,
+            "records_updated": records_updated,
+            "incremental": watermark is not None,
+            "watermark": watermark.isoformat() if watermark else None,
+        }
+
+    def _watermark(
+        self, period_type: str, period_start: datetime
+    ) -> Optional[datetime]:
+        """Start time of the last rebuild of this period, if any."""
+        return self.db.execute(
+            select(func.max(BillingAnalytics.recorded_at)).where(
+                BillingAnalytics.period_type == period_type,
+                BillingAnalytics.period_start == period_start,
+            )
+        ).scalar()
+
+    def _user_ids(self, watermark: Optional[datetime]) -> List[UUID]:
+        """All users, or only those with activity since the watermark."""
+        if watermark is None:
+            query = select(User.id).order_by(User.id)
+        else:
+            active = union(
+                select(UsageLog.user_id).where(UsageLog.created_at >= watermark),
+                select(TranscriptionSession.user_id).where(
+                    TranscriptionSession.created_at >= watermark
+                ),
+            ).subquery()
+            query = select(active.c[0]).order_by(active.c[0])
+        return list(self.db.execute(query).scalars())
+
+    def _build_rows(
+        self,
+        user_ids: List[UUID],
+        period_type: str,
+        period_start: datetime,
+        period_end: datetime,
+        now: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Aggregate a chunk of users with grouped queries and build their rows."""
+        users = self.db.execute(
+            select(User.id, User.plan, User.created_at, User.preferences).where(
+                User.id.in_(user_ids)
+            )
+        ).all()
+        usage = self._usage_totals(user_ids, period_start, period_end)
+        sessions = self._session_counts(user_ids, period_start, period_end)
+        history = self._history_minutes(user_ids, now)
+
+        return [
+            self._build_row(
+                user,
+                usage.get(user.id, {}),
+                sessions.get(user.id, 0),
+                history.get(user.id),
+                period_type,
+                period_start,
+                period_end,
+                now,
+            )
+            for user in users
+        ]
+
+    def _usage_totals(
+        self, user_ids: List[UUID], period_start: datetime, period_end: datetime
+    ) -> Dict[UUID, Dict[str, Any]]:
+        cost = func.coalesce(UsageLog.cost_usd, 0)
+        transcription_type = UsageLog.transcription_type
+        query = (
+            select(
+                UsageLog.user_id,
+                func.count().label("logs"),
+                func.sum(UsageLog.duration_minutes).label("minutes"),
+                func.sum(cost).label("cost"),
+                _sum_where(UsageLog.stt_provider == "google", cost).label(
+                    "google_cost"
+                ),
+                _sum_where(UsageLog.stt_provider == "assemblyai", cost).label(
+                    "assemblyai_cost"
+                ),
+                _count_where(transcription_type == TranscriptionType.ORIGINAL).label(
+                    "original"
+                ),
+                _count_where(
+                    transcription_type == TranscriptionType.RETRY_FAILED
+                ).label("free_retries"),
+                _count_where(
+                    transcription_type == TranscriptionType.RETRY_SUCCESS
+                ).label("paid_retries"),
+                _count_where(transcription_type == TranscriptionType.EXPORT).label(
+                    "exports"
+                ),
+                func.count(func.distinct(func.date(UsageLog.created_at))).label(
+                    "active_days"
+                ),
+                func.avg(
+                    seconds_between(
+                        self.db,
+                        UsageLog.transcription_started_at,
+                        UsageLog.transcription_completed_at,
+                    )
+                ).label("avg_processing"),
+            )
+            .where(
+                UsageLog.user_id.in_(user_ids),
+                UsageLog.created_at >= period_start,
+                UsageLog.created_at < period_end,
+            )
+            .group_by(UsageLog.user_id)
+        )
+        return {row.user_id: row._asdict() for row in self.db.execute(query)}
+
+    def _session_counts(
+        self, user_ids: List[UUID], period_start: datetime, period_end: datetime
+    ) -> Dict[UUID, int]:
+        query = (
+            select(TranscriptionSession.user_id, func.count())
+            .where(
+                TranscriptionSession.user_id.in_(user_ids),
+                TranscriptionSession.created_at >= period_start,
+                TranscriptionSession.created_at < period_end,
+            )
+            .group_by(TranscriptionSession.user_id)
+        )
+        return dict(self.db.execute(query).all())
+
+    def _history_minutes(
+        self, user_ids: List[UUID], now: datetime
+    ) -> Dict[UUID, float]:
+        """Average minutes per usage history record over the segment window."""
+        query = (
+            select(
+                UsageHistory.user_id,
+                func.avg(UsageHistory.audio_minutes_processed),
+            )
+            .where(
+                UsageHistory.user_id.in_(user_ids),
+                UsageHistory.period_start
+                >= now - timedelta(days=SEGMENT_LOOKBACK_DAYS),
+            )
+            .group_by(UsageHistory.user_id)
+        )
+        return {
+            user_id: float(avg_minutes or 0)
+            for user_id, avg_minutes in self.db.execute(query)
+        }
+
+    def _plan_config(self, plan) -> PlanLimit:
+        plan_name = _plan_name(plan)
+        if plan_name not in self._plan_configs:
+            self._plan_configs[plan_name] = self.plan_limits.get_plan_limit(plan_name)
+        return self._plan_configs[plan_name]
+
+    def _build_row(
+        self,
+        user,
+        usage: Dict[str, Any],
+        sessions_created: int,
+        history_minutes: Optional[float],
+        period_type: str,
+        period_start: datetime,
+        period_end: datetime,
+        now: datetime,
+    ) -> Dict[str, Any]:
+        plan_config = self._plan_config(user.plan)
+        logs = usage.get("logs", 0)
+        minutes = float(usage.get("minutes") or 0)
+        active_days = usage.get("active_days", 0)
+        free_retries = usage.get("free_retries") or 0
+        max_minutes = plan_config.max_minutes
+
+        utilization = minutes / max_minutes * 100 if max_minutes > 0 else 0
+        revenue = plan_revenue(plan_config, logs, period_start, period_end)
+        preferences = _preferences(user.preferences)
+        country = preferences.get("country")
+
+        signup_date = user.created_at
+        if signup_date and signup_date.tzinfo is None:
+            signup_date = signup_date.replace(tzinfo=UTC)
+
+        return {
+            "user_id": user.id,
+            "period_type": period_type,
+            "period_start": period_start,
+            "period_end": period_end,
+            "recorded_at": now,
+            "plan_name": _plan_name(user.plan),
+            "total_revenue_usd": _decimal(revenue["total_revenue"], 4),
+            "subscription_revenue_usd": _decimal(revenue["subscription_revenue"], 4),
+            "usage_overage_usd": _decimal(revenue["overage_revenue"], 4),
+            "sessions_created": sessions_created,
+            "transcriptions_completed": logs,
+            "total_minutes_processed": _decimal(minutes),
+            "unique_active_days": active_days,
+            "original_transcriptions": usage.get("original") or 0,
+            "free_retries": free_retries,
+            "paid_retranscriptions": usage.get("paid_retries") or 0,
+            "overage_minutes": _decimal(
+                max(minutes - max_minutes, 0) if max_minutes > 0 else 0
+            ),
+            "google_stt_cost_usd": _decimal(usage.get("google_cost"), 4),
+            "assemblyai_cost_usd": _decimal(usage.get("assemblyai_cost"), 4),
+            "total_provider_cost_usd": _decimal(usage.get("cost"), 4),
+            "plan_utilization_percentage": _decimal(min(utilization, MAX_PERCENTAGE)),
+            "days_active_in_period": active_days,
+            "avg_sessions_per_active_day": _decimal(
+                sessions_created / active_days if active_days else 0
+            ),
+            "total_exports": usage.get("exports") or 0,
+            "api_calls_made": logs,
+            "user_signup_date": signup_date,
+            "user_tenure_days": (now - signup_date).days if signup_date else 0,
+            "user_segment": self._segment(history_minutes, max_minutes),
+            "avg_processing_time_seconds": _decimal(usage.get("avg_processing")),
+            "success_rate_percentage": _decimal(
+                (logs - free_retries) / logs * 100 if logs else 100
+            ),
+            "user_timezone": preferences.get("timezone", "UTC"),
+            "user_country": country if country and len(country) == 2 else None,
+            "user_language": preferences.get("language", "en"),
+        }
+
+    @staticmethod
+    def _segment(history_minutes: Optional[float], max_minutes: int) -> str:
+        """
+        Segment a user the way BillingAnalyticsService._determine_user_segment
+        does, measuring utilization against the user's current plan.
+        """
+        if history_minutes is None:
+            return "new"
+
+        utilization = history_minutes / max_minutes * 100 if max_minutes > 0 else 0
+        if utilization > 80 and history_minutes > 300:
+            return "power"
+        elif utilization > 50:
+            return "growing"
+        else:
+            return "casual"
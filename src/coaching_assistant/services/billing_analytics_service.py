@@ -11,8 +11,17 @@ from sqlalchemy import and_, desc, func
 from sqlalchemy.orm import Session
 
 from ..models.billing_analytics import BillingAnalytics
+from ..models.billing_analytics_rollup import BillingAnalyticsRollup
 from ..models.usage_history import UsageHistory
 from ..models.user import User
+from ..services.analytics_rollups import HEALTH_SCORE_RANGES
+from ..services.billing_analytics_rebuild import (
+    BillingAnalyticsRebuilder,
+    ProgressCallback,
+    current_period,
+    plan_revenue,
+)
+from ..services.plan_limits import get_global_plan_limits
 from ..services.usage_analytics_service import UsageAnalyticsService
 
 logger = logging.getLogger(__name__)
@@ -34,30 +43,32 @@ class BillingAnalyticsService:
         """Get comprehensive admin analytics overview."""
         logger.info(f"📊 Getting admin overview from {period_start} to {period_end}")
 
-        # Get billing analytics for the period
-        billing_data = (
-            self.db.query(BillingAnalytics)
+        rollups = (
+            self.db.query(BillingAnalyticsRollup)
             .filter(
                 and_(
-                    BillingAnalytics.period_start >= period_start,
-                    BillingAnalytics.period_end <= period_end,
-                    BillingAnalytics.period_type == period_type,
+                    BillingAnalyticsRollup.period_start >= period_start,
+                    BillingAnalyticsRollup.period_end <= period_end,
+                    BillingAnalyticsRollup.period_type == period_type,
                 )
             )
             .all()
         )
 
         # Calculate revenue metrics
-        revenue_metrics = self._calculate_revenue_metrics(billing_data)
+        revenue_metrics = self._calculate_revenue_metrics(rollups)
 
         # Calculate usage metrics
-        usage_metrics = self._calculate_usage_metrics(billing_data)
+        usage_metrics = self._calculate_usage_metrics(rollups)
+        usage_metrics["unique_active_users"] = self._count_active_users(
+            rollups, period_start, period_end, period_type
+        )
 
         # Get customer segmentation
-        customer_segments = self._get_customer_segments(billing_data)
+        customer_segments = self._get_rollup_segments(rollups)
 
         # Get top users by revenue
-        top_users = self._get_top_users(billing_data, limit=10)
+        top_users = self._get_top_users(period_start, period_end, period_type, limit=10)
 
         # Get trend data
         trend_data = self._get_trend_data(period_start, period_end, period_type)
@@ -81,22 +92,24 @@ class BillingAnalyticsService:
         end_date = datetime.now(UTC)
         start_date = end_date - timedelta(days=months * 30)
 
-        query = self.db.query(BillingAnalytics).filter(
+        query = self.db.query(BillingAnalyticsRollup).filter(
             and_(
-                BillingAnalytics.period_start >= start_date,
-                BillingAnalytics.period_type == period_type,
+                BillingAnalyticsRollup.period_start >= start_date,
+                BillingAnalyticsRollup.period_type == period_type,
             )
         )
 
         if plan_filter:
-            query = query.filter(BillingAnalytics.plan_name == plan_filter.upper())
+            query = query.filter(
+                BillingAnalyticsRollup.plan_name == plan_filter.upper()
+            )
 
-        billing_data = query.order_by(BillingAnalytics.period_start).all()
+        rollups = query.order_by(BillingAnalyticsRollup.period_start).all()
 
         # Group by period and calculate trends
         trends = {}
-        for record in billing_data:
-            period_key = record.period_start.strftime("%Y-%m-%d")
+        for rollup in rollups:
+            period_key = rollup.period_start.strftime("%Y-%m-%d")
             if period_key not in trends:
                 trends[period_key] = {
                     "date": period_key,
@@ -106,10 +119,10 @@ class BillingAnalyticsService:
                     "minutes": 0,
                 }
 
-            trends[period_key]["revenue"] += float(record.total_revenue_usd)
-            trends[period_key]["users"] += 1
-            trends[period_key]["sessions"] += record.sessions_created
-            trends[period_key]["minutes"] += float(record.total_minutes_processed)
+            trends[period_key]["revenue"] += float(rollup.total_revenue_usd)
+            trends[period_key]["users"] += rollup.users
+            trends[period_key]["sessions"] += rollup.sessions_created
+            trends[period_key]["minutes"] += float(rollup.total_minutes_processed)
 
         return list(trends.values())
 
@@ -430,17 +443,8 @@ class BillingAnalyticsService:
         """Manually refresh analytics for a specific user."""
         logger.info(f"🔄 Refreshing analytics for user {user_id}")
 
-        # Get current month's data
-        now = datetime.now(UTC)
-        if period_type == "monthly":
-            period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            if period_start.month == 12:
-                period_end = period_start.replace(year=period_start.year + 1, month=1)
-            else:
-                period_end = period_start.replace(month=period_start.month + 1)
-        else:  # daily
-            period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            period_end = period_start + timedelta(days=1)
+        # Get current period's data
+        period_start, period_end = current_period(period_type)
 
         # Check if record exists
         existing = (
@@ -486,42 +490,41 @@ class BillingAnalyticsService:
             return {"records_updated": 1}
 
     def refresh_all_analytics(
-        self, period_type: str = "monthly", force_rebuild: bool = False
+        self,
+        period_type: str = "monthly",
+        force_rebuild: bool = False,
+        incremental: bool = False,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
-        """Refresh analytics for all users."""
-        logger.info("🔄 Refreshing analytics for all users")
-
-        users = self.db.query(User).all()
-        records_updated = 0
+        """
+        Refresh analytics for all users with a set-based rebuild.
 
-        for user in users:
-            try:
-                result = self.refresh_user_analytics(
-                    user.id, period_type, force_rebuild
-                )
-                records_updated += result.get("records_updated", 0)
-            except Exception as e:
-                logger.error(f"Failed to refresh analytics for user {user.id}: {e}")
+        Incremental refreshes only recompute users active since the last
+        rebuild; force_rebuild always recomputes everyone.
+        """
+        logger.info("🔄 Refreshing analytics for all users")
 
-        return {
-            "users_processed": len(users),
-            "records_updated": records_updated,
-        }
+        return BillingAnalyticsRebuilder(self.db).rebuild(
+            period_type,
+            incremental=incremental and not force_rebuild,
+            progress=progress,
+        )
 
     def get_health_score_distribution(self) -> Dict[str, Any]:
         """Get distribution of customer health scores."""
         logger.info("📊 Getting health score distribution")
 
-        # Get recent billing analytics
-        recent_data = (
-            self.db.query(BillingAnalytics)
+        recent_rollups = (
+            self.db.query(BillingAnalyticsRollup)
             .filter(
-                BillingAnalytics.period_start >= datetime.now(UTC) - timedelta(days=60)
+                BillingAnalyticsRollup.period_start
+                >= datetime.now(UTC) - timedelta(days=60)
             )
             .all()
         )
 
-        if not recent_data:
+        total_users = sum(rollup.users for rollup in recent_rollups)
+        if not total_users:
             return {
                 "total_users": 0,
                 "score_ranges": {},
@@ -530,34 +533,30 @@ class BillingAnalyticsService:
                 "power_users": 0,
             }
 
-        health_scores = [
-            record.calculate_customer_health_score() for record in recent_data
-        ]
-
-        # Categorize scores
         score_ranges = {
-            "excellent (90-100)": len([s for s in health_scores if s >= 90]),
-            "good (70-89)": len([s for s in health_scores if 70 <= s < 90]),
-            "average (50-69)": len([s for s in health_scores if 50 <= s < 70]),
-            "poor (30-49)": len([s for s in health_scores if 30 <= s < 50]),
-            "critical (0-29)": len([s for s in health_scores if s < 30]),
+            label: sum(getattr(rollup, column) for rollup in recent_rollups)
+            for label, column in HEALTH_SCORE_RANGES.items()
         }
 
         return {
-            "total_users": len(recent_data),
+            "total_users": total_users,
             "score_ranges": score_ranges,
-            "avg_health_score": sum(health_scores) / len(health_scores),
-            "at_risk_users": len([r for r in recent_data if r.is_at_risk]),
-            "power_users": len([r for r in recent_data if r.is_power_user]),
+            "avg_health_score": (
+                sum(float(rollup.health_score_total) for rollup in recent_rollups)
+                / total_users
+            ),
+            "at_risk_users": sum(rollup.at_risk_users for rollup in recent_rollups),
+            "power_users": sum(rollup.power_users for rollup in recent_rollups),
         }
 
     # Helper methods
 
     def _calculate_revenue_metrics(
-        self, billing_data: List[BillingAnalytics]
+        self, rollups: List[BillingAnalyticsRollup]
     ) -> Dict[str, float]:
         """Calculate aggregate revenue metrics."""
-        if not billing_data:
+        total_users = sum(rollup.users for rollup in rollups)
+        if not total_users:
             return {
                 "total_revenue": 0,
                 "subscription_revenue": 0,
@@ -569,42 +568,36 @@ class BillingAnalyticsService:
                 "avg_revenue_per_minute": 0,
             }
 
-        total_revenue = sum(float(record.total_revenue_usd) for record in billing_data)
-        total_cost = sum(
-            float(record.total_provider_cost_usd) for record in billing_data
-        )
-        total_minutes = sum(
-            float(record.total_minutes_processed) for record in billing_data
-        )
+        total_revenue = sum(float(rollup.total_revenue_usd) for rollup in rollups)
+        total_cost = sum(float(rollup.total_provider_cost_usd) for rollup in rollups)
+        total_minutes = sum(float(rollup.total_minutes_processed) for rollup in rollups)
 
         return {
             "total_revenue": total_revenue,
             "subscription_revenue": sum(
-                float(record.subscription_revenue_usd) for record in billing_data
+                float(rollup.subscription_revenue_usd) for rollup in rollups
             ),
             "overage_revenue": sum(
-                float(record.usage_overage_usd) for record in billing_data
-            ),
-            "one_time_fees": sum(
-                float(record.one_time_fees_usd) for record in billing_data
+                float(rollup.usage_overage_usd) for rollup in rollups
             ),
+            "one_time_fees": sum(float(rollup.one_time_fees_usd) for rollup in rollups),
             "gross_margin": total_revenue - total_cost,
             "gross_margin_percentage": (
                 ((total_revenue - total_cost) / total_revenue * 100)
                 if total_revenue > 0
                 else 0
             ),
-            "avg_revenue_per_user": total_revenue / len(billing_data),
+            "avg_revenue_per_user": total_revenue / total_users,
             "avg_revenue_per_minute": (
                 total_revenue / total_minutes if total_minutes > 0 else 0
             ),
         }
 
     def _calculate_usage_metrics(
-        self, billing_data: List[BillingAnalytics]
+        self, rollups: List[BillingAnalyticsRollup]
     ) -> Dict[str, Any]:
         """Calculate aggregate usage metrics."""
-        if not billing_data:
+        if not rollups:
             return {
                 "total_sessions": 0,
                 "total_transcriptions": 0,
@@ -615,18 +608,13 @@ class BillingAnalyticsService:
                 "unique_active_users": 0,
             }
 
-        total_sessions = sum(record.sessions_created for record in billing_data)
+        total_sessions = sum(rollup.sessions_created for rollup in rollups)
         total_transcriptions = sum(
-            record.transcriptions_completed for record in billing_data
-        )
-        total_minutes = sum(
-            float(record.total_minutes_processed) for record in billing_data
+            rollup.transcriptions_completed for rollup in rollups
         )
-        success_rates = [
-            float(record.success_rate_percentage)
-            for record in billing_data
-            if record.success_rate_percentage
-        ]
+        total_minutes = sum(float(rollup.total_minutes_processed) for rollup in rollups)
+        success_rate_total = sum(float(rollup.success_rate_total) for rollup in rollups)
+        success_rate_count = sum(rollup.success_rate_count for rollup in rollups)
 
         return {
             "total_sessions": total_sessions,
@@ -637,11 +625,39 @@ class BillingAnalyticsService:
                 total_minutes / total_transcriptions if total_transcriptions > 0 else 0
             ),
             "success_rate": (
-                sum(success_rates) / len(success_rates) if success_rates else 0
+                success_rate_total / success_rate_count if success_rate_count else 0
             ),
-            "unique_active_users": len(set(record.user_id for record in billing_data)),
+            "unique_active_users": sum(rollup.users for rollup in rollups),
         }
 
+    def _count_active_users(
+        self,
+        rollups: List[BillingAnalyticsRollup],
+        period_start: datetime,
+        period_end: datetime,
+        period_type: str,
+    ) -> int:
+        """Count distinct users with records in the window.
+
+        Each user has one record per period, so within a single period the
+        rollup user counts are already distinct. Only windows spanning
+        several periods need a distinct count over the records.
+        """
+        if len({rollup.period_start for rollup in rollups}) <= 1:
+            return sum(rollup.users for rollup in rollups)
+
+        return (
+            self.db.query(func.count(func.distinct(BillingAnalytics.user_id)))
+            .filter(
+                and_(
+                    BillingAnalytics.period_start >= period_start,
+                    BillingAnalytics.period_end <= period_end,
+                    BillingAnalytics.period_type == period_type,
+                )
+            )
+            .scalar()
+        ) or 0
+
     def _get_customer_segments(
         self, billing_data: List[BillingAnalytics]
     ) -> List[Dict[str, Any]]:
@@ -679,48 +695,87 @@ class BillingAnalyticsService:
 
         return list(segments.values())
 
+    def _get_rollup_segments(
+        self, rollups: List[BillingAnalyticsRollup]
+    ) -> List[Dict[str, Any]]:
+        """Get customer segmentation data from period rollups."""
+        segments = {}
+
+        for rollup in rollups:
+            segment = rollup.user_segment
+            if segment not in segments:
+                segments[segment] = {
+                    "segment": segment,
+                    "user_count": 0,
+                    "total_revenue": 0,
+                    "total_utilization": 0,
+                    "churn_risk_users": 0,
+                }
+
+            segments[segment]["user_count"] += rollup.users
+            segments[segment]["total_revenue"] += float(rollup.total_revenue_usd)
+            segments[segment]["total_utilization"] += float(
+                rollup.plan_utilization_total
+            )
+            segments[segment]["churn_risk_users"] += rollup.churn_risk_users
+
+        # Calculate averages
+        for segment_data in segments.values():
+            if segment_data["user_count"] > 0:
+                segment_data["avg_revenue_per_user"] = (
+                    segment_data["total_revenue"] / segment_data["user_count"]
+                )
+                segment_data["avg_utilization"] = (
+                    segment_data["total_utilization"] / segment_data["user_count"]
+                )
+
+        return list(segments.values())
+
     def _get_top_users(
-        self, billing_data: List[BillingAnalytics], limit: int = 10
+        self,
+        period_start: datetime,
+        period_end: datetime,
+        period_type: str,
+        limit: int = 10,
     ) -> List[Dict[str, Any]]:
         """Get top users by revenue."""
-        # Sort by revenue and get top users
-        sorted_data = sorted(
-            billing_data,
-            key=lambda x: float(x.total_revenue_usd),
-            reverse=True,
-        )
-
-        top_users = []
-        for record in sorted_data[:limit]:
-            user = self.db.query(User).filter(User.id == record.user_id).first()
-            if user:
-                top_users.append(
-                    {
-                        "id": record.id,
-                        "user_id": record.user_id,
-                        "user_email": user.email,
-                        "user_name": user.name,
-                        "period_type": record.period_type,
-                        "period_start": record.period_start,
-                        "period_end": record.period_end,
-                        "plan_name": record.plan_name,
-                        "total_revenue_usd": float(record.total_revenue_usd),
-                        "total_minutes_processed": float(
-                            record.total_minutes_processed
-                        ),
-                        "plan_utilization_percentage": float(
-                            record.plan_utilization_percentage
-                        ),
-                        "churn_risk_score": float(record.churn_risk_score),
-                        "customer_health_score": (
-                            record.calculate_customer_health_score()
-                        ),
-                        "is_power_user": record.is_power_user,
-                        "is_at_risk": record.is_at_risk,
-                    }
+        top_records = (
+            self.db.query(BillingAnalytics, User.email, User.name)
+            .join(User, User.id == BillingAnalytics.user_id)
+            .filter(
+                and_(
+                    BillingAnalytics.period_start >= period_start,
+                    BillingAnalytics.period_end <= period_end,
+                    BillingAnalytics.period_type == period_type,
                 )
+            )
+            .order_by(desc(BillingAnalytics.total_revenue_usd))
+            .limit(limit)
+            .all()
+        )
 
-        return top_users
+        return [
+            {
+                "id": record.id,
+                "user_id": record.user_id,
+                "user_email": email,
+                "user_name": name,
+                "period_type": record.period_type,
+                "period_start": record.period_start,
+                "period_end": record.period_end,
+                "plan_name": record.plan_name,
+                "total_revenue_usd": float(record.total_revenue_usd),
+                "total_minutes_processed": float(record.total_minutes_processed),
+                "plan_utilization_percentage": float(
+                    record.plan_utilization_percentage
+                ),
+                "churn_risk_score": float(record.churn_risk_score),
+                "customer_health_score": record.calculate_customer_health_score(),
+                "is_power_user": record.is_power_user,
+                "is_at_risk": record.is_at_risk,
+            }
+            for record, email, name in top_records
+        ]
 
     def _get_trend_data(
         self, period_start: datetime, period_end: datetime, period_type: str
@@ -729,6 +784,20 @@ class BillingAnalyticsService:
         # This is a simplified implementation
         # In production, you'd want more sophisticated trend analysis
 
+        rollups_by_period: Dict[datetime, List[BillingAnalyticsRollup]] = {}
+        for rollup in (
+            self.db.query(BillingAnalyticsRollup)
+            .filter(
+                and_(
+                    BillingAnalyticsRollup.period_start >= period_start,
+                    BillingAnalyticsRollup.period_start < period_end,
+                    BillingAnalyticsRollup.period_type == period_type,
+                )
+            )
+            .all()
+        ):
+            rollups_by_period.setdefault(rollup.period_start, []).append(rollup)
+
         trends = []
         current_date = period_start
 
@@ -746,27 +815,26 @@ class BillingAnalyticsService:
                 else:
                     next_date = current_date.replace(month=current_date.month + 1)
 
-            period_data = (
-                self.db.query(BillingAnalytics)
-                .filter(
-                    and_(
-                        BillingAnalytics.period_start >= current_date,
-                        BillingAnalytics.period_start < next_date,
-                    )
-                )
-                .all()
-            )
+            period_rollups = [
+                rollup
+                for rollup_start, rollups in rollups_by_period.items()
+                if self._in_range(rollup_start, current_date, next_date)
+                for rollup in rollups
+            ]
 
             trends.append(
                 {
                     "date": current_date.strftime("%Y-%m-%d"),
                     "revenue": sum(
-                        float(record.total_revenue_usd) for record in period_data
+                        float(rollup.total_revenue_usd) for rollup in period_rollups
+                    ),
+                    "users": sum(rollup.users for rollup in period_rollups),
+                    "sessions": sum(
+                        rollup.sessions_created for rollup in period_rollups
                     ),
-                    "users": len(set(record.user_id for record in period_data)),
-                    "sessions": sum(record.sessions_created for record in period_data),
                     "minutes": sum(
-                        float(record.total_minutes_processed) for record in period_data
+                        float(rollup.total_minutes_processed)
+                        for rollup in period_rollups
                     ),
                     "new_signups": self._calculate_new_signups(current_date, next_date),
                     "churned_users": self._calculate_churned_users(
@@ -779,6 +847,13 @@ class BillingAnalyticsService:
 
         return trends
 
+    @staticmethod
+    def _in_range(value: datetime, start: datetime, end: datetime) -> bool:
+        """Compare a stored timestamp against bounds that may carry a timezone."""
+        if value.tzinfo is None and start.tzinfo is not None:
+            value = value.replace(tzinfo=start.tzinfo)
+        return start <= value < end
+
     def _calculate_user_billing_data(
         self, user_id: UUID, period_start: datetime, period_end: datetime
     ) -> Dict[str, Any]:
@@ -874,33 +949,15 @@ class BillingAnalyticsService:
         self, user, usage_data, period_start: datetime, period_end: datetime
     ) -> Dict[str, Any]:
         """Calculate revenue data based on user plan and usage."""
-        from ..services.plan_limits import PlanLimitsService
-
-        plan_service = PlanLimitsService()
-        plan_config = plan_service.get_plan_limit(user.plan.value)
-
-        # Calculate subscription revenue based on plan
-        days_in_period = (period_end - period_start).days
-        monthly_price = getattr(plan_config, "monthly_price_usd", 0) or 0
-
-        # Pro-rate for the period
-        subscription_revenue = (monthly_price * days_in_period) / 30
-
-        # Calculate overage revenue (simplified)
-        overage_revenue = 0
-        transcriptions_used = usage_data.get("transcriptions_completed", 0)
-        if transcriptions_used > plan_config.max_transcriptions:
-            overage_count = transcriptions_used - plan_config.max_transcriptions
-            overage_revenue = overage_count * 0.10  # $0.10 per overage
-
-        total_revenue = subscription_revenue + overage_revenue
+        plan_config = get_global_plan_limits().get_plan_limit(user.plan.value)
+        revenue_data = plan_revenue(
+            plan_config,
+            usage_data.get("transcriptions_completed", 0),
+            period_start,
+            period_end,
+        )
 
-        return {
-            "total_revenue": round(total_revenue, 2),
-            "subscription_revenue": round(subscription_revenue, 2),
-            "overage_revenue": round(overage_revenue, 2),
-            "one_time_fees": 0,
-        }
+        return {**revenue_data, "one_time_fees": 0}
 
     def _get_user_timezone(self, user) -> str:
         """Get user timezone from preferences or default."""
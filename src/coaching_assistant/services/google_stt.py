@@ -560,6 +560,38 @@ class GoogleSTTProvider(STTProvider):
             logger.error(f"Failed to read batch results from GCS URI {output_uri}: {e}")
             raise STTProviderError(f"Failed to read batch results: {e}")
 
+    def _try_read_batch_results_from_gcs(self, output_uri: str) -> Any:
+        """
+        Read batch recognition results from GCS in a single attempt.
+
+        Returns:
+            Parsed results, or None if the file is not (fully) written yet
+        """
+        from google.api_core.exceptions import Forbidden, NotFound
+
+        if not output_uri.startswith("gs://"):
+            raise STTProviderError(f"Invalid GCS URI: {output_uri}")
+        bucket_name, _, blob_name = output_uri[5:].partition("/")
+        if not blob_name:
+            raise STTProviderError(f"No blob name found in URI: {output_uri}")
+
+        blob = self._create_storage_client().bucket(bucket_name).blob(blob_name)
+        try:
+            content = blob.download_as_text()
+        except NotFound:
+            logger.info(f"Batch result file not yet available: {output_uri}")
+            return None
+        except Forbidden as fb:
+            raise STTProviderError(f"GCS permission denied: {fb}")
+
+        if not content or not content.strip():
+            return None
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            logger.info(f"Batch result file still being written: {output_uri}")
+            return None
+
     def _validate_diarization_support(
         self, language: str, model: str, enable_diarization: bool
     ) -> bool:
@@ -834,6 +866,110 @@ class GoogleSTTProvider(STTProvider):
             logger.error(f"Google STT transcription failed: {e}")
             raise STTProviderError(f"Transcription failed: {e}")
 
+    def uses_batch_mode(self, language: str, enable_diarization: bool = None) -> bool:
+        """Whether transcribe() would run a long-running batchRecognize job."""
+        if enable_diarization is None:
+            enable_diarization = settings.ENABLE_SPEAKER_DIARIZATION
+        if not enable_diarization:
+            return True
+        normalized_language = self._normalize_language_code(language)
+        _, model = self._get_optimal_location_and_model(normalized_language)
+        return not self._validate_diarization_support(normalized_language, model, True)
+
+    def submit_batch_transcription(
+        self, audio_uri: str, language: str, original_filename: str = None
+    ) -> dict:
+        """
+        Start a batchRecognize job without waiting for it.
+
+        Args:
+            audio_uri: GCS URI of the audio file
+            language: Language code (cmn-Hant-TW, cmn-Hans-CN, en-US, auto)
+            original_filename: Original uploaded filename for format detection
+
+        Returns:
+            JSON-safe job description to persist and later pass to
+            check_batch_operation / fetch_batch_transcription_result
+        """
+        normalized_language = self._normalize_language_code(language)
+        try:
+            operation, location, model = self._start_batch_recognition(
+                audio_uri, normalized_language, original_filename
+            )
+        except gcp_exceptions.ResourceExhausted as e:
+            raise STTProviderQuotaExceededError(f"Google STT quota exceeded: {e}")
+        except gcp_exceptions.InvalidArgument as e:
+            raise STTProviderInvalidAudioError(f"Invalid audio file: {e}")
+        except gcp_exceptions.ServiceUnavailable as e:
+            raise STTProviderUnavailableError(f"Google STT service unavailable: {e}")
+        except STTProviderError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to start Google STT batch recognition: {e}")
+            raise STTProviderError(f"Failed to start batch recognition: {e}")
+
+        operation_name = operation.operation.name
+        logger.info(f"Started Google STT batch operation {operation_name}")
+        return {
+            "operation_name": operation_name,
+            "audio_uri": audio_uri,
+            "language": normalized_language,
+            "location": location,
+            "model": model,
+        }
+
+    def check_batch_operation(self, operation_name: str) -> Any:
+        """
+        Look up a batchRecognize operation once.
+
+        Returns:
+            BatchRecognizeResponse when the operation is done, or None while
+            it is still running
+
+        Raises:
+            STTProviderUnavailableError: The Speech API could not be reached
+            STTProviderError: The operation failed or does not exist
+        """
+        try:
+            operation = self.client.get_operation(request={"name": operation_name})
+        except (
+            gcp_exceptions.ServiceUnavailable,
+            gcp_exceptions.DeadlineExceeded,
+        ) as e:
+            raise STTProviderUnavailableError(f"Google STT service unavailable: {e}")
+        except gcp_exceptions.GoogleAPICallError as e:
+            raise STTProviderError(f"Failed to get operation {operation_name}: {e}")
+
+        if not operation.done:
+            return None
+        if operation.HasField("error") and operation.error.code:
+            raise STTProviderError(f"Operation failed: {operation.error.message}")
+        return speech_v2.BatchRecognizeResponse.deserialize(operation.response.value)
+
+    def fetch_batch_transcription_result(self, job: dict) -> TranscriptionResult | None:
+        """
+        Parse the transcript of a submitted batch job if it is ready.
+
+        Args:
+            job: Description returned by submit_batch_transcription
+
+        Returns:
+            TranscriptionResult, or None while the operation is running or
+            its output is not yet readable in GCS
+        """
+        response = self.check_batch_operation(job["operation_name"])
+        if response is None:
+            return None
+
+        output_uri = self._batch_output_uri(response, job["audio_uri"])
+        result = self._try_read_batch_results_from_gcs(output_uri)
+        if result is None:
+            return None
+
+        return self._build_batch_result(
+            result, job["language"], job["location"], job["model"]
+        )
+
     def _transcribe_with_diarization(
         self,
         audio_uri: str,
@@ -965,6 +1101,50 @@ class GoogleSTTProvider(STTProvider):
         Transcribe audio using batchRecognize API without diarization.
         This is the original batch processing method.
         """
+        operation, location, model = self._start_batch_recognition(
+            audio_uri, language, original_filename
+        )
+
+        # Wait for operation to complete with progress tracking
+        logger.info("Waiting for transcription to complete...")
+
+        try:
+            timeout_minutes = 120
+            logger.info(f"Using {timeout_minutes} minute timeout for this file type")
+
+            response = self._wait_for_operation_with_progress(
+                operation,
+                timeout_minutes=timeout_minutes,
+                progress_callback=progress_callback,
+            )
+            logger.info("Batch recognition operation completed successfully")
+        except (TimeoutError, Exception) as e:
+            error_type = type(e).__name__
+            logger.error(f"Batch recognition failed ({error_type}): {e}")
+
+            # Check if operation failed with specific error
+            if hasattr(operation, "exception") and operation.exception():
+                logger.error(f"Operation exception details: {operation.exception()}")
+                raise STTProviderError(f"Operation failed: {operation.exception()}")
+            else:
+                raise STTProviderError(f"Operation error ({error_type}): {e}")
+
+        actual_output_uri = self._batch_output_uri(response, audio_uri)
+
+        # Read results from the actual GCS output file
+        result = self._read_batch_results_from_gcs(actual_output_uri)
+
+        return self._build_batch_result(result, language, location, model)
+
+    def _start_batch_recognition(
+        self, audio_uri: str, language: str, original_filename: str = None
+    ) -> tuple[Any, str, str]:
+        """
+        Start a batchRecognize operation writing its results to GCS.
+
+        Returns:
+            (long-running operation, location, model)
+        """
         logger.info(f"Using batchRecognize API without diarization for {audio_uri}")
 
         # Configure recognition features WITHOUT diarization
@@ -1020,33 +1200,12 @@ class GoogleSTTProvider(STTProvider):
             "files": [{"uri": audio_uri}],
         }
 
-        # Execute recognition (this is synchronous but can take time)
+        # Returns as soon as the operation is accepted
         operation = self.client.batch_recognize(request=request)
+        return operation, location, model
 
-        # Wait for operation to complete with progress tracking
-        logger.info("Waiting for transcription to complete...")
-
-        try:
-            timeout_minutes = 120
-            logger.info(f"Using {timeout_minutes} minute timeout for this file type")
-
-            response = self._wait_for_operation_with_progress(
-                operation,
-                timeout_minutes=timeout_minutes,
-                progress_callback=progress_callback,
-            )
-            logger.info("Batch recognition operation completed successfully")
-        except (TimeoutError, Exception) as e:
-            error_type = type(e).__name__
-            logger.error(f"Batch recognition failed ({error_type}): {e}")
-
-            # Check if operation failed with specific error
-            if hasattr(operation, "exception") and operation.exception():
-                logger.error(f"Operation exception details: {operation.exception()}")
-                raise STTProviderError(f"Operation failed: {operation.exception()}")
-            else:
-                raise STTProviderError(f"Operation error ({error_type}): {e}")
-
+    def _batch_output_uri(self, response: Any, audio_uri: str) -> str:
+        """Return the GCS URI of a finished batch operation's transcript."""
         # Process per-file results with detailed error collection
         results_summary = self._process_batch_results(response, audio_uri)
 
@@ -1063,10 +1222,12 @@ class GoogleSTTProvider(STTProvider):
         logger.info(
             f"Batch results summary: {results_summary['ok_count']} success, {results_summary['err_count']} errors"
         )
+        return actual_output_uri
 
-        # Read results from the actual GCS output file
-        result = self._read_batch_results_from_gcs(actual_output_uri)
-
+    def _build_batch_result(
+        self, result: Any, language: str, location: str, model: str
+    ) -> TranscriptionResult:
+        """Convert batch recognition results read from GCS to our format."""
         # Process results
         segments = self._process_recognition_results(result, False)
 
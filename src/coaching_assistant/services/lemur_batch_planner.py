@@ -0,0 +1,236 @@
+"""
+Token-aware batch planning for LeMUR punctuation requests.
+
+Segments are measured in estimated tokens rather than characters, since
+Chinese and English text differ by roughly 4x in characters per token.
+Oversized segments are split at sentence boundaries, and the segments are then
+packed into as few batches as the token budget allows, with batch sizes kept
+close to equal. Each batch after the first carries a short overlap window from
+the end of the previous batch, which is sent as read-only context.
+
+Every planned segment carries the index of the input segment it came from as
+"source_index", so the pieces of a split segment can be joined back together
+once LeMUR has rewritten them.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Claude tokenizers spend about one token per CJK character and about one token
+# per four characters of Latin-script text
+CJK_TOKENS_PER_CHAR = 1.0
+LATIN_CHARS_PER_TOKEN = 4.0
+
+# Upper bound for the overlap window carried into the next batch
+MAX_OVERLAP_TOKENS = 200
+
+_CJK_CHAR_RE = re.compile(r"[㐀-䶿一-鿿豈-﫿　-〿＀-￯]")
+_SENTENCE_END_RE = re.compile(r"(?<=[。！？!?；;…])\s*|(?<=\.)\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the LLM token count of mixed Chinese/English text."""
+    if not text:
+        return 0
+    cjk_chars = len(_CJK_CHAR_RE.findall(text))
+    other_chars = len(text) - cjk_chars
+    return math.ceil(
+        cjk_chars * CJK_TOKENS_PER_CHAR + other_chars / LATIN_CHARS_PER_TOKEN
+    )
+
+
+@dataclass
+class PlannedBatch:
+    """One LeMUR request: segments to rewrite plus read-only overlap context."""
+
+    segments: List[Dict]
+    estimated_tokens: int
+    overlap: List[Dict] = field(default_factory=list)
+
+
+@dataclass
+class BatchPlan:
+    """Batches for a transcript along with their token estimates."""
+
+    batches: List[PlannedBatch]
+    max_batch_tokens: int
+    split_segments: int = 0
+
+    @property
+    def batch_count(self) -> int:
+        return len(self.batches)
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(batch.estimated_tokens for batch in self.batches)
+
+    def summary(self) -> str:
+        """One-line description of the plan for logging."""
+        if not self.batches:
+            return "0 batches"
+        sizes = [batch.estimated_tokens for batch in self.batches]
+        return (
+            f"{self.batch_count} batches, ~{self.total_tokens} tokens "
+            f"(min {min(sizes)}, max {max(sizes)}, budget {self.max_batch_tokens}), "
+            f"{self.split_segments} oversized segments split"
+        )
+
+
+def _split_text(text: str, max_tokens: int) -> List[str]:
+    """Split text at sentence boundaries into pieces within the token budget."""
+    sentences = [s for s in _SENTENCE_END_RE.split(text) if s.strip()]
+    pieces: List[str] = []
+    current = ""
+
+    for sentence in sentences:
+        # A single run-on sentence over budget is cut at a character offset
+        while estimate_tokens(sentence) > max_tokens:
+            cut = max(1, int(len(sentence) * max_tokens / estimate_tokens(sentence)))
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:]
+
+        separator = " " if current and _needs_space(current) else ""
+        candidate = current + separator + sentence
+        if current and estimate_tokens(candidate) > max_tokens:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = candidate
+
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _needs_space(text: str) -> bool:
+    return not _CJK_CHAR_RE.match(text[-1])
+
+
+def join_split_text(pieces: List[str]) -> str:
+    """Join the texts of a split segment, with spaces only between Latin text."""
+    joined = ""
+    for piece in pieces:
+        if joined and piece and _needs_space(joined):
+            joined += " "
+        joined += piece
+    return joined
+
+
+def split_oversized_segment(segment: Dict, max_tokens: int) -> List[Dict]:
+    """
+    Split a segment over the token budget into sentence-aligned pieces.
+
+    Timestamps are interpolated by character position, so the pieces tile the
+    original segment's time range.
+    """
+    text = segment.get("text", "")
+    pieces = _split_text(text, max_tokens)
+    if len(pieces) <= 1:
+        return [segment]
+
+    start = segment.get("start", 0)
+    duration = segment.get("end", start) - start
+    total_chars = sum(len(piece) for piece in pieces)
+
+    result = []
+    consumed = 0
+    for piece in pieces:
+        piece_start = start + duration * consumed / total_chars
+        consumed += len(piece)
+        piece_end = start + duration * consumed / total_chars
+        result.append(
+            {
+                **segment,
+                "text": piece,
+                "start": int(round(piece_start)),
+                "end": int(round(piece_end)),
+            }
+        )
+    return result
+
+
+def _overlap_window(batch: List[Dict], overlap_segments: int) -> List[Dict]:
+    """Take up to overlap_segments trailing segments within MAX_OVERLAP_TOKENS."""
+    window: List[Dict] = []
+    tokens = 0
+    for segment in reversed(batch[-overlap_segments:] if overlap_segments else []):
+        segment_tokens = estimate_tokens(segment.get("text", ""))
+        if window and tokens + segment_tokens > MAX_OVERLAP_TOKENS:
+            break
+        if segment_tokens > MAX_OVERLAP_TOKENS:
+            # Keep only the tail of a long segment as context
+            keep = int(len(segment["text"]) * MAX_OVERLAP_TOKENS / segment_tokens)
+            segment = {**segment, "text": segment["text"][-keep:]}
+            segment_tokens = estimate_tokens(segment["text"])
+        window.insert(0, segment)
+        tokens += segment_tokens
+    return window
+
+
+def plan_batches(
+    segments: List[Dict],
+    max_batch_tokens: int,
+    overlap_segments: int = 1,
+    max_batch_segments: Optional[int] = None,
+) -> BatchPlan:
+    """
+    Pack segments into near-equal batches within a token budget.
+
+    Args:
+        segments: Transcript segments with speaker, text, start and end
+        max_batch_tokens: Token budget per batch
+        overlap_segments: Trailing segments of the previous batch sent as context
+        max_batch_segments: Optional cap on segments per batch
+
+    Returns:
+        BatchPlan covering every segment in order, each tagged with the
+        source_index of the input segment it was planned from
+    """
+    if max_batch_tokens < 1:
+        raise ValueError("max_batch_tokens must be positive")
+
+    items = []
+    split_segments = 0
+    for index, segment in enumerate(segments):
+        segment = {**segment, "source_index": index}
+        tokens = estimate_tokens(segment.get("text", ""))
+        if tokens > max_batch_tokens:
+            pieces = split_oversized_segment(segment, max_batch_tokens)
+            split_segments += len(pieces) > 1
+            items.extend((piece, estimate_tokens(piece["text"])) for piece in pieces)
+        else:
+            items.append((segment, tokens))
+
+    remaining = sum(tokens for _, tokens in items)
+    target = remaining / max(1, math.ceil(remaining / max_batch_tokens))
+
+    batches: List[PlannedBatch] = []
+    current: List[Dict] = []
+    current_tokens = 0
+
+    for segment, tokens in items:
+        if current:
+            over_budget = current_tokens + tokens > max_batch_tokens
+            over_count = max_batch_segments and len(current) >= max_batch_segments
+            # Close at the boundary nearest the target so batches stay even
+            past_target = current_tokens + tokens - target > target - current_tokens
+            if over_budget or over_count or past_target:
+                batches.append(PlannedBatch(current, current_tokens))
+                remaining -= current_tokens
+                target = remaining / max(1, math.ceil(remaining / max_batch_tokens))
+                current, current_tokens = [], 0
+        current.append(segment)
+        current_tokens += tokens
+
+    if current:
+        batches.append(PlannedBatch(current, current_tokens))
+
+    for previous, batch in zip(batches, batches[1:]):
+        batch.overlap = _overlap_window(previous.segments, overlap_segments)
+
+    return BatchPlan(batches, max_batch_tokens, split_segments)
@@ -0,0 +1,381 @@
+"""
+Content-addressed result cache for LeMUR calls.
+
+Every LeMUR task is keyed by a SHA-256 digest of the request that produced it:
+task kind, model, prompt (which embeds the template version), input text,
+speaker mapping and session language. Re-running smoothing over unchanged
+batches therefore returns the stored response instead of paying for another
+LLM round trip.
+
+Responses live in a local SQLite file by default, bounded by entry count and
+total bytes. Setting LEMUR_CACHE_BACKEND to "redis" shares one cache across
+workers instead. A cache that cannot be reached only costs a LeMUR call: the
+error is logged and the lookup counts as a miss.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import redis
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every stored response (e.g. after changing response parsing)
+LEMUR_CACHE_VERSION = 1
+
+LEMUR_CACHE_BACKENDS = ("sqlite", "redis")
+DEFAULT_CACHE_FILENAME = "lemur_cache.sqlite3"
+REDIS_KEY_PREFIX = "lemur:cache:"
+REDIS_INDEX_KEY = "lemur:cache:index"
+
+
+def make_cache_key(
+    kind: str,
+    model: str,
+    prompt: str,
+    input_text: str,
+    speaker_mapping: Optional[Dict[str, str]] = None,
+    language: str = "",
+) -> str:
+    """
+    Build the content address of a LeMUR request.
+
+    Args:
+        kind: Task kind ('speaker', 'punctuation', 'combined')
+        model: Resolved LeMUR model identifier
+        prompt: Final prompt text; covers template edits and custom prompts
+        input_text: Transcript text sent as LeMUR input
+        speaker_mapping: Speaker mapping the prompt was built with
+        language: Session language code
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    payload = json.dumps(
+        {
+            "version": LEMUR_CACHE_VERSION,
+            "kind": kind,
+            "model": model,
+            "prompt": prompt,
+            "input_text": input_text,
+            "speaker_mapping": speaker_mapping or {},
+            "language": language,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class LeMURCacheStats:
+    """Hit/miss counters for a LeMUR result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the counters, including the derived hit rate."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class LeMURCacheBackend(ABC):
+    """Storage interface for cached LeMUR responses."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored response, or None when missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: int) -> int:
+        """Store a response and return how many entries were evicted."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached response."""
+
+    @abstractmethod
+    def size(self) -> int:
+        """Return the number of cached responses."""
+
+
+class SQLiteLeMURCacheBackend(LeMURCacheBackend):
+    """Local SQLite backend with TTL expiry and size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 5000,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.path = path or os.path.join(tempfile.gettempdir(), DEFAULT_CACHE_FILENAME)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS lemur_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_lemur_cache_last_access "
+            "ON lemur_cache (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM lemur_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM lemur_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE lemur_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> int:
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lemur_cache "
+                "(key, value, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now + ttl_seconds, now),
+            )
+            evicted = self._conn.execute(
+                "DELETE FROM lemur_cache WHERE expires_at <= ?", (now,)
+            ).rowcount
+            evicted += self._evict_over_limits()
+            self._conn.commit()
+            return evicted
+
+    def _evict_over_limits(self) -> int:
+        """Drop least recently used entries until both bounds are satisfied."""
+        count, total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM lemur_cache"
+        ).fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return 0
+
+        evicted = 0
+        rows = self._conn.execute(
+            "SELECT key, size FROM lemur_cache ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM lemur_cache WHERE key = ?", (key,))
+            count -= 1
+            total_bytes -= size
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM lemur_cache")
+            self._conn.commit()
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM lemur_cache").fetchone()[0]
+
+
+class RedisLeMURCacheBackend(LeMURCacheBackend):
+    """Redis backend shared across workers, with TTL and an LRU entry bound."""
+
+    def __init__(self, client: "redis.Redis", max_entries: int = 5000):
+        self.redis = client
+        self.max_entries = max_entries
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.redis.get(REDIS_KEY_PREFIX + key)
+        if value is None:
+            self.redis.zrem(REDIS_INDEX_KEY, key)
+            return None
+        self.redis.zadd(REDIS_INDEX_KEY, {key: time.time()})
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> int:
+        pipe = self.redis.pipeline()
+        pipe.setex(REDIS_KEY_PREFIX + key, ttl_seconds, value)
+        pipe.zadd(REDIS_INDEX_KEY, {key: time.time()})
+        pipe.zcard(REDIS_INDEX_KEY)
+        overflow = pipe.execute()[-1] - self.max_entries
+        if overflow <= 0:
+            return 0
+
+        oldest = self.redis.zpopmin(REDIS_INDEX_KEY, overflow)
+        if oldest:
+            self.redis.delete(
+                *[REDIS_KEY_PREFIX + self._decode(member) for member, _ in oldest]
+            )
+        return len(oldest)
+
+    def clear(self) -> None:
+        members = self.redis.zrange(REDIS_INDEX_KEY, 0, -1)
+        if members:
+            self.redis.delete(*[REDIS_KEY_PREFIX + self._decode(m) for m in members])
+        self.redis.delete(REDIS_INDEX_KEY)
+
+    def size(self) -> int:
+        return self.redis.zcard(REDIS_INDEX_KEY)
+
+    @staticmethod
+    def _decode(member: Any) -> str:
+        return member.decode("utf-8") if isinstance(member, bytes) else member
+
+
+class LeMURResultCache:
+    """Content-addressed LeMUR response cache with hit/miss accounting."""
+
+    def __init__(self, backend: LeMURCacheBackend, ttl_seconds: int = 7 * 24 * 3600):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._stats = LeMURCacheStats()
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a response; backend errors are counted and reported as misses."""
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ LeMUR cache lookup failed: {e}")
+            self._count(errors=1, misses=1)
+            return None
+
+        if value is None:
+            self._count(misses=1)
+        else:
+            self._count(hits=1)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response; backend errors are logged and swallowed."""
+        try:
+            evicted = self.backend.set(key, value, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"⚠️ LeMUR cache store failed: {e}")
+            self._count(errors=1)
+            return
+        self._count(stores=1, evictions=evicted)
+
+    def clear(self) -> None:
+        """Remove every cached response and reset the counters."""
+        self.backend.clear()
+        with self._stats_lock:
+            self._stats = LeMURCacheStats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters along with the backend size."""
+        with self._stats_lock:
+            result = self._stats.to_dict()
+        result["backend"] = type(self.backend).__name__
+        try:
+            result["entries"] = self.backend.size()
+        except Exception as e:
+            logger.warning(f"⚠️ LeMUR cache size unavailable: {e}")
+            result["entries"] = None
+        return result
+
+    def _count(self, **deltas: int) -> None:
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                setattr(self._stats, name, getattr(self._stats, name) + delta)
+
+
+_lemur_cache: Optional[LeMURResultCache] = None
+_lemur_cache_lock = threading.Lock()
+
+
+def create_lemur_cache() -> Optional[LeMURResultCache]:
+    """
+    Build a LeMUR cache from settings.
+
+    Returns:
+        Configured cache, or None when caching is disabled
+    """
+    if not settings.LEMUR_CACHE_ENABLED:
+        return None
+
+    backend_name = settings.LEMUR_CACHE_BACKEND.lower()
+    if backend_name not in LEMUR_CACHE_BACKENDS:
+        raise ValueError(
+            f"Unknown LeMUR cache backend '{settings.LEMUR_CACHE_BACKEND}'. "
+            f"Expected one of {LEMUR_CACHE_BACKENDS}"
+        )
+
+    backend: LeMURCacheBackend
+    if backend_name == "redis" and settings.REDIS_URL:
+        backend = RedisLeMURCacheBackend(
+            redis.from_url(settings.REDIS_URL, decode_responses=True),
+            max_entries=settings.LEMUR_CACHE_MAX_ENTRIES,
+        )
+    else:
+        if backend_name == "redis":
+            logger.warning("⚠️ REDIS_URL not set, using SQLite LeMUR cache")
+        backend = SQLiteLeMURCacheBackend(
+            path=settings.LEMUR_CACHE_PATH or None,
+            max_entries=settings.LEMUR_CACHE_MAX_ENTRIES,
+            max_bytes=settings.LEMUR_CACHE_MAX_BYTES,
+        )
+
+    logger.info(f"🗄️ LeMUR result cache enabled: {type(backend).__name__}")
+    return LeMURResultCache(backend, ttl_seconds=settings.LEMUR_CACHE_TTL_SECONDS)
+
+
+def get_lemur_cache() -> Optional[LeMURResultCache]:
+    """
+    Get the process-wide LeMUR result cache.
+
+    Returns:
+        Shared cache instance, or None when caching is disabled or unavailable
+    """
+    global _lemur_cache
+
+    with _lemur_cache_lock:
+        if _lemur_cache is None:
+            try:
+                _lemur_cache = create_lemur_cache()
+            except Exception as e:
+                logger.warning(f"⚠️ LeMUR cache unavailable, caching disabled: {e}")
+                return None
+        return _lemur_cache
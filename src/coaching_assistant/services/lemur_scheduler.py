@@ -0,0 +1,332 @@
+"""
+Process-wide scheduler for LeMUR requests.
+
+All LeMUR calls in the process share one bounded pool of worker threads. The
+number of requests allowed in flight adapts with AIMD: every success raises the
+limit additively (by roughly one slot per window of successes) and every
+throttling response (HTTP 429 or 5xx) halves it and retries the request after
+an exponential backoff. Queued work is ordered by priority, so interactive API
+requests run ahead of background auto-smoothing, and FIFO within a priority.
+
+The scheduler is thread-based rather than asyncio-based because callers run on
+different event loops (FastAPI's loop and ``asyncio.run`` inside Celery tasks).
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last is +Inf
+LATENCY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+# A 429/5xx status only counts when the message labels it as one, so numbers
+# such as "a limit of 500 words" are not mistaken for server errors
+_THROTTLING_STATUS_RE = re.compile(
+    r"\b(?:status(?: code)?|http(?:/[\d.]+)?)[:\s]*(?:429|5\d\d)\b"
+)
+_THROTTLING_MARKERS = ("rate limit", "too many requests")
+
+
+class LeMURPriority(IntEnum):
+    """Scheduling priority; lower values run first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    Check whether an error is a 429 or 5xx response that warrants backing off.
+
+    Looks for an HTTP status code on the error (or its ``response``) and falls
+    back to the error message, since the AssemblyAI SDK reports LeMUR failures
+    with the server's response text.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or 500 <= status < 600
+
+    message = str(error).lower()
+    return any(marker in message for marker in _THROTTLING_MARKERS) or bool(
+        _THROTTLING_STATUS_RE.search(message)
+    )
+
+
+class LatencyHistogram:
+    """Latency histogram with fixed, non-cumulative buckets."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency sample."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize bucket counts keyed by their upper bound."""
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.total, 3),
+            "buckets": dict(zip(bounds, self.counts)),
+        }
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    sequence: int
+    fn: Callable[..., Any] = field(compare=False)
+    args: Tuple[Any, ...] = field(compare=False)
+    kwargs: Dict[str, Any] = field(compare=False)
+    label: str = field(compare=False)
+    future: Future = field(compare=False)
+    attempt: int = field(default=0, compare=False)
+
+
+class LeMURScheduler:
+    """Bounded, priority-ordered executor with AIMD concurrency control."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 6,
+        min_concurrency: int = 1,
+        max_retries: int = 2,
+        backoff_seconds: float = 2.0,
+        decrease_factor: float = 0.5,
+    ):
+        if max_concurrency < 1 or not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                "LeMUR concurrency limits must satisfy "
+                "1 <= min_concurrency <= max_concurrency"
+            )
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.decrease_factor = decrease_factor
+
+        self._limit = float(max_concurrency)
+        self._active = 0
+        self._queue: List[_Job] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._shutdown = False
+
+        self._completed = 0
+        self._failed = 0
+        self._throttled = 0
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: LeMURPriority = LeMURPriority.BACKGROUND,
+        label: str = "task",
+        **kwargs: Any,
+    ) -> Future:
+        """Queue a blocking LeMUR call and return a future for its result."""
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("LeMUR scheduler has been shut down")
+            self._ensure_workers()
+            heapq.heappush(
+                self._queue,
+                _Job(
+                    int(priority),
+                    next(self._sequence),
+                    fn,
+                    args,
+                    kwargs,
+                    label,
+                    future,
+                ),
+            )
+            self._condition.notify()
+        return future
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: LeMURPriority = LeMURPriority.BACKGROUND,
+        label: str = "task",
+        **kwargs: Any,
+    ) -> Any:
+        """Run a blocking LeMUR call through the scheduler and await its result."""
+        future = self.submit(fn, *args, priority=priority, label=label, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return concurrency state, counters and per-label latency histograms."""
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "max_concurrency": self.max_concurrency,
+                "active": self._active,
+                "queued": len(self._queue),
+                "completed": self._completed,
+                "failed": self._failed,
+                "throttled": self._throttled,
+                "latency": {
+                    label: histogram.to_dict()
+                    for label, histogram in self._histograms.items()
+                },
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work; queued jobs still run before workers exit."""
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            workers = list(self._workers)
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def _ensure_workers(self) -> None:
+        """Start the worker threads on first use (caller holds the lock)."""
+        while len(self._workers) < self.max_concurrency:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"lemur-worker-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue or self._active >= self.limit:
+                    if self._shutdown and not self._queue:
+                        return
+                    self._condition.wait()
+                job = heapq.heappop(self._queue)
+                self._active += 1
+
+            try:
+                self._execute(job)
+            finally:
+                with self._condition:
+                    self._active -= 1
+                    self._condition.notify_all()
+
+    def _execute(self, job: _Job) -> None:
+        if job.attempt == 0 and not job.future.set_running_or_notify_cancel():
+            return
+
+        start = time.perf_counter()
+        try:
+            result = job.fn(*job.args, **job.kwargs)
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            if is_throttling_error(e):
+                self._on_throttled(job, e, elapsed)
+            else:
+                self._record(job.label, elapsed, failed=True)
+                job.future.set_exception(e)
+            return
+
+        self._record(job.label, time.perf_counter() - start)
+        self._increase_limit()
+        job.future.set_result(result)
+
+    def _on_throttled(self, job: _Job, error: Exception, elapsed: float) -> None:
+        """Halve the limit, then retry after an exponential backoff or give up."""
+        with self._condition:
+            self._throttled += 1
+            self._limit = max(
+                float(self.min_concurrency), self._limit * self.decrease_factor
+            )
+            limit = self.limit
+        logger.warning(
+            f"⚠️ LeMUR throttled ({job.label}, attempt {job.attempt + 1}): {error}; "
+            f"concurrency limit → {limit}"
+        )
+
+        if job.attempt >= self.max_retries:
+            self._record(job.label, elapsed, failed=True)
+            job.future.set_exception(error)
+            return
+
+        # Hold this worker's slot while sleeping so the backoff also sheds load
+        time.sleep(self.backoff_seconds * (2**job.attempt))
+        job.attempt += 1
+        self._execute(job)
+
+    def _increase_limit(self) -> None:
+        with self._condition:
+            if self._limit < self.max_concurrency:
+                self._limit = min(
+                    float(self.max_concurrency), self._limit + 1.0 / self._limit
+                )
+                self._condition.notify_all()
+
+    def _record(self, label: str, elapsed: float, failed: bool = False) -> None:
+        with self._condition:
+            histogram = self._histograms.get(label)
+            if histogram is None:
+                histogram = self._histograms[label] = LatencyHistogram()
+            histogram.observe(elapsed)
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+
+_lemur_scheduler: Optional[LeMURScheduler] = None
+_lemur_scheduler_lock = threading.Lock()
+
+
+def get_lemur_scheduler() -> LeMURScheduler:
+    """
+    Get the process-wide LeMUR scheduler.
+
+    Returns:
+        Shared scheduler configured from settings
+    """
+    global _lemur_scheduler
+
+    with _lemur_scheduler_lock:
+        if _lemur_scheduler is None:
+            _lemur_scheduler = LeMURScheduler(
+                max_concurrency=settings.LEMUR_MAX_CONCURRENCY,
+                min_concurrency=settings.LEMUR_MIN_CONCURRENCY,
+                max_retries=settings.LEMUR_MAX_RETRIES,
+                backoff_seconds=settings.LEMUR_BACKOFF_SECONDS,
+            )
+            logger.info(
+                f"🚦 LeMUR scheduler started with concurrency limit "
+                f"{settings.LEMUR_MAX_CONCURRENCY}"
+            )
+        return _lemur_scheduler
@@ -25,6 +25,14 @@ from ..config.lemur_config import (
     get_speaker_prompt,
 )
 from ..core.config import settings
+from .lemur_batch_planner import (
+    BatchPlan,
+    PlannedBatch,
+    join_split_text,
+    plan_batches,
+)
+from .lemur_cache import LeMURResultCache, get_lemur_cache, make_cache_key
+from .lemur_scheduler import LeMURPriority, LeMURScheduler, get_lemur_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +46,10 @@ class TranscriptSegment(BaseModel):
         description="Speaker identifier (e.g., 'A', 'B', '教練', '客戶')"
     )
     text: str = Field(description="Transcript text for this segment")
+    source_index: Optional[int] = Field(
+        default=None,
+        description="Index of the input segment this segment was produced from",
+    )
 
 
 class LeMURSmoothedTranscript(BaseModel):
@@ -88,6 +100,9 @@ class LeMURTranscriptSmoother:
         self,
         api_key: Optional[str] = None,
         config: Optional[LeMURConfig] = None,
+        cache: Optional[LeMURResultCache] = None,
+        scheduler: Optional[LeMURScheduler] = None,
+        priority: LeMURPriority = LeMURPriority.INTERACTIVE,
     ):
         """Initialize the LeMUR transcript smoother with configuration."""
         self.api_key = api_key or settings.ASSEMBLYAI_API_KEY
@@ -101,6 +116,13 @@ class LeMURTranscriptSmoother:
         # Load LeMUR configuration
         self.config = config or get_lemur_config()
 
+        # Content-addressed cache so unchanged requests skip the LeMUR call
+        self.cache = cache if cache is not None else get_lemur_cache()
+
+        # Process-wide scheduler bounds LeMUR concurrency across all requests
+        self.scheduler = scheduler or get_lemur_scheduler()
+        self.priority = priority
+
         logger.info(f"🧠 LeMUR initialized with model: {self.config.default_model}")
         logger.info(f"🔧 Combined mode enabled: {self.config.combined_mode_enabled}")
 
@@ -283,6 +305,40 @@ class LeMURTranscriptSmoother:
             logger.exception("Full error traceback:")
             raise
 
+    async def _run_lemur_task(
+        self,
+        prompt: str,
+        input_text: str,
+        model_identifier,
+        max_output_size: int,
+        label: str,
+    ) -> str:
+        """Run a LeMUR task through the shared scheduler and return the response."""
+        result = await self.scheduler.run(
+            self.lemur.task,
+            prompt,
+            input_text=input_text,
+            final_model=model_identifier,
+            max_output_size=max_output_size,
+            priority=self.priority,
+            label=label,
+        )
+        return result.response
+
+    def _get_cached_response(self, cache_key: str, label: str) -> Optional[str]:
+        """Return a cached LeMUR response for an unchanged request, if any."""
+        if self.cache is None:
+            return None
+        response = self.cache.get(cache_key)
+        if response is not None:
+            logger.info(f"♻️ {label}: reusing cached LeMUR response")
+        return response
+
+    def _store_response(self, cache_key: str, response: str) -> None:
+        """Cache a LeMUR response once it has been parsed successfully."""
+        if self.cache is not None:
+            self.cache.set(cache_key, response)
+
     def _prepare_transcript_for_lemur(
         self,
         segments: List[Dict],
@@ -409,32 +465,43 @@ Reply in JSON format: {{"A": "Coach", "B": "Client"}}"""
                 )
 
             # Use LeMUR task endpoint for speaker identification
-            speaker_start_time = time.time()
-            result = await asyncio.to_thread(
-                self.lemur.task,
+            cache_key = make_cache_key(
+                "speaker",
+                str(model_identifier),
                 prompt,
-                input_text=transcript_text,
-                final_model=model_identifier,
-                max_output_size=speaker_output_size,
-            )
-            speaker_end_time = time.time()
-            logger.info(
-                f"⏱️ SPEAKER IDENTIFICATION TIME: {speaker_end_time - speaker_start_time:.2f} seconds"
+                transcript_text,
+                language=context.session_language,
             )
+            response = self._get_cached_response(cache_key, "SPEAKER IDENTIFICATION")
+            if response is None:
+                speaker_start_time = time.time()
+                response = await self._run_lemur_task(
+                    prompt,
+                    transcript_text,
+                    model_identifier,
+                    speaker_output_size,
+                    label="speaker",
+                )
+                speaker_end_time = time.time()
+                logger.info(
+                    f"⏱️ SPEAKER IDENTIFICATION TIME: {speaker_end_time - speaker_start_time:.2f} seconds"
+                )
 
             # Debug: Log the complete response from LeMUR
             logger.info("=" * 80)
             logger.info("📥 LEMUR SPEAKER IDENTIFICATION RESPONSE:")
             logger.info("=" * 80)
-            logger.info(f"RAW RESPONSE: {result.response}")
-            logger.info(f"RESPONSE TYPE: {type(result.response)}")
-            logger.info(f"RESPONSE LENGTH: {len(result.response)} characters")
+            logger.info(f"RAW RESPONSE: {response}")
+            logger.info(f"RESPONSE TYPE: {type(response)}")
+            logger.info(f"RESPONSE LENGTH: {len(response)} characters")
             logger.info("=" * 80)
 
             # Parse JSON response
             import json
 
-            speaker_mapping = json.loads(result.response.strip())
+            speaker_mapping = json.loads(response.strip())
+            # Only responses that parse are worth reusing
+            self._store_response(cache_key, response)
             logger.info(f"🎭 PARSED SPEAKER MAPPING: {speaker_mapping}")
             logger.info(f"📊 MAPPING KEYS: {list(speaker_mapping.keys())}")
             logger.info(f"📊 MAPPING VALUES: {list(speaker_mapping.values())}")
@@ -471,80 +538,54 @@ Reply in JSON format: {{"A": "Coach", "B": "Client"}}"""
         logger.info("=" * 80)
         logger.info(f"📊 TOTAL SEGMENTS TO PROCESS: {len(segments)}")
 
-        # Determine batch size based on content length
-        # Adaptive batch sizing based on total content volume
-        total_chars = sum(len(seg.get("text", "")) for seg in segments)
-
-        if total_chars > 15000:
-            # Large transcript: smaller batches for safety
-            max_batch_chars = 2500
-            max_batch_size = 8
-        elif total_chars > 8000:
-            # Medium transcript: balanced batches
-            max_batch_chars = 3000
-            max_batch_size = 10
-        else:
-            # Small transcript: larger batches for efficiency
-            max_batch_chars = 4000
-            max_batch_size = 15
-
-        min_batch_size = 1  # At least 1 segment per batch
-
-        logger.info(
-            f"📏 ADAPTIVE BATCH SIZING: {total_chars} chars → "
-            f"max_batch_chars={max_batch_chars}, "
-            f"max_batch_size={max_batch_size}"
-        )
-
-        batches = self._create_segment_batches(
-            segments, max_batch_chars, min_batch_size, max_batch_size
-        )
-        logger.info(f"📦 CREATED {len(batches)} BATCHES FOR PROCESSING")
+        # Plan token-balanced batches and report the plan before any LeMUR call
+        plan = self.plan_punctuation_batches(segments)
+        batches = plan.batches
+        logger.info(f"📦 BATCH PLAN: {plan.summary()}")
 
         improved_segments = []
 
-        # Process batches with limited concurrency to avoid API rate limits
-        max_concurrent_batches = min(3, len(batches))  # Max 3 concurrent requests
-
-        if len(batches) > 1 and max_concurrent_batches > 1:
+        # Submit every batch at once; the shared LeMUR scheduler bounds how
+        # many run concurrently across all requests in this process
+        if len(batches) > 1:
             logger.info(
-                f"🚀 PROCESSING {len(batches)} BATCHES WITH {max_concurrent_batches} CONCURRENT WORKERS"
+                f"🚀 PROCESSING {len(batches)} BATCHES VIA LEMUR SCHEDULER "
+                f"(concurrency limit {self.scheduler.limit})"
             )
 
-            # Create semaphore to limit concurrent requests
-            semaphore = asyncio.Semaphore(max_concurrent_batches)
-
             async def process_single_batch(
-                batch_idx: int, batch: List[Dict]
+                batch_idx: int, planned: PlannedBatch
             ) -> Tuple[int, List[TranscriptSegment]]:
-                async with semaphore:
+                batch = planned.segments
+                logger.info(
+                    f"🔄 PROCESSING BATCH {batch_idx + 1}/{len(batches)} "
+                    f"({len(batch)} segments, ~{planned.estimated_tokens} tokens)"
+                )
+
+                try:
+                    batch_result = await self._process_punctuation_batch(
+                        batch,
+                        context,
+                        speaker_corrections,
+                        custom_prompts,
+                        batch_idx + 1,
+                        overlap=planned.overlap,
+                    )
                     logger.info(
-                        f"🔄 PROCESSING BATCH {batch_idx + 1}/{len(batches)} ({len(batch)} segments)"
+                        f"✅ BATCH {batch_idx + 1} COMPLETED: {len(batch_result)} segments processed"
                     )
+                    return batch_idx, batch_result
 
-                    try:
-                        batch_result = await self._process_punctuation_batch(
-                            batch,
-                            context,
-                            speaker_corrections,
-                            custom_prompts,
-                            batch_idx + 1,
-                        )
-                        logger.info(
-                            f"✅ BATCH {batch_idx + 1} COMPLETED: {len(batch_result)} segments processed"
-                        )
-                        return batch_idx, batch_result
-
-                    except Exception as e:
-                        logger.error(f"❌ BATCH {batch_idx + 1} FAILED: {e}")
-                        # Fallback: use original segments for this batch
-                        fallback_segments = self._create_fallback_segments(
-                            batch, speaker_corrections
-                        )
-                        logger.warning(
-                            f"⚠️ USING ORIGINAL SEGMENTS FOR BATCH {batch_idx + 1}"
-                        )
-                        return batch_idx, fallback_segments
+                except Exception as e:
+                    logger.error(f"❌ BATCH {batch_idx + 1} FAILED: {e}")
+                    # Fallback: use original segments for this batch
+                    fallback_segments = self._create_fallback_segments(
+                        batch, speaker_corrections
+                    )
+                    logger.warning(
+                        f"⚠️ USING ORIGINAL SEGMENTS FOR BATCH {batch_idx + 1}"
+                    )
+                    return batch_idx, fallback_segments
 
             # Process all batches concurrently
             tasks = [
@@ -557,13 +598,14 @@ Reply in JSON format: {{"A": "Coach", "B": "Client"}}"""
             for _, batch_segments in batch_results:
                 improved_segments.extend(batch_segments)
         else:
-            # Sequential processing for single batch or when concurrency
-            # disabled
+            # Single batch: nothing to run concurrently
             logger.info(f"📚 PROCESSING {len(batches)} BATCHES SEQUENTIALLY")
 
-            for batch_idx, batch in enumerate(batches):
+            for batch_idx, planned in enumerate(batches):
+                batch = planned.segments
                 logger.info(
-                    f"🔄 PROCESSING BATCH {batch_idx + 1}/{len(batches)} ({len(batch)} segments)"
+                    f"🔄 PROCESSING BATCH {batch_idx + 1}/{len(batches)} "
+                    f"({len(batch)} segments, ~{planned.estimated_tokens} tokens)"
                 )
 
                 try:
@@ -573,6 +615,7 @@ Reply in JSON format: {{"A": "Coach", "B": "Client"}}"""
                         speaker_corrections,
                         custom_prompts,
                         batch_idx + 1,
+                        overlap=planned.overlap,
                     )
                     improved_segments.extend(batch_result)
                     logger.info(
@@ -590,6 +633,9 @@ Reply in JSON format: {{"A": "Coach", "B": "Client"}}"""
                         f"⚠️ USING ORIGINAL SEGMENTS FOR BATCH {batch_idx + 1}"
                     )
 
+        if plan.split_segments:
+            improved_segments = self._join_split_segments(improved_segments)
+
         logger.info("=" * 80)
         logger.info("🎉 BATCH PUNCTUATION IMPROVEMENT COMPLETED")
         logger.info(f"📊 TOTAL PROCESSED SEGMENTS: {len(improved_segments)}")
@@ -597,45 +643,37 @@ Reply in JSON format: {{"A": "Coach", "B": "Client"}}"""
 
         return improved_segments
 
-    def _create_segment_batches(
-        self,
-        segments: List[Dict],
-        max_chars: int,
-        min_size: int,
-        max_size: int,
-    ) -> List[List[Dict]]:
-        """Create batches of segments with character limits."""
-        batches = []
-        current_batch = []
-        current_chars = 0
-
+    def _join_split_segments(
+        self, segments: List[TranscriptSegment]
+    ) -> List[TranscriptSegment]:
+        """Join consecutive pieces of an oversized segment back into one."""
+        joined: List[TranscriptSegment] = []
         for segment in segments:
-            segment_text = segment.get("text", "")
-            segment_chars = len(segment_text)
-
-            # If adding this segment would exceed limits, start new batch
-            if current_batch and (
-                current_chars + segment_chars > max_chars
-                or len(current_batch) >= max_size
+            previous = joined[-1] if joined else None
+            if (
+                previous is not None
+                and segment.source_index is not None
+                and segment.source_index == previous.source_index
             ):
-                batches.append(current_batch)
-                current_batch = []
-                current_chars = 0
-
-            current_batch.append(segment)
-            current_chars += segment_chars
-
-            # If single segment is too large, process it alone
-            if segment_chars > max_chars and len(current_batch) == 1:
-                batches.append(current_batch)
-                current_batch = []
-                current_chars = 0
-
-        # Add final batch
-        if current_batch:
-            batches.append(current_batch)
+                joined[-1] = previous.model_copy(
+                    update={
+                        "end": segment.end,
+                        "text": join_split_text([previous.text, segment.text]),
+                    }
+                )
+            else:
+                joined.append(segment)
+        return joined
 
-        return batches
+    def plan_punctuation_batches(self, segments: List[Dict]) -> BatchPlan:
+        """Plan token-balanced punctuation batches using the configured budget."""
+        performance = self.config.performance_settings
+        return plan_batches(
+            segments,
+            max_batch_tokens=performance.max_batch_tokens,
+            overlap_segments=performance.overlap_segments,
+            max_batch_segments=performance.max_batch_segments,
+        )
 
     async def _process_punctuation_batch(
         self,
@@ -644,6 +682,7 @@ Reply in JSON format: {{"A": "Coach", "B": "Client"}}"""
         speaker_corrections: Dict[str, str],
         custom_prompts: Optional[Dict[str, str]],
         batch_num: int,
+        overlap: Optional[List[Dict]] = None,
     ) -> List[TranscriptSegment]:
         """Process a single batch of segments for punctuation improvement."""
 
@@ -703,6 +742,14 @@ Speaker mapping: {speaker_corrections}
 
 Reply format: Speaker: content"""
 
+        # Trailing segments of the previous batch give LeMUR context across
+        # the batch boundary without being rewritten
+        if overlap:
+            prompt = (
+                self._build_overlap_context(overlap, speaker_corrections, context)
+                + prompt
+            )
+
         # Calculate output size for this batch
         # Chinese punctuation improvement may significantly expand text due to:
         # 1. Detailed formatting instructions in our enhanced prompt
@@ -736,35 +783,43 @@ Reply format: Speaker: content"""
                     aai.LemurModel.claude3_5_sonnet,
                 )
 
-            # Process with LeMUR
-            batch_start_time = time.time()
-            result = await asyncio.to_thread(
-                self.lemur.task,
+            # Process with LeMUR unless this exact batch was already processed
+            cache_key = make_cache_key(
+                "punctuation",
+                str(model_identifier),
                 prompt,
-                input_text=batch_text,
-                final_model=model_identifier,
-                max_output_size=estimated_output_size,
+                batch_text,
+                speaker_mapping=speaker_corrections,
+                language=context.session_language,
             )
-            batch_end_time = time.time()
+            response = self._get_cached_response(cache_key, f"BATCH {batch_num}")
+            if response is None:
+                batch_start_time = time.time()
+                response = await self._run_lemur_task(
+                    prompt,
+                    batch_text,
+                    model_identifier,
+                    estimated_output_size,
+                    label="punctuation_batch",
+                )
+                batch_end_time = time.time()
 
+                logger.info(
+                    f"⏱️ BATCH {batch_num} PROCESSING TIME: {batch_end_time - batch_start_time:.2f} seconds"
+                )
             logger.info(
-                f"⏱️ BATCH {batch_num} PROCESSING TIME: {batch_end_time - batch_start_time:.2f} seconds"
-            )
-            logger.info(
-                f"📏 BATCH {batch_num} RESPONSE LENGTH: {len(result.response)} characters"
-            )
-            logger.info(
-                f"📥 BATCH {batch_num} RESPONSE PREVIEW: {result.response[:300]}..."
+                f"📏 BATCH {batch_num} RESPONSE LENGTH: {len(response)} characters"
             )
+            logger.info(f"📥 BATCH {batch_num} RESPONSE PREVIEW: {response[:300]}...")
 
             # Check if response might have been truncated
-            if len(result.response) >= estimated_output_size * 0.95:
+            if len(response) >= estimated_output_size * 0.95:
                 logger.warning(
-                    f"⚠️ BATCH {batch_num} RESPONSE MIGHT BE TRUNCATED! Response length ({len(result.response)}) is close to max_output_size ({estimated_output_size})"
+                    f"⚠️ BATCH {batch_num} RESPONSE MIGHT BE TRUNCATED! Response length ({len(response)}) is close to max_output_size ({estimated_output_size})"
                 )
 
             # Parse response and create segments
-            improved_text = result.response.strip()
+            improved_text = response.strip()
 
             # Apply Traditional Chinese conversion if needed
             if context.session_language.startswith("zh"):
@@ -783,14 +838,30 @@ Reply format: Speaker: content"""
                     )
 
             # Convert improved text back to segments
-            return self._parse_batch_response_to_segments(
+            batch_segments = self._parse_batch_response_to_segments(
                 improved_text, batch, speaker_corrections
             )
+            self._store_response(cache_key, response)
+            return batch_segments
 
         except Exception as e:
             logger.error(f"❌ BATCH {batch_num} LEMUR PROCESSING FAILED: {e}")
             raise
 
+    def _build_overlap_context(
+        self,
+        overlap: List[Dict],
+        speaker_corrections: Dict[str, str],
+        context: SmoothingContext,
+    ) -> str:
+        """Render the read-only overlap window that precedes a batch prompt."""
+        overlap_text = self._prepare_batch_for_lemur(overlap, speaker_corrections)
+        if context.session_language.startswith("zh"):
+            header = "前文（僅供理解上下文，請勿修改或輸出）："
+        else:
+            header = "Preceding context (for reference only; do not edit or output):"
+        return f"{header}\n{overlap_text}\n\n"
+
     def _prepare_batch_for_lemur(
         self, batch: List[Dict], speaker_corrections: Dict[str, str]
     ) -> str:
@@ -864,10 +935,12 @@ Reply format: Speaker: content"""
                         original_segment = original_batch[segment_index]
                         start_time = int(round(original_segment.get("start", 0)))
                         end_time = int(round(original_segment.get("end", 0)))
+                        source_index = original_segment.get("source_index")
                     else:
                         # Use last segment timing as fallback
                         start_time = 0
                         end_time = 0
+                        source_index = None
 
                     improved_segments.append(
                         TranscriptSegment(
@@ -875,6 +948,7 @@ Reply format: Speaker: content"""
                             end=end_time,
                             speaker=speaker,
                             text=text,
+                            source_index=source_index,
                         )
                     )
 
@@ -892,6 +966,7 @@ Reply format: Speaker: content"""
                     end=int(round(original_segment.get("end", 0))),
                     speaker=speaker_corrected,
                     text=original_segment.get("text", ""),
+                    source_index=original_segment.get("source_index"),
                 )
             )
             segment_index += 1
@@ -914,6 +989,7 @@ Reply format: Speaker: content"""
                     end=int(round(segment.get("end", 0))),
                     speaker=speaker_corrected,
                     text=segment.get("text", ""),
+                    source_index=segment.get("source_index"),
                 )
             )
 
@@ -1036,12 +1112,12 @@ Reply with the improved transcript, maintaining the same format (Speaker: conten
 
             # Use LeMUR task endpoint for punctuation improvement
             punctuation_start_time = time.time()
-            result = await asyncio.to_thread(
-                self.lemur.task,
+            response = await self._run_lemur_task(
                 prompt,
-                input_text=transcript_text,
-                final_model=model_identifier,
-                max_output_size=estimated_output_size,
+                transcript_text,
+                model_identifier,
+                estimated_output_size,
+                label="punctuation",
             )
             punctuation_end_time = time.time()
             logger.info(
@@ -1052,12 +1128,12 @@ Reply with the improved transcript, maintaining the same format (Speaker: conten
             logger.info("=" * 80)
             logger.info("📥 LEMUR PUNCTUATION IMPROVEMENT RESPONSE:")
             logger.info("=" * 80)
-            logger.info(f"RAW RESPONSE: {result.response}")
-            logger.info(f"RESPONSE TYPE: {type(result.response)}")
-            logger.info(f"RESPONSE LENGTH: {len(result.response)} characters")
+            logger.info(f"RAW RESPONSE: {response}")
+            logger.info(f"RESPONSE TYPE: {type(response)}")
+            logger.info(f"RESPONSE LENGTH: {len(response)} characters")
             logger.info("=" * 80)
 
-            improved_text = result.response.strip()
+            improved_text = response.strip()
 
             # Debug: Log text after initial processing
             logger.info(f"📝 STRIPPED RESPONSE LENGTH: {len(improved_text)} characters")
@@ -1340,30 +1416,41 @@ Reply with the improved transcript, maintaining the same format (Speaker: conten
             logger.info(f"📏 OUTPUT SIZE: {estimated_output_size} characters")
             logger.info("=" * 80)
 
-            # Process with LeMUR
-            processing_start_time = time.time()
-            result = await asyncio.to_thread(
-                self.lemur.task,
+            # Process with LeMUR unless this exact transcript was already processed
+            cache_key = make_cache_key(
+                "combined",
+                str(model_identifier),
                 prompt,
-                input_text=transcript_text,
-                final_model=model_identifier,
-                max_output_size=estimated_output_size,
+                transcript_text,
+                speaker_mapping=normalized_to_original_map,
+                language=context.session_language,
             )
-            processing_end_time = time.time()
+            response = self._get_cached_response(cache_key, "COMBINED PROCESSING")
+            if response is None:
+                processing_start_time = time.time()
+                response = await self._run_lemur_task(
+                    prompt,
+                    transcript_text,
+                    model_identifier,
+                    estimated_output_size,
+                    label="combined",
+                )
+                processing_end_time = time.time()
 
-            logger.info(
-                f"⏱️ COMBINED PROCESSING TIME: {processing_end_time - processing_start_time:.2f} seconds"
-            )
-            logger.info(f"📏 RESPONSE LENGTH: {len(result.response)} characters")
+                logger.info(
+                    f"⏱️ COMBINED PROCESSING TIME: {processing_end_time - processing_start_time:.2f} seconds"
+                )
+            logger.info(f"📏 RESPONSE LENGTH: {len(response)} characters")
 
             # Parse combined response
-            combined_response = result.response.strip()
+            combined_response = response.strip()
             speaker_mapping, improved_segments = self._parse_combined_response(
                 combined_response,
                 segments,
                 context,
                 normalized_to_original_map,
             )
+            self._store_response(cache_key, response)
 
             end_time = time.time()
             processing_time = end_time - start_time
@@ -2126,6 +2213,7 @@ async def smooth_transcript_with_lemur(
     speaker_identification_only: bool = False,
     punctuation_optimization_only: bool = False,
     use_combined_processing: bool = None,
+    priority: LeMURPriority = LeMURPriority.INTERACTIVE,
 ) -> LeMURSmoothedTranscript:
     """
     Convenience function to smooth transcript using LeMUR.
@@ -2138,11 +2226,13 @@ async def smooth_transcript_with_lemur(
         speaker_identification_only: If True, only correct speaker identification
         punctuation_optimization_only: If True, only optimize punctuation
         use_combined_processing: If True, use combined mode. If None, use config default
+        priority: Scheduling priority of the LeMUR calls (background work yields
+            to interactive requests)
 
     Returns:
         LeMURSmoothedTranscript with improved quality
     """
-    smoother = LeMURTranscriptSmoother()
+    smoother = LeMURTranscriptSmoother(priority=priority)
     context = SmoothingContext(
         session_language=session_language,
         is_coaching_session=is_coaching_session,
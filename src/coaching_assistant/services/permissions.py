@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from ..models.role_audit_log import RoleAuditLog
 from ..models.user import User, UserRole
+from .user_principal_cache import invalidate_user_principal
 
 
 class PermissionService:
@@ -89,6 +90,7 @@ class PermissionService:
         if new_role in [UserRole.ADMIN, UserRole.STAFF]:
             target_user.admin_access_expires = datetime.now(UTC) + timedelta(hours=2)
 
+        invalidate_user_principal(target_user.id, self.db)
         self.db.commit()
 
         # TODO: Send notification email (implement separately)
@@ -0,0 +1,322 @@
+"""
+Push channel for transcription progress.
+
+The transcription task publishes every progress update to a per-session
+Redis pub/sub topic, and the API relays that topic to the browser as
+Server-Sent Events. Clients no longer need to poll
+``GET /api/v1/sessions/{id}/status``. The last event of each session is
+also kept under a short-lived key, so a client that connects mid-run starts
+from the current state.
+
+The database is no longer written on every STT callback. ProgressReporter
+commits ProcessingStatus only when progress crosses one of
+PROGRESS_DB_MILESTONES or the status changes, which is enough for the status
+endpoint and for recovering after a worker restart.
+
+Without REDIS_URL no events are published and clients fall back to the
+status endpoint; InMemoryProgressBroker stands in for Redis when the task and
+the listener share a process, as in tests and eager task runs. A publish that
+fails is logged and does not interrupt the transcription.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from datetime import UTC, datetime
+from typing import Any, Dict, Optional, Sequence, Set
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.processing_status import ProcessingStatus
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "session:progress:"
+LATEST_KEY_PREFIX = "session:progress:latest:"
+
+# Progress values at which ProcessingStatus is committed; updates in between
+# are only published
+PROGRESS_DB_MILESTONES = (0, 10, 25, 50, 80, 95, 100)
+
+# Event statuses after which no further events are published for a run
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+
+def build_progress_event(
+    session_id: Any,
+    status: str,
+    progress: int,
+    message: Optional[str] = None,
+    duration_processed: Optional[int] = None,
+    duration_total: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build the JSON payload of one progress event."""
+    return {
+        "session_id": str(session_id),
+        "status": status,
+        "progress": progress,
+        "message": message,
+        "duration_processed": duration_processed,
+        "duration_total": duration_total,
+        "updated_at": datetime.now(UTC).isoformat(),
+    }
+
+
+class ProgressSubscription(ABC):
+    """Stream of progress events for one session."""
+
+    @abstractmethod
+    async def next_event(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait for the next event; return None if none arrives in time."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop receiving events."""
+
+
+class ProgressBroker(ABC):
+    """Publishes progress events and hands out subscriptions to them."""
+
+    @abstractmethod
+    def publish(self, session_id: Any, event: Dict[str, Any]) -> None:
+        """Publish an event and remember it as the session's latest."""
+
+    @abstractmethod
+    async def latest(self, session_id: Any) -> Optional[Dict[str, Any]]:
+        """Return the last published event of a session, if still kept."""
+
+    @abstractmethod
+    async def subscribe(self, session_id: Any) -> ProgressSubscription:
+        """Subscribe to a session's events published from now on."""
+
+
+class _RedisSubscription(ProgressSubscription):
+    def __init__(self, pubsub: Any, channel: str):
+        self.pubsub = pubsub
+        self.channel = channel
+
+    async def next_event(self, timeout: float) -> Optional[Dict[str, Any]]:
+        message = await self.pubsub.get_message(
+            ignore_subscribe_messages=True, timeout=timeout
+        )
+        if message is None:
+            return None
+        return json.loads(message["data"])
+
+    async def close(self) -> None:
+        await self.pubsub.unsubscribe(self.channel)
+        await self.pubsub.aclose()
+
+
+class RedisProgressBroker(ProgressBroker):
+    """Redis pub/sub broker; a sync client publishes, an asyncio one listens."""
+
+    def __init__(
+        self,
+        client: "redis.Redis",
+        async_client: "aioredis.Redis",
+        latest_ttl_seconds: int = 3600,
+    ):
+        self.redis = client
+        self.async_redis = async_client
+        self.latest_ttl_seconds = latest_ttl_seconds
+
+    def publish(self, session_id: Any, event: Dict[str, Any]) -> None:
+        payload = json.dumps(event)
+        pipe = self.redis.pipeline()
+        pipe.setex(
+            LATEST_KEY_PREFIX + str(session_id), self.latest_ttl_seconds, payload
+        )
+        pipe.publish(CHANNEL_PREFIX + str(session_id), payload)
+        pipe.execute()
+
+    async def latest(self, session_id: Any) -> Optional[Dict[str, Any]]:
+        payload = await self.async_redis.get(LATEST_KEY_PREFIX + str(session_id))
+        return json.loads(payload) if payload else None
+
+    async def subscribe(self, session_id: Any) -> ProgressSubscription:
+        channel = CHANNEL_PREFIX + str(session_id)
+        pubsub = self.async_redis.pubsub()
+        await pubsub.subscribe(channel)
+        return _RedisSubscription(pubsub, channel)
+
+
+class _QueueSubscription(ProgressSubscription):
+    def __init__(self, broker: "InMemoryProgressBroker", session_id: str):
+        self.broker = broker
+        self.session_id = session_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+
+    async def next_event(self, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self.broker._unsubscribe(self)
+
+
+class InMemoryProgressBroker(ProgressBroker):
+    """In-process broker; publishing is thread-safe, listeners are asyncio."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._subscriptions: Dict[str, Set[_QueueSubscription]] = {}
+
+    def publish(self, session_id: Any, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self._latest[str(session_id)] = event
+            subscriptions = list(self._subscriptions.get(str(session_id), ()))
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+    async def latest(self, session_id: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._latest.get(str(session_id))
+
+    async def subscribe(self, session_id: Any) -> ProgressSubscription:
+        subscription = _QueueSubscription(self, str(session_id))
+        with self._lock:
+            self._subscriptions.setdefault(str(session_id), set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: _QueueSubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.session_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.session_id, None)
+
+
+class ProgressReporter:
+    """
+    Reports the progress of one transcription run.
+
+    Every update is applied to the ProcessingStatus row and published. The
+    row is committed only at milestones and status changes, so frequent STT
+    callbacks cost a Redis PUBLISH each rather than a database transaction.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        processing_status: ProcessingStatus,
+        broker: Optional[ProgressBroker] = None,
+        milestones: Sequence[int] = PROGRESS_DB_MILESTONES,
+    ):
+        self.db = db
+        self.processing_status = processing_status
+        self.broker = broker
+        self.milestones = milestones
+        self._committed_status = processing_status.status
+        self._committed_milestone = self._milestone(processing_status.progress or 0)
+
+    def update(
+        self,
+        progress: int,
+        message: Optional[str] = None,
+        status: Optional[str] = None,
+        commit: Optional[bool] = None,
+    ) -> None:
+        """
+        Record and publish a progress update.
+
+        Args:
+            progress: Overall progress, 0-100
+            message: Human-readable status message
+            status: New ProcessingStatus status, if it changes
+            commit: Force (True) or skip (False) the commit; by default the
+                row is committed when a milestone is reached or the status
+                changes
+        """
+        processing_status = self.processing_status
+        processing_status.update_progress(progress, message)
+        if status:
+            processing_status.status = status
+
+        milestone = self._milestone(processing_status.progress)
+        if commit is None:
+            commit = (
+                milestone > self._committed_milestone
+                or processing_status.status != self._committed_status
+            )
+        if commit:
+            self.db.commit()
+            self._committed_milestone = milestone
+            self._committed_status = processing_status.status
+
+        self.publish()
+
+    def publish(self) -> None:
+        """Publish the current state of the ProcessingStatus row."""
+        if self.broker is None:
+            return
+        processing_status = self.processing_status
+        publish_progress(
+            self.broker,
+            build_progress_event(
+                processing_status.session_id,
+                status=processing_status.status,
+                progress=processing_status.progress_percentage,
+                message=processing_status.message,
+                duration_processed=processing_status.duration_processed,
+                duration_total=processing_status.duration_total,
+            ),
+        )
+
+    def _milestone(self, progress: int) -> int:
+        return bisect_right(self.milestones, progress)
+
+
+def publish_progress(broker: Optional[ProgressBroker], event: Dict[str, Any]) -> None:
+    """Publish an event; broker errors are logged and swallowed."""
+    if broker is None:
+        return
+    try:
+        broker.publish(event["session_id"], event)
+    except Exception as e:
+        logger.warning(
+            f"⚠️ Failed to publish progress for session {event['session_id']}: {e}"
+        )
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """Encode a progress event as a Server-Sent Events message."""
+    return f"event: progress\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+_progress_broker: Optional[ProgressBroker] = None
+_progress_broker_lock = threading.Lock()
+
+
+def get_progress_broker() -> Optional[ProgressBroker]:
+    """
+    Get the process-wide progress broker.
+
+    Returns:
+        Redis broker, or None when REDIS_URL is not configured
+    """
+    global _progress_broker
+
+    if not settings.REDIS_URL:
+        return None
+    with _progress_broker_lock:
+        if _progress_broker is None:
+            _progress_broker = RedisProgressBroker(
+                redis.from_url(settings.REDIS_URL, decode_responses=True),
+                aioredis.from_url(settings.REDIS_URL, decode_responses=True),
+                latest_ttl_seconds=settings.PROGRESS_EVENTS_TTL_SECONDS,
+            )
+        return _progress_broker
@@ -14,7 +14,8 @@ import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, field_validator
 
@@ -149,8 +150,52 @@ class BaseProcessorConfig:
     punctuation: BasePunctuationConfig = field(default_factory=BasePunctuationConfig)
 
 
+# Lightweight records for the trusted fast path. The raw AssemblyAI JSON is
+# validated once by parse_utterances and then processed as plain slotted
+# objects; pydantic models are only created at the API boundary.
+@dataclass(slots=True)
+class WordRecord:
+    """Word-level timestamp (slotted counterpart of WordTimestamp)."""
+
+    text: str
+    start: int  # milliseconds
+    end: int  # milliseconds
+    confidence: Optional[float] = 1.0
+
+
+@dataclass(slots=True)
+class UtteranceRecord:
+    """Utterance (slotted counterpart of Utterance)."""
+
+    speaker: str
+    start: int  # milliseconds
+    end: int  # milliseconds
+    confidence: float
+    words: List[WordRecord]
+
+
+@dataclass(slots=True)
+class SegmentRecord:
+    """Output segment (slotted counterpart of ProcessedSegment)."""
+
+    speaker: str
+    start_ms: int
+    end_ms: int
+    text: str
+    source_utterance_indices: List[int]
+    note: Optional[str] = None
+
+
+@dataclass(slots=True)
+class FastProcessingResult:
+    """Result of the fast path: slotted segments plus the usual statistics."""
+
+    segments: List[SegmentRecord]
+    stats: "ProcessingStats"
+
+
 # Internal helper classes
-@dataclass
+@dataclass(slots=True)
 class WordWithSpeaker:
     """Word with speaker and timing information."""
 
@@ -175,10 +220,333 @@ class UnsupportedLanguageError(TranscriptProcessingError):
     """Raised when language is not supported."""
 
 
+def _to_ms(value: Any, field_name: str, location: str) -> int:
+    """Convert a timestamp to integer milliseconds, like WordTimestamp does."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TranscriptProcessingError(
+            f"Invalid {field_name} in {location}: expected a number"
+        )
+    return int(round(value))
+
+
+def parse_utterances(transcript_json: Dict[str, Any]) -> List[UtteranceRecord]:
+    """
+    Validate raw AssemblyAI utterances in one pass and build slotted records.
+
+    Applies the same rules as TranscriptInput/Utterance/WordTimestamp
+    (non-empty utterances and words, timestamps rounded to integer
+    milliseconds, word confidence defaulting to 1.0) without creating
+    pydantic models.
+
+    Raises:
+        TranscriptProcessingError: If utterances are missing or malformed
+        MissingWordsError: If an utterance has no words
+    """
+    utterances = transcript_json.get("utterances")
+    if utterances is None:
+        raise TranscriptProcessingError("Utterances missing from transcript")
+    if not utterances:
+        raise TranscriptProcessingError("Empty utterances list")
+    if not isinstance(utterances, list):
+        raise TranscriptProcessingError("Invalid utterances: expected a list")
+
+    records = []
+    for i, utterance in enumerate(utterances):
+        location = f"utterance {i}"
+        if not isinstance(utterance, dict):
+            raise TranscriptProcessingError(f"Invalid {location}: expected an object")
+        words = utterance.get("words")
+        if not words:
+            raise MissingWordsError(
+                f"Words missing in utterance {i}; cannot perform smoothing"
+            )
+        if not isinstance(words, list):
+            raise TranscriptProcessingError(
+                f"Invalid words in {location}: expected a list"
+            )
+
+        speaker = utterance.get("speaker")
+        confidence = utterance.get("confidence")
+        if not isinstance(speaker, str):
+            raise TranscriptProcessingError(f"Invalid speaker in {location}")
+        if isinstance(confidence, bool) or not isinstance(confidence, (int, float)):
+            raise TranscriptProcessingError(f"Invalid confidence in {location}")
+
+        word_records = []
+        for j, word in enumerate(words):
+            word_location = f"word {j} of {location}"
+            if not isinstance(word, dict):
+                raise TranscriptProcessingError(
+                    f"Invalid {word_location}: expected an object"
+                )
+            text = word.get("text")
+            if not isinstance(text, str):
+                raise TranscriptProcessingError(f"Invalid text in {word_location}")
+            word_confidence = word.get("confidence", 1.0)
+            if word_confidence is not None and (
+                isinstance(word_confidence, bool)
+                or not isinstance(word_confidence, (int, float))
+            ):
+                raise TranscriptProcessingError(
+                    f"Invalid confidence in {word_location}"
+                )
+            word_records.append(
+                WordRecord(
+                    text,
+                    _to_ms(word.get("start"), "start", word_location),
+                    _to_ms(word.get("end"), "end", word_location),
+                    word_confidence,
+                )
+            )
+
+        records.append(
+            UtteranceRecord(
+                speaker,
+                _to_ms(utterance.get("start"), "start", location),
+                _to_ms(utterance.get("end"), "end", location),
+                float(confidence),
+                word_records,
+            )
+        )
+
+    return records
+
+
+# Compiled Rule Tables
+class MultiPatternMatcher:
+    """
+    Match any of a fixed set of substrings in a single scan.
+
+    The patterns are compiled once into one regex alternation (longest
+    first), so a lookup is a single C-level pass over the text instead of one
+    substring search per pattern.
+    """
+
+    __slots__ = ("patterns", "_regex")
+
+    def __init__(self, patterns: Tuple[str, ...]):
+        self.patterns = tuple(patterns)
+        longest_first = sorted(self.patterns, key=len, reverse=True)
+        alternation = "|".join(re.escape(pattern) for pattern in longest_first)
+        self._regex = re.compile(alternation) if self.patterns else None
+
+    def contains_any(self, text: str) -> bool:
+        """Return True if any pattern occurs in text."""
+        return self._regex is not None and self._regex.search(text) is not None
+
+    def find_all(self, text: str) -> List[str]:
+        """Return the non-overlapping pattern occurrences in text."""
+        if self._regex is None:
+            return []
+        return self._regex.findall(text)
+
+
+@dataclass(frozen=True)
+class LanguageRules:
+    """Precompiled, immutable rule table for one language."""
+
+    language: SupportedLanguage
+    filler_words: Tuple[str, ...] = ()
+    filler_set: frozenset = frozenset()
+    terminal_punctuation: Tuple[str, ...] = ()
+    question_markers: MultiPatternMatcher = MultiPatternMatcher(())
+    question_prefixes: Tuple[str, ...] = ()
+    exclamation_markers: MultiPatternMatcher = MultiPatternMatcher(())
+    ellipsis_suffixes: Tuple[str, ...] = ()
+    punctuation_table: Dict[int, str] = field(default_factory=dict)
+    common_words: frozenset = frozenset()
+
+
+# Language detection only samples this many words from the first utterances
+DETECTION_SAMPLE_UTTERANCES = 3
+DETECTION_SAMPLE_WORDS = 200
+
+_CHINESE_CHAR_RE = re.compile("[\u4e00-\u9fff]")
+
+
+def _build_chinese_rules() -> LanguageRules:
+    fillers = ("嗯", "呃", "唉", "喔", "哦", "唔", "啊", "欸", "對", "好")
+    return LanguageRules(
+        language=SupportedLanguage.CHINESE,
+        filler_words=fillers,
+        filler_set=frozenset(fillers),
+        terminal_punctuation=("。", "！", "？", "…"),
+        question_markers=MultiPatternMatcher(
+            (
+                "嗎",
+                "呢",
+                "是不是",
+                "對不對",
+                "好不好",
+                "怎麼",
+                "什麼",
+                "哪裡",
+                "為什麼",
+            )
+        ),
+        exclamation_markers=MultiPatternMatcher(
+            (
+                "真的",
+                "太",
+                "非常",
+                "超級",
+                "哇",
+                "哎呀",
+                "天啊",
+                "不行",
+                "一定要",
+            )
+        ),
+        ellipsis_suffixes=("之類的", "什麼的", "等等", "等等等"),
+        punctuation_table=str.maketrans(
+            {
+                ",": "，",
+                ".": "。",
+                "?": "？",
+                "!": "！",
+                ":": "：",
+                ";": "；",
+                "(": "（",
+                ")": "）",
+            }
+        ),
+    )
+
+
+def _build_english_rules() -> LanguageRules:
+    fillers = ("um", "uh", "er", "ah", "yeah", "okay", "right", "well")
+    return LanguageRules(
+        language=SupportedLanguage.ENGLISH,
+        filler_words=fillers,
+        filler_set=frozenset(fillers),
+        terminal_punctuation=(".", "!", "?"),
+        question_prefixes=(
+            "what",
+            "where",
+            "when",
+            "why",
+            "how",
+            "who",
+            "which",
+            "do",
+            "does",
+            "did",
+            "can",
+            "could",
+            "should",
+            "would",
+        ),
+        exclamation_markers=MultiPatternMatcher(
+            ("wow", "amazing", "incredible", "fantastic")
+        ),
+        common_words=frozenset(
+            (
+                "the",
+                "and",
+                "or",
+                "but",
+                "in",
+                "on",
+                "at",
+                "to",
+                "for",
+                "of",
+                "with",
+                "by",
+                "a",
+                "an",
+                "is",
+                "are",
+                "was",
+                "were",
+                "be",
+                "been",
+                "have",
+                "has",
+                "had",
+                "do",
+                "does",
+                "did",
+                "will",
+                "would",
+                "could",
+                "should",
+                "can",
+                "may",
+                "this",
+                "that",
+                "these",
+                "those",
+                "i",
+                "you",
+                "he",
+                "she",
+                "it",
+                "we",
+                "they",
+                "me",
+                "him",
+                "her",
+                "us",
+                "them",
+                "my",
+                "your",
+                "his",
+                "our",
+                "their",
+                "what",
+                "when",
+                "where",
+                "why",
+                "how",
+                "who",
+                "which",
+                "so",
+                "about",
+            )
+        ),
+    )
+
+
+_RULE_BUILDERS = {
+    SupportedLanguage.CHINESE: _build_chinese_rules,
+    SupportedLanguage.ENGLISH: _build_english_rules,
+}
+
+
+@lru_cache(maxsize=None)
+def get_language_rules(language: SupportedLanguage) -> LanguageRules:
+    """Return the rule table for a language, compiled once per process."""
+    builder = _RULE_BUILDERS.get(language)
+    if builder is None:
+        return LanguageRules(language=language)
+    return builder()
+
+
+def sample_words(utterances: List[Utterance]) -> List[str]:
+    """Return the word texts of a bounded transcript prefix for detection."""
+    sample: List[str] = []
+    for utterance in utterances[:DETECTION_SAMPLE_UTTERANCES]:
+        for word in utterance.words:
+            sample.append(word.text)
+            if len(sample) >= DETECTION_SAMPLE_WORDS:
+                return sample
+    return sample
+
+
 # Abstract Base Classes
 class LanguageProcessor(ABC):
     """Abstract base class for language-specific processing."""
 
+    @property
+    def rules(self) -> LanguageRules:
+        """Shared compiled rule table for this processor's language."""
+        return get_language_rules(self.get_supported_language())
+
+    def is_filler(self, text: str) -> bool:
+        """Check if a word is a filler word (constant-time set lookup)."""
+        return text in self.rules.filler_set
+
     @abstractmethod
     def get_supported_language(self) -> SupportedLanguage:
         """Get the language this processor supports."""
@@ -285,90 +653,45 @@ class ChineseProcessor(LanguageProcessor):
 
     def detect_language(self, utterances: List[Utterance]) -> bool:
         """Detect Chinese language by checking character patterns."""
-        chinese_char_count = 0
-        total_char_count = 0
-
-        for utterance in utterances[:3]:  # Check first 3 utterances
-            for word in utterance.words:
-                for char in word.text:
-                    total_char_count += 1
-                    if "\u4e00" <= char <= "\u9fff":  # Chinese characters
-                        chinese_char_count += 1
-
-        if total_char_count == 0:
+        text = "".join(sample_words(utterances))
+        if not text:
             return False
 
-        chinese_ratio = chinese_char_count / total_char_count
+        chinese_ratio = len(_CHINESE_CHAR_RE.findall(text)) / len(text)
         return chinese_ratio > 0.3  # 30% Chinese characters threshold
 
     def get_filler_words(self) -> List[str]:
-        return ["嗯", "呃", "唉", "喔", "哦", "唔", "啊", "欸", "對", "好"]
+        return list(self.rules.filler_words)
 
     def has_terminal_punctuation(self, text: str) -> bool:
         """Check if text ends with Chinese terminal punctuation."""
         if not text:
             return False
-        return text.strip().endswith(("。", "！", "？", "…"))
+        return text.strip().endswith(self.rules.terminal_punctuation)
 
     def determine_punctuation(self, text: str) -> str:
         """Determine appropriate Chinese punctuation."""
-        # Question indicators
-        question_patterns = [
-            "嗎",
-            "呢",
-            "是不是",
-            "對不對",
-            "好不好",
-            "怎麼",
-            "什麼",
-            "哪裡",
-            "為什麼",
-        ]
-        if any(pattern in text for pattern in question_patterns):
+        rules = self.rules
+        if rules.question_markers.contains_any(text):
             return "？"
 
-        # Exclamation indicators
-        exclamation_patterns = [
-            "真的",
-            "太",
-            "非常",
-            "超級",
-            "哇",
-            "哎呀",
-            "天啊",
-            "不行",
-            "一定要",
-        ]
-        if any(pattern in text for pattern in exclamation_patterns):
+        if rules.exclamation_markers.contains_any(text):
             return "！"
 
-        # Ellipsis indicators
-        ellipsis_patterns = ["之類的", "什麼的", "等等", "等等等"]
-        if any(text.endswith(pattern) for pattern in ellipsis_patterns):
+        if text.endswith(rules.ellipsis_suffixes):
             return "…"
 
         return "。"
 
     def normalize_punctuation(self, text: str) -> str:
         """Convert to full-width Chinese punctuation."""
-        punctuation_map = {
-            ",": "，",
-            ".": "。",
-            "?": "？",
-            "!": "！",
-            ":": "：",
-            ";": "；",
-            "(": "（",
-            ")": "）",
-        }
-
-        for half, full in punctuation_map.items():
-            text = text.replace(half, full)
-
-        return text
+        return text.translate(self.rules.punctuation_table)
 
     def process_smart_quotes(self, text: str) -> str:
         """Process smart quotes for Chinese."""
+        if '"' not in text:
+            return text
+
         result = []
         quote_count = 0
 
@@ -393,124 +716,33 @@ class EnglishProcessor(LanguageProcessor):
 
     def detect_language(self, utterances: List[Utterance]) -> bool:
         """Detect English language by checking patterns."""
-        english_words = {
-            "the",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "a",
-            "an",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "can",
-            "may",
-            "this",
-            "that",
-            "these",
-            "those",
-            "i",
-            "you",
-            "he",
-            "she",
-            "it",
-            "we",
-            "they",
-            "me",
-            "him",
-            "her",
-            "us",
-            "them",
-            "my",
-            "your",
-            "his",
-            "our",
-            "their",
-            "what",
-            "when",
-            "where",
-            "why",
-            "how",
-            "who",
-            "which",
-            "so",
-            "about",
-        }
-        total_words = 0
-        english_word_count = 0
-
-        for utterance in utterances[:3]:  # Check first 3 utterances
-            for word in utterance.words:
-                total_words += 1
-                if word.text.lower() in english_words:
-                    english_word_count += 1
-
-        if total_words == 0:
+        sample = sample_words(utterances)
+        if not sample:
             return False
 
-        english_ratio = english_word_count / total_words
+        common_words = self.rules.common_words
+        english_word_count = sum(1 for text in sample if text.lower() in common_words)
+        english_ratio = english_word_count / len(sample)
         return english_ratio > 0.1  # 10% common English words threshold
 
     def get_filler_words(self) -> List[str]:
-        return ["um", "uh", "er", "ah", "yeah", "okay", "right", "well"]
+        return list(self.rules.filler_words)
 
     def has_terminal_punctuation(self, text: str) -> bool:
         """Check if text ends with English terminal punctuation."""
         if not text:
             return False
-        return text.strip().endswith((".", "!", "?"))
+        return text.strip().endswith(self.rules.terminal_punctuation)
 
     def determine_punctuation(self, text: str) -> str:
         """Determine appropriate English punctuation."""
-        # Question indicators
-        question_words = [
-            "what",
-            "where",
-            "when",
-            "why",
-            "how",
-            "who",
-            "which",
-            "do",
-            "does",
-            "did",
-            "can",
-            "could",
-            "should",
-            "would",
-        ]
+        rules = self.rules
         text_lower = text.lower()
 
-        if any(
-            text_lower.startswith(word) for word in question_words
-        ) or text_lower.endswith("?"):
+        if text_lower.startswith(rules.question_prefixes) or text_lower.endswith("?"):
             return "?"
 
-        # Exclamation indicators
-        if any(
-            word in text_lower for word in ["wow", "amazing", "incredible", "fantastic"]
-        ):
+        if rules.exclamation_markers.contains_any(text_lower):
             return "!"
 
         return "."
@@ -571,9 +803,11 @@ class SpeakerBoundarySmoother:
         self,
         config: BaseSmoothingConfig,
         language_processor: LanguageProcessor,
+        utterance_factory: Callable[..., Any] = Utterance,
     ):
         self.config = config
         self.language_processor = language_processor
+        self.utterance_factory = utterance_factory
         self.stats = HeuristicStats()
 
     def smooth_boundaries(self, utterances: List[Utterance]) -> List[Utterance]:
@@ -695,10 +929,12 @@ class SpeakerBoundarySmoother:
         first_word = next_utt.words[0]
         word_duration = (first_word.end - first_word.start) / 1000.0
 
-        filler_words = self.language_processor.get_filler_words()
         th_filler_max_sec = getattr(self.config, "th_filler_max_sec", 0.6)
 
-        if first_word.text in filler_words and word_duration < th_filler_max_sec:
+        if (
+            self.language_processor.is_filler(first_word.text)
+            and word_duration < th_filler_max_sec
+        ):
             return self._merge_words_to_previous(current, next_utt, [first_word])
 
         return None
@@ -861,7 +1097,7 @@ class SpeakerBoundarySmoother:
         new_words = current.words + words_to_move
         new_end = words_to_move[-1].end if words_to_move else current.end
 
-        merged = Utterance(
+        merged = self.utterance_factory(
             speaker=current.speaker,
             start=current.start,
             end=new_end,
@@ -873,7 +1109,7 @@ class SpeakerBoundarySmoother:
         remaining_words = [w for w in next_utt.words if w not in words_to_move]
 
         if remaining_words:
-            remaining = Utterance(
+            remaining = self.utterance_factory(
                 speaker=next_utt.speaker,
                 start=remaining_words[0].start,
                 end=remaining_words[-1].end,
@@ -893,9 +1129,11 @@ class PunctuationRepairer:
         self,
         config: BasePunctuationConfig,
         language_processor: LanguageProcessor,
+        segment_factory: Callable[..., Any] = ProcessedSegment,
     ):
         self.config = config
         self.language_processor = language_processor
+        self.segment_factory = segment_factory
 
     def repair_punctuation(self, utterances: List[Utterance]) -> List[ProcessedSegment]:
         """Repair punctuation and split sentences based on pause timing."""
@@ -971,7 +1209,7 @@ class PunctuationRepairer:
         )
         text_with_punct = self.language_processor.process_smart_quotes(text_with_punct)
 
-        return ProcessedSegment(
+        return self.segment_factory(
             speaker=words[0].speaker,
             start_ms=words[0].start,
             end_ms=words[-1].end,
@@ -982,6 +1220,11 @@ class PunctuationRepairer:
 
 
 # Main Service Class
+# "reference" is the pure-Python SpeakerBoundarySmoother; "vectorized" is the
+# NumPy engine in vectorized_smoother, which produces identical results
+SMOOTHING_ENGINES = ("reference", "vectorized")
+
+
 class TranscriptSmoothingService:
     """Main service for transcript smoothing with multi-language support."""
 
@@ -989,9 +1232,13 @@ class TranscriptSmoothingService:
         self,
         language: Optional[str] = None,
         config: Optional[BaseProcessorConfig] = None,
+        smoothing_engine: str = "reference",
     ):
+        if smoothing_engine not in SMOOTHING_ENGINES:
+            raise ValueError(f"Unknown smoothing engine: {smoothing_engine}")
         self.language = language
         self.config = config
+        self.smoothing_engine = smoothing_engine
 
     def smooth_and_punctuate(
         self, transcript_json: dict, language: str = "auto", **kwargs
@@ -1013,11 +1260,56 @@ class TranscriptSmoothingService:
         # Parse input
         transcript_input = TranscriptInput(**transcript_json, language=language)
 
+        segments, stats = self._process(
+            transcript_input.utterances,
+            language,
+            kwargs,
+            utterance_factory=Utterance,
+            segment_factory=ProcessedSegment,
+        )
+        return ProcessingResult(segments=segments, stats=stats)
+
+    def smooth_and_punctuate_fast(
+        self, transcript_json: dict, language: str = "auto", **kwargs
+    ) -> FastProcessingResult:
+        """
+        Trusted fast path for smooth_and_punctuate.
+
+        The raw transcript is validated once by parse_utterances and processed
+        as slotted records, so no pydantic model is created per word, merge or
+        segment. Callers convert the SegmentRecords at their API boundary.
+
+        Args:
+            transcript_json: AssemblyAI transcript with utterances and words
+            language: Language hint ("auto", "chinese", "english", etc.)
+            **kwargs: Additional configuration parameters
+
+        Returns:
+            FastProcessingResult with SegmentRecords and statistics
+        """
+        utterances = parse_utterances(transcript_json)
+
+        segments, stats = self._process(
+            utterances,
+            language,
+            kwargs,
+            utterance_factory=UtteranceRecord,
+            segment_factory=SegmentRecord,
+        )
+        return FastProcessingResult(segments=segments, stats=stats)
+
+    def _process(
+        self,
+        utterances: list,
+        language: str,
+        kwargs: Dict[str, Any],
+        utterance_factory: Callable[..., Any],
+        segment_factory: Callable[..., Any],
+    ) -> Tuple[list, ProcessingStats]:
+        """Run language detection, smoothing and punctuation repair."""
         # Detect/determine language
         if language == "auto":
-            detected_language = LanguageProcessorFactory.detect_language(
-                transcript_input.utterances
-            )
+            detected_language = LanguageProcessorFactory.detect_language(utterances)
         else:
             try:
                 detected_language = SupportedLanguage(language.lower())
@@ -1025,9 +1317,7 @@ class TranscriptSmoothingService:
                 logger.warning(
                     f"Unsupported language '{language}', falling back to auto-detection"
                 )
-                detected_language = LanguageProcessorFactory.detect_language(
-                    transcript_input.utterances
-                )
+                detected_language = LanguageProcessorFactory.detect_language(utterances)
 
         # Create language processor
         language_processor = LanguageProcessorFactory.create_processor(
@@ -1046,11 +1336,11 @@ class TranscriptSmoothingService:
         self._update_config_from_kwargs(config, **kwargs)
 
         # Create processors
-        boundary_smoother = SpeakerBoundarySmoother(
-            config.smoothing, language_processor
+        boundary_smoother = self._create_boundary_smoother(
+            config.smoothing, language_processor, utterance_factory
         )
         punctuation_repairer = PunctuationRepairer(
-            config.punctuation, language_processor
+            config.punctuation, language_processor, segment_factory
         )
 
         logger.info(
@@ -1058,9 +1348,7 @@ class TranscriptSmoothingService:
         )
 
         # Process
-        smoothed_utterances = boundary_smoother.smooth_boundaries(
-            transcript_input.utterances
-        )
+        smoothed_utterances = boundary_smoother.smooth_boundaries(utterances)
         final_segments = punctuation_repairer.repair_punctuation(smoothed_utterances)
 
         # Calculate statistics
@@ -1068,7 +1356,7 @@ class TranscriptSmoothingService:
             boundary_smoother.stats.short_first_segment
             + boundary_smoother.stats.filler_words
         )
-        merged_segments = len(transcript_input.utterances) - len(smoothed_utterances)
+        merged_segments = len(utterances) - len(smoothed_utterances)
         split_segments = len(final_segments) - len(smoothed_utterances)
 
         stats = ProcessingStats(
@@ -1082,7 +1370,32 @@ class TranscriptSmoothingService:
 
         logger.info(f"Processing completed. Stats: {stats}")
 
-        return ProcessingResult(segments=final_segments, stats=stats)
+        return final_segments, stats
+
+    def _create_boundary_smoother(
+        self,
+        config: BaseSmoothingConfig,
+        language_processor: LanguageProcessor,
+        utterance_factory: Callable[..., Any],
+    ):
+        """Create the boundary smoother for the configured engine."""
+        if self.smoothing_engine == "vectorized":
+            from .vectorized_smoother import (
+                HAS_NUMPY,
+                VectorizedSpeakerBoundarySmoother,
+            )
+
+            if HAS_NUMPY:
+                if utterance_factory is Utterance:
+                    # Merged utterances reuse validated words, skip revalidation
+                    utterance_factory = Utterance.model_construct
+                return VectorizedSpeakerBoundarySmoother(
+                    config, language_processor, utterance_factory
+                )
+            logger.warning(
+                "numpy is not installed, falling back to the reference smoothing engine"
+            )
+        return SpeakerBoundarySmoother(config, language_processor, utterance_factory)
 
     def _validate_input(self, transcript_json: dict) -> None:
         """Validate input transcript data."""
@@ -5,9 +5,10 @@ from datetime import UTC, datetime, timedelta
 from typing import Any, Dict, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func, literal, select, union_all
 from sqlalchemy.orm import Session
 
+from ..infrastructure.db.expressions import seconds_between
 from ..models.session import Session as TranscriptionSession
 from ..models.usage_history import UsageHistory
 from ..models.usage_log import TranscriptionType, UsageLog
@@ -361,68 +362,11 @@ class UsageAnalyticsService:
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> Dict[str, Any]:
         """Aggregate usage data for a specific time period."""
-        # Get usage logs for the period
-        usage_logs = (
-            self.db.query(UsageLog)
-            .filter(
-                and_(
-                    UsageLog.user_id == user_id,
-                    UsageLog.created_at >= start_date,
-                    UsageLog.created_at < end_date,
-                )
-            )
-            .all()
+        usage = self._usage_log_totals(user_id, start_date, end_date)
+        sessions_created, concurrent_peak = self._session_totals(
+            user_id, start_date, end_date
         )
 
-        # Get sessions for the period
-        sessions = (
-            self.db.query(TranscriptionSession)
-            .filter(
-                and_(
-                    TranscriptionSession.user_id == user_id,
-                    TranscriptionSession.created_at >= start_date,
-                    TranscriptionSession.created_at < end_date,
-                )
-            )
-            .all()
-        )
-
-        # Calculate aggregated metrics
-        total_minutes = sum(log.duration_minutes for log in usage_logs)
-        total_cost = sum(float(log.cost_usd or 0) for log in usage_logs)
-        billable_transcriptions = len([log for log in usage_logs if log.is_billable])
-        free_retries = len(
-            [
-                log
-                for log in usage_logs
-                if log.transcription_type == TranscriptionType.RETRY_FAILED
-            ]
-        )
-
-        # Provider breakdown
-        google_minutes = sum(
-            log.duration_minutes for log in usage_logs if log.stt_provider == "google"
-        )
-        assemblyai_minutes = sum(
-            log.duration_minutes
-            for log in usage_logs
-            if log.stt_provider == "assemblyai"
-        )
-
-        # Calculate performance metrics
-        completed_logs = [log for log in usage_logs if log.transcription_completed_at]
-        avg_processing_time = 0
-        if completed_logs:
-            processing_times = [
-                (
-                    log.transcription_completed_at - log.transcription_started_at
-                ).total_seconds()
-                for log in completed_logs
-                if log.transcription_started_at and log.transcription_completed_at
-            ]
-            if processing_times:
-                avg_processing_time = sum(processing_times) / len(processing_times)
-
         # Get user's current plan info
         user = self.db.query(User).filter(User.id == user_id).first()
         plan_config = self.plan_limits.get_plan_limit(user.plan.value)
@@ -436,103 +380,111 @@ class UsageAnalyticsService:
             "export_formats": plan_config.export_formats,
         }
 
-        # Calculate storage usage from session file sizes
-        storage_used_mb = sum(
-            getattr(session, "audio_file_size_mb", 0) or 0 for session in sessions
-        )
-
-        # Track exports by format from usage logs
-        export_logs = [
-            log
-            for log in usage_logs
-            if log.transcription_type and log.transcription_type.value == "export"
-        ]
-        exports_by_format = {}
-        for log in export_logs:
-            # Extract format from metadata if available, otherwise default to "unknown"
-            format_type = "unknown"
-            if log.metadata and "export_format" in log.metadata:
-                format_type = log.metadata["export_format"].lower()
-            current_count = exports_by_format.get(format_type, 0)
-            exports_by_format[format_type] = current_count + 1
-
-        # Track failed transcriptions from usage logs (retry_failed indicates an error)
-        failed_transcriptions = len(
-            [
-                log
-                for log in usage_logs
-                if log.transcription_type == TranscriptionType.RETRY_FAILED
-            ]
-        )
-
-        # Calculate API calls from total usage log entries
-        api_calls_made = len(usage_logs)
-
-        # Calculate concurrent sessions peak
-        concurrent_peak = self._calculate_concurrent_sessions_peak(sessions)
+        # Usage logs record neither an export format nor a client, so every
+        # export counts as "unknown" and there are no clients to count
+        exports = usage.exports or 0
+        exports_by_format = {"unknown": exports} if exports else {}
 
         return {
-            "sessions_created": len(sessions),
-            "audio_minutes_processed": total_minutes,
-            "transcriptions_completed": len(usage_logs),
-            "exports_generated": len(export_logs),
-            "storage_used_mb": storage_used_mb,
-            "unique_clients": len(
-                set(
-                    log.metadata.get("client_id")
-                    for log in usage_logs
-                    if log.metadata and "client_id" in log.metadata
-                )
-            ),
-            "api_calls_made": api_calls_made,
+            "sessions_created": sessions_created,
+            "audio_minutes_processed": usage.minutes or 0,
+            "transcriptions_completed": usage.logs,
+            "exports_generated": exports,
+            # Sessions do not store their audio file size
+            "storage_used_mb": 0,
+            "unique_clients": 0,
+            "api_calls_made": usage.logs,
             "concurrent_sessions_peak": concurrent_peak,
             "plan_name": user.plan.value,
             "plan_limits": plan_limits_dict,
-            "total_cost_usd": total_cost,
-            "billable_transcriptions": billable_transcriptions,
-            "free_retries": free_retries,
-            "google_stt_minutes": google_minutes,
-            "assemblyai_minutes": assemblyai_minutes,
+            "total_cost_usd": float(usage.cost or 0),
+            "billable_transcriptions": usage.billable or 0,
+            "free_retries": usage.failed or 0,
+            "google_stt_minutes": usage.google_minutes or 0,
+            "assemblyai_minutes": usage.assemblyai_minutes or 0,
             "exports_by_format": exports_by_format,
-            "avg_processing_time_seconds": avg_processing_time,
-            "failed_transcriptions": failed_transcriptions,
+            "avg_processing_time_seconds": (
+                float(usage.avg_processing) if usage.avg_processing is not None else 0
+            ),
+            # A retry_failed log marks a transcription that errored
+            "failed_transcriptions": usage.failed or 0,
         }
 
-    def _calculate_concurrent_sessions_peak(self, sessions) -> int:
-        """Calculate the peak number of concurrent sessions."""
-        if not sessions:
-            return 0
-
-        # Create timeline events for session start/end
-        events = []
-        for session in sessions:
-            if hasattr(session, "created_at") and session.created_at:
-                events.append((session.created_at, "start"))
-
-                # Use updated_at as end time if available, otherwise assume 1
-                # hour duration
-                end_time = getattr(session, "updated_at", None)
-                if not end_time:
-                    from datetime import timedelta
-
-                    end_time = session.created_at + timedelta(hours=1)
-                events.append((end_time, "end"))
-
-        # Sort events by timestamp
-        events.sort(key=lambda x: x[0])
-
-        # Calculate peak concurrent sessions
-        current_concurrent = 0
-        peak_concurrent = 0
-
-        for timestamp, event_type in events:
-            if event_type == "start":
-                current_concurrent += 1
-                peak_concurrent = max(peak_concurrent, current_concurrent)
-            else:  # end
-                current_concurrent -= 1
-
-        return peak_concurrent
+    def _usage_log_totals(
+        self, user_id: UUID, start_date: datetime, end_date: datetime
+    ):
+        """Sum a user's usage logs for the period in one aggregate query."""
+        minutes = UsageLog.duration_minutes
+        transcription_type = UsageLog.transcription_type
+        query = select(
+            func.count().label("logs"),
+            func.sum(minutes).label("minutes"),
+            func.sum(UsageLog.cost_usd).label("cost"),
+            func.count().filter(UsageLog.is_billable).label("billable"),
+            func.count()
+            .filter(transcription_type == TranscriptionType.RETRY_FAILED)
+            .label("failed"),
+            func.count()
+            .filter(transcription_type == TranscriptionType.EXPORT)
+            .label("exports"),
+            func.sum(minutes)
+            .filter(UsageLog.stt_provider == "google")
+            .label("google_minutes"),
+            func.sum(minutes)
+            .filter(UsageLog.stt_provider == "assemblyai")
+            .label("assemblyai_minutes"),
+            func.avg(
+                seconds_between(
+                    self.db,
+                    UsageLog.transcription_started_at,
+                    UsageLog.transcription_completed_at,
+                )
+            ).label("avg_processing"),
+        ).where(
+            UsageLog.user_id == user_id,
+            UsageLog.created_at >= start_date,
+            UsageLog.created_at < end_date,
+        )
+        return self.db.execute(query).one()
+
+    def _session_totals(
+        self, user_id: UUID, start_date: datetime, end_date: datetime
+    ) -> Tuple[int, int]:
+        """
+        Count the period's sessions and the peak number running at once.
+
+        Each session opens at created_at and closes at updated_at. A running
+        sum over the opening (+1) and closing (-1) events, ordered by time,
+        gives the number of open sessions after every event. At equal
+        timestamps openings sort first, so sessions that touch overlap.
+        """
+        in_period = (
+            TranscriptionSession.user_id == user_id,
+            TranscriptionSession.created_at >= start_date,
+            TranscriptionSession.created_at < end_date,
+        )
+        events = union_all(
+            select(
+                TranscriptionSession.created_at.label("at"),
+                literal(1).label("change"),
+            ).where(*in_period),
+            select(
+                TranscriptionSession.updated_at.label("at"),
+                literal(-1).label("change"),
+            ).where(*in_period),
+        ).subquery()
+        running = select(
+            events.c.change,
+            func.sum(events.c.change)
+            .over(order_by=(events.c.at, events.c.change.desc()), rows=(None, 0))
+            .label("open_sessions"),
+        ).subquery()
+        query = select(
+            func.count().filter(running.c.change == 1),
+            func.max(running.c.open_sessions),
+        )
+        sessions_created, peak = self.db.execute(query).one()
+        return sessions_created, peak or 0
 
     def _parse_period_to_date(self, period: str) -> datetime:
         """Parse period string to start date."""
@@ -0,0 +1,456 @@
+"""
+Real-time monthly minute quotas for upload and transcription admission.
+
+Admission only needs the minutes a user has used this month and their plan's
+limits. Going through the plan use cases costs several queries per request,
+so used minutes are kept as one counter per user and month:
+
+- A counter is seeded from User.usage_minutes on its first read and expires
+  shortly after its month ends, so a new month starts from a fresh key
+  instead of waiting for a reset job.
+- create_usage_log adds each billable log's minutes with an atomic increment
+  once its transaction has committed. Increments only apply to a seeded
+  counter; an unseeded one is read from the database on its next check.
+- The database stays the source of truth. Every increment marks the user
+  dirty, and reconcile() (run by a beat task) rewrites dirty users' counters
+  from the database, repairing increments lost to a crash or to a seed that
+  read the row just before a commit.
+
+By default each process keeps its own counters and drops them after
+USAGE_QUOTA_MEMORY_TTL_SECONDS, so minutes recorded by another process are
+picked up within that window. With USAGE_QUOTA_BACKEND set to "redis" the API
+and Celery workers share one counter per user and month.
+
+Plan limits are memoized per plan for a few minutes. An unreachable counter
+store never blocks an upload: checks read the database instead and the
+increment is skipped.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+import redis
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.user import User
+from .plan_limits import PlanLimit, get_global_plan_limits
+
+logger = logging.getLogger(__name__)
+
+USAGE_QUOTA_BACKENDS = ("memory", "redis")
+REDIS_KEY_PREFIX = "quota:minutes:"
+REDIS_DIRTY_KEY = "quota:dirty"
+
+# Counters outlive their month by this much so late reads near the boundary
+# still hit, then expire on their own
+COUNTER_GRACE = timedelta(days=1)
+PLAN_LIMITS_TTL_SECONDS = 300
+RECONCILE_BATCH_SIZE = 1000
+
+# Adds to a counter only if it has been seeded; always marks the user dirty
+_INCREMENT_SCRIPT = """
+redis.call('SADD', KEYS[2], ARGV[2])
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return false
+"""
+
+
+def month_start(now: Optional[datetime] = None) -> datetime:
+    """Return the first instant of the UTC month containing now."""
+    now = now or datetime.now(UTC)
+    return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month_start(start: datetime) -> datetime:
+    """Return the first instant of the month after start's."""
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def counter_key(user_id: Any, start: datetime) -> str:
+    """Store key of a user's minute counter for the month beginning at start."""
+    return f"{REDIS_KEY_PREFIX}{user_id}:{start:%Y-%m}"
+
+
+@dataclass
+class QuotaCheck:
+    """Outcome of an admission check."""
+
+    allowed: bool
+    limit_type: str  # "minutes" or "file_size"
+    current: float
+    limit: int  # -1 means unlimited
+    message: Optional[str] = None
+
+
+class UsageQuotaBackend(ABC):
+    """Storage interface for per-user monthly minute counters."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[int]:
+        """Return a counter's value, or None when it is not seeded."""
+
+    @abstractmethod
+    def seed(self, key: str, minutes: int, expires_at: datetime) -> int:
+        """Store minutes unless the counter exists; return the stored value."""
+
+    @abstractmethod
+    def replace(self, key: str, minutes: int, expires_at: datetime) -> None:
+        """Overwrite a counter with a value read from the database."""
+
+    @abstractmethod
+    def increment(self, key: str, minutes: int, user_id: str) -> Optional[int]:
+        """
+        Add minutes to a seeded counter and mark the user dirty.
+
+        Returns:
+            New value, or None when the counter was not seeded
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Drop a counter so the next read seeds it from the database."""
+
+    @abstractmethod
+    def pop_dirty(self, count: int) -> List[str]:
+        """Remove and return up to count users marked dirty."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every counter and dirty mark."""
+
+
+class InMemoryUsageQuotaBackend(UsageQuotaBackend):
+    """Per-process backend; entries expire at month end or after ttl_seconds."""
+
+    def __init__(self, ttl_seconds: int = 60):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Tuple[float, int]] = {}
+        self._dirty: Set[str] = set()
+
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            return self._live(key)
+
+    def seed(self, key: str, minutes: int, expires_at: datetime) -> int:
+        with self._lock:
+            current = self._live(key)
+            if current is not None:
+                return current
+            self._store(key, minutes, expires_at)
+            return minutes
+
+    def replace(self, key: str, minutes: int, expires_at: datetime) -> None:
+        with self._lock:
+            self._store(key, minutes, expires_at)
+
+    def increment(self, key: str, minutes: int, user_id: str) -> Optional[int]:
+        with self._lock:
+            self._dirty.add(user_id)
+            current = self._live(key)
+            if current is None:
+                return None
+            deadline, _ = self._counters[key]
+            self._counters[key] = (deadline, current + minutes)
+            return current + minutes
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def pop_dirty(self, count: int) -> List[str]:
+        with self._lock:
+            return [self._dirty.pop() for _ in range(min(count, len(self._dirty)))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._dirty.clear()
+
+    def _live(self, key: str) -> Optional[int]:
+        entry = self._counters.get(key)
+        if entry is None:
+            return None
+        deadline, minutes = entry
+        if deadline <= time.time():
+            del self._counters[key]
+            return None
+        return minutes
+
+    def _store(self, key: str, minutes: int, expires_at: datetime) -> None:
+        deadline = min(expires_at.timestamp(), time.time() + self.ttl_seconds)
+        self._counters[key] = (deadline, minutes)
+
+
+class RedisUsageQuotaBackend(UsageQuotaBackend):
+    """
+    Redis backend shared across workers.
+
+    Each counter is a plain integer key incremented with INCRBY, expiring at
+    its month's end plus COUNTER_GRACE. The conditional increment and the
+    dirty mark run as one script, so a counter is never created from a
+    partial delta.
+    """
+
+    def __init__(self, client: "redis.Redis"):
+        self.redis = client
+        self._increment = client.register_script(_INCREMENT_SCRIPT)
+
+    def get(self, key: str) -> Optional[int]:
+        value = self.redis.get(key)
+        return int(value) if value is not None else None
+
+    def seed(self, key: str, minutes: int, expires_at: datetime) -> int:
+        pipe = self.redis.pipeline()
+        pipe.set(key, minutes, nx=True)
+        pipe.expireat(key, expires_at)
+        pipe.get(key)
+        _, _, value = pipe.execute()
+        return int(value)
+
+    def replace(self, key: str, minutes: int, expires_at: datetime) -> None:
+        pipe = self.redis.pipeline()
+        pipe.set(key, minutes)
+        pipe.expireat(key, expires_at)
+        pipe.execute()
+
+    def increment(self, key: str, minutes: int, user_id: str) -> Optional[int]:
+        value = self._increment(keys=[key, REDIS_DIRTY_KEY], args=[minutes, user_id])
+        return int(value) if value is not None else None
+
+    def delete(self, key: str) -> None:
+        self.redis.delete(key)
+
+    def pop_dirty(self, count: int) -> List[str]:
+        return list(self.redis.spop(REDIS_DIRTY_KEY, count) or [])
+
+    def clear(self) -> None:
+        keys = list(self.redis.scan_iter(match=REDIS_KEY_PREFIX + "*"))
+        self.redis.delete(REDIS_DIRTY_KEY, *keys)
+
+
+class UsageQuota:
+    """Monthly minute counters and the admission checks built on them."""
+
+    def __init__(self, backend: UsageQuotaBackend):
+        self.backend = backend
+        self._plan_limits: Dict[str, Tuple[float, PlanLimit]] = {}
+        self._plan_limits_lock = threading.Lock()
+
+    def used_minutes(self, db: Session, user_id: Any) -> int:
+        """
+        Minutes a user has used this month.
+
+        Served from the store; a missing counter is seeded from the database.
+        """
+        start = month_start()
+        key = counter_key(user_id, start)
+        try:
+            minutes = self.backend.get(key)
+            if minutes is not None:
+                return minutes
+        except Exception as e:
+            logger.warning(f"⚠️ Usage quota lookup failed: {e}")
+            return self._minutes_from_db(db, user_id, start)
+
+        minutes = self._minutes_from_db(db, user_id, start)
+        try:
+            return self.backend.seed(key, minutes, self._expires_at(start))
+        except Exception as e:
+            logger.warning(f"⚠️ Usage quota seed failed: {e}")
+            return minutes
+
+    def check_minutes(
+        self, db: Session, user_id: Any, plan: Any, requested_minutes: float = 0
+    ) -> QuotaCheck:
+        """
+        Check that a user may transcribe requested_minutes more this month.
+
+        With no requested minutes the check passes while any minutes remain.
+        """
+        limit = self.plan_limit(plan).max_minutes
+        used = self.used_minutes(db, user_id)
+        if limit < 0:
+            return QuotaCheck(True, "minutes", used, limit)
+
+        if requested_minutes:
+            allowed = used + requested_minutes <= limit
+        else:
+            allowed = used < limit
+        message = (
+            None
+            if allowed
+            else f"Total minutes limit exceeded: {used}/{limit} minutes used this month"
+        )
+        return QuotaCheck(allowed, "minutes", used, limit, message)
+
+    def check_upload(
+        self, db: Session, user_id: Any, plan: Any, file_size_mb: float
+    ) -> QuotaCheck:
+        """
+        Check an upload against the plan's file size and remaining minutes.
+
+        A rejection reports the limit that failed; an accepted upload reports
+        the file size limit.
+        """
+        max_file_size = self.plan_limit(plan).max_file_size_mb
+        if file_size_mb > max_file_size:
+            return QuotaCheck(
+                False,
+                "file_size",
+                file_size_mb,
+                max_file_size,
+                f"File size {file_size_mb:.1f}MB exceeds plan limit of "
+                f"{max_file_size}MB",
+            )
+        minutes = self.check_minutes(db, user_id, plan)
+        if not minutes.allowed:
+            return minutes
+        return QuotaCheck(True, "file_size", file_size_mb, max_file_size)
+
+    def record(self, user_id: Any, minutes: int) -> None:
+        """
+        Add committed billable minutes to the user's counter.
+
+        Call after the transaction writing User.usage_minutes has committed.
+        """
+        try:
+            self.backend.increment(
+                counter_key(user_id, month_start()), int(minutes), str(user_id)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Usage quota increment failed for {user_id}: {e}")
+
+    def invalidate(self, user_id: Any) -> None:
+        """Drop a user's counter after their usage was changed directly."""
+        try:
+            self.backend.delete(counter_key(user_id, month_start()))
+        except Exception as e:
+            logger.warning(f"⚠️ Usage quota invalidation failed for {user_id}: {e}")
+
+    def clear(self) -> None:
+        """Drop every counter, e.g. after usage was reset for all users."""
+        try:
+            self.backend.clear()
+        except Exception as e:
+            logger.warning(f"⚠️ Usage quota clear failed: {e}")
+
+    def reconcile(self, db: Session, batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+        """
+        Rewrite the counters of users marked dirty from the database.
+
+        Users incremented again while this runs are marked dirty again and
+        picked up by the next run.
+
+        Returns:
+            Number of counters rewritten
+        """
+        start = month_start()
+        expires_at = self._expires_at(start)
+        reconciled = 0
+        while True:
+            user_ids = self.backend.pop_dirty(batch_size)
+            if not user_ids:
+                return reconciled
+            usage = self._usage_from_db(db, user_ids, start)
+            for user_id in user_ids:
+                self.backend.replace(
+                    counter_key(user_id, start), usage.get(user_id, 0), expires_at
+                )
+            reconciled += len(user_ids)
+
+    def plan_limit(self, plan: Any) -> PlanLimit:
+        """Limits of a plan, memoized for PLAN_LIMITS_TTL_SECONDS."""
+        plan_key = str(getattr(plan, "value", plan) or "free").lower()
+        now = time.monotonic()
+        with self._plan_limits_lock:
+            cached = self._plan_limits.get(plan_key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        limit = get_global_plan_limits().get_plan_limit(plan_key)
+        with self._plan_limits_lock:
+            self._plan_limits[plan_key] = (now + PLAN_LIMITS_TTL_SECONDS, limit)
+        return limit
+
+    def _minutes_from_db(self, db: Session, user_id: Any, start: datetime) -> int:
+        return self._usage_from_db(db, [user_id], start).get(str(user_id), 0)
+
+    @staticmethod
+    def _usage_from_db(
+        db: Session, user_ids: Iterable[Any], start: datetime
+    ) -> Dict[str, int]:
+        """This month's minutes per user; counters from earlier months count as 0."""
+        ids = [
+            user_id if isinstance(user_id, UUID) else UUID(str(user_id))
+            for user_id in user_ids
+        ]
+        rows = db.execute(
+            select(User.id, User.usage_minutes, User.current_month_start).where(
+                User.id.in_(ids)
+            )
+        )
+        usage = {}
+        for user_id, minutes, current_month_start in rows:
+            if current_month_start is not None and current_month_start.tzinfo is None:
+                current_month_start = current_month_start.replace(tzinfo=UTC)
+            this_month = (
+                current_month_start is not None and current_month_start >= start
+            )
+            usage[str(user_id)] = (minutes or 0) if this_month else 0
+        return usage
+
+    @staticmethod
+    def _expires_at(start: datetime) -> datetime:
+        return next_month_start(start) + COUNTER_GRACE
+
+
+_usage_quota: Optional[UsageQuota] = None
+_usage_quota_lock = threading.Lock()
+
+
+def create_usage_quota() -> UsageQuota:
+    """Build a usage quota from settings."""
+    backend_name = settings.USAGE_QUOTA_BACKEND.lower()
+    if backend_name not in USAGE_QUOTA_BACKENDS:
+        raise ValueError(
+            f"Unknown usage quota backend '{settings.USAGE_QUOTA_BACKEND}'. "
+            f"Expected one of {USAGE_QUOTA_BACKENDS}"
+        )
+
+    backend: UsageQuotaBackend
+    if backend_name == "redis" and settings.REDIS_URL:
+        backend = RedisUsageQuotaBackend(
+            redis.from_url(settings.REDIS_URL, decode_responses=True)
+        )
+    else:
+        if backend_name == "redis":
+            logger.warning("⚠️ REDIS_URL not set, using in-memory usage quotas")
+        backend = InMemoryUsageQuotaBackend(
+            ttl_seconds=settings.USAGE_QUOTA_MEMORY_TTL_SECONDS
+        )
+
+    logger.info(f"🗄️ Usage quota counters: {type(backend).__name__}")
+    return UsageQuota(backend)
+
+
+def get_usage_quota() -> UsageQuota:
+    """Get the process-wide usage quota."""
+    global _usage_quota
+
+    with _usage_quota_lock:
+        if _usage_quota is None:
+            _usage_quota = create_usage_quota()
+        return _usage_quota
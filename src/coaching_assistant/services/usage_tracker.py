@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from coaching_assistant.core.config import settings
 from coaching_assistant.models.user import User
+from coaching_assistant.services.usage_quota import get_usage_quota
 
 logger = logging.getLogger(__name__)
 
@@ -183,6 +184,7 @@ class UsageTracker:
                 self.redis.delete(cache_key)
             except Exception as e:
                 logger.warning(f"Cache clear failed: {e}")
+        get_usage_quota().invalidate(user_id)
 
         logger.info(f"Reset monthly usage for user {user_id}")
 
@@ -221,6 +223,7 @@ class UsageTracker:
                         self.redis.delete(key)
                 except Exception as e:
                     logger.warning(f"Cache clear failed: {e}")
+            get_usage_quota().clear()
 
             logger.info(f"Reset monthly usage for {affected_rows} users")
             return affected_rows
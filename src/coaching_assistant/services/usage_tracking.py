@@ -6,16 +6,33 @@ from decimal import Decimal
 from typing import Any, Dict, Optional, Union
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, case, or_, select, update
 from sqlalchemy.orm import Session as DBSession
 
+from ..infrastructure.db.bulk import bulk_increment
 from ..models.session import Session as SessionModel
 from ..models.usage_analytics import UsageAnalytics
 from ..models.usage_log import TranscriptionType, UsageLog
 from ..models.user import User, UserPlan
+from .analytics_rollups import UsageRollups
+from .usage_quota import get_usage_quota
 
 logger = logging.getLogger(__name__)
 
+# User counters that restart from zero at the start of each month
+MONTHLY_USAGE_COUNTERS = ("usage_minutes", "session_count", "transcription_count")
+# UsageAnalytics counters incremented by every usage log
+MONTHLY_ANALYTICS_COUNTERS = (
+    "transcriptions_completed",
+    "original_transcriptions",
+    "free_retries",
+    "paid_retranscriptions",
+    "total_minutes_processed",
+    "total_cost_usd",
+    "google_stt_minutes",
+    "assemblyai_minutes",
+)
+
 
 class PlanLimits:
     """Plan limit configuration."""
@@ -85,26 +102,19 @@ class UsageTrackingService:
         is_billable: bool = True,
         billing_reason: str = "transcription_completed",
     ) -> UsageLog:
-        """Create comprehensive usage log entry."""
+        """
+        Create comprehensive usage log entry.
+
+        Every counter touched here is incremented by a single UPDATE or
+        INSERT ... ON CONFLICT statement, so parallel workers completing
+        transcriptions for the same user queue on row locks instead of
+        overwriting each other's totals.
+        """
 
         logger.info(
             f"📊 Creating usage log for session {session.id}, type: {transcription_type.value}"
         )
 
-        user = self.db.query(User).filter(User.id == session.user_id).first()
-        if not user:
-            raise ValueError(f"User not found: {session.user_id}")
-
-        # Find parent log for retries/re-transcriptions
-        parent_log = None
-        if transcription_type != TranscriptionType.ORIGINAL:
-            parent_log = (
-                self.db.query(UsageLog)
-                .filter(UsageLog.session_id == session.id)
-                .order_by(UsageLog.created_at.asc())
-                .first()
-            )
-
         # Calculate cost if not provided
         if cost_usd is None and is_billable:
             # Basic cost calculation (can be enhanced later)
@@ -116,25 +126,56 @@ class UsageTrackingService:
                 else 0.0
             )
 
+        duration_minutes = (
+            int(session.duration_seconds / 60) if session.duration_seconds else 0
+        )
+        cost = Decimal(str(cost_usd)) if is_billable and cost_usd else Decimal("0")
+
+        # Update user usage counters (only for billable); the UPDATE also
+        # returns the plan, so the user row is never loaded
+        if is_billable:
+            user_plan = self._increment_user_counters(
+                session.user_id,
+                usage_minutes=duration_minutes,
+                transcription_count=1,
+                total_transcriptions_generated=1,
+                total_minutes_processed=duration_minutes,
+                total_cost_usd=cost,
+            )
+        else:
+            user_plan = self.db.execute(
+                select(User.plan).where(User.id == session.user_id)
+            ).scalar_one_or_none()
+        if user_plan is None:
+            raise ValueError(f"User not found: {session.user_id}")
+
+        # Retries and re-transcriptions point at the session's first log,
+        # looked up inside the INSERT
+        parent_log_id = None
+        if transcription_type != TranscriptionType.ORIGINAL:
+            parent_log_id = (
+                select(UsageLog.id)
+                .where(UsageLog.session_id == session.id)
+                .order_by(UsageLog.created_at.asc())
+                .limit(1)
+                .scalar_subquery()
+            )
+
         # Create usage log with comprehensive data
         usage_log = UsageLog(
             user_id=session.user_id,
             session_id=session.id,
             client_id=getattr(session, "client_id", None),
-            duration_minutes=(
-                int(session.duration_seconds / 60) if session.duration_seconds else 0
-            ),
+            duration_minutes=duration_minutes,
             duration_seconds=session.duration_seconds or 0,
-            cost_usd=(
-                Decimal(str(cost_usd)) if is_billable and cost_usd else Decimal("0")
-            ),
+            cost_usd=cost,
             stt_provider=session.stt_provider,
             transcription_type=transcription_type,
             is_billable=is_billable,
             billing_reason=billing_reason,
-            parent_log_id=parent_log.id if parent_log else None,
-            user_plan=user.plan.value,
-            plan_limits=PlanLimits.get_limits(user.plan),
+            parent_log_id=parent_log_id,
+            user_plan=user_plan.value,
+            plan_limits=PlanLimits.get_limits(user_plan),
             language=session.language,
             enable_diarization=True,  # Default from session config
             original_filename=session.audio_filename,
@@ -146,153 +187,136 @@ class UsageTrackingService:
         self.db.add(usage_log)
         self.db.flush()
 
-        # Update user usage counters (only for billable)
-        if is_billable:
-            self._update_user_usage_counters(user, usage_log)
-
         # Update monthly analytics
-        self._update_monthly_analytics(user.id, usage_log)
+        self._update_monthly_analytics(session.user_id, usage_log)
+
+        # Update the daily and monthly admin rollups
+        UsageRollups(self.db).record(usage_log)
 
         self.db.commit()
 
+        # Only committed minutes reach the admission counters
+        if is_billable:
+            get_usage_quota().record(session.user_id, duration_minutes)
+
         logger.info(
-            f"✅ Usage log created: {usage_log.id}, billable: {is_billable}, cost: ${cost_usd:.4f}"
+            f"✅ Usage log created: {usage_log.id}, billable: {is_billable}, cost: ${cost:.4f}"
         )
 
         return usage_log
 
-    def _update_user_usage_counters(self, user: User, usage_log: UsageLog):
-        """Update user's monthly usage counters with monthly reset logic."""
-
-        logger.debug(f"📈 Updating usage counters for user {user.id}")
-
-        # Check if we need to reset monthly usage
+    def _increment_user_counters(
+        self, user_id: Union[str, UUID], **deltas: Any
+    ) -> Optional[UserPlan]:
+        """
+        Add deltas to a user's counters in one UPDATE, with monthly reset.
+
+        The monthly counters restart from zero when current_month_start is
+        before this month. That check runs inside the statement against the
+        locked row, so two workers crossing a month boundary cannot both
+        reset, and neither loses the other's increment. Any loaded User is
+        refreshed from the statement's result.
+
+        Returns:
+            The user's plan, or None if the user does not exist
+        """
         current_month = datetime.now(timezone.utc).replace(
             day=1, hour=0, minute=0, second=0, microsecond=0
         )
-        if (
-            not user.current_month_start
-            or user.current_month_start.replace(tzinfo=timezone.utc) < current_month
-        ):
-            logger.info(f"🔄 Resetting monthly usage for user {user.id}")
-            user.usage_minutes = 0
-            user.session_count = 0
-            user.transcription_count = 0
-            user.current_month_start = current_month
-
-        # Update current month counters
-        user.usage_minutes += usage_log.duration_minutes
-        user.transcription_count += 1
-
-        # Update cumulative counters
-        user.total_transcriptions_generated += 1
-        user.total_minutes_processed = Decimal(
-            str(user.total_minutes_processed or 0)
-        ) + Decimal(str(usage_log.duration_minutes))
-        user.total_cost_usd = Decimal(str(user.total_cost_usd or 0)) + (
-            usage_log.cost_usd or Decimal("0")
+        new_month = or_(
+            User.current_month_start.is_(None),
+            User.current_month_start < current_month,
         )
 
-        self.db.flush()
-
-        logger.debug(
-            f"✅ User counters updated: usage_minutes={user.usage_minutes}, total_transcriptions={user.total_transcriptions_generated}"
-        )
+        values = {
+            "current_month_start": case(
+                (new_month, current_month), else_=User.current_month_start
+            )
+        }
+        for name, delta in deltas.items():
+            if name not in MONTHLY_USAGE_COUNTERS:
+                values[name] = getattr(User, name) + delta
+        for name in MONTHLY_USAGE_COUNTERS:
+            this_month = case((new_month, 0), else_=getattr(User, name))
+            values[name] = this_month + deltas.get(name, 0)
+
+        user_plan = self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(values)
+            .returning(User.plan)
+            .execution_options(synchronize_session="fetch")
+        ).scalar_one_or_none()
+
+        logger.debug(f"✅ User counters updated for user {user_id}: {deltas}")
+        return user_plan
 
     def increment_session_count(self, user: User):
         """Increment session count with monthly reset check."""
 
         logger.debug(f"📈 Incrementing session count for user {user.id}")
 
-        current_month = datetime.now(timezone.utc).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
+        self._increment_user_counters(
+            user.id, session_count=1, total_sessions_created=1
         )
-        if (
-            not user.current_month_start
-            or user.current_month_start.replace(tzinfo=timezone.utc) < current_month
-        ):
-            logger.info(f"🔄 Resetting monthly session count for user {user.id}")
-            user.session_count = 0
-            user.usage_minutes = 0
-            user.transcription_count = 0
-            user.current_month_start = current_month
-
-        user.session_count += 1
-        user.total_sessions_created += 1
-        self.db.flush()
 
-        logger.debug(
-            f"✅ Session count updated: session_count={user.session_count}, total_sessions={user.total_sessions_created}"
-        )
+        logger.debug(f"✅ Session count updated for user {user.id}")
+
+    def _update_monthly_analytics(self, user_id: Union[str, UUID], usage_log: UsageLog):
+        """
+        Add a usage log to its monthly analytics record.
 
-    def _update_monthly_analytics(self, user_id: str, usage_log: UsageLog):
-        """Update or create monthly analytics record."""
+        The record is created or incremented by one INSERT ... ON CONFLICT
+        on (user_id, month_year).
+        """
 
         month_year = usage_log.created_at.strftime("%Y-%m")
         logger.debug(
             f"📊 Updating monthly analytics for user {user_id}, month: {month_year}"
         )
 
-        analytics = (
-            self.db.query(UsageAnalytics)
-            .filter(
-                and_(
-                    UsageAnalytics.user_id == user_id,
-                    UsageAnalytics.month_year == month_year,
-                )
-            )
-            .first()
-        )
-
-        if not analytics:
-            # Create new monthly analytics record
-            logger.info(f"📝 Creating new monthly analytics record for {month_year}")
-            analytics = UsageAnalytics(
-                user_id=user_id,
-                month_year=month_year,
-                primary_plan=usage_log.user_plan,
-                period_start=usage_log.created_at.replace(
-                    day=1, hour=0, minute=0, second=0
-                ),
-                period_end=self._get_month_end(usage_log.created_at),
-            )
-            self.db.add(analytics)
-
-        # Update metrics based on transcription type
-        if usage_log.transcription_type == TranscriptionType.ORIGINAL:
-            analytics.original_transcriptions = (
-                analytics.original_transcriptions or 0
-            ) + 1
-        elif usage_log.transcription_type == TranscriptionType.RETRY_FAILED:
-            analytics.free_retries = (analytics.free_retries or 0) + 1
-        elif usage_log.transcription_type == TranscriptionType.RETRY_SUCCESS:
-            analytics.paid_retranscriptions = (analytics.paid_retranscriptions or 0) + 1
-
-        analytics.transcriptions_completed = (
-            analytics.transcriptions_completed or 0
-        ) + 1
-        analytics.total_minutes_processed = Decimal(
-            str(analytics.total_minutes_processed or 0)
-        ) + Decimal(str(usage_log.duration_minutes))
-        analytics.total_cost_usd = Decimal(str(analytics.total_cost_usd or 0)) + (
-            usage_log.cost_usd or Decimal("0")
+        month_start = usage_log.created_at.replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
         )
-
-        # Update provider breakdown
-        if usage_log.stt_provider == "google":
-            analytics.google_stt_minutes = Decimal(
-                str(analytics.google_stt_minutes or 0)
-            ) + Decimal(str(usage_log.duration_minutes))
-        elif usage_log.stt_provider == "assemblyai":
-            analytics.assemblyai_minutes = Decimal(
-                str(analytics.assemblyai_minutes or 0)
-            ) + Decimal(str(usage_log.duration_minutes))
-
-        analytics.updated_at = datetime.now(timezone.utc)
-        self.db.flush()
-
-        logger.debug(
-            f"✅ Monthly analytics updated: transcriptions={analytics.transcriptions_completed}, minutes={analytics.total_minutes_processed}"
+        transcription_type = usage_log.transcription_type
+        minutes = Decimal(str(usage_log.duration_minutes))
+        no_minutes = Decimal("0")
+
+        bulk_increment(
+            self.db,
+            UsageAnalytics.__table__,
+            [
+                {
+                    "user_id": user_id,
+                    "month_year": month_year,
+                    "primary_plan": usage_log.user_plan,
+                    "period_start": month_start,
+                    "period_end": self._get_month_end(month_start),
+                    "transcriptions_completed": 1,
+                    "original_transcriptions": int(
+                        transcription_type == TranscriptionType.ORIGINAL
+                    ),
+                    "free_retries": int(
+                        transcription_type == TranscriptionType.RETRY_FAILED
+                    ),
+                    "paid_retranscriptions": int(
+                        transcription_type == TranscriptionType.RETRY_SUCCESS
+                    ),
+                    "total_minutes_processed": minutes,
+                    "total_cost_usd": usage_log.cost_usd or Decimal("0"),
+                    "google_stt_minutes": (
+                        minutes if usage_log.stt_provider == "google" else no_minutes
+                    ),
+                    "assemblyai_minutes": (
+                        minutes
+                        if usage_log.stt_provider == "assemblyai"
+                        else no_minutes
+                    ),
+                }
+            ],
+            conflict_columns=("user_id", "month_year"),
+            increment_columns=MONTHLY_ANALYTICS_COUNTERS,
+            update_columns=("updated_at",),
         )
 
     def get_user_usage_summary(self, user_id: Union[str, UUID]) -> Dict[str, Any]:
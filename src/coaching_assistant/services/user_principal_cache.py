@@ -0,0 +1,424 @@
+"""
+Short-lived cache of authenticated user principals.
+
+Every authenticated request resolves its bearer token to a User row. Between
+profile, plan or role changes that row is stable, so the identity columns
+routes read on the hot path (id, email, name, role, plan, ...) are cached per
+(user id, token issue time) for a short TTL instead of being selected again.
+
+A cached principal is rebuilt as a detached User and merged into the request's
+session without loading it. Columns outside the snapshot (usage counters,
+preferences, admin security fields) stay expired and are loaded from the
+database the first time a route touches them, so writes through the returned
+instance keep working as before.
+
+Writers call invalidate_user_principal() after changing a cached column. The
+entry is dropped immediately and again when the writing session commits, so a
+request that read the old row in between cannot keep it cached. Principals are
+cached per process by default; other processes only see the change once their
+entry expires, which is what the short TTL bounds. With AUTH_USER_CACHE_BACKEND
+set to "redis" every worker shares one hash per user, so an invalidation
+reaches all of them. If the cache is unreachable, authentication falls back to
+selecting the user.
+"""
+
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from ..core.config import settings
+from ..models.user import User, UserPlan, UserRole
+
+logger = logging.getLogger(__name__)
+
+USER_PRINCIPAL_CACHE_BACKENDS = ("memory", "redis")
+REDIS_KEY_PREFIX = "auth:principal:"
+
+# session.info key collecting users to invalidate again after commit
+_PENDING_INVALIDATIONS = "user_principal_cache_pending"
+
+
+def snapshot_user(user: User) -> Dict[str, Any]:
+    """Serialize the principal columns of a loaded User to JSON-safe values."""
+    return {
+        "id": str(user.id),
+        "email": user.email,
+        "name": user.name,
+        "avatar_url": user.avatar_url,
+        "google_id": user.google_id,
+        "role": _enum_value(user.role),
+        "plan": _enum_value(user.plan),
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+    }
+
+
+def restore_user(db: Session, snapshot: Dict[str, Any]) -> User:
+    """
+    Attach a cached principal to a session without selecting the user row.
+
+    Args:
+        db: Session of the current request
+        snapshot: Values produced by snapshot_user
+
+    Returns:
+        Persistent User whose non-principal columns load on first access
+    """
+    created_at = snapshot["created_at"]
+    user = User(
+        id=UUID(snapshot["id"]),
+        email=snapshot["email"],
+        name=snapshot["name"],
+        avatar_url=snapshot["avatar_url"],
+        google_id=snapshot["google_id"],
+        role=UserRole(snapshot["role"]),
+        plan=UserPlan(snapshot["plan"]),
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+    )
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if hasattr(value, "value") else value
+
+
+@dataclass
+class UserPrincipalCacheStats:
+    """Hit/miss counters for the user principal cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the counters, including the derived hit rate."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class UserPrincipalBackend(ABC):
+    """Storage interface for cached principals, keyed by (user id, token)."""
+
+    @abstractmethod
+    def get(self, user_id: str, token_key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored snapshot, or None when missing or expired."""
+
+    @abstractmethod
+    def set(
+        self,
+        user_id: str,
+        token_key: str,
+        snapshot: Dict[str, Any],
+        ttl_seconds: int,
+    ) -> int:
+        """Store a snapshot and return how many entries were evicted."""
+
+    @abstractmethod
+    def invalidate(self, user_id: str) -> None:
+        """Drop every cached snapshot of a user."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached snapshot."""
+
+    @abstractmethod
+    def size(self) -> int:
+        """Return the number of cached snapshots."""
+
+
+class InMemoryUserPrincipalBackend(UserPrincipalBackend):
+    """Per-process backend with TTL expiry and LRU eviction by entry count."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict]]" = (
+            OrderedDict()
+        )
+        self._tokens_by_user: Dict[str, Set[str]] = {}
+
+    def get(self, user_id: str, token_key: str) -> Optional[Dict[str, Any]]:
+        key = (user_id, token_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return snapshot
+
+    def set(
+        self,
+        user_id: str,
+        token_key: str,
+        snapshot: Dict[str, Any],
+        ttl_seconds: int,
+    ) -> int:
+        key = (user_id, token_key)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, snapshot)
+            self._entries.move_to_end(key)
+            self._tokens_by_user.setdefault(user_id, set()).add(token_key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+            return evicted
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            for token_key in self._tokens_by_user.pop(user_id, ()):
+                self._entries.pop((user_id, token_key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        user_id, token_key = key
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token_key)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+
+
+class RedisUserPrincipalBackend(UserPrincipalBackend):
+    """
+    Redis backend shared across workers.
+
+    Each user has one hash whose fields are token keys, so invalidation is a
+    single DEL. Entries carry their own expiry because the hash TTL is reset
+    by every store; the hash itself disappears once the user is idle for a
+    full TTL.
+    """
+
+    def __init__(self, client: "redis.Redis"):
+        self.redis = client
+
+    def get(self, user_id: str, token_key: str) -> Optional[Dict[str, Any]]:
+        value = self.redis.hget(REDIS_KEY_PREFIX + user_id, token_key)
+        if value is None:
+            return None
+        entry = json.loads(value)
+        if entry["expires_at"] <= time.time():
+            self.redis.hdel(REDIS_KEY_PREFIX + user_id, token_key)
+            return None
+        return entry["principal"]
+
+    def set(
+        self,
+        user_id: str,
+        token_key: str,
+        snapshot: Dict[str, Any],
+        ttl_seconds: int,
+    ) -> int:
+        entry = {"expires_at": time.time() + ttl_seconds, "principal": snapshot}
+        pipe = self.redis.pipeline()
+        pipe.hset(REDIS_KEY_PREFIX + user_id, token_key, json.dumps(entry))
+        pipe.expire(REDIS_KEY_PREFIX + user_id, ttl_seconds)
+        pipe.execute()
+        return 0
+
+    def invalidate(self, user_id: str) -> None:
+        self.redis.delete(REDIS_KEY_PREFIX + user_id)
+
+    def clear(self) -> None:
+        keys = list(self.redis.scan_iter(match=REDIS_KEY_PREFIX + "*"))
+        if keys:
+            self.redis.delete(*keys)
+
+    def size(self) -> int:
+        return sum(
+            self.redis.hlen(key)
+            for key in self.redis.scan_iter(match=REDIS_KEY_PREFIX + "*")
+        )
+
+
+class UserPrincipalCache:
+    """TTL cache of user principals with hit/miss accounting."""
+
+    def __init__(self, backend: UserPrincipalBackend, ttl_seconds: int = 60):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._stats = UserPrincipalCacheStats()
+        self._stats_lock = threading.Lock()
+
+    def get(self, user_id: str, token_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a principal; backend errors are counted and reported as misses."""
+        try:
+            snapshot = self.backend.get(user_id, token_key)
+        except Exception as e:
+            logger.warning(f"⚠️ User principal cache lookup failed: {e}")
+            self._count(errors=1, misses=1)
+            return None
+
+        if snapshot is None:
+            self._count(misses=1)
+        else:
+            self._count(hits=1)
+        return snapshot
+
+    def set(self, user_id: str, token_key: str, snapshot: Dict[str, Any]) -> None:
+        """Store a principal; backend errors are logged and swallowed."""
+        try:
+            evicted = self.backend.set(user_id, token_key, snapshot, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"⚠️ User principal cache store failed: {e}")
+            self._count(errors=1)
+            return
+        self._count(stores=1, evictions=evicted)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's principals; backend errors are logged and swallowed."""
+        try:
+            self.backend.invalidate(user_id)
+        except Exception as e:
+            logger.warning(f"⚠️ User principal cache invalidation failed: {e}")
+            self._count(errors=1)
+            return
+        self._count(invalidations=1)
+
+    def clear(self) -> None:
+        """Remove every cached principal and reset the counters."""
+        self.backend.clear()
+        with self._stats_lock:
+            self._stats = UserPrincipalCacheStats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters along with the backend size."""
+        with self._stats_lock:
+            result = self._stats.to_dict()
+        result["backend"] = type(self.backend).__name__
+        result["ttl_seconds"] = self.ttl_seconds
+        try:
+            result["entries"] = self.backend.size()
+        except Exception as e:
+            logger.warning(f"⚠️ User principal cache size unavailable: {e}")
+            result["entries"] = None
+        return result
+
+    def _count(self, **deltas: int) -> None:
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                setattr(self._stats, name, getattr(self._stats, name) + delta)
+
+
+_user_principal_cache: Optional[UserPrincipalCache] = None
+_user_principal_cache_lock = threading.Lock()
+
+
+def create_user_principal_cache() -> Optional[UserPrincipalCache]:
+    """
+    Build a user principal cache from settings.
+
+    Returns:
+        Configured cache, or None when caching is disabled
+    """
+    if not settings.AUTH_USER_CACHE_ENABLED:
+        return None
+
+    backend_name = settings.AUTH_USER_CACHE_BACKEND.lower()
+    if backend_name not in USER_PRINCIPAL_CACHE_BACKENDS:
+        raise ValueError(
+            f"Unknown user principal cache backend "
+            f"'{settings.AUTH_USER_CACHE_BACKEND}'. "
+            f"Expected one of {USER_PRINCIPAL_CACHE_BACKENDS}"
+        )
+
+    backend: UserPrincipalBackend
+    if backend_name == "redis" and settings.REDIS_URL:
+        backend = RedisUserPrincipalBackend(
+            redis.from_url(settings.REDIS_URL, decode_responses=True)
+        )
+    else:
+        if backend_name == "redis":
+            logger.warning("⚠️ REDIS_URL not set, using in-memory user principal cache")
+        backend = InMemoryUserPrincipalBackend(
+            max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES
+        )
+
+    logger.info(f"🗄️ User principal cache enabled: {type(backend).__name__}")
+    return UserPrincipalCache(backend, ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS)
+
+
+def get_user_principal_cache() -> Optional[UserPrincipalCache]:
+    """
+    Get the process-wide user principal cache.
+
+    Returns:
+        Shared cache instance, or None when caching is disabled or unavailable
+    """
+    global _user_principal_cache
+
+    with _user_principal_cache_lock:
+        if _user_principal_cache is None:
+            try:
+                _user_principal_cache = create_user_principal_cache()
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ User principal cache unavailable, caching disabled: {e}"
+                )
+                return None
+        return _user_principal_cache
+
+
+def invalidate_user_principal(user_id: Any, session: Optional[Session] = None) -> None:
+    """
+    Drop the cached principals of a user whose cached columns changed.
+
+    Args:
+        user_id: ID of the changed user
+        session: Session holding the change; when given, the entry is dropped
+            again after it commits
+    """
+    cache = get_user_principal_cache()
+    if cache is None or user_id is None:
+        return
+    cache.invalidate(str(user_id))
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(str(user_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    user_ids = session.info.pop(_PENDING_INVALIDATIONS, None)
+    cache = get_user_principal_cache() if user_ids else None
+    if cache is not None:
+        for user_id in user_ids:
+            cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_invalidations(session: Session, previous_transaction) -> None:
+    # Savepoint rollbacks leave the outer transaction's changes pending
+    if not session.in_transaction():
+        session.info.pop(_PENDING_INVALIDATIONS, None)
@@ -0,0 +1,369 @@
+"""
+NumPy-backed speaker boundary smoothing engine.
+
+VectorizedSpeakerBoundarySmoother is a drop-in alternative to
+SpeakerBoundarySmoother. All words are loaded once into flat arrays (start,
+end and interned token ids) and every
+per-word predicate the heuristics need - terminal punctuation, filler words,
+quotation marks - is evaluated as one vectorized mask up front. Utterances
+become index arrays into those columns, so the short-head, filler and echo
+rules work on array slices instead of rebuilding pydantic models, and word
+removal after a merge is a single ``np.isin`` instead of an O(n·m) list scan.
+
+The pass structure is the same as the reference engine, so the resulting
+utterances, and therefore the ProcessingResult, are identical.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .transcript_smoother import (
+    BaseSmoothingConfig,
+    HeuristicStats,
+    LanguageProcessor,
+    Utterance,
+    WordTimestamp,
+)
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+QUOTE_MARK = '"'
+_QUOTED_CONTENT_RE = re.compile(r'["""](.*?)["""]')
+
+# Window used by the Jaccard echo rule (mirrors the reference engine)
+ECHO_WINDOW = 6
+
+
+def _intern(values: List[object]) -> Tuple[List[int], List[object]]:
+    """Assign dense integer ids to values; return (ids, distinct values)."""
+    index: Dict[object, int] = {}
+    ids = [index.setdefault(value, len(index)) for value in values]
+    return ids, list(index)
+
+
+class WordArrays:
+    """Columnar view over every word of a transcript."""
+
+    def __init__(
+        self, utterances: List[Utterance], language_processor: LanguageProcessor
+    ):
+        words: List[WordTimestamp] = [
+            word for utterance in utterances for word in utterance.words
+        ]
+        count = len(words)
+        token_ids, token_texts = _intern([word.text for word in words])
+
+        self.words = words
+        self.texts = token_texts
+        self.token_id = np.asarray(token_ids, dtype=np.int64)
+        self.start = np.fromiter((w.start for w in words), dtype=np.int64, count=count)
+        self.end = np.fromiter((w.end for w in words), dtype=np.int64, count=count)
+
+        # Per-token columns, evaluated once per distinct token and then
+        # broadcast to every word through the token id column
+        lower_ids, _ = _intern([text.lower() for text in token_texts])
+        lower_by_token = np.asarray(lower_ids, dtype=np.int64)
+        terminal_by_token = np.fromiter(
+            (language_processor.has_terminal_punctuation(t) for t in token_texts),
+            dtype=bool,
+            count=len(token_texts),
+        )
+        filler_by_token = np.fromiter(
+            (language_processor.is_filler(t) for t in token_texts),
+            dtype=bool,
+            count=len(token_texts),
+        )
+        quote_by_token = np.fromiter(
+            (QUOTE_MARK in t for t in token_texts),
+            dtype=bool,
+            count=len(token_texts),
+        )
+
+        self.lower_id = lower_by_token[self.token_id]
+        self.is_terminal = terminal_by_token[self.token_id]
+        self.is_filler = filler_by_token[self.token_id]
+        self.has_quote = quote_by_token[self.token_id]
+        self.duration_sec = (self.end - self.start) / 1000.0
+
+        # The reference engine removes moved words by value, so identical
+        # words would be removed together. They can only exist when two words
+        # share start and end times; only then are value keys built.
+        self.word_key: Optional["np.ndarray"] = None
+        if count:
+            spans = self.start * (int(self.end.max()) + 1) + self.end
+            if len(np.unique(spans)) < count:
+                keys, _ = _intern(
+                    [(w.text, w.start, w.end, w.confidence) for w in words]
+                )
+                self.word_key = np.asarray(keys, dtype=np.int64)
+
+    def join_text(self, idx: "np.ndarray") -> str:
+        texts = self.texts
+        return "".join(texts[token] for token in self.token_id[idx].tolist())
+
+
+@dataclass
+class _Span:
+    """An utterance expressed as an index array into WordArrays."""
+
+    speaker: str
+    start: int
+    end: int
+    confidence: float
+    idx: "np.ndarray"
+    source: Optional[Utterance] = None  # Untouched input utterance, if any
+
+
+class VectorizedSpeakerBoundarySmoother:
+    """Array-based implementation of SpeakerBoundarySmoother."""
+
+    def __init__(
+        self,
+        config: BaseSmoothingConfig,
+        language_processor: LanguageProcessor,
+        utterance_factory: Callable[..., Any] = Utterance.model_construct,
+    ):
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for the vectorized smoothing engine")
+        self.config = config
+        self.language_processor = language_processor
+        # Input words were already validated, so pydantic validation is
+        # skipped by default when building merged utterances
+        self.utterance_factory = utterance_factory
+        self.stats = HeuristicStats()
+        self._arrays: Optional[WordArrays] = None
+
+    def smooth_boundaries(self, utterances: List[Utterance]) -> List[Utterance]:
+        """Apply multi-pass iterative smoothing to speaker boundaries."""
+        arrays = WordArrays(utterances, self.language_processor)
+        self._arrays = arrays
+
+        positions = np.arange(len(arrays.words), dtype=np.int64)
+        smoothed: List[_Span] = []
+        offset = 0
+        for utterance in utterances:
+            count = len(utterance.words)
+            smoothed.append(
+                _Span(
+                    speaker=utterance.speaker,
+                    start=utterance.start,
+                    end=utterance.end,
+                    confidence=utterance.confidence,
+                    idx=positions[offset : offset + count],
+                    source=utterance,
+                )
+            )
+            offset += count
+
+        for pass_num in range(self.config.n_pass):
+            logger.debug(f"Starting smoothing pass {pass_num + 1}/{self.config.n_pass}")
+            changed = False
+            new_smoothed: List[_Span] = []
+
+            i = 0
+            while i < len(smoothed):
+                if i < len(smoothed) - 1:
+                    merge_result = self._try_merge_segments(
+                        smoothed[i], smoothed[i + 1]
+                    )
+
+                    if merge_result:
+                        merged, remaining = merge_result
+                        new_smoothed.append(merged)
+                        if remaining:
+                            smoothed[i + 1] = remaining
+                        else:
+                            i += 1
+                        changed = True
+                        i += 1
+                    else:
+                        new_smoothed.append(smoothed[i])
+                        i += 1
+                else:
+                    new_smoothed.append(smoothed[i])
+                    i += 1
+
+            smoothed = new_smoothed
+            if not changed:
+                logger.debug(f"No changes in pass {pass_num + 1}, stopping early")
+                break
+
+        logger.info(f"Vectorized boundary smoothing completed. Stats: {self.stats}")
+        return [self._to_utterance(span) for span in smoothed]
+
+    def _to_utterance(self, span: _Span) -> Utterance:
+        if span.source is not None:
+            return span.source
+        words = self._arrays.words
+        return self.utterance_factory(
+            speaker=span.speaker,
+            start=span.start,
+            end=span.end,
+            confidence=span.confidence,
+            words=[words[i] for i in span.idx.tolist()],
+        )
+
+    def _try_merge_segments(
+        self, current: _Span, next_span: _Span
+    ) -> Optional[Tuple[_Span, Optional[_Span]]]:
+        if current.speaker == next_span.speaker:
+            return None
+
+        # Terminal punctuation on the current span's last word blocks both the
+        # short-head and filler rules
+        current_terminal = bool(
+            len(current.idx) and self._arrays.is_terminal[current.idx[-1]]
+        )
+
+        merge_result = self._check_short_head_backfill(
+            current, next_span, current_terminal
+        )
+        if merge_result:
+            self.stats.short_first_segment += 1
+            return merge_result
+
+        merge_result = self._check_filler_backfill(current, next_span, current_terminal)
+        if merge_result:
+            self.stats.filler_words += 1
+            return merge_result
+
+        if hasattr(self.config, "echo_jaccard_tau"):
+            merge_result = self._check_echo_backfill(current, next_span)
+            if merge_result:
+                self.stats.echo_backfill += 1
+                return merge_result
+
+        return None
+
+    def _check_short_head_backfill(
+        self, current: _Span, next_span: _Span, current_terminal: bool
+    ) -> Optional[Tuple[_Span, Optional[_Span]]]:
+        th_short_head_sec = self.config.th_short_head_sec
+        idx = next_span.idx
+        if len(idx):
+            head_duration = min(
+                (next_span.end - next_span.start) / 1000.0, th_short_head_sec
+            )
+        else:
+            head_duration = 0.0
+
+        if head_duration < th_short_head_sec and not current_terminal:
+            cut = self._head_within_duration(idx, th_short_head_sec)
+
+            if self._duration(idx[:cut]) <= self.config.th_max_move_sec:
+                move_mask = np.zeros(len(idx), dtype=bool)
+                move_mask[:cut] = True
+                return self._merge_words_to_previous(current, next_span, move_mask)
+
+        return None
+
+    def _check_filler_backfill(
+        self, current: _Span, next_span: _Span, current_terminal: bool
+    ) -> Optional[Tuple[_Span, Optional[_Span]]]:
+        if not len(next_span.idx) or current_terminal:
+            return None
+
+        first = next_span.idx[0]
+        th_filler_max_sec = getattr(self.config, "th_filler_max_sec", 0.6)
+        arrays = self._arrays
+        if arrays.is_filler[first] and arrays.duration_sec[first] < th_filler_max_sec:
+            move_mask = np.zeros(len(next_span.idx), dtype=bool)
+            move_mask[0] = True
+            return self._merge_words_to_previous(current, next_span, move_mask)
+
+        return None
+
+    def _check_echo_backfill(
+        self, current: _Span, next_span: _Span
+    ) -> Optional[Tuple[_Span, Optional[_Span]]]:
+        arrays = self._arrays
+        next_idx = next_span.idx
+        current_idx = current.idx
+
+        quote_mask = arrays.has_quote[next_idx]
+        if quote_mask.any():
+            match = _QUOTED_CONTENT_RE.search(arrays.join_text(next_idx))
+            quoted_content = match.group(1) if match else ""
+            if quoted_content and quoted_content in arrays.join_text(current_idx):
+                # A word is inside a quote when an odd number of quote-bearing
+                # words precede it; quote-bearing words are always included
+                in_quote = quote_mask | (np.cumsum(quote_mask) % 2 == 1)
+
+                if self._duration(next_idx[in_quote]) <= self.config.th_echo_max_sec:
+                    return self._merge_words_to_previous(current, next_span, in_quote)
+
+        similarity = 0.0
+        if len(current_idx) and len(next_idx):
+            tail = set(arrays.lower_id[current_idx[-ECHO_WINDOW:]].tolist())
+            head = set(arrays.lower_id[next_idx[:ECHO_WINDOW]].tolist())
+            similarity = len(tail & head) / len(tail | head)
+
+        if similarity >= self.config.echo_jaccard_tau:
+            echo_mask = np.isin(arrays.lower_id[next_idx], arrays.lower_id[current_idx])
+
+            if self._duration(next_idx[echo_mask]) <= self.config.th_echo_max_sec:
+                return self._merge_words_to_previous(current, next_span, echo_mask)
+
+        return None
+
+    def _head_within_duration(self, idx: "np.ndarray", max_duration: float) -> int:
+        """Return how many leading words of idx end within max_duration."""
+        if not len(idx):
+            return 0
+        arrays = self._arrays
+        within = (arrays.end[idx] - arrays.start[idx[0]]) / 1000.0 <= max_duration
+        # Words are taken until the first one that overruns the window
+        return len(idx) if within.all() else int(np.argmin(within))
+
+    def _duration(self, idx: "np.ndarray") -> float:
+        if not len(idx):
+            return 0.0
+        return (self._arrays.end[idx[-1]] - self._arrays.start[idx[0]]) / 1000.0
+
+    def _merge_words_to_previous(
+        self,
+        current: _Span,
+        next_span: _Span,
+        move_mask: "np.ndarray",
+    ) -> Tuple[_Span, Optional[_Span]]:
+        """Move the words selected by move_mask from next_span to current."""
+        words_to_move = next_span.idx[move_mask]
+        if not len(words_to_move):
+            return current, next_span
+
+        arrays = self._arrays
+        merged = _Span(
+            speaker=current.speaker,
+            start=current.start,
+            end=int(arrays.end[words_to_move[-1]]),
+            confidence=min(current.confidence, next_span.confidence),
+            idx=np.concatenate((current.idx, words_to_move)),
+        )
+
+        if arrays.word_key is None:
+            keep = ~move_mask
+        else:
+            keep = ~np.isin(
+                arrays.word_key[next_span.idx], arrays.word_key[words_to_move]
+            )
+        remaining_idx = next_span.idx[keep]
+        if not len(remaining_idx):
+            return merged, None
+
+        remaining = _Span(
+            speaker=next_span.speaker,
+            start=int(arrays.start[remaining_idx[0]]),
+            end=int(arrays.end[remaining_idx[-1]]),
+            confidence=next_span.confidence,
+            idx=remaining_idx,
+        )
+        return merged, remaining
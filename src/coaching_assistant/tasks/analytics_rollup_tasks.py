@@ -0,0 +1,51 @@
+"""Celery tasks that keep the admin analytics rollup tables in line."""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+
+from celery import shared_task
+
+from ..core.database import get_db_session
+from ..services.analytics_rollups import BillingAnalyticsRollups, UsageRollups
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def reconcile_analytics_rollups(since_str: Optional[str] = None) -> dict:
+    """
+    Rebuild the usage and billing rollups for recent periods.
+
+    Usage rollups are maintained incrementally as logs are written; this
+    nightly pass recomputes them from usage_logs to correct drift from
+    retried or out-of-order writes. Billing rollups are recomputed from the
+    stored BillingAnalytics records.
+
+    Args:
+        since_str: First day to reconcile (YYYY-MM-DD). Defaults to the
+            first day of the previous month, so late logs around a month
+            boundary are still counted in the right month.
+
+    Returns:
+        Rollup rows written per table
+    """
+    if since_str:
+        since = datetime.strptime(since_str, "%Y-%m-%d").replace(tzinfo=UTC)
+    else:
+        this_month = datetime.now(UTC).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        since = (this_month - timedelta(days=1)).replace(day=1)
+
+    logger.info(f"🔄 Reconciling analytics rollups since {since.date()}")
+
+    with get_db_session() as db:
+        usage_rows = UsageRollups(db).reconcile(since.date())
+        billing_rows = BillingAnalyticsRollups(db).refresh_since(since)
+
+    return {
+        "since": since.date().isoformat(),
+        "usage_rollups": usage_rows,
+        "billing_analytics_rollups": billing_rows,
+    }
@@ -1,16 +1,21 @@
 """Transcription tasks for Celery."""
 
 import logging
-from datetime import UTC, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal
+from urllib.parse import urlencode
 from uuid import UUID
 
 from celery import Task
+from sqlalchemy import or_
 from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.orm import Session
 
 from ..core.celery_app import celery_app
+from ..core.config import settings
 from ..core.database import get_db_session
+from ..infrastructure.db.bulk import bulk_insert
 from ..models.processing_status import ProcessingStatus
 from ..models.session import Session as SessionModel
 from ..models.session import SessionStatus
@@ -25,10 +30,29 @@ from ..services import (
     STTProviderFactory,
     STTProviderUnavailableError,
 )
+from ..services.progress_events import (
+    ProgressReporter,
+    build_progress_event,
+    get_progress_broker,
+    publish_progress,
+)
 from ..services.usage_tracking import UsageTrackingService
 
 logger = logging.getLogger(__name__)
 
+# provider_metadata key holding a submitted AssemblyAI job until it completes
+ASSEMBLYAI_JOB_KEY = "assemblyai_job"
+# Resubmissions after AssemblyAI server errors, matching transcribe_audio retries
+ASSEMBLYAI_MAX_RESUBMISSIONS = 3
+# provider_metadata key holding a running Google STT batch operation
+GOOGLE_STT_JOB_KEY = "google_stt_job"
+# Operation status lookups run in parallel during one sweep
+GOOGLE_STT_SWEEP_CONCURRENCY = 8
+# Job field set when the sweep queues the completion task; later sweeps skip
+# the job until the task clears it or it is old enough to assume the task lost
+GOOGLE_STT_COMPLETION_QUEUED_KEY = "completion_queued_at"
+GOOGLE_STT_REQUEUE_AFTER_SECONDS = 30 * 60
+
 
 class TranscriptionTask(Task):
     """Base task class for transcription tasks."""
@@ -61,6 +85,12 @@ class TranscriptionTask(Task):
                             processing_status.message = error_msg
 
                         db.commit()
+                        publish_progress(
+                            get_progress_broker(),
+                            build_progress_event(
+                                session_id, "failed", 0, message=error_msg
+                            ),
+                        )
                         logger.error(
                             f"Session {session_id} marked as failed: {error_msg}"
                         )
@@ -144,6 +174,11 @@ def transcribe_audio(
 
         db.commit()
 
+        # Progress is pushed to subscribers on every update but only committed
+        # at milestones
+        progress = ProgressReporter(db, processing_status, get_progress_broker())
+        progress.publish()
+
         try:
             # Use provider preference from session, fallback to global settings
             preferred_provider = session.stt_provider if session.stt_provider else None
@@ -164,33 +199,54 @@ def transcribe_audio(
                 session.stt_provider = provider_name
 
             # Update progress: STT provider initialized
-            processing_status.update_progress(
-                10, f"Connecting to {provider_name} speech service..."
-            )
-            db.commit()
+            progress.update(10, f"Connecting to {provider_name} speech service...")
 
             logger.info(f"Using STT provider: {provider_name}")
 
         except Exception as provider_error:
             logger.error(f"Failed to initialize any STT provider: {provider_error}")
-            processing_status.update_progress(
-                0, f"Failed to initialize STT provider: {provider_error}"
+            progress.update(
+                0, f"Failed to initialize STT provider: {provider_error}", commit=True
             )
-            db.commit()
             raise STTProviderError(f"No STT provider available: {provider_error}")
 
         try:
             # Perform transcription with progress callback
             logger.info(f"Sending audio to STT provider: {gcs_uri}")
-            processing_status.update_progress(
-                25, f"Processing audio with {provider_name}..."
-            )
-            db.commit()
+            progress.update(25, f"Processing audio with {provider_name}...")
+
+            if provider_name == "assemblyai" and settings.ASSEMBLYAI_WEBHOOK_URL:
+                # AssemblyAI calls back when done; no worker waits on the job
+                return _submit_assemblyai_transcription(
+                    db,
+                    session,
+                    progress,
+                    stt_provider,
+                    gcs_uri,
+                    language,
+                    enable_diarization,
+                )
+
+            if (
+                provider_name == "google_stt_v2"
+                and settings.GOOGLE_STT_ASYNC_BATCH
+                and stt_provider.uses_batch_mode(language, enable_diarization)
+            ):
+                # The beat sweeper tracks the operation; no worker waits on it
+                return _submit_google_stt_transcription(
+                    db,
+                    session,
+                    progress,
+                    stt_provider,
+                    gcs_uri,
+                    language,
+                    original_filename,
+                )
 
             def update_transcription_progress(
                 progress_percentage, message, elapsed_minutes
             ):
-                """Callback to update transcription progress in database."""
+                """Callback to publish transcription progress."""
                 try:
                     # Map progress from 25% (start) to 75% (just before saving)
                     # This reserves 25% for initial setup and 25% for saving
@@ -204,27 +260,11 @@ def transcribe_audio(
                     if progress_percentage > 90:
                         progress_message = "Almost done processing audio..."
 
-                    # Re-query the processing status to ensure we have the
-                    # latest from DB
-                    current_status = (
-                        db.query(ProcessingStatus)
-                        .filter(ProcessingStatus.session_id == session_uuid)
-                        .first()
+                    progress.update(int(mapped_progress), progress_message)
+                    logger.info(
+                        f"STT Progress: {mapped_progress:.1f}% - {progress_message}"
                     )
 
-                    if current_status:
-                        current_status.update_progress(
-                            int(mapped_progress), progress_message
-                        )
-                        db.commit()
-                        logger.info(
-                            f"STT Progress: {mapped_progress:.1f}% - {progress_message} (DB updated)"
-                        )
-                    else:
-                        logger.warning(
-                            f"Processing status not found for session {session_uuid}"
-                        )
-
                 except Exception as e:
                     db.rollback()
                     logger.warning(f"Failed to update progress: {e}")
@@ -251,96 +291,10 @@ def transcribe_audio(
                     progress_callback=update_transcription_progress,
                 )
 
-            logger.info(f"Transcription completed: {len(result.segments)} segments")
-
-            # Update progress: transcription completed, now saving
-            processing_status.update_progress(80, "Saving transcript segments...")
-            db.commit()
-
-            # Save transcript segments to database
-            _save_transcript_segments(db, session_uuid, result.segments)
-
-            # Save speaker role assignments if available
-            _save_speaker_role_assignments(db, session_uuid, result.provider_metadata)
-
-            # Calculate processing duration
-            processing_duration = (datetime.now(UTC) - start_time).total_seconds()
-
-            # Update progress: finalizing
-            processing_status.update_progress(95, "Finalizing transcription...")
-            processing_status.duration_total = int(result.total_duration_sec)
-            processing_status.duration_processed = int(result.total_duration_sec)
-            db.commit()
-
-            # Calculate actual duration from segments
-            actual_duration_sec = _calculate_actual_duration(db, session_uuid)
-
-            # Format cost to fit VARCHAR(10) constraint
-            formatted_cost = None
-            if result.cost_usd:
-                cost_decimal = Decimal(str(result.cost_usd))
-                cost_rounded = cost_decimal.quantize(
-                    Decimal("0.000001"), rounding=ROUND_HALF_UP
-                )
-                formatted_cost = f"{cost_rounded:.6f}"
-
-            # Update session as completed
-            session.mark_completed(
-                duration_seconds=actual_duration_sec, cost_usd=formatted_cost
+            return _complete_transcription(
+                db, session, progress, result, start_time, self.request.id
             )
 
-            # Store provider metadata
-            if result.provider_metadata:
-                session.provider_metadata = result.provider_metadata
-                logger.info(f"Stored provider metadata for session {session_id}")
-
-            # Log processing metadata
-            session.transcription_job_id = self.request.id
-
-            # Final progress update
-            processing_status.update_progress(
-                100, "Transcription completed successfully!"
-            )
-            processing_status.status = "completed"
-
-            # Create usage log for successful transcription
-            try:
-                usage_service = UsageTrackingService(db)
-                usage_log = usage_service.create_usage_log(
-                    session=session,
-                    transcription_type=TranscriptionType.ORIGINAL,
-                    cost_usd=(float(result.cost_usd) if result.cost_usd else None),
-                    is_billable=True,
-                    billing_reason="transcription_completed",
-                )
-                logger.info(
-                    f"Usage log created for session {session_id}: {usage_log.id}"
-                )
-            except Exception as usage_error:
-                logger.error(
-                    f"Failed to create usage log for session {session_id}: {usage_error}"
-                )
-                # Don't fail the transcription if usage logging fails
-
-            db.commit()
-
-            logger.info(
-                f"Session {session_id} completed successfully: "
-                f"{len(result.segments)} segments, "
-                f"{result.total_duration_sec:.1f}s audio, "
-                f"{processing_duration:.1f}s processing time"
-            )
-
-            return {
-                "session_id": session_id,
-                "status": "completed",
-                "segments_count": len(result.segments),
-                "duration_seconds": result.total_duration_sec,
-                "processing_time_sec": processing_duration,
-                "cost_usd": float(result.cost_usd) if result.cost_usd else 0.0,
-                "language_code": result.language_code,
-            }
-
         except STTProviderUnavailableError as exc:
             # This will trigger automatic retry
             logger.warning(f"STT provider unavailable, retrying: {exc}")
@@ -362,6 +316,7 @@ def transcribe_audio(
                 processing_status.status = "error"
                 processing_status.message = f"Temporary provider issue: {error_msg}"
                 db.commit()
+                progress.publish()
 
                 # If we haven't exceeded retries, try again with longer delay
                 if self.request.retries < self.max_retries:
@@ -385,6 +340,7 @@ def transcribe_audio(
                         f"Provider unavailable after {self.max_retries} attempts"
                     )
                     db.commit()
+                    progress.publish()
                     raise
             else:
                 # Non-server error - treat as permanent failure
@@ -393,6 +349,7 @@ def transcribe_audio(
                 processing_status.status = "failed"
                 processing_status.message = error_msg
                 db.commit()
+                progress.publish()
                 logger.error(f"Session {session_id} failed permanently: {error_msg}")
                 raise
 
@@ -406,6 +363,7 @@ def transcribe_audio(
             processing_status.status = "failed"
             processing_status.message = error_msg
             db.commit()
+            progress.publish()
             raise
 
         except Exception as exc:
@@ -425,47 +383,561 @@ def transcribe_audio(
                 processing_status.status = "failed"
                 processing_status.message = error_msg
                 db.commit()
+                progress.publish()
                 raise
 
 
-def _save_transcript_segments(db: Session, session_id: UUID, segments: list) -> None:
-    """Save transcript segments to database."""
-    logger.info(f"Saving {len(segments)} transcript segments for session {session_id}")
+@celery_app.task(
+    bind=True,
+    base=TranscriptionTask,
+    max_retries=5,
+    default_retry_delay=60,  # 1 minute
+    autoretry_for=(STTProviderUnavailableError,),
+    retry_backoff=True,
+    retry_jitter=True,
+)
+def complete_assemblyai_transcription(
+    self, session_id: str, transcript_id: str, recheck: bool = False
+) -> dict:
+    """
+    Fetch, parse and store the transcript of a submitted AssemblyAI job.
+
+    Queued by the AssemblyAI webhook when the job ends, and on a timer after
+    submission as a fallback for lost webhooks. Runs for a job that is no
+    longer the session's pending one are ignored, so duplicate or forged
+    deliveries cost at most one status request.
 
-    db_segments = []
-    for segment in segments:
-        db_segment = TranscriptSegmentModel(
-            session_id=session_id,
-            speaker_id=segment.speaker_id,
-            start_seconds=segment.start_seconds,
-            end_seconds=segment.end_seconds,
-            content=segment.content,
-            confidence=segment.confidence,
+    Args:
+        session_id: UUID of the session being transcribed
+        transcript_id: AssemblyAI transcript ID
+        recheck: Whether this is the fallback timer; only the timer schedules
+            another check while the job is still running
+
+    Returns:
+        Dictionary with transcription results, or the job status if the
+        transcript is not stored by this run
+    """
+    session_uuid = UUID(session_id)
+
+    with get_db_session() as db:
+        session = db.query(SessionModel).filter(SessionModel.id == session_uuid).first()
+        job = _pending_job(session, ASSEMBLYAI_JOB_KEY, "transcript_id", transcript_id)
+        if job is None:
+            logger.info(
+                f"Ignoring AssemblyAI transcript {transcript_id}: "
+                f"not pending for session {session_id}"
+            )
+            return {"session_id": session_id, "status": "ignored"}
+
+        processing_status = (
+            db.query(ProcessingStatus)
+            .filter(ProcessingStatus.session_id == session_uuid)
+            .first()
         )
-        db_segments.append(db_segment)
+        progress = ProgressReporter(db, processing_status, get_progress_broker())
+        stt_provider = STTProviderFactory.create("assemblyai")
+        submitted_at = datetime.fromisoformat(job["submitted_at"])
 
-    # Batch insert segments
-    db.add_all(db_segments)
-    db.flush()  # Ensure segments are saved
+        try:
+            result = stt_provider.fetch_transcription_result(
+                transcript_id,
+                language=job["language"],
+                enable_diarization=job["enable_diarization"],
+            )
+            if result is None:
+                waited = (datetime.now(UTC) - submitted_at).total_seconds()
+                if waited >= settings.ASSEMBLYAI_MAX_WAIT_SECONDS:
+                    raise STTProviderError(
+                        f"AssemblyAI transcript {transcript_id} still unfinished "
+                        f"after {waited / 60:.0f} minutes"
+                    )
+                if recheck:
+                    self.apply_async(
+                        (session_id, transcript_id),
+                        {"recheck": True},
+                        countdown=settings.ASSEMBLYAI_RECHECK_SECONDS,
+                    )
+                return {"session_id": session_id, "status": "processing"}
+        except STTProviderUnavailableError:
+            raise
+        except STTProviderError as exc:
+            return _handle_assemblyai_job_error(
+                db, session, progress, stt_provider, job, exc
+            )
+
+        # Parsing can take minutes (LeMUR); store the transcript only if no
+        # other run completed the session meanwhile
+        db.refresh(session, with_for_update=True)
+        job = _pending_job(session, ASSEMBLYAI_JOB_KEY, "transcript_id", transcript_id)
+        if job is None:
+            logger.info(f"Session {session_id} was completed by another run")
+            db.rollback()
+            return {"session_id": session_id, "status": "ignored"}
+
+        return _complete_transcription(
+            db, session, progress, result, submitted_at, self.request.id
+        )
 
-    logger.info(f"Successfully saved {len(db_segments)} transcript segments")
 
+def _submit_assemblyai_transcription(
+    db: Session,
+    session: SessionModel,
+    progress: ProgressReporter,
+    stt_provider,
+    audio_uri: str,
+    language: str,
+    enable_diarization: bool,
+    resubmissions: int = 0,
+) -> dict:
+    """Submit an AssemblyAI job with a webhook and return without waiting."""
+    session_id = str(session.id)
+    webhook_url = (
+        f"{settings.ASSEMBLYAI_WEBHOOK_URL}?{urlencode({'session_id': session_id})}"
+    )
+    transcript_id = stt_provider.submit_transcription(
+        audio_uri=audio_uri,
+        language=language,
+        enable_diarization=enable_diarization,
+        webhook_url=webhook_url,
+    )
 
-def _calculate_actual_duration(db: Session, session_id: UUID) -> int:
-    """Calculate actual duration from transcript segments."""
-    # Get the maximum end_seconds from all segments
-    max_end_sec = (
-        db.query(TranscriptSegmentModel.end_seconds)
-        .filter(TranscriptSegmentModel.session_id == session_id)
-        .order_by(TranscriptSegmentModel.end_seconds.desc())
-        .first()
+    session.provider_metadata = {
+        ASSEMBLYAI_JOB_KEY: {
+            "transcript_id": transcript_id,
+            "audio_uri": audio_uri,
+            "language": language,
+            "enable_diarization": enable_diarization,
+            "submitted_at": datetime.now(UTC).isoformat(),
+            "resubmissions": resubmissions,
+        }
+    }
+    progress.update(30, "Transcribing with AssemblyAI...", commit=True)
+
+    complete_assemblyai_transcription.apply_async(
+        (session_id, transcript_id),
+        {"recheck": True},
+        countdown=settings.ASSEMBLYAI_RECHECK_SECONDS,
     )
+    logger.info(
+        f"Session {session_id} submitted to AssemblyAI as transcript {transcript_id}"
+    )
+
+    return {
+        "session_id": session_id,
+        "status": "submitted",
+        "transcript_id": transcript_id,
+    }
+
+
+@celery_app.task
+def sweep_google_stt_operations() -> dict:
+    """
+    Check pending Google STT batch operations and queue the finished ones.
+
+    Runs from celery beat. Each tick looks up the operations of up to
+    GOOGLE_STT_SWEEP_BATCH_SIZE processing sessions concurrently, one status
+    request each, so a tick takes seconds however long the recordings are.
+    Finished, failed and overdue operations are marked as queued and handed
+    to complete_google_stt_transcription; running ones wait for the next
+    tick. Operations already queued are not checked again.
+
+    Returns:
+        Counts of checked, queued, running and unreachable operations
+    """
+    now = datetime.now(UTC)
+    requeue_before = now - timedelta(seconds=GOOGLE_STT_REQUEUE_AFTER_SECONDS)
+    job_column = SessionModel.provider_metadata[GOOGLE_STT_JOB_KEY].as_string()
+    queued_at = SessionModel.provider_metadata[
+        (GOOGLE_STT_JOB_KEY, GOOGLE_STT_COMPLETION_QUEUED_KEY)
+    ].as_string()
+    with get_db_session() as db:
+        # Filter on the job in SQL so the batch limit only counts sessions
+        # with an operation still waiting to be checked
+        rows = (
+            db.query(SessionModel.id, SessionModel.provider_metadata)
+            .filter(
+                SessionModel.status == SessionStatus.PROCESSING,
+                SessionModel.stt_provider == "google_stt_v2",
+                job_column.isnot(None),
+                or_(queued_at.is_(None), queued_at < requeue_before.isoformat()),
+            )
+            .order_by(SessionModel.created_at)
+            .limit(settings.GOOGLE_STT_SWEEP_BATCH_SIZE)
+            .all()
+        )
+    jobs = {
+        str(session_id): metadata[GOOGLE_STT_JOB_KEY] for session_id, metadata in rows
+    }
+
+    stats = {"checked": len(jobs), "queued": 0, "running": 0, "unavailable": 0}
+    if not jobs:
+        return stats
+
+    stt_provider = STTProviderFactory.create("google")
+
+    def check(job: dict) -> str:
+        try:
+            response = stt_provider.check_batch_operation(job["operation_name"])
+        except STTProviderUnavailableError as e:
+            logger.warning(f"⚠️ Could not check {job['operation_name']}: {e}")
+            return "unavailable"
+        except STTProviderError:
+            # The completion task records the failure
+            return "done"
+        return "running" if response is None else "done"
+
+    with ThreadPoolExecutor(max_workers=GOOGLE_STT_SWEEP_CONCURRENCY) as pool:
+        states = dict(zip(jobs, pool.map(check, jobs.values())))
+
+    finished = []
+    for session_id, state in states.items():
+        job = jobs[session_id]
+        waited = (now - datetime.fromisoformat(job["submitted_at"])).total_seconds()
+        if state == "done" or (
+            state == "running" and waited >= settings.GOOGLE_STT_MAX_WAIT_SECONDS
+        ):
+            finished.append(session_id)
+        else:
+            stats[state] += 1
+
+    if finished:
+        # Mark before queueing so a fast completion task can clear the mark
+        with get_db_session() as db:
+            sessions = (
+                db.query(SessionModel)
+                .filter(SessionModel.id.in_([UUID(s) for s in finished]))
+                .with_for_update()
+                .all()
+            )
+            for session in sessions:
+                job = _pending_job(
+                    session,
+                    GOOGLE_STT_JOB_KEY,
+                    "operation_name",
+                    jobs[str(session.id)]["operation_name"],
+                )
+                if job is not None:
+                    _set_google_stt_job(
+                        session,
+                        {**job, GOOGLE_STT_COMPLETION_QUEUED_KEY: now.isoformat()},
+                    )
+        for session_id in finished:
+            complete_google_stt_transcription.delay(
+                session_id, jobs[session_id]["operation_name"]
+            )
+        stats["queued"] = len(finished)
+
+    logger.info(f"Google STT operation sweep: {stats}")
+    return stats
+
+
+@celery_app.task(
+    bind=True,
+    base=TranscriptionTask,
+    max_retries=5,
+    default_retry_delay=60,  # 1 minute
+    autoretry_for=(STTProviderUnavailableError,),
+    retry_backoff=True,
+    retry_jitter=True,
+)
+def complete_google_stt_transcription(
+    self, session_id: str, operation_name: str
+) -> dict:
+    """
+    Read, parse and store the transcript of a finished Google STT batch job.
+
+    Queued by sweep_google_stt_operations. The results file is read from GCS
+    once; if it is not visible yet the queued mark is cleared so the next
+    sweep queues this task again.
+
+    Args:
+        session_id: UUID of the session being transcribed
+        operation_name: Name of the batchRecognize operation
+
+    Returns:
+        Dictionary with transcription results, or the job status if the
+        transcript is not stored by this run
+    """
+    session_uuid = UUID(session_id)
+
+    with get_db_session() as db:
+        session = db.query(SessionModel).filter(SessionModel.id == session_uuid).first()
+        job = _pending_job(
+            session, GOOGLE_STT_JOB_KEY, "operation_name", operation_name
+        )
+        if job is None:
+            logger.info(
+                f"Ignoring Google STT operation {operation_name}: "
+                f"not pending for session {session_id}"
+            )
+            return {"session_id": session_id, "status": "ignored"}
+
+        processing_status = (
+            db.query(ProcessingStatus)
+            .filter(ProcessingStatus.session_id == session_uuid)
+            .first()
+        )
+        progress = ProgressReporter(db, processing_status, get_progress_broker())
+        stt_provider = STTProviderFactory.create("google")
+        submitted_at = datetime.fromisoformat(job["submitted_at"])
+
+        try:
+            result = stt_provider.fetch_batch_transcription_result(job)
+            if result is None:
+                waited = (datetime.now(UTC) - submitted_at).total_seconds()
+                if waited >= settings.GOOGLE_STT_MAX_WAIT_SECONDS:
+                    raise STTProviderError(
+                        f"Google STT operation {operation_name} still unfinished "
+                        f"after {waited / 60:.0f} minutes"
+                    )
+                job = dict(job)
+                job.pop(GOOGLE_STT_COMPLETION_QUEUED_KEY, None)
+                _set_google_stt_job(session, job)
+                return {"session_id": session_id, "status": "processing"}
+        except STTProviderUnavailableError:
+            raise
+        except STTProviderError as exc:
+            return _fail_transcription(db, session, progress, exc)
+
+        db.refresh(session, with_for_update=True)
+        job = _pending_job(
+            session, GOOGLE_STT_JOB_KEY, "operation_name", operation_name
+        )
+        if job is None:
+            logger.info(f"Session {session_id} was completed by another run")
+            db.rollback()
+            return {"session_id": session_id, "status": "ignored"}
+
+        return _complete_transcription(
+            db, session, progress, result, submitted_at, self.request.id
+        )
+
+
+def _submit_google_stt_transcription(
+    db: Session,
+    session: SessionModel,
+    progress: ProgressReporter,
+    stt_provider,
+    audio_uri: str,
+    language: str,
+    original_filename: str = None,
+) -> dict:
+    """Start a Google STT batch job and leave it to the beat sweeper."""
+    job = stt_provider.submit_batch_transcription(
+        audio_uri, language, original_filename
+    )
+    job["submitted_at"] = datetime.now(UTC).isoformat()
+
+    session.provider_metadata = {GOOGLE_STT_JOB_KEY: job}
+    progress.update(30, "Transcribing with Google Speech-to-Text...", commit=True)
+    logger.info(
+        f"Session {session.id} submitted to Google STT as {job['operation_name']}"
+    )
+
+    return {
+        "session_id": str(session.id),
+        "status": "submitted",
+        "operation_name": job["operation_name"],
+    }
+
+
+def _set_google_stt_job(session: SessionModel, job: dict) -> None:
+    """Replace the pending job; JSON columns only notice reassignment."""
+    session.provider_metadata = {
+        **(session.provider_metadata or {}),
+        GOOGLE_STT_JOB_KEY: job,
+    }
+
+
+def _pending_job(session, job_key: str, id_field: str, job_id: str):
+    """Return the session's submitted provider job if it is still awaited."""
+    if session is None or session.status != SessionStatus.PROCESSING:
+        return None
+    job = (session.provider_metadata or {}).get(job_key)
+    if not job or job.get(id_field) != job_id:
+        return None
+    return job
+
+
+def _handle_assemblyai_job_error(
+    db: Session,
+    session: SessionModel,
+    progress: ProgressReporter,
+    stt_provider,
+    job: dict,
+    exc: STTProviderError,
+) -> dict:
+    """Resubmit a job that hit an AssemblyAI server error, otherwise fail it."""
+    session_id = str(session.id)
+    error_msg = str(exc)
+    resubmissions = job.get("resubmissions", 0)
+
+    if (
+        "server error" in error_msg.lower()
+        and resubmissions < ASSEMBLYAI_MAX_RESUBMISSIONS
+    ):
+        logger.warning(
+            f"Resubmitting session {session_id} after temporary server error "
+            f"({resubmissions + 1}/{ASSEMBLYAI_MAX_RESUBMISSIONS}): {error_msg}"
+        )
+        try:
+            return _submit_assemblyai_transcription(
+                db,
+                session,
+                progress,
+                stt_provider,
+                job["audio_uri"],
+                job["language"],
+                job["enable_diarization"],
+                resubmissions=resubmissions + 1,
+            )
+        except STTProviderError as resubmit_exc:
+            exc = resubmit_exc
+
+    return _fail_transcription(db, session, progress, exc)
+
+
+def _fail_transcription(
+    db: Session, session: SessionModel, progress: ProgressReporter, exc: Exception
+) -> dict:
+    """Mark a submitted job's session as permanently failed."""
+    session_id = str(session.id)
+    error_msg = f"STT provider error: {exc}"
+    session.mark_failed(error_msg)
+    progress.processing_status.status = "failed"
+    progress.processing_status.message = error_msg
+    db.commit()
+    progress.publish()
+    logger.error(f"Session {session_id} failed permanently: {error_msg}")
+    return {"session_id": session_id, "status": "failed", "error": error_msg}
+
+
+def _complete_transcription(
+    db: Session,
+    session: SessionModel,
+    progress: ProgressReporter,
+    result,
+    started_at: datetime,
+    job_id: str,
+) -> dict:
+    """Store a finished transcription and mark the session completed."""
+    session_id = str(session.id)
+    processing_status = progress.processing_status
+
+    logger.info(f"Transcription completed: {len(result.segments)} segments")
+
+    # Update progress: transcription completed, now saving
+    progress.update(80, "Saving transcript segments...")
+
+    # Save transcript segments to database
+    _save_transcript_segments(db, session.id, result.segments)
+
+    # Save speaker role assignments if available
+    _save_speaker_role_assignments(db, session.id, result.provider_metadata)
+
+    # Calculate processing duration
+    processing_duration = (datetime.now(UTC) - started_at).total_seconds()
+
+    # Update progress: finalizing
+    processing_status.duration_total = int(result.total_duration_sec)
+    processing_status.duration_processed = int(result.total_duration_sec)
+    progress.update(95, "Finalizing transcription...")
+
+    # Calculate actual duration from segments
+    actual_duration_sec = _calculate_actual_duration(result.segments)
+
+    # Format cost to fit VARCHAR(10) constraint
+    formatted_cost = None
+    if result.cost_usd:
+        cost_decimal = Decimal(str(result.cost_usd))
+        cost_rounded = cost_decimal.quantize(
+            Decimal("0.000001"), rounding=ROUND_HALF_UP
+        )
+        formatted_cost = f"{cost_rounded:.6f}"
+
+    # Update session as completed
+    session.mark_completed(
+        duration_seconds=actual_duration_sec, cost_usd=formatted_cost
+    )
+
+    # Store provider metadata
+    if result.provider_metadata:
+        session.provider_metadata = result.provider_metadata
+        logger.info(f"Stored provider metadata for session {session_id}")
+
+    # Log processing metadata
+    session.transcription_job_id = job_id
+
+    # Final progress update
+    processing_status.update_progress(100, "Transcription completed successfully!")
+    processing_status.status = "completed"
+
+    # Create usage log for successful transcription
+    try:
+        usage_service = UsageTrackingService(db)
+        usage_log = usage_service.create_usage_log(
+            session=session,
+            transcription_type=TranscriptionType.ORIGINAL,
+            cost_usd=(float(result.cost_usd) if result.cost_usd else None),
+            is_billable=True,
+            billing_reason="transcription_completed",
+        )
+        logger.info(f"Usage log created for session {session_id}: {usage_log.id}")
+    except Exception as usage_error:
+        logger.error(
+            f"Failed to create usage log for session {session_id}: {usage_error}"
+        )
+        # Don't fail the transcription if usage logging fails
+
+    db.commit()
+    # Announce completion only once the transcript is committed
+    progress.publish()
+
+    logger.info(
+        f"Session {session_id} completed successfully: "
+        f"{len(result.segments)} segments, "
+        f"{result.total_duration_sec:.1f}s audio, "
+        f"{processing_duration:.1f}s processing time"
+    )
+
+    return {
+        "session_id": session_id,
+        "status": "completed",
+        "segments_count": len(result.segments),
+        "duration_seconds": result.total_duration_sec,
+        "processing_time_sec": processing_duration,
+        "cost_usd": float(result.cost_usd) if result.cost_usd else 0.0,
+        "language_code": result.language_code,
+    }
+
+
+def _save_transcript_segments(db: Session, session_id: UUID, segments: list) -> None:
+    """Save transcript segments to database in one bulk insert."""
+    logger.info(f"Saving {len(segments)} transcript segments for session {session_id}")
+
+    rows = bulk_insert(
+        db,
+        TranscriptSegmentModel.__table__,
+        (
+            {
+                "session_id": session_id,
+                "speaker_id": segment.speaker_id,
+                "start_seconds": segment.start_seconds,
+                "end_seconds": segment.end_seconds,
+                "content": segment.content,
+                "confidence": segment.confidence,
+            }
+            for segment in segments
+        ),
+    )
+
+    logger.info(f"Successfully saved {len(rows)} transcript segments")
 
-    if max_end_sec and max_end_sec[0]:
-        return int(max_end_sec[0])
 
-    # Fallback to 0 if no segments found
-    return 0
+def _calculate_actual_duration(segments: list) -> int:
+    """Calculate actual duration from the end of the last transcript segment."""
+    max_end_sec = max((segment.end_seconds for segment in segments), default=0)
+    return int(max_end_sec or 0)
 
 
 def _save_speaker_role_assignments(
@@ -0,0 +1,30 @@
+"""Celery task that keeps the usage quota counters in line with the database."""
+
+import logging
+
+from celery import shared_task
+
+from ..core.database import get_db_session
+from ..services.usage_quota import get_usage_quota
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def reconcile_usage_quotas() -> dict:
+    """
+    Rewrite the minute counters of recently active users from the database.
+
+    Counters are incremented after each usage log commits; this pass repairs
+    increments lost to crashes or store errors, keeping the database the
+    source of truth for admission checks.
+
+    Returns:
+        Number of counters rewritten
+    """
+    with get_db_session() as db:
+        reconciled = get_usage_quota().reconcile(db)
+
+    if reconciled:
+        logger.info(f"🔄 Reconciled usage quota counters for {reconciled} users")
+    return {"reconciled": reconciled}
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Single-pass ingest engine for VTT and SRT transcripts.
+
+Every transcript upload path (the session and coaching-session upload use
+cases, the coaching-session upload endpoint and the format converter in
+parser.py) tokenizes files here, so they all accept the same inputs.
+
+The source is decoded incrementally and each line is looked at once. Cue
+timings are matched by one precompiled, anchored pattern that accepts VTT
+("00:00:01.000") and SRT ("00:00:01,000") timestamps, with or without hours or
+milliseconds. Lines without "-->" never reach a regex, so cue identifiers, SRT
+sequence numbers, headers and NOTE/STYLE/REGION blocks are skipped cheaply.
+
+Speakers come from MS Teams voice tags ("<v Name>text</v>") or a "Name: text"
+prefix (MacWhisper, Zoom, most SRT exports). A SpeakerRoleResolver maps each
+speaker name to a coach/client role once and caches the result, and segments
+are emitted as slotted IngestedSegment records with integer millisecond times.
+"""
+
+import codecs
+import logging
+import re
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+# Size of each read from a file-like source
+READ_CHUNK_SIZE = 64 * 1024
+
+TranscriptSource = Union[str, bytes, Iterable[bytes], Iterable[str], Any]
+
+COACH_ROLE = "coach"
+CLIENT_ROLE = "client"
+
+# Keyword table used when no explicit role mapping matches; first match wins
+DEFAULT_ROLE_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (CLIENT_ROLE, ("client", "客戶", "學員")),
+    (COACH_ROLE, ("coach", "教練", "老師")),
+)
+
+# Block types that are skipped up to the next blank line
+_SKIPPED_BLOCKS = frozenset({"NOTE", "STYLE", "REGION"})
+
+_CUE_TIMING_RE = re.compile(
+    r"(?:(\d+):)?(\d{1,2}):(\d{2})(?:[.,](\d{1,3}))?[ \t]*-->[ \t]*"
+    r"(?:(\d+):)?(\d{1,2}):(\d{2})(?:[.,](\d{1,3}))?(?:\s|$)"
+)
+_VOICE_TAG_RE = re.compile(r"<v(?:\.[^\s>]+)?\s+([^>]+)>\s*(.*?)\s*(?:</v>)?$")
+_SPEAKER_PREFIX_RE = re.compile(r"([^:]+):\s*(.+)")
+_SPEAKER_KEY_STRIP_RE = re.compile(r"[^\w_]")
+_SPEAKER_NUMBER_RE = re.compile(r"\d+")
+
+
+class UnrecognizedFormatError(ValueError):
+    """Custom exception for when the VTT format cannot be determined."""
+
+
+@dataclass(slots=True)
+class IngestedSegment:
+    """One transcript cue with its speaker resolved to a role."""
+
+    start_ms: int
+    end_ms: int
+    content: str
+    speaker_id: int
+    speaker_role: str
+    speaker_name: Optional[str] = None
+
+    @property
+    def start_seconds(self) -> float:
+        return self.start_ms / 1000
+
+    @property
+    def end_seconds(self) -> float:
+        return self.end_ms / 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the segment dict stored by the upload endpoints."""
+        return {
+            "start_seconds": self.start_seconds,
+            "end_seconds": self.end_seconds,
+            "content": self.content,
+            "speaker_id": self.speaker_id,
+            "speaker_role": self.speaker_role,
+        }
+
+
+def speaker_key(speaker_name: str) -> str:
+    """Build the speaker key used by the frontend's role mapping."""
+    normalized = _SPEAKER_KEY_STRIP_RE.sub("", speaker_name.lower().replace(" ", "_"))
+    return f"speaker_{normalized}"
+
+
+class SpeakerRoleResolver:
+    """
+    Map speaker names to (speaker_id, role) pairs.
+
+    Names are looked up in order: the explicit role mapping keyed by
+    speaker_key(name), the keyword table, a speaker number in the name
+    ("Speaker 2", "說話者 1"), then the default role. Coaches get speaker_id 1
+    and every other role speaker_id 2. Results are cached per name, since a
+    transcript only has a handful of speakers.
+    """
+
+    def __init__(
+        self,
+        role_mapping: Optional[Mapping[str, str]] = None,
+        keywords: Sequence[Tuple[str, Sequence[str]]] = DEFAULT_ROLE_KEYWORDS,
+        default_role: str = COACH_ROLE,
+    ):
+        self.role_mapping = {
+            key: role.lower() for key, role in (role_mapping or {}).items()
+        }
+        self.keywords = tuple(
+            (role, tuple(word.lower() for word in words)) for role, words in keywords
+        )
+        self.default_role = default_role
+        self._resolved: Dict[Optional[str], Tuple[int, str]] = {}
+
+    def resolve(self, speaker_name: Optional[str]) -> Tuple[int, str]:
+        """Return (speaker_id, role) for a speaker name, or the default."""
+        resolved = self._resolved.get(speaker_name)
+        if resolved is None:
+            resolved = self._resolved[speaker_name] = self._resolve(speaker_name)
+            if speaker_name:
+                logger.info(
+                    f"Speaker role assignment: {speaker_name} -> {resolved[1]} "
+                    f"(speaker_id: {resolved[0]})"
+                )
+        return resolved
+
+    def _resolve(self, speaker_name: Optional[str]) -> Tuple[int, str]:
+        if not speaker_name:
+            return self._with_id(self.default_role)
+
+        role = self.role_mapping.get(speaker_key(speaker_name))
+        if role is not None:
+            return self._with_id(role)
+
+        lowered = speaker_name.lower()
+        for role, words in self.keywords:
+            if any(word in lowered for word in words):
+                return self._with_id(role)
+
+        number = _SPEAKER_NUMBER_RE.search(speaker_name)
+        if number is not None and number.group() in ("1", "2"):
+            role = COACH_ROLE if number.group() == "1" else CLIENT_ROLE
+            return self._with_id(role)
+
+        return self._with_id(self.default_role)
+
+    @staticmethod
+    def _with_id(role: str) -> Tuple[int, str]:
+        return (1 if role == COACH_ROLE else 2), role
+
+
+def iter_chunks(source: TranscriptSource) -> Iterator[Union[str, bytes]]:
+    """Normalize the supported source types into an iterator of chunks."""
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        yield source
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from source
+
+
+def iter_lines(source: TranscriptSource) -> Iterator[str]:
+    """
+    Decode a transcript source incrementally and yield its lines.
+
+    Line terminators ("\\n" or "\\r\\n") are stripped. Byte input is decoded as
+    UTF-8; invalid input raises UnrecognizedFormatError.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+
+    try:
+        for chunk in iter_chunks(source):
+            if not isinstance(chunk, str):
+                chunk = decoder.decode(bytes(chunk))
+            pending += chunk
+            lines = pending.split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise UnrecognizedFormatError("File is not valid UTF-8 text.")
+
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _timestamp_ms(
+    hours: Optional[str], minutes: str, seconds: str, millis: Optional[str]
+) -> int:
+    total = ((int(hours or 0) * 60 + int(minutes)) * 60 + int(seconds)) * 1000
+    # ".5" means 500 ms, as in the VTT and SRT specs
+    return total + int(millis.ljust(3, "0")) if millis else total
+
+
+def parse_cue_timing(line: str) -> Optional[Tuple[int, int]]:
+    """Parse a cue timing line into (start_ms, end_ms), or None."""
+    match = _CUE_TIMING_RE.match(line)
+    if match is None:
+        return None
+    groups = match.groups()
+    return _timestamp_ms(*groups[:4]), _timestamp_ms(*groups[4:])
+
+
+def iter_cue_lines(source: TranscriptSource) -> Iterator[Tuple[int, int, List[str]]]:
+    """
+    Split a transcript into cues in a single pass.
+
+    Yields (start_ms, end_ms, lines) tuples, where lines holds the cue's
+    stripped, non-empty text lines. Cues without text are dropped.
+    """
+    start_ms = end_ms = 0
+    cue_lines: Optional[List[str]] = None
+    skipping = False
+
+    for line in iter_lines(source):
+        line = line.strip()
+        if not line:
+            if cue_lines:
+                yield start_ms, end_ms, cue_lines
+            cue_lines = None
+            skipping = False
+            continue
+        if skipping:
+            continue
+
+        if "-->" in line:
+            timing = parse_cue_timing(line)
+            if timing is not None:
+                if cue_lines:
+                    # A cue ran into the next one without a blank line; its
+                    # last line is the next cue's SRT sequence number
+                    if cue_lines[-1].isdigit():
+                        cue_lines.pop()
+                    if cue_lines:
+                        yield start_ms, end_ms, cue_lines
+                start_ms, end_ms = timing
+                cue_lines = []
+                continue
+
+        if cue_lines is not None:
+            cue_lines.append(line)
+        elif line.split(None, 1)[0] in _SKIPPED_BLOCKS:
+            skipping = True
+
+    if cue_lines:
+        yield start_ms, end_ms, cue_lines
+
+
+def split_speaker(lines: List[str]) -> Tuple[Optional[str], str]:
+    """Split a cue's lines into (speaker name, content)."""
+    first = lines[0]
+    if first.startswith("<v"):
+        match = _VOICE_TAG_RE.match(" ".join(lines))
+        if match is not None:
+            return match.group(1).strip(), match.group(2)
+    elif ":" in first:
+        match = _SPEAKER_PREFIX_RE.match(first)
+        if match is not None:
+            content = match.group(2)
+            if len(lines) > 1:
+                content = " ".join([content, *lines[1:]])
+            return match.group(1).strip(), content
+    return None, " ".join(lines)
+
+
+def iter_segments(
+    source: TranscriptSource, resolver: Optional[SpeakerRoleResolver] = None
+) -> Iterator[IngestedSegment]:
+    """
+    Stream the segments of a VTT or SRT transcript.
+
+    Args:
+        source: str, bytes, a text/binary file-like object, or an iterator of
+            byte/str chunks.
+        resolver: Speaker role resolver; defaults to keyword-based resolution.
+
+    Yields:
+        IngestedSegment records in file order.
+    """
+    resolver = resolver or SpeakerRoleResolver()
+    resolve = resolver.resolve
+
+    for start_ms, end_ms, lines in iter_cue_lines(source):
+        speaker_name, content = split_speaker(lines)
+        if not content:
+            continue
+        speaker_id, speaker_role = resolve(speaker_name)
+        yield IngestedSegment(
+            start_ms, end_ms, content, speaker_id, speaker_role, speaker_name
+        )
+
+
+def ingest_transcript(
+    source: TranscriptSource,
+    speaker_role_mapping: Optional[Mapping[str, str]] = None,
+    resolver: Optional[SpeakerRoleResolver] = None,
+) -> List[IngestedSegment]:
+    """
+    Parse a VTT or SRT transcript into segments.
+
+    Args:
+        source: Transcript content; see iter_segments.
+        speaker_role_mapping: Optional mapping of speaker keys
+            ("speaker_<name>") to roles. Ignored when a resolver is given.
+        resolver: Optional custom speaker role resolver.
+
+    Returns:
+        List of IngestedSegment records.
+    """
+    if resolver is None:
+        resolver = SpeakerRoleResolver(speaker_role_mapping)
+    segments = list(iter_segments(source, resolver))
+    logger.debug(f"Ingested {len(segments)} transcript segments")
+    return segments
@@ -5,6 +5,8 @@ Utility module for Chinese text conversion between Simplified and Traditional.
 
 from typing import Any, Dict, List
 
+from ..cue_table import CueTable
+
 try:
     import opencc
 
@@ -87,7 +89,7 @@ def convert_to_traditional(data):
     Convert Simplified Chinese text to Traditional Chinese.
 
     Args:
-        data: Can be a string, dictionary, or list of dictionaries
+        data: Can be a string, dictionary, list of dictionaries, or CueTable
 
     Returns:
         Converted data with Traditional Chinese text
@@ -99,7 +101,9 @@ def convert_to_traditional(data):
         print("Please install it with: pip install opencc-python-reimplemented")
         return data
 
-    if isinstance(data, str):
+    if isinstance(data, CueTable):
+        return data.map_text(chinese_converter.convert_text)
+    elif isinstance(data, str):
         return chinese_converter.convert_text(data)
     elif isinstance(data, dict):
         return chinese_converter.convert_dict(data)
@@ -0,0 +1,152 @@
+"""
+Performance tests for the set-based BillingAnalytics rebuild.
+
+Seeds an in-memory database with 50,000 users, half of them active this
+month, and times full and incremental rebuilds of their monthly records.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.infrastructure.db.bulk import bulk_insert
+from coaching_assistant.models import Base
+from coaching_assistant.models.billing_analytics import BillingAnalytics
+from coaching_assistant.models.session import Session as TranscriptionSession
+from coaching_assistant.models.usage_log import UsageLog
+from coaching_assistant.models.user import User, UserPlan
+from coaching_assistant.services import billing_analytics_rebuild
+from coaching_assistant.services.billing_analytics_rebuild import (
+    BillingAnalyticsRebuilder,
+)
+from coaching_assistant.services.plan_limits import PlanLimit
+
+USER_COUNT = 50_000
+LOGS_PER_ACTIVE_USER = 4
+NOW = datetime(2025, 3, 20, 12, 0, tzinfo=UTC)
+LATER = NOW + timedelta(hours=1)
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def plan_limits():
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(
+        billing_analytics_rebuild,
+        "get_global_plan_limits",
+        lambda: SimpleNamespace(
+            get_plan_limit=lambda plan: PlanLimit(
+                max_minutes=1200, monthly_price_usd=30
+            )
+        ),
+    )
+    yield
+    patcher.undo()
+
+
+@pytest.fixture(scope="module")
+def seeded_db():
+    """50k users; every other one has sessions and usage logs this month."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    users, sessions, logs = [], [], []
+    signup = datetime(2024, 6, 1)
+    for index in range(USER_COUNT):
+        user_id = uuid4()
+        users.append(
+            {
+                "id": user_id,
+                "email": f"rebuild_{index}@example.com",
+                "name": f"Rebuild {index}",
+                "plan": UserPlan.PRO if index % 3 else UserPlan.FREE,
+                "created_at": signup,
+            }
+        )
+        if index % 2:
+            continue
+        for log_index in range(LOGS_PER_ACTIVE_USER):
+            created_at = datetime(2025, 3, 1 + (index + log_index) % 19, 10, 0)
+            sessions.append(
+                {"user_id": user_id, "title": "Session", "created_at": created_at}
+            )
+            logs.append(
+                {
+                    "user_id": user_id,
+                    "session_id": uuid4(),
+                    "duration_minutes": 30 + log_index,
+                    "duration_seconds": (30 + log_index) * 60,
+                    "cost_usd": Decimal("0.48"),
+                    "stt_provider": "google" if log_index % 2 else "assemblyai",
+                    "user_plan": "pro",
+                    "created_at": created_at,
+                }
+            )
+
+    bulk_insert(db, User.__table__, users)
+    bulk_insert(db, TranscriptionSession.__table__, sessions)
+    bulk_insert(db, UsageLog.__table__, logs)
+    db.commit()
+    yield db
+    db.close()
+
+
+def timed_rebuild(db, **kwargs):
+    start = time.perf_counter()
+    result = BillingAnalyticsRebuilder(db).rebuild("monthly", **kwargs)
+    return result, time.perf_counter() - start
+
+
+def test_full_rebuild_of_50k_users(seeded_db):
+    progress = []
+
+    result, elapsed = timed_rebuild(
+        seeded_db, now=NOW, progress=lambda done, total: progress.append(done)
+    )
+
+    print(
+        f"\nFull rebuild: {result['users_processed']} users in {elapsed:.2f}s "
+        f"({result['users_processed'] / elapsed:,.0f} users/s)"
+    )
+    assert result["users_processed"] == USER_COUNT
+    assert seeded_db.query(BillingAnalytics).count() == USER_COUNT
+    assert progress[-1] == USER_COUNT
+    # A per-user refresh issues several queries and a commit per user
+    assert elapsed < 60
+
+
+def test_incremental_rebuild_only_touches_active_users(seeded_db):
+    timed_rebuild(seeded_db, now=NOW)
+    active = [user_id for (user_id,) in seeded_db.query(User.id).limit(100).all()]
+    bulk_insert(
+        seeded_db,
+        UsageLog.__table__,
+        [
+            {
+                "user_id": user_id,
+                "session_id": uuid4(),
+                "duration_minutes": 10,
+                "duration_seconds": 600,
+                "stt_provider": "google",
+                "user_plan": "pro",
+                "created_at": datetime(2025, 3, 20, 12, 30),
+            }
+            for user_id in active
+        ],
+    )
+    seeded_db.commit()
+
+    result, elapsed = timed_rebuild(seeded_db, now=LATER, incremental=True)
+
+    print(f"\nIncremental rebuild: {result['users_processed']} users in {elapsed:.2f}s")
+    assert result["incremental"] is True
+    assert result["users_processed"] == len(active)
+    assert elapsed < 5
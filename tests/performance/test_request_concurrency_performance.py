@@ -0,0 +1,309 @@
+"""
+Load test for blocking work on the API request path.
+
+Runs concurrent transcript exports through the real sessions router while a probe
+client keeps requesting a cheap endpoint on the same event loop, then reports
+the probe's p50/p99 latency. The use cases are replaced by fakes that block
+like synchronous SQLAlchemy calls do, so the test shows whether that work
+runs in the threadpool or stalls every other request on the worker.
+
+For comparison the same export handler is also mounted as an ``async def``
+route, which is how the sessions routes were declared before they moved to
+the threadpool.
+
+Rendering an export is CPU work and still shares the GIL with the event loop,
+so the latency comparison uses text exports, whose rendering is negligible.
+Workbook rendering can saturate a small machine's CPU and then raises probe
+latency in both modes alike.
+
+A second load sends a burst of twice as many requests as the engine's pool has
+connections through the real get_db dependency, checking that the configured
+threadpool lets every request finish without waiting out pool_timeout.
+"""
+
+import asyncio
+import statistics
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+from anyio import to_thread
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from coaching_assistant.api.v1 import sessions
+from coaching_assistant.api.v1.auth import get_current_user_dependency
+from coaching_assistant.core import database
+from coaching_assistant.core.config import settings
+from coaching_assistant.core.database import create_database_engine
+from coaching_assistant.core.models.session import SessionStatus
+from coaching_assistant.core.models.transcript import TranscriptSegment
+
+# Blocking time of the export's ownership check and of each segment page
+EXPORT_QUERY_SECONDS = 0.2
+CHUNK_QUERY_SECONDS = 0.01
+# Blocking time of the probe endpoint's session lookup
+PROBE_QUERY_SECONDS = 0.002
+# Exports arrive at this interval; probes are sent back to back
+EXPORT_INTERVAL_SECONDS = 0.05
+PROBE_INTERVAL_SECONDS = 0.005
+# Enough exports for a few hundred probes, so p99 is not a single outlier
+LOAD_EXPORTS = 48
+
+SEGMENTS = 200
+CHUNK_SIZE = 100
+
+USER = SimpleNamespace(id=uuid4())
+SESSION = SimpleNamespace(
+    id=uuid4(),
+    user_id=USER.id,
+    title="Load test session",
+    status=SessionStatus.COMPLETED,
+    language="zh-TW",
+    stt_provider="google",
+    audio_filename="session.mp3",
+    duration_seconds=3600,
+    segments_count=SEGMENTS,
+    error_message=None,
+    stt_cost_usd=None,
+    created_at=datetime(2025, 1, 1),
+    updated_at=datetime(2025, 1, 1),
+)
+SEGMENT_ROWS = [
+    TranscriptSegment(
+        id=uuid4(),
+        session_id=SESSION.id,
+        speaker_id=1 + index % 2,
+        start_seconds=index * 1.5,
+        end_seconds=index * 1.5 + 1.4,
+        content="我想談談工作上的壓力，最近常常覺得很累。",
+    )
+    for index in range(SEGMENTS)
+]
+
+
+class BlockingExportUseCase:
+    """Export use case whose queries block like sync SQLAlchemy calls."""
+
+    def stream_transcript(self, session_id: UUID, user_id: UUID, format: str):
+        time.sleep(EXPORT_QUERY_SECONDS)
+        return {"session": SESSION, "segment_chunks": self._chunks()}
+
+    def _chunks(self):
+        for start in range(0, SEGMENTS, CHUNK_SIZE):
+            time.sleep(CHUNK_QUERY_SECONDS)
+            yield SEGMENT_ROWS[start : start + CHUNK_SIZE]
+
+
+class SpeakerRoleUseCase:
+    def get_session_speaker_roles(self, session_id: UUID, user_id: UUID):
+        return {1: "coach", 2: "client"}
+
+    def get_segment_roles(self, session_id: UUID, user_id: UUID):
+        return {}
+
+
+class BlockingRetrievalUseCase:
+    def get_session_by_id(self, session_id: UUID, user_id: UUID):
+        time.sleep(PROBE_QUERY_SECONDS)
+        return SESSION
+
+
+def build_app() -> FastAPI:
+    """Mount the sessions router with blocking fakes behind its use cases."""
+    app = FastAPI()
+    app.include_router(sessions.router, prefix="/api/v1/sessions")
+    app.dependency_overrides.update(
+        {
+            get_current_user_dependency: lambda: USER,
+            sessions.get_session_export_use_case: BlockingExportUseCase,
+            sessions.get_speaker_role_retrieval_use_case: SpeakerRoleUseCase,
+            sessions.get_session_retrieval_use_case: BlockingRetrievalUseCase,
+        }
+    )
+
+    @app.get("/event-loop/{session_id}/transcript")
+    async def export_on_event_loop(
+        session_id: UUID,
+        format: str = "xlsx",
+        export_use_case=Depends(sessions.get_session_export_use_case),
+        speaker_role_use_case=Depends(sessions.get_speaker_role_retrieval_use_case),
+    ):
+        return sessions.export_transcript(
+            session_id=session_id,
+            format=format,
+            current_user=USER,
+            export_use_case=export_use_case,
+            speaker_role_use_case=speaker_role_use_case,
+        )
+
+    return app
+
+
+async def run_load(
+    export_path: str, exports: int, interval: float = EXPORT_INTERVAL_SECONDS
+) -> dict:
+    """Start exports at a steady rate and time probe requests until they end."""
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        probe_path = f"/api/v1/sessions/{SESSION.id}"
+        # Warm up routing, response model validation and the export writer
+        assert (await client.get(probe_path)).status_code == 200
+        assert (await client.get(export_path)).status_code == 200
+
+        async def start_exports():
+            tasks = []
+            for _ in range(exports):
+                tasks.append(asyncio.create_task(client.get(export_path)))
+                await asyncio.sleep(interval)
+            return await asyncio.gather(*tasks)
+
+        exporter = asyncio.create_task(start_exports())
+        latencies = []
+        while not exporter.done():
+            start = time.perf_counter()
+            response = await client.get(probe_path)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+            await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+
+        export_responses = exporter.result()
+
+    assert all(response.status_code == 200 for response in export_responses)
+    assert all(response.content for response in export_responses)
+    latencies.sort()
+    return {
+        "probes": len(latencies),
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def describe(label: str, result: dict) -> str:
+    return (
+        f"\n{label}: {result['probes']} probes, "
+        f"p50 {result['p50'] * 1000:.1f} ms, p99 {result['p99'] * 1000:.1f} ms"
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+class TestConcurrentExportLatency:
+    """p99 latency of cheap requests while exports are running."""
+
+    EXPORT_PATH = f"/api/v1/sessions/{SESSION.id}/transcript?format=txt"
+    EVENT_LOOP_EXPORT_PATH = f"/event-loop/{SESSION.id}/transcript?format=txt"
+
+    def test_probe_latency_during_concurrent_exports(self):
+        # Act
+        threaded = asyncio.run(run_load(self.EXPORT_PATH, exports=LOAD_EXPORTS))
+        on_loop = asyncio.run(
+            run_load(self.EVENT_LOOP_EXPORT_PATH, exports=LOAD_EXPORTS)
+        )
+
+        # Assert
+        print(describe("threadpool routes", threaded))
+        print(describe("event-loop routes", on_loop))
+        assert threaded["probes"] > on_loop["probes"]
+        # On the event loop probes wait behind the exports' blocking queries;
+        # how fast they are otherwise depends on the machine, so only compare
+        assert on_loop["p99"] >= EXPORT_QUERY_SECONDS
+        assert threaded["p99"] < on_loop["p99"] / 2
+
+    @pytest.mark.slow
+    def test_probe_latency_with_threadpool_saturated(self):
+        # Exports arrive faster than 40 worker threads can drain them, so
+        # probes queue for a thread token (but the event loop stays free).
+        # Text exports keep CPU out of the picture.
+        txt_path = f"/api/v1/sessions/{SESSION.id}/transcript?format=txt"
+        result = asyncio.run(run_load(txt_path, exports=160, interval=0.001))
+
+        print(describe("160 txt exports in a burst", result))
+        waves = 160 / 40
+        assert result["p99"] < EXPORT_QUERY_SECONDS * (waves + 2)
+
+
+# A burst this many times the pool size, all using a database connection
+POOL_BURST_FACTOR = 2
+POOL_TIMEOUT_SECONDS = 1
+ROUTE_QUERY_SECONDS = 0.02
+
+
+def build_pool_app(monkeypatch) -> tuple[FastAPI, int]:
+    """Mount a route whose auth dependency and handler both query the pool."""
+    # The production pool sizes, with SQLite connections shared across threads
+    engine = create_database_engine(
+        "sqlite://",
+        poolclass=QueuePool,
+        pool_timeout=POOL_TIMEOUT_SECONDS,
+        connect_args={"check_same_thread": False},
+    )
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+    app = FastAPI()
+
+    def current_user(db: Session = Depends(database.get_db)):
+        # Like the auth lookup: the connection stays checked out afterwards
+        db.execute(text("SELECT 1"))
+        return USER
+
+    @app.get("/pooled")
+    def pooled(user=Depends(current_user), db: Session = Depends(database.get_db)):
+        db.execute(text("SELECT 1"))
+        time.sleep(ROUTE_QUERY_SECONDS)
+        return {"user_id": str(user.id)}
+
+    return app, engine.pool.size() + engine.pool._max_overflow
+
+
+async def run_pool_burst(app: FastAPI, requests: int, threads: int) -> dict:
+    """Send a burst of requests at once and count the ones that failed."""
+    to_thread.current_default_thread_limiter().total_tokens = threads
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.get("/pooled") for _ in range(requests))
+        )
+        elapsed = time.perf_counter() - start
+    return {
+        "failed": sum(response.status_code != 200 for response in responses),
+        "elapsed": elapsed,
+    }
+
+
+@pytest.mark.performance
+class TestPoolCheckoutUnderBurst:
+    """More concurrent requests than database connections."""
+
+    def test_burst_larger_than_the_pool_completes(self, monkeypatch):
+        # Arrange
+        app, connections = build_pool_app(monkeypatch)
+        requests = connections * POOL_BURST_FACTOR
+
+        # Act
+        result = asyncio.run(
+            run_pool_burst(app, requests, settings.THREADPOOL_MAX_WORKERS)
+        )
+
+        # Assert
+        print(f"\n{requests} requests over {connections} connections: {result}")
+        assert result["failed"] == 0
+        assert result["elapsed"] < POOL_TIMEOUT_SECONDS
+
+    def test_threads_sized_to_the_pool_stall_on_checkout(self, monkeypatch):
+        # With one thread per connection, the burst's auth lookups take every
+        # thread waiting for a connection, while the requests that hold the
+        # connections wait for a thread to run their route in
+        app, connections = build_pool_app(monkeypatch)
+        requests = connections * POOL_BURST_FACTOR
+
+        result = asyncio.run(run_pool_burst(app, requests, threads=connections))
+
+        print(f"\n{connections} threads for {requests} requests: {result}")
+        assert result["failed"] > 0
+        assert result["elapsed"] >= POOL_TIMEOUT_SECONDS
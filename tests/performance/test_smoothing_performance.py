@@ -0,0 +1,140 @@
+"""
+Performance tests for speaker boundary smoothing.
+
+Compares the reference and vectorized smoothing engines, and the pydantic and
+slotted-record pipelines, on an hour-long synthetic AssemblyAI payload.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Dict
+
+import pytest
+
+from coaching_assistant.services.transcript_smoother import (
+    EnglishProcessor,
+    EnglishSmoothingConfig,
+    SpeakerBoundarySmoother,
+    TranscriptInput,
+    TranscriptSmoothingService,
+)
+
+pytest.importorskip("numpy")
+
+from coaching_assistant.services.vectorized_smoother import (  # noqa: E402
+    VectorizedSpeakerBoundarySmoother,
+)
+
+VOCAB = [
+    "so",
+    "what",
+    "do",
+    "you",
+    "think",
+    "about",
+    "the",
+    "goal",
+    "um",
+    "uh",
+    "yeah",
+    "okay",
+    "right",
+    "really.",
+    "now?",
+]
+
+
+@contextmanager
+def measure_time():
+    """Context manager to measure execution time."""
+    start = time.perf_counter()
+    result = {"elapsed": 0}
+    try:
+        yield result
+    finally:
+        result["elapsed"] = time.perf_counter() - start
+
+
+def build_hour_long_transcript(seed: int = 42) -> Dict[str, Any]:
+    """Build a one-hour two-speaker payload with short interjections."""
+    rng = random.Random(seed)
+    utterances = []
+    clock = 0
+    index = 0
+
+    while clock < 60 * 60 * 1000:
+        words = []
+        for _ in range(rng.choice([1, 2, 4, 12, 30, 60])):
+            start = clock + rng.randint(0, 120)
+            end = start + rng.randint(120, 450)
+            words.append({"text": rng.choice(VOCAB), "start": start, "end": end})
+            clock = end
+        utterances.append(
+            {
+                "speaker": "AB"[index % 2],
+                "start": words[0]["start"],
+                "end": words[-1]["end"],
+                "confidence": 0.9,
+                "words": words,
+            }
+        )
+        clock += rng.randint(0, 800)
+        index += 1
+
+    return {"utterances": utterances}
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+class TestSmoothingPerformance:
+    """Benchmark the smoothing engines against each other."""
+
+    def test_vectorized_engine_on_hour_long_transcript(self):
+        utterances = TranscriptInput(**build_hour_long_transcript()).utterances
+
+        reference = SpeakerBoundarySmoother(
+            EnglishSmoothingConfig(), EnglishProcessor()
+        )
+        with measure_time() as reference_timer:
+            expected = reference.smooth_boundaries(list(utterances))
+
+        vectorized = VectorizedSpeakerBoundarySmoother(
+            EnglishSmoothingConfig(), EnglishProcessor()
+        )
+        with measure_time() as vectorized_timer:
+            actual = vectorized.smooth_boundaries(list(utterances))
+
+        word_count = sum(len(utterance.words) for utterance in utterances)
+        print(
+            f"\nSmoothed {len(utterances)} utterances / {word_count} words: "
+            f"reference {reference_timer['elapsed']:.3f}s, "
+            f"vectorized {vectorized_timer['elapsed']:.3f}s"
+        )
+
+        assert [u.model_dump() for u in actual] == [u.model_dump() for u in expected]
+        assert vectorized.stats == reference.stats
+        # An hour of audio should smooth well within a second on either engine
+        assert reference_timer["elapsed"] < 1.0
+        assert vectorized_timer["elapsed"] < 1.0
+
+    def test_fast_path_on_hour_long_transcript(self):
+        transcript = build_hour_long_transcript()
+        service = TranscriptSmoothingService()
+
+        with measure_time() as pydantic_timer:
+            expected = service.smooth_and_punctuate(transcript, language="english")
+        with measure_time() as fast_timer:
+            actual = service.smooth_and_punctuate_fast(transcript, language="english")
+
+        print(
+            f"\nSmoothed {len(expected.segments)} segments: "
+            f"pydantic path {pydantic_timer['elapsed']:.3f}s, "
+            f"fast path {fast_timer['elapsed']:.3f}s"
+        )
+
+        assert [segment.text for segment in actual.segments] == [
+            segment.text for segment in expected.segments
+        ]
+        assert actual.stats == expected.stats
+        assert fast_timer["elapsed"] < pydantic_timer["elapsed"]
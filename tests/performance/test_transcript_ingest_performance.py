@@ -0,0 +1,138 @@
+"""
+Performance tests for the transcript ingest engine.
+
+Fixtures are synthetic MS Teams, MacWhisper, Zoom and SRT transcripts built at
+sizes from 1 KB to 50 MB, so throughput can be compared across layouts and the
+engine can be checked to scale linearly with file size.
+"""
+
+import time
+from itertools import count
+from typing import Callable, Dict
+
+import pytest
+
+from coaching_assistant.cue_table import format_timestamp_ms
+from coaching_assistant.transcript_ingest import ingest_transcript, iter_segments
+
+KB = 1024
+MB = 1024 * KB
+
+LINES = [
+    "So what would you like to focus on today?",
+    "我想談談工作上的壓力，最近常常覺得很累。",
+    "What does a good outcome look like for you?",
+    "可能是找到一個比較平衡的節奏吧。",
+]
+SPEAKERS = ["Coach Chen", "Client Lin"]
+
+
+def _teams_cue(index: int, start: str, end: str) -> str:
+    speaker = SPEAKERS[index % 2]
+    return (
+        f"{index:08x}-{index}\n{start} --> {end}\n"
+        f"<v {speaker}>{LINES[index % 4]}</v>\n\n"
+    )
+
+
+def _macwhisper_cue(index: int, start: str, end: str) -> str:
+    return f"{start} --> {end}\n{SPEAKERS[index % 2]}: {LINES[index % 4]}\n\n"
+
+
+def _zoom_cue(index: int, start: str, end: str) -> str:
+    return f"{index}\n{start} --> {end}\n{SPEAKERS[index % 2]}: {LINES[index % 4]}\n\n"
+
+
+def _srt_cue(index: int, start: str, end: str) -> str:
+    start, end = start.replace(".", ","), end.replace(".", ",")
+    return f"{index}\n{start} --> {end}\n{SPEAKERS[index % 2]}: {LINES[index % 4]}\n\n"
+
+
+STYLES: Dict[str, Callable[[int, str, str], str]] = {
+    "teams": _teams_cue,
+    "macwhisper": _macwhisper_cue,
+    "zoom": _zoom_cue,
+    "srt": _srt_cue,
+}
+
+
+def build_transcript(style: str, size_bytes: int) -> bytes:
+    """Build a transcript of roughly size_bytes in the given layout."""
+    render = STYLES[style]
+    parts = [] if style == "srt" else [b"WEBVTT\n\n"]
+    total = sum(len(part) for part in parts)
+
+    for index in count(1):
+        start_ms = index * 3000
+        cue = render(
+            index, format_timestamp_ms(start_ms), format_timestamp_ms(start_ms + 2500)
+        ).encode("utf-8")
+        parts.append(cue)
+        total += len(cue)
+        if total >= size_bytes:
+            break
+
+    return b"".join(parts)
+
+
+def measure(data: bytes) -> Dict[str, float]:
+    """Ingest data once and return segment count and throughput."""
+    start = time.perf_counter()
+    segments = sum(1 for _ in iter_segments(data))
+    elapsed = time.perf_counter() - start
+    return {
+        "segments": segments,
+        "elapsed": elapsed,
+        "mb_per_second": len(data) / MB / max(elapsed, 1e-9),
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+class TestTranscriptIngestPerformance:
+    """Benchmark the ingest engine across layouts and file sizes."""
+
+    @pytest.mark.parametrize("style", sorted(STYLES))
+    @pytest.mark.parametrize("size_bytes", [1 * KB, 100 * KB, 1 * MB, 10 * MB])
+    def test_ingest_throughput(self, style, size_bytes):
+        # Arrange
+        data = build_transcript(style, size_bytes)
+
+        # Act
+        result = measure(data)
+
+        # Assert
+        print(
+            f"\n{style} {len(data) / KB:.0f} KB: {result['segments']} segments "
+            f"in {result['elapsed'] * 1000:.1f} ms "
+            f"({result['mb_per_second']:.1f} MB/s)"
+        )
+        assert result["segments"] == data.count(b"-->")
+        assert result["elapsed"] < max(0.05, len(data) / MB * 0.5)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("style", sorted(STYLES))
+    def test_fifty_megabyte_transcript(self, style):
+        data = build_transcript(style, 50 * MB)
+
+        result = measure(data)
+
+        print(
+            f"\n{style} 50 MB: {result['segments']} segments "
+            f"({result['mb_per_second']:.1f} MB/s)"
+        )
+        assert result["segments"] == data.count(b"-->")
+        assert result["elapsed"] < 25.0
+
+    def test_scales_linearly_with_size(self):
+        small = measure(build_transcript("zoom", 1 * MB))
+        large = measure(build_transcript("zoom", 8 * MB))
+
+        # Allow generous noise, but rule out quadratic behaviour
+        assert large["elapsed"] < small["elapsed"] * 8 * 3
+
+    def test_roles_resolved_for_every_layout(self):
+        for style in STYLES:
+            segments = ingest_transcript(build_transcript(style, 1 * KB))
+
+            assert {s.speaker_role for s in segments} == {"coach", "client"}
@@ -0,0 +1,152 @@
+"""
+Concurrency stress test for usage accounting.
+
+Parallel workers complete transcriptions for the same coach, each through
+its own database session the way Celery workers do. Every counter that
+create_usage_log touches must end up with the exact total: a
+read-modify-write anywhere on that path shows up as lost updates, and a
+monthly reset decided outside the database shows up as a second reset.
+
+The database is a SQLite file, so the workers hold separate connections
+and really contend for the write lock.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.infrastructure.db.bulk import bulk_insert
+from coaching_assistant.models import Base
+from coaching_assistant.models.session import Session as TranscriptionSession
+from coaching_assistant.models.usage_analytics import UsageAnalytics
+from coaching_assistant.models.usage_log import UsageLog
+from coaching_assistant.models.usage_rollup import UsageRollup
+from coaching_assistant.models.user import User, UserPlan
+from coaching_assistant.services.usage_tracking import UsageTrackingService
+
+WORKERS = 8
+LOGS_PER_WORKER = 25
+TOTAL_LOGS = WORKERS * LOGS_PER_WORKER
+SESSION_MINUTES = 10
+# Google STT at $0.016 per minute
+SESSION_COST_USD = Decimal("0.16")
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+
+@pytest.fixture
+def make_session(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'usage.db'}",
+        connect_args={"timeout": 60, "check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def coach(make_session):
+    """A coach with one session per worker, last reset in an earlier month."""
+    db = make_session()
+    user_id = uuid4()
+    session_ids = [uuid4() for _ in range(WORKERS)]
+    bulk_insert(
+        db,
+        User.__table__,
+        [
+            {
+                "id": user_id,
+                "email": "concurrent@example.com",
+                "name": "Concurrent Coach",
+                "plan": UserPlan.PRO,
+                "usage_minutes": 500,
+                "transcription_count": 50,
+                "current_month_start": datetime(2024, 1, 1, tzinfo=UTC),
+            }
+        ],
+    )
+    bulk_insert(
+        db,
+        TranscriptionSession.__table__,
+        [
+            {
+                "id": session_id,
+                "user_id": user_id,
+                "title": "Session",
+                "audio_filename": "session.mp3",
+                "duration_seconds": SESSION_MINUTES * 60,
+                "stt_provider": "google",
+            }
+            for session_id in session_ids
+        ],
+    )
+    db.commit()
+    db.close()
+    return user_id, session_ids
+
+
+def complete_transcriptions(make_session, session_id, start):
+    db = make_session()
+    start.wait()
+    try:
+        for _ in range(LOGS_PER_WORKER):
+            session = db.get(TranscriptionSession, session_id)
+            UsageTrackingService(db).create_usage_log(session)
+    finally:
+        db.close()
+
+
+def test_parallel_usage_logs_lose_no_updates(make_session, coach):
+    user_id, session_ids = coach
+    start = threading.Barrier(WORKERS)
+
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        workers = [
+            pool.submit(complete_transcriptions, make_session, session_id, start)
+            for session_id in session_ids
+        ]
+        for worker in workers:
+            worker.result()
+    elapsed = time.perf_counter() - began
+
+    print(
+        f"\n{TOTAL_LOGS} usage logs from {WORKERS} workers in {elapsed:.2f}s "
+        f"({TOTAL_LOGS / elapsed:,.0f} logs/s)"
+    )
+
+    db = make_session()
+    assert db.query(UsageLog).count() == TOTAL_LOGS
+
+    user = db.get(User, user_id)
+    assert user.transcription_count == TOTAL_LOGS
+    assert user.usage_minutes == TOTAL_LOGS * SESSION_MINUTES
+    assert user.total_transcriptions_generated == TOTAL_LOGS
+    assert user.total_minutes_processed == TOTAL_LOGS * SESSION_MINUTES
+    assert user.total_cost_usd == TOTAL_LOGS * SESSION_COST_USD
+    now = datetime.now(UTC)
+    assert (user.current_month_start.year, user.current_month_start.month) == (
+        now.year,
+        now.month,
+    )
+
+    analytics = db.query(UsageAnalytics).filter_by(user_id=user_id).one()
+    assert analytics.transcriptions_completed == TOTAL_LOGS
+    assert analytics.original_transcriptions == TOTAL_LOGS
+    assert analytics.google_stt_minutes == TOTAL_LOGS * SESSION_MINUTES
+    assert analytics.total_cost_usd == TOTAL_LOGS * SESSION_COST_USD
+
+    monthly = db.query(UsageRollup).filter_by(period_type="monthly").one()
+    assert monthly.transcriptions == TOTAL_LOGS
+    assert monthly.total_minutes == TOTAL_LOGS * SESSION_MINUTES
+    assert monthly.active_users == 1
+    assert monthly.new_users == 1
+    db.close()
@@ -0,0 +1,95 @@
+"""
+Unit tests for writing LeMUR punctuation results back to database segments.
+
+LeMUR is faked with an echo that marks every line it rewrites; everything
+between the endpoint and the LeMUR call (batch planning, splitting, response
+parsing and joining) runs for real.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import assemblyai as aai
+import pytest
+
+from coaching_assistant.api.v1 import transcript_smoothing
+from coaching_assistant.core.config import settings
+from coaching_assistant.services import lemur_transcript_smoother
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(aai, "Lemur"), reason="Installed assemblyai SDK has no LeMUR client"
+)
+
+# About 4,300 estimated tokens: over the 3,000 token batch budget, so the
+# planner splits it into two pieces that land in different batches
+LONG_TEXT = ("I want to focus on my goals for this week. " * 400).strip()
+
+
+def mark_lines(prompt, input_text, **kwargs):
+    lines = input_text.split("\n\n")
+    return SimpleNamespace(response="\n\n".join(f"{line} [ok]" for line in lines))
+
+
+@pytest.fixture
+def fake_lemur(monkeypatch):
+    lemur = MagicMock()
+    lemur.task.side_effect = mark_lines
+    monkeypatch.setattr(settings, "ASSEMBLYAI_API_KEY", "test_api_key")
+    monkeypatch.setattr(aai, "Lemur", lambda: lemur)
+    monkeypatch.setattr(lemur_transcript_smoother, "get_lemur_cache", lambda: None)
+    return lemur
+
+
+def make_db_segment(index, content):
+    return SimpleNamespace(
+        id=uuid4(),
+        speaker_id=index % 2 + 1,
+        start_seconds=index * 60.0,
+        end_seconds=index * 60.0 + 59.0,
+        content=content,
+    )
+
+
+def test_split_segment_followed_by_more_segments_writes_each_row(
+    fake_lemur, monkeypatch
+):
+    # Arrange
+    db_segments = [
+        make_db_segment(0, LONG_TEXT),
+        make_db_segment(1, "Sounds good."),
+        make_db_segment(2, "Where should we start?"),
+    ]
+    session = SimpleNamespace(language="en-US")
+    written = []
+    monkeypatch.setattr(
+        transcript_smoothing,
+        "_load_session_segments",
+        lambda session_id, user_id, db: (db_segments, session),
+    )
+    monkeypatch.setattr(
+        transcript_smoothing,
+        "_write_segment_changes",
+        lambda db, changes: written.extend(changes),
+    )
+
+    # Act
+    response = asyncio.run(
+        transcript_smoothing.lemur_punctuation_optimization_from_db(
+            session_id=str(uuid4()),
+            request=transcript_smoothing.DBProcessingRequest(),
+            current_user=SimpleNamespace(id=uuid4(), email="coach@example.com"),
+            db=None,
+        )
+    )
+
+    # Assert
+    assert fake_lemur.task.call_count == 2
+    contents = {change["id"]: change["content"] for change in written}
+    assert list(contents) == [segment.id for segment in db_segments]
+    assert contents[db_segments[0].id].count("[ok]") == 2
+    assert contents[db_segments[0].id].replace(" [ok]", "") == LONG_TEXT
+    assert contents[db_segments[1].id] == "Sounds good. [ok]"
+    assert contents[db_segments[2].id] == "Where should we start? [ok]"
+    assert len(response.segments) == 3
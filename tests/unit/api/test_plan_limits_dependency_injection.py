@@ -61,6 +61,13 @@ class TestDependencyInjectionCompatibility:
         assert hasattr(current_user_param.default, "dependency")
         assert current_user_param.default.dependency == get_current_user_dependency
 
+    def test_blocking_endpoints_run_in_the_threadpool(self):
+        """Quota and database calls must not run on the event loop."""
+        import inspect
+
+        for endpoint in (validate_action, get_current_usage, increment_usage):
+            assert not inspect.iscoroutinefunction(endpoint), endpoint.__name__
+
     def test_user_model_has_required_attributes(self):
         """Test that User model has all attributes required by plan limits."""
         user = User()
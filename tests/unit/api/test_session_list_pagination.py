@@ -0,0 +1,101 @@
+"""
+Unit tests for cursor pagination of the transcription session list.
+
+The retrieval use case is faked; the tests check how the endpoint chooses
+between keyset and OFFSET paging and where it returns the next cursor.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from coaching_assistant.api.v1 import sessions
+from coaching_assistant.api.v1.auth import get_current_user_dependency
+from coaching_assistant.core.models.session import SessionStatus
+from coaching_assistant.core.repositories.pagination import (
+    CursorPage,
+    InvalidCursorError,
+)
+
+USER = SimpleNamespace(id=uuid4())
+
+
+def make_session(title):
+    return SimpleNamespace(
+        id=uuid4(),
+        title=title,
+        status=SessionStatus.COMPLETED,
+        language="cmn-Hant-TW",
+        stt_provider="google",
+        audio_filename=f"{title}.mp3",
+        duration_seconds=600,
+        error_message=None,
+        stt_cost_usd=None,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1),
+    )
+
+
+class RetrievalUseCase:
+    def __init__(self, next_cursor=None):
+        self.next_cursor = next_cursor
+        self.calls = []
+
+    def get_user_sessions_page(self, user_id, status, cursor, limit):
+        self.calls.append(("page", cursor))
+        if cursor == "bad":
+            raise InvalidCursorError("Invalid pagination cursor")
+        return CursorPage(items=[make_session("page")], next_cursor=self.next_cursor)
+
+    def get_user_sessions(self, user_id, status, limit, offset):
+        self.calls.append(("offset", offset))
+        return [make_session("offset")]
+
+
+def build_client(use_case):
+    app = FastAPI()
+    app.include_router(sessions.router, prefix="/api/v1/sessions")
+    app.dependency_overrides.update(
+        {
+            get_current_user_dependency: lambda: USER,
+            sessions.get_session_retrieval_use_case: lambda: use_case,
+        }
+    )
+    return TestClient(app)
+
+
+class TestListSessions:
+    def test_next_cursor_is_returned_in_the_body(self):
+        use_case = RetrievalUseCase(next_cursor="abc")
+
+        response = build_client(use_case).get("/api/v1/sessions?limit=1")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["next_cursor"] == "abc"
+        assert [item["title"] for item in body["items"]] == ["page"]
+        assert "x-next-cursor" not in response.headers
+
+    def test_cursor_requests_use_keyset_paging(self):
+        use_case = RetrievalUseCase()
+
+        body = build_client(use_case).get("/api/v1/sessions?cursor=abc").json()
+
+        assert use_case.calls == [("page", "abc")]
+        assert body["next_cursor"] is None
+
+    def test_offset_without_cursor_has_no_next_cursor(self):
+        use_case = RetrievalUseCase(next_cursor="abc")
+
+        body = build_client(use_case).get("/api/v1/sessions?offset=50").json()
+
+        assert use_case.calls == [("offset", 50)]
+        assert body["next_cursor"] is None
+
+    def test_invalid_cursor_is_a_bad_request(self):
+        response = build_client(RetrievalUseCase()).get("/api/v1/sessions?cursor=bad")
+
+        assert response.status_code == 400
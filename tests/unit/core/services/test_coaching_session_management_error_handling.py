@@ -210,6 +210,38 @@ class TestCoachingSessionRetrievalErrorHandling:
             coach_id, from_date, to_date, client_id, currency, "-session_date", 2, 15
         )
 
+    def test_sessions_with_response_data_loads_summaries_in_one_call(
+        self, use_case, mock_repos
+    ):
+        """Test that summaries come from the joined query, not per-session lookups."""
+        # Arrange
+        coach_id = uuid4()
+        mock_repos["user_repo"].get_by_id.return_value = Mock(spec=User)
+        rows = [
+            {
+                "session": Mock(spec=CoachingSession),
+                "client_summary": {"id": uuid4(), "name": "A", "is_anonymized": False},
+                "transcription_session_summary": None,
+            }
+            for _ in range(3)
+        ]
+        mock_repos["session_repo"].get_paginated_with_summaries.return_value = (
+            rows,
+            23,
+        )
+
+        # Act
+        sessions_with_data, total, total_pages = (
+            use_case.get_sessions_with_response_data(coach_id, page_size=10)
+        )
+
+        # Assert
+        assert sessions_with_data == rows
+        assert total == 23
+        assert total_pages == 3
+        mock_repos["client_repo"].get_by_id.assert_not_called()
+        mock_repos["transcription_session_repo"].get_by_id.assert_not_called()
+
 
 class TestCoachingSessionCreationErrorHandling:
     """Test error handling in CoachingSessionCreationUseCase."""
@@ -9,7 +9,7 @@ from datetime import date, datetime, timezone
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from src.coaching_assistant.core.models.coaching_session import (
@@ -20,12 +20,18 @@ from src.coaching_assistant.infrastructure.db.repositories.coaching_session_repo
     SQLAlchemyCoachingSessionRepository,
 )
 from src.coaching_assistant.models import Base
+from src.coaching_assistant.models.client import Client as ORMClient
 from src.coaching_assistant.models.coaching_session import (
     CoachingSession as ORMCoachingSession,
 )
 from src.coaching_assistant.models.coaching_session import (
     SessionSource as ORMSessionSource,
 )
+from src.coaching_assistant.models.session import Session as ORMTranscriptionSession
+from src.coaching_assistant.models.session import SessionStatus as ORMSessionStatus
+from src.coaching_assistant.models.transcript import (
+    TranscriptSegment as ORMTranscriptSegment,
+)
 
 
 @pytest.fixture
@@ -333,3 +339,107 @@ class TestDeletionScenarios:
 
         assert retrieved_deleted.transcript_deleted_at is not None
         assert retrieved_deleted.saved_speaking_stats is not None
+
+
+class TestPaginatedWithSummaries:
+    """Test the single-query session list with client and transcript summaries."""
+
+    @pytest.fixture
+    def coach_id(self, db_session):
+        """Seed three sessions for one coach, two of them with transcripts."""
+        coach_id = uuid4()
+        client = ORMClient(id=uuid4(), user_id=coach_id, name="王小明")
+        db_session.add(client)
+
+        for day in range(1, 4):
+            transcription_session_id = None
+            if day < 3:
+                transcription_session = ORMTranscriptionSession(
+                    id=uuid4(),
+                    user_id=coach_id,
+                    title=f"Session {day}",
+                    status=ORMSessionStatus.COMPLETED,
+                )
+                db_session.add(transcription_session)
+                transcription_session_id = transcription_session.id
+                for index in range(day):
+                    db_session.add(
+                        ORMTranscriptSegment(
+                            id=uuid4(),
+                            session_id=transcription_session_id,
+                            speaker_id=1,
+                            start_seconds=index,
+                            end_seconds=index + 1,
+                            content="你好",
+                        )
+                    )
+            db_session.add(
+                ORMCoachingSession(
+                    id=uuid4(),
+                    user_id=coach_id,
+                    client_id=client.id,
+                    session_date=date(2025, 1, day),
+                    source=ORMSessionSource.CLIENT,
+                    duration_min=60,
+                    fee_currency="TWD",
+                    fee_amount=3000,
+                    transcription_session_id=transcription_session_id,
+                )
+            )
+        db_session.commit()
+        return coach_id
+
+    @pytest.fixture
+    def statements(self, db_session):
+        """Record the SQL statements issued through the session's engine."""
+        executed = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        yield executed
+        event.remove(engine, "before_cursor_execute", record)
+
+    def test_page_with_summaries_in_one_query(self, repository, coach_id, statements):
+        # Act
+        rows, total = repository.get_paginated_with_summaries(coach_id, page_size=2)
+
+        # Assert
+        assert len(statements) == 1
+        assert total == 3
+        assert [row["session"].session_date.day for row in rows] == [3, 2]
+        assert rows[0]["client_summary"]["name"] == "王小明"
+        assert rows[0]["transcription_session_summary"] is None
+        assert rows[1]["transcription_session_summary"]["title"] == "Session 2"
+        assert rows[1]["transcription_session_summary"]["status"] == "completed"
+        assert rows[1]["transcription_session_summary"]["segments_count"] == 2
+
+    def test_total_can_be_skipped(self, repository, coach_id):
+        rows, total = repository.get_paginated_with_summaries(
+            coach_id, include_total=False
+        )
+
+        assert total is None
+        assert len(rows) == 3
+
+    def test_page_past_the_end_still_reports_total(self, repository, coach_id):
+        rows, total = repository.get_paginated_with_summaries(
+            coach_id, page=5, page_size=2
+        )
+
+        assert rows == []
+        assert total == 3
+
+    def test_matches_paginated_with_filters(self, repository, coach_id):
+        sessions, expected_total = repository.get_paginated_with_filters(
+            coach_id, sort="session_date", from_date=date(2025, 1, 2)
+        )
+
+        rows, total = repository.get_paginated_with_summaries(
+            coach_id, sort="session_date", from_date=date(2025, 1, 2)
+        )
+
+        assert [row["session"] for row in rows] == sessions
+        assert total == expected_total
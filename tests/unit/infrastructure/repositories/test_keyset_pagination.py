@@ -0,0 +1,281 @@
+"""Unit tests for keyset (cursor) pagination in the list repositories.
+
+Each list is seeded with rows that share their sort value, so walking the
+pages checks that the id tiebreaker neither drops nor repeats rows.
+"""
+
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.coaching_assistant.core.repositories.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from src.coaching_assistant.infrastructure.db.repositories.client_repository import (
+    SQLAlchemyClientRepository,
+)
+from src.coaching_assistant.infrastructure.db.repositories.coaching_session_repository import (
+    SQLAlchemyCoachingSessionRepository,
+)
+from src.coaching_assistant.infrastructure.db.repositories.session_repository import (
+    SQLAlchemySessionRepository,
+)
+from src.coaching_assistant.models import Base
+from src.coaching_assistant.models.client import Client as ORMClient
+from src.coaching_assistant.models.coaching_session import (
+    CoachingSession as ORMCoachingSession,
+)
+from src.coaching_assistant.models.coaching_session import (
+    SessionSource as ORMSessionSource,
+)
+from src.coaching_assistant.models.session import Session as ORMTranscriptionSession
+from src.coaching_assistant.models.session import SessionStatus as ORMSessionStatus
+
+
+@pytest.fixture
+def db_session():
+    """Create an in-memory SQLite database for testing."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+def walk(fetch_page):
+    """Follow next_cursor from the first page and collect every page."""
+    pages = [fetch_page(None)]
+    while pages[-1].next_cursor:
+        pages.append(fetch_page(pages[-1].next_cursor))
+    return pages
+
+
+class TestCursorCodec:
+    """Opaque cursor encoding and validation."""
+
+    def test_round_trip(self):
+        session_id = uuid4()
+        cursor = encode_cursor("-session_date", [date(2025, 1, 2), session_id])
+
+        values = decode_cursor(
+            cursor, "-session_date", [date.fromisoformat, type(session_id)]
+        )
+
+        assert values == [date(2025, 1, 2), session_id]
+        assert "=" not in cursor
+
+    def test_cursor_for_another_sort_is_rejected(self):
+        cursor = encode_cursor("fee", ["TWD", 3000, str(uuid4())])
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "session_date", [str, str])
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "W10"])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "name", [str, str])
+
+
+class TestCoachingSessionKeysetPagination:
+    """Cursor pages of the coaching session list."""
+
+    @pytest.fixture
+    def coach_id(self, db_session):
+        """Seed seven sessions over three dates and two fees."""
+        coach_id = uuid4()
+        client = ORMClient(id=uuid4(), user_id=coach_id, name="王小明")
+        db_session.add(client)
+        for index in range(7):
+            db_session.add(
+                ORMCoachingSession(
+                    id=uuid4(),
+                    user_id=coach_id,
+                    client_id=client.id,
+                    session_date=date(2025, 1, 1 + index % 3),
+                    source=ORMSessionSource.CLIENT,
+                    duration_min=60,
+                    fee_currency="TWD",
+                    fee_amount=1000 * (1 + index % 2),
+                )
+            )
+        db_session.commit()
+        return coach_id
+
+    @pytest.mark.parametrize("sort", ["-session_date", "session_date", "-fee", "fee"])
+    def test_pages_match_offset_order(self, db_session, coach_id, sort):
+        # Arrange
+        repository = SQLAlchemyCoachingSessionRepository(db_session)
+        expected, _ = repository.get_paginated_with_filters(
+            coach_id, sort=sort, page_size=100
+        )
+
+        # Act
+        pages = walk(
+            lambda cursor: repository.get_cursor_page_with_summaries(
+                coach_id, sort=sort, cursor=cursor, page_size=3
+            )
+        )
+
+        # Assert
+        ids = [row["session"].id for page in pages for row in page.items]
+        assert ids == [session.id for session in expected]
+        assert [len(page.items) for page in pages] == [3, 3, 1]
+
+    def test_total_on_first_and_later_pages(self, db_session, coach_id):
+        repository = SQLAlchemyCoachingSessionRepository(db_session)
+
+        first = repository.get_cursor_page_with_summaries(
+            coach_id, page_size=3, include_total=True
+        )
+        second = repository.get_cursor_page_with_summaries(
+            coach_id, cursor=first.next_cursor, page_size=3, include_total=True
+        )
+
+        assert (first.total, second.total) == (7, 7)
+        assert first.items[0]["client_summary"]["name"] == "王小明"
+
+    def test_total_is_optional(self, db_session, coach_id):
+        repository = SQLAlchemyCoachingSessionRepository(db_session)
+
+        page = repository.get_cursor_page_with_summaries(coach_id, page_size=3)
+
+        assert page.total is None
+
+    def test_filters_apply_to_later_pages(self, db_session, coach_id):
+        repository = SQLAlchemyCoachingSessionRepository(db_session)
+
+        pages = walk(
+            lambda cursor: repository.get_cursor_page_with_summaries(
+                coach_id, from_date=date(2025, 1, 2), cursor=cursor, page_size=2
+            )
+        )
+
+        dates = [row["session"].session_date for page in pages for row in page.items]
+        assert len(dates) == 4
+        assert min(dates) == date(2025, 1, 2)
+
+    def test_cursor_from_other_sort_is_rejected(self, db_session, coach_id):
+        repository = SQLAlchemyCoachingSessionRepository(db_session)
+        page = repository.get_cursor_page_with_summaries(coach_id, page_size=3)
+
+        with pytest.raises(InvalidCursorError):
+            repository.get_cursor_page_with_summaries(
+                coach_id, sort="fee", cursor=page.next_cursor
+            )
+
+
+class TestClientKeysetPagination:
+    """Cursor pages of the client list."""
+
+    @pytest.fixture
+    def coach_id(self, db_session):
+        """Seed clients whose names repeat."""
+        coach_id = uuid4()
+        for index in range(9):
+            db_session.add(
+                ORMClient(
+                    id=uuid4(),
+                    user_id=coach_id,
+                    name=f"Client {index % 4}",
+                    email=f"client{index}@example.com",
+                )
+            )
+        db_session.add(ORMClient(id=uuid4(), user_id=uuid4(), name="Client 0"))
+        db_session.commit()
+        return coach_id
+
+    def test_pages_match_offset_order(self, db_session, coach_id):
+        # Arrange
+        repository = SQLAlchemyClientRepository(db_session)
+        expected, total = repository.get_clients_paginated(coach_id, page_size=100)
+
+        # Act
+        pages = walk(
+            lambda cursor: repository.get_clients_cursor_page(
+                coach_id, cursor=cursor, page_size=4, include_total=True
+            )
+        )
+
+        # Assert
+        ids = [client.id for page in pages for client in page.items]
+        assert ids == [client.id for client in expected]
+        assert len(set(ids)) == total == 9
+        assert {page.total for page in pages} == {9}
+
+    def test_search_applies_to_later_pages(self, db_session, coach_id):
+        repository = SQLAlchemyClientRepository(db_session)
+
+        pages = walk(
+            lambda cursor: repository.get_clients_cursor_page(
+                coach_id, query="Client 1", cursor=cursor, page_size=1
+            )
+        )
+
+        assert [len(page.items) for page in pages] == [1, 1]
+        assert all(page.total is None for page in pages)
+
+
+class TestSessionKeysetPagination:
+    """Cursor pages of the transcription session list."""
+
+    @pytest.fixture
+    def user_id(self, db_session):
+        """Seed sessions that share creation timestamps."""
+        user_id = uuid4()
+        for index in range(8):
+            db_session.add(
+                ORMTranscriptionSession(
+                    id=uuid4(),
+                    user_id=user_id,
+                    title=f"Session {index}",
+                    status=(
+                        ORMSessionStatus.COMPLETED
+                        if index % 2
+                        else ORMSessionStatus.FAILED
+                    ),
+                    created_at=datetime(2025, 1, 1 + index // 3, 9, 30, 15, 250000),
+                )
+            )
+        db_session.commit()
+        return user_id
+
+    def test_pages_match_offset_order(self, db_session, user_id):
+        # Arrange
+        repository = SQLAlchemySessionRepository(db_session)
+        expected = repository.get_by_user_id(user_id, limit=100)
+
+        # Act
+        pages = walk(
+            lambda cursor: repository.get_page_by_user_id(
+                user_id, cursor=cursor, limit=3
+            )
+        )
+
+        # Assert
+        ids = [session.id for page in pages for session in page.items]
+        assert ids == [session.id for session in expected]
+        assert len(set(ids)) == 8
+        assert pages[0].items[0].created_at >= pages[-1].items[-1].created_at
+
+    def test_status_filter_applies_to_later_pages(self, db_session, user_id):
+        repository = SQLAlchemySessionRepository(db_session)
+
+        pages = walk(
+            lambda cursor: repository.get_page_by_user_id(
+                user_id, status=ORMSessionStatus.COMPLETED, cursor=cursor, limit=3
+            )
+        )
+
+        assert [len(page.items) for page in pages] == [3, 1]
+
+    def test_invalid_cursor_is_rejected(self, db_session, user_id):
+        repository = SQLAlchemySessionRepository(db_session)
+
+        with pytest.raises(InvalidCursorError):
+            repository.get_page_by_user_id(user_id, cursor="garbage")
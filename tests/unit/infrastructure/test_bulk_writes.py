@@ -0,0 +1,222 @@
+"""Unit tests for bulk transcript segment inserts and updates."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.coaching_assistant.core.models.transcript import TranscriptSegment
+from src.coaching_assistant.infrastructure.db.bulk import (
+    _copy_value,
+    bulk_insert,
+    bulk_update,
+)
+from src.coaching_assistant.infrastructure.db.models.base import Base as InfraBase
+from src.coaching_assistant.infrastructure.db.models.transcript_model import (
+    TranscriptSegmentModel,
+)
+from src.coaching_assistant.infrastructure.db.repositories.transcript_repository import (
+    TranscriptRepository,
+)
+from src.coaching_assistant.models import Base
+from src.coaching_assistant.models.transcript import (
+    TranscriptSegment as ORMTranscriptSegment,
+)
+from src.coaching_assistant.tasks.transcription_tasks import (
+    _calculate_actual_duration,
+    _save_transcript_segments,
+)
+
+
+def make_session(base):
+    engine = create_engine("sqlite:///:memory:")
+    base.metadata.create_all(engine)
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0])
+
+    return sessionmaker(bind=engine)(), statements
+
+
+def stt_segments(count):
+    return [
+        SimpleNamespace(
+            speaker_id=index % 2 + 1,
+            start_seconds=index * 2.0,
+            end_seconds=index * 2.0 + 1.5,
+            content=f"第 {index} 句",
+            confidence=None if index % 3 else 0.9,
+        )
+        for index in range(count)
+    ]
+
+
+class TestBulkInsert:
+    def test_rows_come_back_with_client_side_defaults(self):
+        db, statements = make_session(Base)
+        session_id = uuid4()
+
+        rows = bulk_insert(
+            db,
+            ORMTranscriptSegment.__table__,
+            [
+                {
+                    "session_id": session_id,
+                    "speaker_id": 1,
+                    "start_seconds": 0.0,
+                    "end_seconds": 1.0,
+                    "content": "hello",
+                }
+            ],
+        )
+
+        assert isinstance(rows[0]["id"], UUID)
+        assert rows[0]["created_at"] is not None
+        assert rows[0]["confidence"] is None
+        assert statements == ["INSERT"]
+        assert db.get(ORMTranscriptSegment, rows[0]["id"]).content == "hello"
+
+    def test_nothing_to_insert_skips_the_database(self):
+        db, statements = make_session(Base)
+
+        assert bulk_insert(db, ORMTranscriptSegment.__table__, []) == []
+        assert statements == []
+
+    def test_copy_values_escape_text_format_specials(self):
+        assert _copy_value(None) == "\\N"
+        assert _copy_value(True) == "t"
+        assert _copy_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+        assert _copy_value(1.5) == "1.5"
+
+
+class TestTranscriptionTaskSegments:
+    def test_segments_are_saved_in_one_statement(self):
+        db, statements = make_session(Base)
+        session_id = uuid4()
+
+        _save_transcript_segments(db, session_id, stt_segments(1200))
+        db.commit()
+
+        assert statements == ["INSERT"]
+        assert db.query(ORMTranscriptSegment).count() == 1200
+
+    def test_actual_duration_comes_from_the_last_segment_end(self):
+        assert _calculate_actual_duration(stt_segments(3)) == 5
+        assert _calculate_actual_duration([]) == 0
+
+
+class TestRepositorySaveSegments:
+    def test_save_returns_segments_without_reading_them_back(self):
+        db, statements = make_session(InfraBase)
+        session_id = uuid4()
+        kept_id = uuid4()
+        segments = [
+            TranscriptSegment(
+                id=kept_id if index == 0 else None,
+                session_id=session_id,
+                speaker_id=1,
+                start_seconds=float(index),
+                end_seconds=index + 0.5,
+                content=f"segment {index}",
+                confidence=0.8,
+            )
+            for index in range(50)
+        ]
+
+        saved = TranscriptRepository(db).save_segments(segments)
+
+        assert statements == ["INSERT"]
+        assert saved[0].id == kept_id
+        assert all(segment.id and segment.created_at for segment in saved)
+        assert db.query(TranscriptSegmentModel).count() == 50
+
+    def test_empty_save(self):
+        db, _ = make_session(InfraBase)
+
+        assert TranscriptRepository(db).save_segments([]) == []
+
+
+def seed_segments(db, count):
+    """Insert segments with an old updated_at and return their ids."""
+    session_id = uuid4()
+    rows = bulk_insert(
+        db,
+        TranscriptSegmentModel.__table__,
+        [
+            {
+                "session_id": session_id,
+                "speaker_id": 1,
+                "start_seconds": float(index),
+                "end_seconds": index + 0.5,
+                "content": f"segment {index}",
+                "updated_at": datetime(2024, 1, 1),
+            }
+            for index in range(count)
+        ],
+    )
+    db.commit()
+    return session_id, [row["id"] for row in rows]
+
+
+class TestBulkUpdate:
+    def test_diff_is_applied_in_one_statement(self):
+        db, statements = make_session(InfraBase)
+        _, ids = seed_segments(db, 5)
+        statements.clear()
+
+        bulk_update(
+            db,
+            TranscriptSegmentModel.__table__,
+            [{"id": ids[1], "speaker_id": 2}, {"id": ids[3], "speaker_id": 2}],
+        )
+        db.commit()
+
+        assert statements == ["UPDATE"]
+        stored = {segment.id: segment for segment in db.query(TranscriptSegmentModel)}
+        assert [stored[segment_id].speaker_id for segment_id in ids] == [1, 2, 1, 2, 1]
+        assert stored[ids[1]].updated_at > datetime(2024, 1, 1)
+        assert stored[ids[0]].updated_at == datetime(2024, 1, 1)
+
+    def test_empty_diff_skips_the_database(self):
+        db, statements = make_session(InfraBase)
+
+        bulk_update(db, TranscriptSegmentModel.__table__, [])
+
+        assert statements == []
+
+
+class TestRepositoryUpdateSegmentContent:
+    def test_only_changed_segments_are_written(self):
+        db, statements = make_session(InfraBase)
+        session_id, ids = seed_segments(db, 3)
+        repository = TranscriptRepository(db)
+        segments = repository.get_by_session_id(session_id)
+        segments[2].content = "segment 2, revised"
+        statements.clear()
+
+        repository.update_segment_content(session_id, segments)
+        db.commit()
+
+        assert statements == ["SELECT", "UPDATE"]
+        stored = {segment.id: segment for segment in db.query(TranscriptSegmentModel)}
+        assert stored[ids[2]].content == "segment 2, revised"
+        assert stored[ids[0]].updated_at == datetime(2024, 1, 1)
+
+    def test_unknown_segment_is_rejected(self):
+        db, _ = make_session(InfraBase)
+        session_id, _ = seed_segments(db, 1)
+        stranger = TranscriptSegment(
+            id=uuid4(),
+            session_id=session_id,
+            start_seconds=0.0,
+            end_seconds=1.0,
+            content="not stored",
+        )
+
+        with pytest.raises(ValueError, match="Segments not found"):
+            TranscriptRepository(db).update_segment_content(session_id, [stranger])
@@ -0,0 +1,121 @@
+"""
+Local fake of the AssemblyAI v2 REST API for tests.
+
+Serves the endpoints AssemblyAIProvider uses (upload, submit, fetch) over
+real HTTP on a free localhost port, so the provider runs unmodified against
+``FakeAssemblyAIServer.base_url``. Jobs stay "processing" until a test calls
+complete() or fail(), which return the webhook AssemblyAI would send.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+
+
+class FakeAssemblyAIServer:
+    """In-process AssemblyAI API; use as a context manager."""
+
+    def __init__(self, api_key="test-key"):
+        self.api_key = api_key
+        self.transcripts = {}
+        self.submissions = []
+        self.fetches = 0
+        self._ids = count(1)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v2"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def complete(self, transcript_id, **result):
+        """Finish a job with the given transcript fields; return its webhook."""
+        self.transcripts[transcript_id].update(status="completed", **result)
+        return self.webhook(transcript_id)
+
+    def fail(self, transcript_id, error):
+        """Fail a job with an AssemblyAI error message; return its webhook."""
+        self.transcripts[transcript_id].update(status="error", error=error)
+        return self.webhook(transcript_id)
+
+    def webhook(self, transcript_id):
+        """The request AssemblyAI would POST to the job's webhook_url."""
+        request = self.transcripts[transcript_id]["request"]
+        headers = {}
+        if request.get("webhook_auth_header_name"):
+            headers[request["webhook_auth_header_name"]] = request[
+                "webhook_auth_header_value"
+            ]
+        return {
+            "url": request.get("webhook_url"),
+            "headers": headers,
+            "json": {
+                "transcript_id": transcript_id,
+                "status": self.transcripts[transcript_id]["status"],
+            },
+        }
+
+    def _submit(self, request):
+        transcript_id = f"fake-transcript-{next(self._ids)}"
+        self.submissions.append(request)
+        self.transcripts[transcript_id] = {
+            "id": transcript_id,
+            "status": "processing",
+            "request": request,
+        }
+        return {"id": transcript_id, "status": "queued"}
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if not self._authorized():
+                    return
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.path == "/v2/upload":
+                    self._send(200, {"upload_url": f"{fake.base_url}/files/audio"})
+                elif self.path == "/v2/transcript":
+                    self._send(200, fake._submit(json.loads(body)))
+                else:
+                    self._send(404, {"error": "Not found"})
+
+            def do_GET(self):
+                if not self._authorized():
+                    return
+                fake.fetches += 1
+                transcript_id = self.path.rsplit("/", 1)[-1]
+                transcript = fake.transcripts.get(transcript_id)
+                if not self.path.startswith("/v2/transcript/") or transcript is None:
+                    self._send(404, {"error": "Transcript not found"})
+                    return
+                self._send(200, {k: v for k, v in transcript.items() if k != "request"})
+
+            def _authorized(self):
+                if self.headers.get("authorization") == fake.api_key:
+                    return True
+                self._send(401, {"error": "Authentication error"})
+                return False
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,353 @@
+"""
+Unit tests for the webhook-driven AssemblyAI pipeline.
+
+Runs the provider against a local fake AssemblyAI server, checks the webhook
+endpoint only queues verified notifications, and drives the submit and
+completion tasks against an in-memory database.
+"""
+
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.api.webhooks import assemblyai as assemblyai_webhook
+from coaching_assistant.models import Base
+from coaching_assistant.models.processing_status import ProcessingStatus
+from coaching_assistant.models.session import Session as SessionModel
+from coaching_assistant.models.session import SessionStatus
+from coaching_assistant.models.transcript import TranscriptSegment
+from coaching_assistant.models.user import User
+from coaching_assistant.services import assemblyai_stt
+from coaching_assistant.services.assemblyai_stt import AssemblyAIProvider
+from coaching_assistant.services.stt_provider import (
+    STTProviderError,
+    STTProviderUnavailableError,
+)
+from coaching_assistant.tasks import transcription_tasks
+from coaching_assistant.tasks.transcription_tasks import (
+    ASSEMBLYAI_JOB_KEY,
+    complete_assemblyai_transcription,
+    transcribe_audio,
+)
+
+from .fake_assemblyai import FakeAssemblyAIServer
+
+WEBHOOK_URL = "https://api.example.com/api/webhooks/assemblyai"
+SECRET = "webhook-secret"
+
+UTTERANCES = [
+    {"speaker": "A", "start": 0, "end": 4000, "text": "How was your week?"},
+    {"speaker": "B", "start": 4000, "end": 9500, "text": "Busy but good."},
+]
+
+
+@pytest.fixture(autouse=True)
+def assemblyai_settings(monkeypatch):
+    settings = assemblyai_stt.settings
+    monkeypatch.setattr(settings, "ASSEMBLYAI_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "ASSEMBLYAI_WEBHOOK_URL", WEBHOOK_URL)
+    monkeypatch.setattr(settings, "ASSEMBLYAI_WEBHOOK_SECRET", SECRET)
+    return settings
+
+
+@pytest.fixture
+def fake():
+    with FakeAssemblyAIServer() as server:
+        yield server
+
+
+@pytest.fixture
+def provider(fake):
+    return AssemblyAIProvider(base_url=fake.base_url)
+
+
+def complete_english(fake, transcript_id):
+    return fake.complete(
+        transcript_id,
+        language_code="en",
+        audio_duration=9.5,
+        utterances=UTTERANCES,
+    )
+
+
+class TestProviderAgainstFakeServer:
+    def test_submit_registers_webhook_with_secret(self, fake, provider):
+        transcript_id = provider.submit_transcription(
+            "https://cdn.example.com/a.mp3", "en-US", webhook_url=WEBHOOK_URL
+        )
+
+        request = fake.transcripts[transcript_id]["request"]
+        assert request["webhook_url"] == WEBHOOK_URL
+        assert request["webhook_auth_header_value"] == SECRET
+        assert request["speaker_labels"] is True
+
+    def test_fetch_returns_none_until_completed(self, fake, provider):
+        transcript_id = provider.submit_transcription(
+            "https://cdn.example.com/a.mp3", "en-US"
+        )
+
+        assert provider.fetch_transcription_result(transcript_id, "en-US") is None
+
+        complete_english(fake, transcript_id)
+        result = provider.fetch_transcription_result(transcript_id, "en-US")
+
+        assert [s.speaker_id for s in result.segments] == [1, 2]
+        assert result.provider_metadata["transcript_id"] == transcript_id
+
+    def test_fetch_of_failed_job_raises(self, fake, provider):
+        transcript_id = provider.submit_transcription("https://cdn.example.com/a.mp3")
+        fake.fail(transcript_id, "Server error, developers have been alerted")
+
+        with pytest.raises(STTProviderError, match="temporary server error"):
+            provider.fetch_transcription_result(transcript_id)
+
+    def test_unreachable_api_is_retryable(self, fake):
+        with FakeAssemblyAIServer() as stopped:
+            base_url = stopped.base_url
+        provider = AssemblyAIProvider(base_url=base_url)
+
+        with pytest.raises(STTProviderUnavailableError):
+            provider.fetch_transcription_result("fake-transcript-1")
+
+
+class TestWebhookEndpoint:
+    @pytest.fixture
+    def queued(self, monkeypatch):
+        calls = []
+
+        class RecordingTask:
+            def delay(self, *args):
+                calls.append(args)
+
+        monkeypatch.setattr(
+            assemblyai_webhook, "complete_assemblyai_transcription", RecordingTask()
+        )
+        return calls
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(assemblyai_webhook.router, prefix="/api/webhooks")
+        return TestClient(app)
+
+    def post(self, client, session_id, status, secret=SECRET):
+        return client.post(
+            f"/api/webhooks/assemblyai?session_id={session_id}",
+            json={"transcript_id": "t1", "status": status},
+            headers={AssemblyAIProvider.WEBHOOK_AUTH_HEADER: secret},
+        )
+
+    def test_completed_job_is_queued_for_fetch(self, client, queued):
+        session_id = uuid4()
+
+        response = self.post(client, session_id, "completed")
+
+        assert response.json() == {"status": "queued"}
+        assert queued == [(str(session_id), "t1")]
+
+    def test_wrong_secret_is_rejected(self, client, queued):
+        response = self.post(client, uuid4(), "completed", secret="guess")
+
+        assert response.status_code == 401
+        assert queued == []
+
+    def test_unfinished_status_is_ignored(self, client, queued):
+        response = self.post(client, uuid4(), "processing")
+
+        assert response.json() == {"status": "ignored"}
+        assert queued == []
+
+
+@pytest.fixture
+def db_factory(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def get_db_session():
+        db = factory()
+        try:
+            yield db
+            db.commit()
+        finally:
+            db.close()
+
+    monkeypatch.setattr(transcription_tasks, "get_db_session", get_db_session)
+    monkeypatch.setattr(transcription_tasks, "get_progress_broker", lambda: None)
+    return factory
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    """Record rechecks the completion task schedules instead of queueing them."""
+    calls = []
+    monkeypatch.setattr(
+        complete_assemblyai_transcription,
+        "apply_async",
+        lambda args, kwargs=None, **options: calls.append((args, options)),
+    )
+    return calls
+
+
+@pytest.fixture
+def use_fake(monkeypatch, provider):
+    monkeypatch.setattr(
+        transcription_tasks.STTProviderFactory,
+        "create",
+        lambda *args, **kwargs: provider,
+    )
+
+
+def create_session(factory, status=SessionStatus.UPLOADING, job=None):
+    db = factory()
+    session_id = uuid4()
+    user = User(id=uuid4(), email=f"{uuid4()}@example.com", name="Coach")
+    session = SessionModel(
+        id=session_id,
+        title="Weekly coaching",
+        user_id=user.id,
+        status=status,
+        stt_provider="assemblyai",
+        provider_metadata={ASSEMBLYAI_JOB_KEY: job} if job else {},
+    )
+    db.add_all([user, session])
+    if job:
+        db.add(
+            ProcessingStatus(session_id=session_id, status="processing", progress=30)
+        )
+    db.commit()
+    db.close()
+    return session_id
+
+
+def submitted_job(transcript_id, minutes_ago=1, resubmissions=0):
+    submitted_at = datetime.now(UTC) - timedelta(minutes=minutes_ago)
+    return {
+        "transcript_id": transcript_id,
+        "audio_uri": "https://cdn.example.com/a.mp3",
+        "language": "en-US",
+        "enable_diarization": True,
+        "submitted_at": submitted_at.isoformat(),
+        "resubmissions": resubmissions,
+    }
+
+
+def complete(session_id, transcript_id, recheck=False):
+    return complete_assemblyai_transcription.apply(
+        args=(str(session_id), transcript_id), kwargs={"recheck": recheck}
+    ).get()
+
+
+@pytest.mark.usefixtures("use_fake")
+class TestSplitPipeline:
+    def test_transcribe_submits_and_returns_without_waiting(
+        self, fake, db_factory, scheduled
+    ):
+        session_id = create_session(db_factory)
+
+        result = transcribe_audio.apply(
+            args=(str(session_id), "https://cdn.example.com/a.mp3", "en-US")
+        ).get()
+
+        assert result["status"] == "submitted"
+        assert fake.fetches == 0
+        request = fake.submissions[0]
+        assert request["webhook_url"] == f"{WEBHOOK_URL}?session_id={session_id}"
+        assert scheduled == [
+            ((str(session_id), result["transcript_id"]), {"countdown": 900})
+        ]
+        db = db_factory()
+        session = db.get(SessionModel, session_id)
+        assert session.status == SessionStatus.PROCESSING
+        assert (
+            session.provider_metadata[ASSEMBLYAI_JOB_KEY]["transcript_id"]
+            == (result["transcript_id"])
+        )
+
+    def test_webhook_completion_stores_transcript(self, fake, db_factory, scheduled):
+        transcript_id = fake._submit({"webhook_url": WEBHOOK_URL})["id"]
+        session_id = create_session(
+            db_factory, SessionStatus.PROCESSING, submitted_job(transcript_id)
+        )
+        complete_english(fake, transcript_id)
+
+        result = complete(session_id, transcript_id)
+
+        assert result["status"] == "completed"
+        db = db_factory()
+        session = db.get(SessionModel, session_id)
+        assert session.status == SessionStatus.COMPLETED
+        assert session.duration_seconds == 9
+        assert db.query(TranscriptSegment).count() == 2
+        assert scheduled == []
+
+    def test_duplicate_delivery_is_ignored(self, fake, db_factory, scheduled):
+        transcript_id = fake._submit({"webhook_url": WEBHOOK_URL})["id"]
+        session_id = create_session(
+            db_factory, SessionStatus.PROCESSING, submitted_job(transcript_id)
+        )
+        complete_english(fake, transcript_id)
+        complete(session_id, transcript_id)
+
+        assert complete(session_id, transcript_id)["status"] == "ignored"
+        assert complete(session_id, "someone-elses")["status"] == "ignored"
+        assert db_factory().query(TranscriptSegment).count() == 2
+
+    def test_recheck_of_running_job_schedules_next_check(
+        self, fake, db_factory, scheduled
+    ):
+        transcript_id = fake._submit({"webhook_url": WEBHOOK_URL})["id"]
+        session_id = create_session(
+            db_factory, SessionStatus.PROCESSING, submitted_job(transcript_id)
+        )
+
+        assert complete(session_id, transcript_id, recheck=True)["status"] == (
+            "processing"
+        )
+        assert len(scheduled) == 1
+
+    def test_job_past_max_wait_fails(self, fake, db_factory, scheduled):
+        transcript_id = fake._submit({"webhook_url": WEBHOOK_URL})["id"]
+        job = submitted_job(transcript_id, minutes_ago=121)
+        session_id = create_session(db_factory, SessionStatus.PROCESSING, job)
+
+        result = complete(session_id, transcript_id, recheck=True)
+
+        assert result["status"] == "failed"
+        assert scheduled == []
+        session = db_factory().get(SessionModel, session_id)
+        assert session.status == SessionStatus.FAILED
+
+    def test_server_error_resubmits_the_job(self, fake, db_factory, scheduled):
+        transcript_id = fake._submit({"webhook_url": WEBHOOK_URL})["id"]
+        session_id = create_session(
+            db_factory, SessionStatus.PROCESSING, submitted_job(transcript_id)
+        )
+        fake.fail(transcript_id, "Server error, developers have been alerted")
+
+        result = complete(session_id, transcript_id)
+
+        assert result["status"] == "submitted"
+        job = (
+            db_factory()
+            .get(SessionModel, session_id)
+            .provider_metadata[ASSEMBLYAI_JOB_KEY]
+        )
+        assert job["transcript_id"] == result["transcript_id"] != transcript_id
+        assert job["resubmissions"] == 1
+
+    def test_server_error_after_resubmissions_fails(self, fake, db_factory, scheduled):
+        transcript_id = fake._submit({"webhook_url": WEBHOOK_URL})["id"]
+        job = submitted_job(transcript_id, resubmissions=3)
+        session_id = create_session(db_factory, SessionStatus.PROCESSING, job)
+        fake.fail(transcript_id, "Server error, developers have been alerted")
+
+        assert complete(session_id, transcript_id)["status"] == "failed"
+        assert len(fake.submissions) == 1
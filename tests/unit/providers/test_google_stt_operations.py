@@ -0,0 +1,438 @@
+"""
+Unit tests for tracking Google STT batch operations without a waiting worker.
+
+Covers the provider's single-shot operation check and GCS read, and the
+submit, sweep and completion tasks against an in-memory database.
+"""
+
+import json
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud import speech_v2
+from google.longrunning import operations_pb2
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.models import Base
+from coaching_assistant.models.processing_status import ProcessingStatus
+from coaching_assistant.models.session import Session as SessionModel
+from coaching_assistant.models.session import SessionStatus
+from coaching_assistant.models.transcript import TranscriptSegment
+from coaching_assistant.models.user import User
+from coaching_assistant.services.google_stt import GoogleSTTProvider
+from coaching_assistant.services.stt_provider import (
+    STTProviderError,
+    STTProviderUnavailableError,
+    TranscriptionResult,
+)
+from coaching_assistant.services.stt_provider import (
+    TranscriptSegment as SegmentResult,
+)
+from coaching_assistant.tasks import transcription_tasks
+from coaching_assistant.tasks.transcription_tasks import (
+    GOOGLE_STT_COMPLETION_QUEUED_KEY,
+    GOOGLE_STT_JOB_KEY,
+    complete_google_stt_transcription,
+    sweep_google_stt_operations,
+    transcribe_audio,
+)
+
+AUDIO_URI = "gs://audio/session.wav"
+OUTPUT_URI = "gs://transcripts/batch-results/1/session_transcript.json"
+
+GCS_RESULTS = {
+    "results": [
+        {
+            "alternatives": [
+                {
+                    "transcript": "今天想聊什麼",
+                    "confidence": 0.93,
+                    "words": [
+                        {"word": "今天", "startOffset": "0s", "endOffset": "1s"},
+                        {"word": "什麼", "startOffset": "1s", "endOffset": "2.5s"},
+                    ],
+                }
+            ]
+        }
+    ]
+}
+
+
+def finished_operation(name="operations/1"):
+    response = speech_v2.BatchRecognizeResponse(
+        results={
+            AUDIO_URI: speech_v2.BatchRecognizeFileResult(
+                cloud_storage_result=speech_v2.CloudStorageResult(uri=OUTPUT_URI)
+            )
+        }
+    )
+    operation = operations_pb2.Operation(name=name, done=True)
+    operation.response.value = speech_v2.BatchRecognizeResponse.serialize(response)
+    return operation
+
+
+class FakeSpeechClient:
+    def __init__(self, operation):
+        self.operation = operation
+
+    def get_operation(self, request):
+        if isinstance(self.operation, Exception):
+            raise self.operation
+        return self.operation
+
+
+class FakeBlob:
+    def __init__(self, store, name):
+        self.store = store
+        self.name = name
+
+    def download_as_text(self):
+        if self.name not in self.store:
+            raise NotFound("no such object")
+        return self.store[self.name]
+
+
+class FakeStorageClient:
+    def __init__(self, store):
+        self.store = store
+
+    def bucket(self, bucket_name):
+        return self
+
+    def blob(self, blob_name):
+        return FakeBlob(self.store, blob_name)
+
+
+@pytest.fixture
+def gcs():
+    return {}
+
+
+def make_provider(operation, gcs):
+    provider = GoogleSTTProvider.__new__(GoogleSTTProvider)
+    provider.client = FakeSpeechClient(operation)
+    provider._create_storage_client = lambda: FakeStorageClient(gcs)
+    return provider
+
+
+JOB = {
+    "operation_name": "operations/1",
+    "audio_uri": AUDIO_URI,
+    "language": "cmn-Hant-TW",
+    "location": "asia-southeast1",
+    "model": "chirp_2",
+}
+
+
+class TestProviderOperationCheck:
+    def test_running_operation_is_none(self, gcs):
+        running = operations_pb2.Operation(name="operations/1", done=False)
+
+        assert make_provider(running, gcs).check_batch_operation("operations/1") is None
+
+    def test_failed_operation_raises(self, gcs):
+        failed = operations_pb2.Operation(name="operations/1", done=True)
+        failed.error.code = 3
+        failed.error.message = "Audio can't be decoded"
+
+        with pytest.raises(STTProviderError, match="can't be decoded"):
+            make_provider(failed, gcs).check_batch_operation("operations/1")
+
+    def test_unreachable_api_is_retryable(self, gcs):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        provider = make_provider(ServiceUnavailable("down"), gcs)
+
+        with pytest.raises(STTProviderUnavailableError):
+            provider.check_batch_operation("operations/1")
+
+    def test_results_are_read_once_the_file_is_visible(self, gcs):
+        provider = make_provider(finished_operation(), gcs)
+
+        assert provider.fetch_batch_transcription_result(JOB) is None
+
+        gcs["batch-results/1/session_transcript.json"] = json.dumps(GCS_RESULTS)
+        result = provider.fetch_batch_transcription_result(JOB)
+
+        assert [s.content for s in result.segments] == ["今天想聊什麼"]
+        assert result.total_duration_sec == 2.5
+        assert result.provider_metadata["method"] == "batchRecognize"
+
+
+class FakeGoogleProvider:
+    """Records calls the tasks make; states map operation names to outcomes."""
+
+    provider_name = "google_stt_v2"
+
+    def __init__(self):
+        self.states = {}
+        self.submitted = []
+
+    def uses_batch_mode(self, language, enable_diarization=None):
+        return True
+
+    def submit_batch_transcription(self, audio_uri, language, original_filename=None):
+        self.submitted.append(audio_uri)
+        return dict(JOB, operation_name=f"operations/{len(self.submitted)}")
+
+    def check_batch_operation(self, operation_name):
+        state = self.states.get(operation_name, "running")
+        if isinstance(state, Exception):
+            raise state
+        return None if state == "running" else object()
+
+    def fetch_batch_transcription_result(self, job):
+        state = self.states.get(job["operation_name"], "running")
+        if isinstance(state, Exception):
+            raise state
+        return None if state == "running" else state
+
+
+@pytest.fixture
+def google(monkeypatch):
+    provider = FakeGoogleProvider()
+    monkeypatch.setattr(
+        transcription_tasks.STTProviderFactory,
+        "create",
+        lambda *args, **kwargs: provider,
+    )
+    return provider
+
+
+@pytest.fixture
+def db_factory(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def get_db_session():
+        db = factory()
+        try:
+            yield db
+            db.commit()
+        finally:
+            db.close()
+
+    monkeypatch.setattr(transcription_tasks, "get_db_session", get_db_session)
+    monkeypatch.setattr(transcription_tasks, "get_progress_broker", lambda: None)
+    return factory
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        complete_google_stt_transcription, "delay", lambda *args: calls.append(args)
+    )
+    return calls
+
+
+def create_session(
+    factory,
+    operation_name=None,
+    minutes_ago=1,
+    queued_minutes_ago=None,
+    status=SessionStatus.UPLOADING,
+):
+    db = factory()
+    session_id = uuid4()
+    user = User(id=uuid4(), email=f"{uuid4()}@example.com", name="Coach")
+    metadata = {}
+    if operation_name:
+        submitted_at = datetime.now(UTC) - timedelta(minutes=minutes_ago)
+        job = dict(
+            JOB, operation_name=operation_name, submitted_at=submitted_at.isoformat()
+        )
+        if queued_minutes_ago is not None:
+            queued_at = datetime.now(UTC) - timedelta(minutes=queued_minutes_ago)
+            job[GOOGLE_STT_COMPLETION_QUEUED_KEY] = queued_at.isoformat()
+        metadata = {GOOGLE_STT_JOB_KEY: job}
+        status = SessionStatus.PROCESSING
+        db.add(
+            ProcessingStatus(session_id=session_id, status="processing", progress=30)
+        )
+    db.add_all(
+        [
+            user,
+            SessionModel(
+                id=session_id,
+                title="Weekly coaching",
+                user_id=user.id,
+                status=status,
+                stt_provider="google_stt_v2",
+                provider_metadata=metadata,
+            ),
+        ]
+    )
+    db.commit()
+    db.close()
+    return session_id
+
+
+def transcription_result():
+    return TranscriptionResult(
+        segments=[SegmentResult(1, 0.0, 2.5, "今天想聊什麼", 0.93)],
+        total_duration_sec=2.5,
+        language_code="cmn-Hant-TW",
+        cost_usd=Decimal("0.002"),
+        provider_metadata={"provider": "google_stt_v2"},
+    )
+
+
+class TestSubmit:
+    def test_transcribe_submits_and_returns_without_waiting(
+        self, monkeypatch, google, db_factory
+    ):
+        settings = transcription_tasks.settings
+        monkeypatch.setattr(settings, "GOOGLE_STT_ASYNC_BATCH", True)
+        session_id = create_session(db_factory)
+
+        result = transcribe_audio.apply(
+            args=(str(session_id), AUDIO_URI, "zh-TW", False)
+        ).get()
+
+        assert result == {
+            "session_id": str(session_id),
+            "status": "submitted",
+            "operation_name": "operations/1",
+        }
+        session = db_factory().get(SessionModel, session_id)
+        assert session.status == SessionStatus.PROCESSING
+        job = session.provider_metadata[GOOGLE_STT_JOB_KEY]
+        assert job["operation_name"] == "operations/1"
+        assert "submitted_at" in job
+
+
+class TestSweep:
+    def test_queues_finished_failed_and_overdue_operations(
+        self, google, db_factory, queued
+    ):
+        done = create_session(db_factory, "operations/done")
+        failed = create_session(db_factory, "operations/failed")
+        create_session(db_factory, "operations/running")
+        overdue = create_session(db_factory, "operations/overdue", minutes_ago=121)
+        create_session(db_factory, "operations/down")
+        create_session(db_factory)  # not submitted
+        google.states.update(
+            {
+                "operations/done": "done",
+                "operations/failed": STTProviderError("Operation failed"),
+                "operations/down": STTProviderUnavailableError("down"),
+            }
+        )
+
+        stats = sweep_google_stt_operations.apply().get()
+
+        assert stats == {"checked": 5, "queued": 3, "running": 1, "unavailable": 1}
+        assert sorted(queued) == sorted(
+            [
+                (str(done), "operations/done"),
+                (str(failed), "operations/failed"),
+                (str(overdue), "operations/overdue"),
+            ]
+        )
+
+    def test_queued_operations_are_skipped_on_later_sweeps(
+        self, google, db_factory, queued
+    ):
+        done = create_session(db_factory, "operations/done")
+        create_session(db_factory, "operations/running")
+        google.states["operations/done"] = "done"
+
+        first = sweep_google_stt_operations.apply().get()
+        second = sweep_google_stt_operations.apply().get()
+
+        assert first == {"checked": 2, "queued": 1, "running": 1, "unavailable": 0}
+        assert second == {"checked": 1, "queued": 0, "running": 1, "unavailable": 0}
+        assert queued == [(str(done), "operations/done")]
+        job = db_factory().get(SessionModel, done).provider_metadata[GOOGLE_STT_JOB_KEY]
+        assert GOOGLE_STT_COMPLETION_QUEUED_KEY in job
+
+    def test_operations_queued_long_ago_are_queued_again(
+        self, google, db_factory, queued
+    ):
+        lost = create_session(db_factory, "operations/lost", queued_minutes_ago=31)
+        create_session(db_factory, "operations/recent", queued_minutes_ago=5)
+        google.states.update({"operations/lost": "done", "operations/recent": "done"})
+
+        stats = sweep_google_stt_operations.apply().get()
+
+        assert stats["checked"] == 1
+        assert queued == [(str(lost), "operations/lost")]
+
+    def test_batch_limit_counts_only_sessions_with_an_operation(
+        self, monkeypatch, google, db_factory, queued
+    ):
+        monkeypatch.setattr(
+            transcription_tasks.settings, "GOOGLE_STT_SWEEP_BATCH_SIZE", 1
+        )
+        create_session(db_factory, status=SessionStatus.PROCESSING)  # still uploading
+        create_session(db_factory, "operations/queued", queued_minutes_ago=1)
+        done = create_session(db_factory, "operations/done")
+        google.states["operations/done"] = "done"
+
+        stats = sweep_google_stt_operations.apply().get()
+
+        assert stats["checked"] == 1
+        assert queued == [(str(done), "operations/done")]
+
+    def test_nothing_pending_skips_the_provider(self, monkeypatch, db_factory):
+        def unavailable(*args, **kwargs):
+            raise AssertionError("provider should not be created")
+
+        monkeypatch.setattr(
+            transcription_tasks.STTProviderFactory, "create", unavailable
+        )
+
+        assert sweep_google_stt_operations.apply().get()["checked"] == 0
+
+
+def complete(session_id, operation_name):
+    return complete_google_stt_transcription.apply(
+        args=(str(session_id), operation_name)
+    ).get()
+
+
+class TestCompletion:
+    def test_finished_operation_stores_transcript(self, google, db_factory):
+        session_id = create_session(db_factory, "operations/1")
+        google.states["operations/1"] = transcription_result()
+
+        assert complete(session_id, "operations/1")["status"] == "completed"
+
+        db = db_factory()
+        assert db.get(SessionModel, session_id).status == SessionStatus.COMPLETED
+        assert db.query(TranscriptSegment).count() == 1
+        assert complete(session_id, "operations/1")["status"] == "ignored"
+
+    def test_unreadable_results_wait_for_next_sweep(self, google, db_factory):
+        session_id = create_session(db_factory, "operations/1", queued_minutes_ago=0)
+
+        assert complete(session_id, "operations/1")["status"] == "processing"
+        session = db_factory().get(SessionModel, session_id)
+        assert session.status == SessionStatus.PROCESSING
+        job = session.provider_metadata[GOOGLE_STT_JOB_KEY]
+        assert GOOGLE_STT_COMPLETION_QUEUED_KEY not in job
+        assert job["operation_name"] == "operations/1"
+
+    def test_overdue_operation_fails(self, google, db_factory):
+        session_id = create_session(db_factory, "operations/1", minutes_ago=121)
+
+        assert complete(session_id, "operations/1")["status"] == "failed"
+        session = db_factory().get(SessionModel, session_id)
+        assert session.status == SessionStatus.FAILED
+
+    def test_failed_operation_fails_the_session(self, google, db_factory):
+        session_id = create_session(db_factory, "operations/1")
+        google.states["operations/1"] = STTProviderError("Operation failed: bad")
+
+        result = complete(session_id, "operations/1")
+
+        assert result["status"] == "failed"
+        assert "bad" in db_factory().get(SessionModel, session_id).error_message
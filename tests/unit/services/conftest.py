@@ -0,0 +1,177 @@
+"""
+Shared fakes for the Redis-backed caches and counters.
+
+FakeRedis keeps strings, hashes, sets and sorted sets in dicts and implements
+the subset of redis-py commands the service backends issue, including expiry
+and pipelines. Lua scripts cannot run here: register a Python stand-in under
+the script's source in FakeRedis.scripts before the backend registers it.
+"""
+
+import time
+from datetime import datetime
+from fnmatch import fnmatchcase
+
+import pytest
+
+
+class FakePipeline:
+    """Queues commands and runs them against the client on execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [
+            getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.calls
+        ]
+
+
+class FakeRedis:
+    """In-memory stand-in for a redis client created with decode_responses."""
+
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+        self.sets = {}
+        self.zsets = {}
+        self.expiry = {}
+        self.published = []
+        self.scripts = {}
+
+    def _keyspaces(self):
+        return (self.values, self.hashes, self.sets, self.zsets)
+
+    def _live(self, key):
+        when = self.expiry.get(key)
+        if isinstance(when, datetime):
+            when = when.timestamp()
+        if when is not None and when <= time.time():
+            self.delete(key)
+        return any(key in keyspace for keyspace in self._keyspaces())
+
+    # Keys
+
+    def exists(self, key):
+        return int(self._live(key))
+
+    def delete(self, *keys):
+        for key in keys:
+            for keyspace in self._keyspaces():
+                keyspace.pop(key, None)
+            self.expiry.pop(key, None)
+
+    def expire(self, key, ttl):
+        self.expiry[key] = time.time() + ttl
+
+    def expireat(self, key, when):
+        self.expiry[key] = when
+
+    def scan_iter(self, match="*"):
+        keys = {key for keyspace in self._keyspaces() for key in keyspace}
+        return [key for key in keys if fnmatchcase(key, match) and self._live(key)]
+
+    # Strings
+
+    def get(self, key):
+        return self.values.get(key) if self._live(key) else None
+
+    def set(self, key, value, nx=False):
+        if nx and self._live(key):
+            return None
+        self.values[key] = str(value)
+        self.expiry.pop(key, None)
+        return True
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.expire(key, ttl)
+
+    def incrby(self, key, amount):
+        self.values[key] = str(int(self.get(key) or 0) + amount)
+        return int(self.values[key])
+
+    # Hashes
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field) if self._live(key) else None
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hdel(self, key, field):
+        self.hashes.get(key, {}).pop(field, None)
+
+    def hlen(self, key):
+        return len(self.hashes.get(key, {})) if self._live(key) else 0
+
+    # Sets
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def spop(self, key, count):
+        members = self.sets.get(key, set())
+        return [members.pop() for _ in range(min(count, len(members)))]
+
+    # Sorted sets
+
+    def _ranked(self, key):
+        return sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zrange(self, key, start, end):
+        members = [member for member, _ in self._ranked(key)]
+        return members[start:] if end == -1 else members[start : end + 1]
+
+    def zpopmin(self, key, count):
+        oldest = self._ranked(key)[:count]
+        self.zrem(key, *[member for member, _ in oldest])
+        return oldest
+
+    # Pub/sub, pipelines and scripts
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        stand_in = self.scripts[script]
+        return lambda keys, args: stand_in(self, keys, args)
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def failing_backend():
+    """Build an instance of a backend ABC whose every method raises."""
+
+    def build(backend_class):
+        def fail(self, *args, **kwargs):
+            raise ConnectionError("store down")
+
+        methods = dict.fromkeys(backend_class.__abstractmethods__, fail)
+        return type(f"Failing{backend_class.__name__}", (backend_class,), methods)()
+
+    return build
@@ -0,0 +1,333 @@
+"""Tests for the usage and billing analytics rollup tables."""
+
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.infrastructure.db.bulk import bulk_insert
+from coaching_assistant.infrastructure.db.repositories.usage_analytics_repository import (
+    SQLAlchemyUsageAnalyticsRepository,
+)
+from coaching_assistant.models import Base
+from coaching_assistant.models.billing_analytics import BillingAnalytics
+from coaching_assistant.models.billing_analytics_rollup import (
+    BillingAnalyticsRollup,
+)
+from coaching_assistant.models.usage_log import TranscriptionType, UsageLog
+from coaching_assistant.models.usage_rollup import UsageRollup
+from coaching_assistant.models.user import User, UserPlan
+from coaching_assistant.services.analytics_rollups import (
+    BillingAnalyticsRollups,
+    UsageRollups,
+    backfill_rollups,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def add_user(db):
+    user_id = uuid4()
+    bulk_insert(
+        db,
+        User.__table__,
+        [
+            {
+                "id": user_id,
+                "email": f"{user_id}@example.com",
+                "name": "Coach",
+                "plan": UserPlan.PRO,
+            }
+        ],
+    )
+    return user_id
+
+
+def log_usage(db, user_id, created_at, minutes=30, provider="google", **kw):
+    """Write a usage log and roll it up the way create_usage_log does."""
+    kw.setdefault("transcription_type", TranscriptionType.ORIGINAL)
+    usage_log = UsageLog(
+        user_id=user_id,
+        session_id=uuid4(),
+        duration_minutes=minutes,
+        duration_seconds=minutes * 60,
+        cost_usd=Decimal("0.48"),
+        stt_provider=provider,
+        user_plan="pro",
+        created_at=created_at,
+        **kw,
+    )
+    db.add(usage_log)
+    db.flush()
+    UsageRollups(db).record(usage_log)
+    db.commit()
+    return usage_log
+
+
+def rollups(db, period_type):
+    return {
+        (row.period_start, row.stt_provider): row
+        for row in db.query(UsageRollup).filter_by(period_type=period_type)
+    }
+
+
+def snapshot(db):
+    return sorted(
+        (
+            row.period_type,
+            row.period_start,
+            row.user_plan,
+            row.stt_provider,
+            row.transcriptions,
+            row.billable_transcriptions,
+            row.original_transcriptions,
+            row.free_retries,
+            row.total_minutes,
+            row.total_cost_usd,
+            row.active_users,
+            row.new_users,
+        )
+        for row in db.query(UsageRollup)
+    )
+
+
+class TestUsageRollups:
+    def test_logs_are_added_to_daily_and_monthly_rows(self, db):
+        coach = add_user(db)
+        log_usage(db, coach, datetime(2025, 3, 2, 9, 0))
+        log_usage(db, coach, datetime(2025, 3, 2, 10, 0), minutes=10)
+        log_usage(
+            db,
+            coach,
+            datetime(2025, 3, 5, 9, 0),
+            is_billable=False,
+            transcription_type=TranscriptionType.RETRY_FAILED,
+        )
+
+        daily = rollups(db, "daily")
+        assert daily[(date(2025, 3, 2), "google")].transcriptions == 2
+        assert daily[(date(2025, 3, 2), "google")].total_minutes == 40
+        assert daily[(date(2025, 3, 2), "google")].active_users == 1
+        assert daily[(date(2025, 3, 5), "google")].active_users == 1
+        assert daily[(date(2025, 3, 5), "google")].new_users == 0
+
+        monthly = rollups(db, "monthly")[(date(2025, 3, 1), "google")]
+        assert monthly.transcriptions == 3
+        assert monthly.billable_transcriptions == 2
+        assert monthly.original_transcriptions == 2
+        assert monthly.free_retries == 1
+        assert monthly.total_minutes == 70
+        assert monthly.total_cost_usd == Decimal("1.44")
+        assert monthly.active_users == 1
+        assert monthly.new_users == 1
+
+    def test_users_are_counted_once_per_period(self, db):
+        first, second = add_user(db), add_user(db)
+        log_usage(db, first, datetime(2025, 2, 20, 9, 0))
+        log_usage(db, first, datetime(2025, 3, 2, 9, 0))
+        log_usage(db, second, datetime(2025, 3, 2, 9, 30), provider="assemblyai")
+        log_usage(db, second, datetime(2025, 3, 3, 9, 30), provider="assemblyai")
+
+        march = rollups(db, "monthly")
+        assert march[(date(2025, 3, 1), "google")].active_users == 1
+        assert march[(date(2025, 3, 1), "google")].new_users == 0
+        assert march[(date(2025, 3, 1), "assemblyai")].active_users == 1
+        assert march[(date(2025, 3, 1), "assemblyai")].new_users == 1
+
+    def test_reconcile_matches_incremental_totals_and_fixes_drift(self, db):
+        first, second = add_user(db), add_user(db)
+        log_usage(db, first, datetime(2025, 2, 27, 9, 0))
+        log_usage(db, first, datetime(2025, 3, 1, 0, 0))
+        log_usage(db, second, datetime(2025, 3, 1, 0, 0), provider="assemblyai")
+        log_usage(
+            db,
+            second,
+            datetime(2025, 3, 14, 23, 59),
+            transcription_type=TranscriptionType.RETRY_FAILED,
+        )
+        incremental = snapshot(db)
+
+        drifted = rollups(db, "monthly")[(date(2025, 3, 1), "google")]
+        drifted.transcriptions = 99
+        db.commit()
+
+        written = UsageRollups(db).reconcile(date(2025, 2, 1))
+
+        assert written == {"daily": 4, "monthly": 3}
+        assert snapshot(db) == incremental
+
+    def test_reconcile_keeps_periods_before_the_window(self, db):
+        coach = add_user(db)
+        log_usage(db, coach, datetime(2025, 1, 10, 9, 0))
+        log_usage(db, coach, datetime(2025, 3, 10, 9, 0))
+
+        UsageRollups(db).reconcile(date(2025, 3, 5))
+
+        assert (date(2025, 1, 10), "google") in rollups(db, "daily")
+        assert rollups(db, "monthly")[(date(2025, 3, 1), "google")].new_users == 0
+
+    def test_admin_analytics_reads_monthly_rollups(self, db):
+        first, second = add_user(db), add_user(db)
+        log_usage(db, first, datetime(2025, 2, 20, 9, 0))
+        log_usage(db, first, datetime(2025, 3, 2, 9, 0))
+        log_usage(db, second, datetime(2025, 3, 2, 9, 30), provider="assemblyai")
+
+        analytics = SQLAlchemyUsageAnalyticsRepository(db).get_admin_analytics()
+
+        assert analytics["total_users"] == 2
+        assert analytics["total_transcriptions"] == 3
+        assert analytics["total_minutes_processed"] == 90
+        assert analytics["plan_breakdown"]["pro"]["users"] == 2
+        assert analytics["provider_breakdown"]["google"]["minutes"] == 60
+        assert analytics["provider_breakdown"]["assemblyai"]["percentage"] == (
+            pytest.approx(100 / 3)
+        )
+
+
+class TestBillingAnalyticsRollups:
+    PERIOD_START = datetime(2025, 3, 1, tzinfo=UTC)
+
+    def add_record(self, db, **kw):
+        record = BillingAnalytics(
+            user_id=add_user(db),
+            period_type="monthly",
+            period_start=self.PERIOD_START,
+            period_end=self.PERIOD_START + timedelta(days=31),
+            plan_name="PRO",
+            **kw,
+        )
+        db.add(record)
+        db.flush()
+        return record
+
+    def test_refresh_sums_records_and_scores_health_like_the_model(self, db):
+        records = [
+            self.add_record(
+                db,
+                total_revenue_usd=Decimal("20"),
+                plan_utilization_percentage=Decimal("80"),
+                days_active_in_period=25,
+                avg_sessions_per_active_day=Decimal("4"),
+                success_rate_percentage=Decimal("95"),
+                user_segment="power",
+            ),
+            self.add_record(
+                db,
+                total_revenue_usd=Decimal("10"),
+                plan_utilization_percentage=Decimal("5"),
+                days_active_in_period=2,
+                churn_risk_score=Decimal("0.9"),
+                success_rate_percentage=Decimal("0"),
+                user_segment="power",
+            ),
+            self.add_record(db, total_revenue_usd=Decimal("5")),
+        ]
+        db.commit()
+
+        written = BillingAnalyticsRollups(db).refresh("monthly", self.PERIOD_START)
+        db.commit()
+
+        assert written == 2
+        power = db.query(BillingAnalyticsRollup).filter_by(user_segment="power").one()
+        assert power.users == 2
+        assert power.total_revenue_usd == Decimal("30")
+        assert power.success_rate_count == 1
+        assert power.churn_risk_users == 1
+        assert power.at_risk_users == 1
+        assert power.power_users == 1
+
+        expected_scores = [
+            record.calculate_customer_health_score() for record in records[:2]
+        ]
+        assert float(power.health_score_total) == pytest.approx(
+            sum(expected_scores), abs=0.01
+        )
+        buckets = (
+            power.health_excellent,
+            power.health_good,
+            power.health_average,
+            power.health_poor,
+            power.health_critical,
+        )
+        assert sum(buckets) == 2
+        assert power.health_good == 1  # 24 + 24.19 + 8 + 19
+
+        unknown = (
+            db.query(BillingAnalyticsRollup).filter_by(user_segment="unknown").one()
+        )
+        assert unknown.users == 1
+
+    def test_refresh_replaces_the_previous_rollups(self, db):
+        self.add_record(db, total_revenue_usd=Decimal("20"))
+        db.commit()
+        rollup = BillingAnalyticsRollups(db)
+        rollup.refresh("monthly", self.PERIOD_START)
+        self.add_record(db, total_revenue_usd=Decimal("5"))
+        db.commit()
+
+        rollup.refresh("monthly", self.PERIOD_START)
+        db.commit()
+
+        refreshed = db.query(BillingAnalyticsRollup).one()
+        assert refreshed.users == 2
+        assert refreshed.total_revenue_usd == Decimal("25")
+
+
+class TestBackfill:
+    def test_history_written_before_the_rollups_is_summed(self, db):
+        # Logs and billing records from before the rollup tables existed
+        coach = add_user(db)
+        for created_at in (datetime(2024, 6, 3, 9, 0), datetime(2025, 3, 2, 9, 0)):
+            db.add(
+                UsageLog(
+                    user_id=coach,
+                    session_id=uuid4(),
+                    duration_minutes=30,
+                    duration_seconds=1800,
+                    cost_usd=Decimal("0.48"),
+                    stt_provider="google",
+                    user_plan="pro",
+                    transcription_type=TranscriptionType.ORIGINAL,
+                    created_at=created_at,
+                )
+            )
+        db.add(
+            BillingAnalytics(
+                user_id=coach,
+                period_type="monthly",
+                period_start=datetime(2024, 6, 1, tzinfo=UTC),
+                period_end=datetime(2024, 7, 1, tzinfo=UTC),
+                plan_name="PRO",
+                total_revenue_usd=Decimal("20"),
+            )
+        )
+        db.commit()
+
+        written = backfill_rollups(db)
+
+        assert written == {
+            "usage_rollups": {"daily": 2, "monthly": 2},
+            "billing_analytics_rollups": 1,
+        }
+        june = rollups(db, "monthly")[(date(2024, 6, 1), "google")]
+        assert (june.transcriptions, june.new_users) == (1, 1)
+        analytics = SQLAlchemyUsageAnalyticsRepository(db).get_admin_analytics()
+        assert analytics["total_transcriptions"] == 2
+        assert analytics["total_minutes_processed"] == 60
+        assert db.query(BillingAnalyticsRollup).one().total_revenue_usd == Decimal("20")
+
+    def test_empty_history_writes_nothing(self, db):
+        assert backfill_rollups(db) == {
+            "usage_rollups": {},
+            "billing_analytics_rollups": 0,
+        }
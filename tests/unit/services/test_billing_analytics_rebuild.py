@@ -0,0 +1,273 @@
+"""Tests for the set-based BillingAnalytics rebuild."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.infrastructure.db.bulk import bulk_insert
+from coaching_assistant.models import Base
+from coaching_assistant.models.billing_analytics import BillingAnalytics
+from coaching_assistant.models.session import Session as TranscriptionSession
+from coaching_assistant.models.usage_history import UsageHistory
+from coaching_assistant.models.usage_log import TranscriptionType, UsageLog
+from coaching_assistant.models.user import User, UserPlan
+from coaching_assistant.services import billing_analytics_rebuild
+from coaching_assistant.services.billing_analytics_rebuild import (
+    BillingAnalyticsRebuilder,
+    plan_revenue,
+)
+from coaching_assistant.services.plan_limits import PlanLimit
+
+NOW = datetime(2025, 3, 15, 12, 0, tzinfo=UTC)
+LATER = datetime(2025, 3, 16, 12, 0, tzinfo=UTC)
+
+PLANS = {
+    "free": PlanLimit(max_transcriptions=10, max_minutes=200),
+    "pro": PlanLimit(max_minutes=1200, monthly_price_usd=30),
+}
+
+
+@pytest.fixture(autouse=True)
+def plan_limits(monkeypatch):
+    monkeypatch.setattr(
+        billing_analytics_rebuild,
+        "get_global_plan_limits",
+        lambda: SimpleNamespace(get_plan_limit=lambda plan: PLANS[plan]),
+    )
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        session.statements.append(statement.split()[0])
+
+    yield session
+    session.close()
+
+
+def add_user(db, plan=UserPlan.PRO, preferences=None):
+    user_id = uuid4()
+    bulk_insert(
+        db,
+        User.__table__,
+        [
+            {
+                "id": user_id,
+                "email": f"{user_id}@example.com",
+                "name": "Coach",
+                "plan": plan,
+                "preferences": preferences,
+                "created_at": datetime(2025, 1, 14, 12, 0),
+            }
+        ],
+    )
+    return user_id
+
+
+def add_log(db, user_id, created_at, minutes=30, cost="0.48", provider="google", **kw):
+    bulk_insert(
+        db,
+        UsageLog.__table__,
+        [
+            {
+                "user_id": user_id,
+                "session_id": uuid4(),
+                "duration_minutes": minutes,
+                "duration_seconds": minutes * 60,
+                "cost_usd": Decimal(cost),
+                "stt_provider": provider,
+                "user_plan": "pro",
+                "created_at": created_at,
+                **kw,
+            }
+        ],
+    )
+
+
+def add_session(db, user_id, created_at):
+    bulk_insert(
+        db,
+        TranscriptionSession.__table__,
+        [{"user_id": user_id, "title": "Weekly", "created_at": created_at}],
+    )
+
+
+def record_for(db, user_id):
+    db.expire_all()
+    return db.query(BillingAnalytics).filter_by(user_id=user_id).one()
+
+
+@pytest.fixture
+def active_user(db):
+    user_id = add_user(db, preferences='{"language": "zh-TW", "country": "TW"}')
+    add_log(
+        db,
+        user_id,
+        datetime(2025, 3, 2, 9, 0),
+        transcription_started_at=datetime(2025, 3, 2, 9, 0),
+        transcription_completed_at=datetime(2025, 3, 2, 9, 2),
+    )
+    add_log(
+        db, user_id, datetime(2025, 3, 2, 15, 0), cost="0.30", provider="assemblyai"
+    )
+    add_log(
+        db,
+        user_id,
+        datetime(2025, 3, 9, 10, 0),
+        cost="0",
+        transcription_type=TranscriptionType.RETRY_FAILED,
+        is_billable=False,
+    )
+    add_log(db, user_id, datetime(2025, 2, 27, 10, 0))  # previous month
+    add_session(db, user_id, datetime(2025, 3, 2, 8, 55))
+    add_session(db, user_id, datetime(2025, 3, 9, 9, 55))
+    db.commit()
+    return user_id
+
+
+class TestRebuild:
+    def test_full_rebuild_aggregates_every_user(self, db, active_user):
+        idle_user = add_user(db, plan=UserPlan.FREE)
+        db.commit()
+        progress = []
+
+        result = BillingAnalyticsRebuilder(db, chunk_size=1).rebuild(
+            "monthly",
+            progress=lambda done, total: progress.append((done, total)),
+            now=NOW,
+        )
+
+        assert result["users_processed"] == 2
+        assert result["incremental"] is False
+        assert progress == [(1, 2), (2, 2)]
+
+        record = record_for(db, active_user)
+        assert record.plan_name == "pro"
+        assert record.transcriptions_completed == 3
+        assert record.api_calls_made == 3
+        assert record.sessions_created == 2
+        assert record.total_minutes_processed == Decimal("90")
+        assert record.original_transcriptions == 2
+        assert record.free_retries == 1
+        assert record.google_stt_cost_usd == Decimal("0.48")
+        assert record.assemblyai_cost_usd == Decimal("0.30")
+        assert record.total_provider_cost_usd == Decimal("0.78")
+        assert record.days_active_in_period == 2
+        assert record.avg_sessions_per_active_day == Decimal("1")
+        assert record.avg_processing_time_seconds == Decimal("120")
+        assert record.plan_utilization_percentage == Decimal("7.5")
+        assert record.total_revenue_usd == Decimal("31")
+        assert record.user_tenure_days == 60
+        assert record.user_segment == "new"
+        assert (record.user_language, record.user_country) == ("zh-TW", "TW")
+
+        idle = record_for(db, idle_user)
+        assert idle.transcriptions_completed == 0
+        assert idle.success_rate_percentage == Decimal("100")
+        assert idle.total_revenue_usd == Decimal("0")
+
+    def test_chunk_costs_a_fixed_number_of_statements(self, db, active_user):
+        for _ in range(20):
+            add_user(db)
+        db.commit()
+        db.statements.clear()
+
+        BillingAnalyticsRebuilder(db, chunk_size=100).rebuild("monthly", now=NOW)
+
+        # user ids, then users, usage, sessions, history and the upsert,
+        # followed by the period's rollup refresh
+        assert db.statements == ["SELECT"] * 5 + ["INSERT"] + [
+            "DELETE",
+            "SELECT",
+            "SELECT",
+            "INSERT",
+        ]
+
+    def test_rebuild_updates_records_in_place(self, db, active_user):
+        rebuilder = BillingAnalyticsRebuilder(db)
+        rebuilder.rebuild("monthly", now=NOW)
+        add_log(db, active_user, datetime(2025, 3, 15, 13, 0))
+        db.commit()
+
+        rebuilder.rebuild("monthly", now=LATER)
+
+        assert db.query(BillingAnalytics).count() == 1
+        record = record_for(db, active_user)
+        assert record.transcriptions_completed == 4
+        assert record.recorded_at.replace(tzinfo=UTC) == LATER
+
+    def test_segment_comes_from_recent_usage_history(self, db, active_user):
+        bulk_insert(
+            db,
+            UsageHistory.__table__,
+            [
+                {
+                    "user_id": active_user,
+                    "period_type": "monthly",
+                    "period_start": datetime(2025, 2, 1, tzinfo=UTC),
+                    "period_end": datetime(2025, 3, 1, tzinfo=UTC),
+                    "plan_name": "pro",
+                    "audio_minutes_processed": Decimal("1000"),
+                }
+            ],
+        )
+        db.commit()
+
+        BillingAnalyticsRebuilder(db).rebuild("monthly", now=NOW)
+
+        assert record_for(db, active_user).user_segment == "power"
+
+
+class TestIncrementalRebuild:
+    def test_only_users_active_since_last_rebuild_are_recomputed(self, db, active_user):
+        idle_user = add_user(db)
+        db.commit()
+        BillingAnalyticsRebuilder(db).rebuild("monthly", now=NOW)
+        add_log(db, idle_user, datetime(2025, 3, 15, 18, 0))
+        db.commit()
+
+        result = BillingAnalyticsRebuilder(db).rebuild(
+            "monthly", incremental=True, now=LATER
+        )
+
+        assert result["incremental"] is True
+        assert result["users_processed"] == 1
+        assert record_for(db, idle_user).transcriptions_completed == 1
+        assert record_for(db, active_user).recorded_at.replace(tzinfo=UTC) == NOW
+
+    def test_first_incremental_rebuild_covers_everyone(self, db, active_user):
+        result = BillingAnalyticsRebuilder(db).rebuild(
+            "monthly", incremental=True, now=NOW
+        )
+
+        assert result["incremental"] is False
+        assert result["users_processed"] == 1
+
+
+class TestPlanRevenue:
+    def test_overage_is_charged_past_the_transcription_limit(self):
+        revenue = plan_revenue(
+            PLANS["free"], 12, datetime(2025, 3, 1), datetime(2025, 4, 1)
+        )
+
+        assert revenue["overage_revenue"] == 0.2
+        assert revenue["total_revenue"] == 0.2
+
+    def test_unlimited_plans_have_no_overage(self):
+        revenue = plan_revenue(
+            PLANS["pro"], 500, datetime(2025, 3, 1), datetime(2025, 4, 1)
+        )
+
+        assert revenue["overage_revenue"] == 0
+        assert revenue["subscription_revenue"] == 31.0
@@ -0,0 +1,74 @@
+from coaching_assistant.cue_table import (
+    CueTable,
+    format_timestamp_ms,
+    iter_rows,
+    parse_timestamp_ms,
+)
+from coaching_assistant.parser import parse_vtt, parse_vtt_table
+
+SAMPLE_VTT = (
+    "WEBVTT\n\n"
+    "00:00:01.000 --> 00:00:05.000\n"
+    "John Doe: Hello, this is a test coaching session.\n\n"
+    "00:00:06.000 --> 00:00:10.000\n"
+    "John Doe: I'll be your coach today.\n\n"
+    "00:00:11.000 --> 00:00:15.000\n"
+    "Jane Smith: Thank you for your time.\n\n"
+    "01:02:03.456 --> 01:02:05.000\n"
+    "John Doe: See you next time.\n"
+)
+
+
+def test_timestamp_round_trip():
+    assert parse_timestamp_ms("01:02:03.456") == 3_723_456
+    assert parse_timestamp_ms("00:00:01,500") == 1_500
+    assert format_timestamp_ms(3_723_456) == "01:02:03.456"
+
+
+def test_table_interns_speakers():
+    table = parse_vtt_table(SAMPLE_VTT)
+
+    assert len(table) == 4
+    assert table.speakers == ["John Doe", "Jane Smith"]
+    assert list(table.speaker_ids) == [0, 0, 1, 0]
+    assert table.to_dicts() == parse_vtt(SAMPLE_VTT)
+
+
+def test_consolidate_merges_consecutive_cues_from_one_speaker():
+    table = parse_vtt_table(SAMPLE_VTT).consolidate()
+
+    assert table.to_dicts() == [
+        {
+            "time": "00:00:01.000",
+            "speaker": "John Doe",
+            "content": "Hello, this is a test coaching session. I'll be your coach today.",
+        },
+        {
+            "time": "00:00:11.000",
+            "speaker": "Jane Smith",
+            "content": "Thank you for your time.",
+        },
+        {
+            "time": "01:02:03.456",
+            "speaker": "John Doe",
+            "content": "See you next time.",
+        },
+    ]
+
+
+def test_rename_speakers_merges_colliding_names():
+    table = parse_vtt_table(SAMPLE_VTT)
+    table.rename_speakers({"Jane Smith": "John Doe"})
+
+    assert table.speakers == ["John Doe"]
+    assert list(table.speaker_ids) == [0, 0, 0, 0]
+    assert len(table.consolidate()) == 1
+
+
+def test_map_text_converts_content_and_speakers():
+    table = CueTable.from_dicts(
+        [{"time": "00:00:01.000", "speaker": "a", "content": "hello"}]
+    )
+    table.map_text(str.upper)
+
+    assert list(iter_rows(table)) == [("00:00:01.000", "A", "HELLO")]
@@ -0,0 +1,46 @@
+import io
+
+from openpyxl import load_workbook
+
+from coaching_assistant.cue_table import CueTable
+from coaching_assistant.exporters.excel import (
+    calculate_column_widths,
+    generate_excel,
+    iter_excel,
+)
+
+DATA = [
+    {"time": "00:00:01.000", "speaker": "Coach", "content": "Hello"},
+    {"time": "00:00:05.000", "speaker": "Client", "content": "x" * 400},
+]
+
+
+def test_calculate_column_widths_clamps_to_bounds():
+    widths = calculate_column_widths(
+        [(item["time"], item["speaker"], item["content"]) for item in DATA]
+    )
+    assert widths[0] == (12 + 2) * 1.1
+    assert widths[1] == (6 + 2) * 1.1
+    assert widths[2] == 50
+
+
+def test_iter_excel_streams_the_same_workbook_as_generate_excel():
+    chunks = list(iter_excel(CueTable.from_dicts(DATA), chunk_size=1024))
+
+    assert len(chunks) > 1
+    streamed = b"".join(chunks)
+    assert streamed.startswith(b"PK\x03\x04")
+
+    ws = load_workbook(io.BytesIO(streamed))["Transcript"]
+    rows = list(ws.iter_rows(values_only=True))
+    assert rows[0] == ("時間", "角色", "內容")
+    assert rows[1] == ("00:00:01.000", "Coach", "Hello")
+    assert ws.freeze_panes == "A2"
+    assert ws.column_dimensions["C"].width == 50
+    assert ws.row_dimensions[1].height == 30
+    assert ws.row_dimensions[3].height == 75
+    assert ws["A2"].fill.start_color.rgb.endswith("D8E4F0")
+    assert ws["A3"].fill.start_color.rgb.endswith("F0F0F0")
+
+    buffered = load_workbook(generate_excel(DATA))["Transcript"]
+    assert list(buffered.iter_rows(values_only=True)) == rows
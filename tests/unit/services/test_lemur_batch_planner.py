@@ -0,0 +1,253 @@
+"""
+Unit tests for token-aware LeMUR batch planning.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import assemblyai as aai
+import pytest
+
+from coaching_assistant.services.lemur_batch_planner import (
+    MAX_OVERLAP_TOKENS,
+    estimate_tokens,
+    join_split_text,
+    plan_batches,
+    split_oversized_segment,
+)
+from coaching_assistant.services.lemur_transcript_smoother import (
+    LeMURTranscriptSmoother,
+    SmoothingContext,
+    TranscriptSegment,
+)
+
+
+def make_segments(texts):
+    return [
+        {
+            "speaker": "AB"[index % 2],
+            "text": text,
+            "start": index * 1000,
+            "end": index * 1000 + 900,
+        }
+        for index, text in enumerate(texts)
+    ]
+
+
+class TestEstimateTokens:
+    def test_chinese_counts_one_token_per_character(self):
+        assert estimate_tokens("你覺得呢？") == 5
+
+    def test_english_counts_four_characters_per_token(self):
+        assert estimate_tokens("what do you think") == 5
+
+    def test_mixed_text(self):
+        assert estimate_tokens("我想 focus 在工作") == 7
+
+    def test_empty_text(self):
+        assert estimate_tokens("") == 0
+
+
+class TestPlanBatches:
+    """Packing segments into near-equal batches."""
+
+    def test_plan_covers_segments_in_order(self):
+        segments = make_segments(["好" * 100] * 10)
+
+        plan = plan_batches(segments, max_batch_tokens=350)
+
+        flattened = [s for batch in plan.batches for s in batch.segments]
+        assert flattened == [
+            {**segment, "source_index": index} for index, segment in enumerate(segments)
+        ]
+        assert plan.total_tokens == 1000
+
+    def test_batches_are_near_equal(self):
+        # Greedy packing would produce 300/300/300/100
+        segments = make_segments(["好" * 100] * 10)
+
+        plan = plan_batches(segments, max_batch_tokens=350)
+
+        assert [b.estimated_tokens for b in plan.batches] == [300, 300, 200, 200]
+
+    def test_no_more_batches_than_budget_requires(self):
+        segments = make_segments(["好" * 90] * 9)
+
+        plan = plan_batches(segments, max_batch_tokens=300)
+
+        assert plan.batch_count == 3
+        assert all(b.estimated_tokens <= 300 for b in plan.batches)
+
+    def test_segment_cap_is_respected(self):
+        segments = make_segments(["好"] * 10)
+
+        plan = plan_batches(segments, max_batch_tokens=1000, max_batch_segments=4)
+
+        assert [len(b.segments) for b in plan.batches] == [4, 4, 2]
+
+    def test_overlap_carries_previous_tail(self):
+        segments = make_segments(["好" * 100] * 4)
+
+        plan = plan_batches(segments, max_batch_tokens=200, overlap_segments=1)
+
+        assert plan.batches[0].overlap == []
+        assert plan.batches[1].overlap == [plan.batches[0].segments[-1]]
+
+    def test_overlap_is_token_bounded(self):
+        segments = make_segments(["好" * 600] * 2)
+
+        plan = plan_batches(segments, max_batch_tokens=700, overlap_segments=1)
+
+        overlap_text = plan.batches[1].overlap[0]["text"]
+        assert estimate_tokens(overlap_text) <= MAX_OVERLAP_TOKENS
+
+    def test_summary_reports_plan(self):
+        plan = plan_batches(make_segments(["好" * 100] * 4), max_batch_tokens=200)
+
+        assert plan.summary().startswith("2 batches, ~400 tokens")
+
+    def test_invalid_budget_rejected(self):
+        with pytest.raises(ValueError):
+            plan_batches(make_segments(["好"]), max_batch_tokens=0)
+
+
+class TestOversizedSegments:
+    """Sentence-boundary splitting of segments over the budget."""
+
+    def test_chinese_segment_split_at_sentence_ends(self):
+        # Arrange
+        sentence = "我覺得這個目標很重要。"
+        segment = {"speaker": "A", "text": sentence * 10, "start": 0, "end": 10000}
+
+        # Act
+        pieces = split_oversized_segment(segment, max_tokens=35)
+
+        # Assert
+        assert "".join(p["text"] for p in pieces) == segment["text"]
+        assert all(p["text"].endswith("。") for p in pieces)
+        assert all(estimate_tokens(p["text"]) <= 35 for p in pieces)
+        assert pieces[0]["start"] == 0
+        assert pieces[-1]["end"] == 10000
+        assert all(a["end"] == b["start"] for a, b in zip(pieces, pieces[1:]))
+
+    def test_english_segment_keeps_words(self):
+        segment = {
+            "speaker": "B",
+            "text": "I want to focus on time. " * 8,
+            "start": 0,
+            "end": 8000,
+        }
+
+        pieces = split_oversized_segment(segment, max_tokens=15)
+
+        assert len(pieces) > 1
+        assert " ".join(p["text"] for p in pieces) == segment["text"].strip()
+
+    def test_run_on_sentence_is_cut(self):
+        segment = {"speaker": "A", "text": "好" * 250, "start": 0, "end": 5000}
+
+        pieces = split_oversized_segment(segment, max_tokens=100)
+
+        assert [len(p["text"]) for p in pieces] == [100, 100, 50]
+
+    def test_plan_counts_split_segments(self):
+        segments = make_segments(["短句。", "我覺得這個目標很重要。" * 10])
+
+        plan = plan_batches(segments, max_batch_tokens=40)
+
+        assert plan.split_segments == 1
+        assert all(b.estimated_tokens <= 40 for b in plan.batches)
+
+    def test_split_pieces_keep_their_source_index(self):
+        segments = make_segments(
+            ["短句。", "我覺得這個目標很重要。" * 10, "好。", "對。"]
+        )
+
+        plan = plan_batches(segments, max_batch_tokens=40)
+
+        planned = [s for batch in plan.batches for s in batch.segments]
+        assert len(planned) > len(segments)
+        assert [s["source_index"] for s in planned] == sorted(
+            s["source_index"] for s in planned
+        )
+        assert {s["source_index"] for s in planned} == {0, 1, 2, 3}
+        pieces = [s["text"] for s in planned if s["source_index"] == 1]
+        assert join_split_text(pieces) == segments[1]["text"]
+        assert planned[-2:] == [
+            {**segments[2], "source_index": 2},
+            {**segments[3], "source_index": 3},
+        ]
+
+    def test_join_split_text_spaces_only_latin_text(self):
+        assert join_split_text(["我覺得。", "很好。"]) == "我覺得。很好。"
+        assert join_split_text(["I agree.", "Let's go."]) == "I agree. Let's go."
+
+
+@pytest.mark.skipif(
+    not hasattr(aai, "Lemur"), reason="Installed assemblyai SDK has no LeMUR client"
+)
+class TestSmootherOverlapPrompt:
+    def test_overlap_is_prompt_context_not_batch_text(self):
+        # Arrange
+        smoother = LeMURTranscriptSmoother(api_key="test_api_key")
+        smoother.cache = None
+        smoother.lemur = MagicMock()
+        smoother.lemur.task.return_value = SimpleNamespace(response="B: 好的。")
+        overlap = [{"speaker": "A", "text": "你覺得呢", "start": 0, "end": 900}]
+        batch = [{"speaker": "B", "text": "好 的", "start": 1000, "end": 1900}]
+
+        # Act
+        asyncio.run(
+            smoother._process_punctuation_batch(
+                batch,
+                SmoothingContext(session_language="zh-TW"),
+                {},
+                None,
+                batch_num=2,
+                overlap=overlap,
+            )
+        )
+
+        # Assert
+        prompt = smoother.lemur.task.call_args.args[0]
+        input_text = smoother.lemur.task.call_args.kwargs["input_text"]
+        assert prompt.startswith("前文")
+        assert "A: 你覺得呢" in prompt
+        assert input_text == "B: 好 的"
+
+
+@pytest.mark.skipif(
+    not hasattr(aai, "Lemur"), reason="Installed assemblyai SDK has no LeMUR client"
+)
+class TestSmootherSplitSegments:
+    def test_split_segment_is_joined_back_before_later_segments(self):
+        # Arrange
+        smoother = LeMURTranscriptSmoother(api_key="test_api_key")
+        smoother.cache = None
+        smoother.lemur = MagicMock()
+        smoother.lemur.task.side_effect = lambda prompt, input_text, **kwargs: (
+            SimpleNamespace(response=input_text.replace("。", "！"))
+        )
+        segments = make_segments(["我覺得這個目標很重要。" * 10, "好。", "對。"])
+        smoother.plan_punctuation_batches = lambda segs: plan_batches(
+            segs, max_batch_tokens=40
+        )
+
+        # Act
+        result = asyncio.run(
+            smoother._improve_punctuation_batch_with_lemur(
+                segments, SmoothingContext(session_language="zh-TW"), {}
+            )
+        )
+
+        # Assert
+        assert [segment.source_index for segment in result] == [0, 1, 2]
+        assert result[0] == TranscriptSegment(
+            start=0,
+            end=900,
+            speaker="A",
+            text="我覺得這個目標很重要！" * 10,
+            source_index=0,
+        )
+        assert [segment.text for segment in result[1:]] == ["好！", "對！"]
@@ -0,0 +1,245 @@
+"""
+Unit tests for the content-addressed LeMUR result cache.
+
+Covers key derivation, the SQLite and Redis backends (TTL and size-bounded
+eviction), hit/miss accounting, and skipping LeMUR calls for unchanged batches.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import assemblyai as aai
+import pytest
+
+from coaching_assistant.services.lemur_cache import (
+    LeMURCacheBackend,
+    LeMURResultCache,
+    RedisLeMURCacheBackend,
+    SQLiteLeMURCacheBackend,
+    make_cache_key,
+)
+from coaching_assistant.services.lemur_transcript_smoother import (
+    LeMURTranscriptSmoother,
+    SmoothingContext,
+)
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    return SQLiteLeMURCacheBackend(path=str(tmp_path / "lemur.sqlite3"))
+
+
+class TestCacheKey:
+    """make_cache_key content addressing."""
+
+    def test_key_is_deterministic(self):
+        first = make_cache_key("punctuation", "m", "p", "text", {"B": "A"}, "zh")
+        second = make_cache_key("punctuation", "m", "p", "text", {"B": "A"}, "zh")
+        assert first == second
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"kind": "combined"},
+            {"model": "other-model"},
+            {"prompt": "edited template"},
+            {"input_text": "new text"},
+            {"speaker_mapping": {"A": "B"}},
+            {"language": "en"},
+        ],
+    )
+    def test_any_component_changes_key(self, changed):
+        base = {
+            "kind": "punctuation",
+            "model": "m",
+            "prompt": "p",
+            "input_text": "text",
+            "speaker_mapping": {"B": "A"},
+            "language": "zh",
+        }
+        assert make_cache_key(**base) != make_cache_key(**{**base, **changed})
+
+
+class TestSQLiteBackend:
+    """SQLite backend TTL and eviction."""
+
+    def test_round_trip_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "lemur.sqlite3")
+        SQLiteLeMURCacheBackend(path=path).set("k", "教練: 你好。", 60)
+
+        assert SQLiteLeMURCacheBackend(path=path).get("k") == "教練: 你好。"
+
+    def test_expired_entry_is_a_miss(self, sqlite_backend):
+        sqlite_backend.set("k", "value", 0)
+
+        assert sqlite_backend.get("k") is None
+        assert sqlite_backend.size() == 0
+
+    def test_evicts_least_recently_used_over_entry_limit(self, tmp_path):
+        # Arrange
+        backend = SQLiteLeMURCacheBackend(
+            path=str(tmp_path / "lemur.sqlite3"), max_entries=2
+        )
+        backend.set("a", "1", 60)
+        backend.set("b", "2", 60)
+        backend.get("a")  # "b" becomes least recently used
+
+        # Act
+        evicted = backend.set("c", "3", 60)
+
+        # Assert
+        assert evicted == 1
+        assert backend.get("b") is None
+        assert backend.get("a") == "1"
+        assert backend.get("c") == "3"
+
+    def test_evicts_over_byte_limit(self, tmp_path):
+        backend = SQLiteLeMURCacheBackend(
+            path=str(tmp_path / "lemur.sqlite3"), max_bytes=10
+        )
+        backend.set("a", "x" * 6, 60)
+        backend.set("b", "y" * 6, 60)
+
+        assert backend.get("a") is None
+        assert backend.get("b") == "y" * 6
+
+
+class TestRedisBackend:
+    """Redis backend TTL and eviction."""
+
+    def test_round_trip_and_entry_limit(self, fake_redis):
+        # Arrange
+        backend = RedisLeMURCacheBackend(fake_redis, max_entries=2)
+        backend.set("a", "1", 60)
+        backend.set("b", "2", 60)
+
+        # Act
+        evicted = backend.set("c", "3", 60)
+
+        # Assert
+        assert evicted == 1
+        assert backend.get("a") is None
+        assert backend.get("c") == "3"
+        assert backend.size() == 2
+
+    def test_clear_removes_entries(self, fake_redis):
+        backend = RedisLeMURCacheBackend(fake_redis)
+        backend.set("a", "1", 60)
+
+        backend.clear()
+
+        assert backend.get("a") is None
+        assert backend.size() == 0
+
+
+class TestLeMURResultCache:
+    """Hit/miss accounting and failure isolation."""
+
+    def test_counts_hits_misses_and_stores(self, sqlite_backend):
+        cache = LeMURResultCache(sqlite_backend)
+
+        assert cache.get("k") is None
+        cache.set("k", "value")
+        assert cache.get("k") == "value"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["stores"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+        assert stats["backend"] == "SQLiteLeMURCacheBackend"
+
+    def test_backend_failures_degrade_to_misses(self, failing_backend):
+        cache = LeMURResultCache(failing_backend(LeMURCacheBackend))
+
+        assert cache.get("k") is None
+        cache.set("k", "value")
+
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["errors"] == 2
+        assert stats["entries"] is None
+
+
+@pytest.mark.skipif(
+    not hasattr(aai, "Lemur"), reason="Installed assemblyai SDK has no LeMUR client"
+)
+class TestSmootherCaching:
+    """LeMURTranscriptSmoother skips LeMUR for unchanged requests."""
+
+    def setup_method(self):
+        self.segments = [
+            {"speaker": "A", "text": "你 覺得 呢", "start": 0, "end": 1000},
+            {"speaker": "B", "text": "我 想 一下", "start": 1000, "end": 2000},
+        ]
+        self.context = SmoothingContext(session_language="zh-TW")
+
+    def build_smoother(self, sqlite_backend, response):
+        smoother = LeMURTranscriptSmoother(
+            api_key="test_api_key", cache=LeMURResultCache(sqlite_backend)
+        )
+        smoother.lemur = MagicMock()
+        smoother.lemur.task.return_value = SimpleNamespace(response=response)
+        return smoother
+
+    def test_unchanged_batch_is_not_resent(self, sqlite_backend):
+        # Arrange
+        smoother = self.build_smoother(sqlite_backend, "A: 你覺得呢？\nB: 我想一下。")
+
+        # Act
+        for _ in range(2):
+            first = asyncio.run(
+                smoother._process_punctuation_batch(
+                    self.segments, self.context, {}, None, batch_num=1
+                )
+            )
+
+        # Assert
+        assert smoother.lemur.task.call_count == 1
+        assert smoother.cache.stats()["hits"] == 1
+        assert [segment.text for segment in first]
+
+    def test_changed_speaker_mapping_is_resent(self, sqlite_backend):
+        smoother = self.build_smoother(sqlite_backend, "A: 你覺得呢？\nB: 我想一下。")
+
+        asyncio.run(
+            smoother._process_punctuation_batch(
+                self.segments, self.context, {}, None, batch_num=1
+            )
+        )
+        asyncio.run(
+            smoother._process_punctuation_batch(
+                self.segments, self.context, {"A": "教練"}, None, batch_num=1
+            )
+        )
+
+        assert smoother.lemur.task.call_count == 2
+
+    def test_speaker_mapping_is_cached(self, sqlite_backend):
+        smoother = self.build_smoother(sqlite_backend, '{"A": "教練", "B": "客戶"}')
+
+        first = asyncio.run(
+            smoother._correct_speakers_with_lemur("A: 你覺得呢", self.context)
+        )
+        second = asyncio.run(
+            smoother._correct_speakers_with_lemur("A: 你覺得呢", self.context)
+        )
+
+        assert first == second == {"A": "教練", "B": "客戶"}
+        assert smoother.lemur.task.call_count == 1
+
+    def test_unparseable_response_is_not_cached(self, sqlite_backend):
+        smoother = self.build_smoother(sqlite_backend, "not json")
+
+        for _ in range(2):
+            assert (
+                asyncio.run(
+                    smoother._correct_speakers_with_lemur("A: 你覺得呢", self.context)
+                )
+                == {}
+            )
+
+        assert smoother.lemur.task.call_count == 2
+        assert smoother.cache.stats()["stores"] == 0
@@ -0,0 +1,204 @@
+"""
+Unit tests for the process-wide LeMUR request scheduler.
+
+Covers bounded concurrency, priority ordering, AIMD backoff on throttling
+responses, and latency histograms.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from coaching_assistant.services.lemur_scheduler import (
+    LatencyHistogram,
+    LeMURPriority,
+    LeMURScheduler,
+    is_throttling_error,
+)
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = LeMURScheduler(max_concurrency=2, backoff_seconds=0)
+    yield scheduler
+    scheduler.shutdown()
+
+
+class TestThrottlingDetection:
+    """is_throttling_error classification."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            StatusError(429),
+            StatusError(503),
+            SimpleNamespace(response=SimpleNamespace(status_code=502)),
+            Exception("Too Many Requests"),
+            Exception("LeMUR request failed with status 500"),
+            Exception("Request failed with status code: 429"),
+            Exception("HTTP/1.1 502 Bad Gateway"),
+        ],
+    )
+    def test_throttling_errors(self, error):
+        assert is_throttling_error(error)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            StatusError(400),
+            StatusError(401),
+            ValueError("invalid JSON"),
+            Exception("Input exceeds the limit of 500 words"),
+            Exception("Transcript 1429 not found"),
+        ],
+    )
+    def test_other_errors(self, error):
+        assert not is_throttling_error(error)
+
+
+class TestLatencyHistogram:
+    def test_observations_land_in_buckets(self):
+        histogram = LatencyHistogram(buckets=(1.0, 5.0))
+
+        for seconds in (0.2, 1.0, 3.0, 90.0):
+            histogram.observe(seconds)
+
+        assert histogram.to_dict() == {
+            "count": 4,
+            "sum_seconds": 94.2,
+            "buckets": {"1.0": 2, "5.0": 1, "+Inf": 1},
+        }
+
+
+class TestLeMURScheduler:
+    """Scheduling behaviour."""
+
+    def test_run_returns_result_and_records_latency(self, scheduler):
+        result = asyncio.run(scheduler.run(lambda x: x * 2, 21, label="batch"))
+
+        stats = scheduler.stats()
+        assert result == 42
+        assert stats["completed"] == 1
+        assert stats["latency"]["batch"]["count"] == 1
+
+    def test_errors_propagate_without_backoff(self, scheduler):
+        def fail():
+            raise ValueError("bad prompt")
+
+        with pytest.raises(ValueError):
+            asyncio.run(scheduler.run(fail))
+
+        assert scheduler.stats()["failed"] == 1
+        assert scheduler.limit == 2
+
+    def test_concurrency_is_bounded(self, scheduler):
+        # Arrange
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+
+        # Act
+        futures = [scheduler.submit(work) for _ in range(8)]
+        for future in futures:
+            future.result(timeout=5)
+
+        # Assert
+        assert state["peak"] == 2
+
+    def test_interactive_work_runs_before_background(self):
+        # Arrange
+        scheduler = LeMURScheduler(max_concurrency=1)
+        release = threading.Event()
+        order = []
+        blocker = scheduler.submit(release.wait)
+
+        # Act
+        futures = [
+            scheduler.submit(order.append, "background-1"),
+            scheduler.submit(order.append, "background-2"),
+            scheduler.submit(
+                order.append, "interactive", priority=LeMURPriority.INTERACTIVE
+            ),
+        ]
+        release.set()
+        blocker.result(timeout=5)
+        for future in futures:
+            future.result(timeout=5)
+        scheduler.shutdown()
+
+        # Assert
+        assert order == ["interactive", "background-1", "background-2"]
+
+    def test_throttling_halves_limit_and_retries(self):
+        # Arrange
+        scheduler = LeMURScheduler(max_concurrency=4, backoff_seconds=0)
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise StatusError(429)
+            return "ok"
+
+        # Act
+        result = scheduler.submit(flaky).result(timeout=5)
+        stats = scheduler.stats()
+        scheduler.shutdown()
+
+        # Assert
+        assert result == "ok"
+        assert len(attempts) == 2
+        assert stats["throttled"] == 1
+        # Halved to 2, then one additive step of 1/2 after the retry succeeds
+        assert stats["limit"] == 2
+
+    def test_gives_up_after_max_retries(self):
+        scheduler = LeMURScheduler(max_concurrency=4, max_retries=1, backoff_seconds=0)
+
+        def overloaded():
+            raise StatusError(503)
+
+        with pytest.raises(StatusError):
+            scheduler.submit(overloaded).result(timeout=5)
+        stats = scheduler.stats()
+        scheduler.shutdown()
+
+        assert stats["throttled"] == 2
+        assert stats["failed"] == 1
+        assert stats["limit"] == 1
+
+    def test_limit_recovers_additively(self):
+        scheduler = LeMURScheduler(max_concurrency=4, max_retries=0, backoff_seconds=0)
+
+        def rate_limited():
+            raise StatusError(429)
+
+        with pytest.raises(StatusError):
+            scheduler.submit(rate_limited).result(timeout=5)
+        assert scheduler.limit == 2
+
+        for _ in range(10):
+            scheduler.submit(lambda: None).result(timeout=5)
+        scheduler.shutdown()
+
+        assert scheduler.limit == 4
+
+    def test_invalid_limits_rejected(self):
+        with pytest.raises(ValueError):
+            LeMURScheduler(max_concurrency=2, min_concurrency=3)
@@ -0,0 +1,70 @@
+import io
+
+import pytest
+
+from coaching_assistant.parser import (
+    UnrecognizedFormatError,
+    VTTFormat,
+    detect_format,
+    iter_cues,
+    parse_vtt,
+)
+
+TEAMS_VTT = (
+    "WEBVTT\r\n\r\n"
+    "1\r\n"
+    "00:00:01.000 --> 00:00:02.000\r\n"
+    "<v John Doe>Hello\r\nthere</v>\r\n\r\n"
+    "00:00:03.000 --> 00:00:04.000\r\n"
+    "<v John Doe>Note: one more thing</v>\r\n\r\n"
+    "00:00:05.000 --> 00:00:06.000\r\n"
+    "<v 王小明>你好</v>\r\n"
+)
+
+MAC_WHISPER_VTT = (
+    "WEBVTT\n\n"
+    "00:00:00.500 --> 00:00:03.000\n"
+    "Coach: Hello there.\n\n"
+    "00:00:03.500 --> 00:00:06.000\n"
+    "Client: Hi coach.\n"
+)
+
+
+def test_detect_format():
+    assert detect_format(TEAMS_VTT) == VTTFormat.MS_TEAMS
+    assert detect_format(MAC_WHISPER_VTT) == VTTFormat.MAC_WHISPER
+    assert detect_format("WEBVTT\n\nnothing here\n") is None
+
+
+def test_iter_cues_from_byte_chunks_matches_string_parse():
+    """Chunk boundaries inside multi-byte characters and CRLF must not matter."""
+    data = TEAMS_VTT.encode("utf-8")
+    chunks = (data[i : i + 3] for i in range(0, len(data), 3))
+
+    streamed = list(iter_cues(chunks))
+
+    assert streamed == parse_vtt(TEAMS_VTT)
+    assert streamed == [
+        {"time": "00:00:01.000", "speaker": "John Doe", "content": "Hello there"},
+        {
+            "time": "00:00:03.000",
+            "speaker": "John Doe",
+            "content": "Note: one more thing",
+        },
+        {"time": "00:00:05.000", "speaker": "王小明", "content": "你好"},
+    ]
+
+
+def test_iter_cues_from_file_object():
+    cues = list(iter_cues(io.BytesIO(MAC_WHISPER_VTT.encode("utf-8"))))
+    assert [cue["speaker"] for cue in cues] == ["Coach", "Client"]
+
+
+def test_iter_cues_rejects_invalid_utf8():
+    with pytest.raises(UnrecognizedFormatError):
+        list(iter_cues(io.BytesIO(b"WEBVTT\n\n\xff\xfe")))
+
+
+def test_iter_cues_unrecognized_format():
+    with pytest.raises(UnrecognizedFormatError):
+        list(iter_cues("WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nno speaker\n"))
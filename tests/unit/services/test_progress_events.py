@@ -0,0 +1,306 @@
+"""
+Unit tests for the transcription progress push channel.
+
+Covers milestone-coalesced ProcessingStatus commits, the in-memory and Redis
+brokers, and the Server-Sent Events endpoint relaying published progress.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI
+
+from coaching_assistant.api.v1 import sessions
+from coaching_assistant.api.v1.auth import get_current_user_dependency
+from coaching_assistant.core.database import get_db
+from coaching_assistant.core.models.session import SessionStatus
+from coaching_assistant.models.processing_status import ProcessingStatus
+from coaching_assistant.services.progress_events import (
+    CHANNEL_PREFIX,
+    LATEST_KEY_PREFIX,
+    InMemoryProgressBroker,
+    ProgressReporter,
+    RedisProgressBroker,
+    build_progress_event,
+    get_progress_broker,
+)
+
+
+class CountingSession:
+    """Stands in for the task's db session and counts commits."""
+
+    def __init__(self):
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+class RecordingBroker(InMemoryProgressBroker):
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def publish(self, session_id, event):
+        self.events.append(event)
+        super().publish(session_id, event)
+
+
+class FailingBroker(InMemoryProgressBroker):
+    def publish(self, session_id, event):
+        raise ConnectionError("redis is down")
+
+
+def processing_status():
+    return ProcessingStatus(session_id=uuid4(), status="processing", progress=0)
+
+
+class TestProgressReporter:
+    def test_stt_callbacks_commit_only_at_milestones(self):
+        # Arrange
+        db = CountingSession()
+        broker = RecordingBroker()
+        reporter = ProgressReporter(db, processing_status(), broker)
+
+        # Act: setup milestones, then one callback per percent of STT progress
+        reporter.update(10, "Connecting...")
+        reporter.update(25, "Processing audio...")
+        for percent in range(100):
+            reporter.update(25 + percent // 2, f"{percent}% processed")
+        reporter.update(80, "Saving transcript segments...")
+
+        # Assert: 10, 25, 50 and 80 were committed, every update was published
+        assert db.commits == 4
+        assert len(broker.events) == 103
+        assert broker.events[-1]["progress"] == 80
+
+    def test_status_change_and_forced_commit(self):
+        db = CountingSession()
+        reporter = ProgressReporter(db, processing_status(), RecordingBroker())
+
+        reporter.update(30, "Processing...", status="error")
+        reporter.update(30, "Retrying...", commit=True)
+        reporter.update(31, "Processing...", commit=False)
+
+        assert db.commits == 2
+
+    def test_broker_failure_does_not_interrupt_the_task(self):
+        db = CountingSession()
+        reporter = ProgressReporter(db, processing_status(), FailingBroker())
+
+        reporter.update(10, "Connecting...")
+
+        assert db.commits == 1
+
+    def test_without_broker_only_milestones_are_recorded(self):
+        db = CountingSession()
+        status = processing_status()
+        reporter = ProgressReporter(db, status, broker=None)
+
+        reporter.update(40, "Processing...")
+
+        assert (status.progress, db.commits) == (40, 1)
+
+
+class TestInMemoryProgressBroker:
+    def test_events_published_from_worker_threads_reach_subscribers(self):
+        broker = InMemoryProgressBroker()
+        session_id = uuid4()
+
+        async def scenario():
+            subscription = await broker.subscribe(session_id)
+            await asyncio.to_thread(
+                broker.publish,
+                session_id,
+                build_progress_event(session_id, "processing", 40),
+            )
+            event = await subscription.next_event(timeout=1)
+            idle = await subscription.next_event(timeout=0.01)
+            await subscription.close()
+            return event, idle, await broker.latest(session_id)
+
+        event, idle, latest = asyncio.run(scenario())
+
+        assert event["progress"] == 40
+        assert idle is None
+        assert latest == event
+        assert broker._subscriptions == {}
+
+
+class TestRedisProgressBroker:
+    def test_publish_stores_latest_and_publishes(self, fake_redis):
+        broker = RedisProgressBroker(
+            fake_redis, async_client=None, latest_ttl_seconds=60
+        )
+        event = build_progress_event("s1", "processing", 40)
+
+        broker.publish("s1", event)
+
+        assert fake_redis.get(LATEST_KEY_PREFIX + "s1") == json.dumps(event)
+        assert fake_redis.expiry[LATEST_KEY_PREFIX + "s1"] > time.time()
+        assert fake_redis.published == [(CHANNEL_PREFIX + "s1", json.dumps(event))]
+
+
+SESSION_ID = uuid4()
+USER = SimpleNamespace(id=uuid4())
+
+
+class StatusUseCase:
+    def __init__(self, status):
+        self.status = status
+
+    def get_detailed_status(self, session_id, user_id):
+        if session_id != SESSION_ID:
+            raise ValueError("Session not found or access denied")
+        session = SimpleNamespace(
+            id=SESSION_ID,
+            status=self.status,
+            created_at=datetime(2025, 1, 1),
+            updated_at=datetime(2025, 1, 1),
+        )
+        return {
+            "session": session,
+            "processing_status": {
+                "progress_percentage": 100 if self.status.value == "completed" else 30,
+                "message": "From the database",
+                "duration_processed": None,
+                "duration_total": 3600,
+            },
+        }
+
+
+class RecordingDBSession:
+    def __init__(self):
+        self.calls = []
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def close(self):
+        self.calls.append("close")
+
+
+class DBCheckingBroker(InMemoryProgressBroker):
+    """Remembers what had happened to the DB session when streaming began."""
+
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+        self.db_calls_at_subscribe = None
+
+    async def subscribe(self, session_id):
+        self.db_calls_at_subscribe = list(self.db.calls)
+        return await super().subscribe(session_id)
+
+
+def build_app(broker, status=SessionStatus.PROCESSING, db=None):
+    app = FastAPI()
+    app.include_router(sessions.router, prefix="/api/v1/sessions")
+    db = db or RecordingDBSession()
+    app.dependency_overrides.update(
+        {
+            get_db: lambda: db,
+            get_current_user_dependency: lambda: USER,
+            sessions.get_session_status_retrieval_use_case: lambda: StatusUseCase(
+                status
+            ),
+            get_progress_broker: lambda: broker,
+        }
+    )
+    return app
+
+
+def parse_events(body):
+    return [
+        json.loads(block.split("data: ", 1)[1])
+        for block in body.split("\n\n")
+        if block.startswith("event: progress")
+    ]
+
+
+async def fetch_events(app, session_id=SESSION_ID, publish=()):
+    """Request the event stream and publish the given events once subscribed."""
+    broker = app.dependency_overrides[get_progress_broker]()
+
+    async def publisher():
+        while broker is None or not broker._subscriptions:
+            await asyncio.sleep(0.001)
+        for event in publish:
+            broker.publish(session_id, event)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        task = asyncio.create_task(publisher())
+        response = await client.get(f"/api/v1/sessions/{session_id}/events")
+        task.cancel()
+    return response
+
+
+class TestSessionProgressStream:
+    def test_relays_events_until_completion(self):
+        # Arrange
+        broker = InMemoryProgressBroker()
+        published = [
+            build_progress_event(SESSION_ID, "processing", 50, "Halfway"),
+            build_progress_event(SESSION_ID, "completed", 100, "Done"),
+            build_progress_event(SESSION_ID, "processing", 10, "Next run"),
+        ]
+
+        # Act
+        response = asyncio.run(fetch_events(build_app(broker), publish=published))
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_events(response.text)
+        assert [event["progress"] for event in events] == [30, 50, 100]
+        assert events[0]["message"] == "From the database"
+        assert broker._subscriptions == {}
+
+    def test_starts_from_latest_published_event(self):
+        broker = InMemoryProgressBroker()
+        broker.publish(
+            SESSION_ID, build_progress_event(SESSION_ID, "processing", 62, "Latest")
+        )
+        done = build_progress_event(SESSION_ID, "completed", 100)
+
+        response = asyncio.run(fetch_events(build_app(broker), publish=[done]))
+
+        assert [e["progress"] for e in parse_events(response.text)] == [62, 100]
+
+    def test_finished_session_sends_one_event(self):
+        app = build_app(InMemoryProgressBroker(), status=SessionStatus.COMPLETED)
+
+        response = asyncio.run(fetch_events(app))
+
+        events = parse_events(response.text)
+        assert [(e["status"], e["progress"]) for e in events] == [("completed", 100)]
+
+    def test_db_session_is_released_before_streaming(self):
+        db = RecordingDBSession()
+        broker = DBCheckingBroker(db)
+        done = build_progress_event(SESSION_ID, "completed", 100)
+
+        response = asyncio.run(fetch_events(build_app(broker, db=db), publish=[done]))
+
+        assert response.status_code == 200
+        assert broker.db_calls_at_subscribe == ["commit", "close"]
+
+    def test_unknown_session_is_not_found(self):
+        app = build_app(InMemoryProgressBroker())
+
+        response = asyncio.run(fetch_events(app, session_id=uuid4()))
+
+        assert response.status_code == 404
+
+    def test_unavailable_without_broker(self):
+        app = build_app(None)
+
+        response = asyncio.run(fetch_events(app))
+
+        assert response.status_code == 503
@@ -1388,6 +1388,61 @@ class TestSessionExportUseCase:
                 sample_session.id, sample_session.user_id, "invalid_format"
             )
 
+    def test_stream_transcript_yields_all_chunks(
+        self, mock_session_repo, mock_transcript_repo, sample_session
+    ):
+        """Test chunked export prefetches the first chunk and keeps the rest lazy."""
+        # Arrange
+        use_case = SessionExportUseCase(mock_session_repo, mock_transcript_repo)
+        sample_session.status = SessionStatus.COMPLETED
+        mock_session_repo.get_by_id.return_value = sample_session
+
+        chunks = [
+            [
+                TranscriptSegment(
+                    id=uuid4(),
+                    session_id=sample_session.id,
+                    speaker_id=1,
+                    start_seconds=float(index),
+                    end_seconds=float(index) + 1,
+                    content=f"Segment {index}",
+                )
+                for index in range(start, start + 2)
+            ]
+            for start in (0, 2)
+        ]
+        mock_transcript_repo.iter_by_session_id.return_value = iter(chunks)
+
+        # Act
+        result = use_case.stream_transcript(
+            sample_session.id, sample_session.user_id, "vtt", chunk_size=2
+        )
+
+        # Assert
+        mock_transcript_repo.iter_by_session_id.assert_called_once_with(
+            sample_session.id, chunk_size=2
+        )
+        mock_transcript_repo.get_by_session_id.assert_not_called()
+        assert result["session"] == sample_session
+        assert result["format"] == "vtt"
+        assert list(result["segment_chunks"]) == chunks
+
+    def test_stream_transcript_without_segments(
+        self, mock_session_repo, mock_transcript_repo, sample_session
+    ):
+        """Test chunked export reports an empty transcript before streaming."""
+        # Arrange
+        use_case = SessionExportUseCase(mock_session_repo, mock_transcript_repo)
+        sample_session.status = SessionStatus.COMPLETED
+        mock_session_repo.get_by_id.return_value = sample_session
+        mock_transcript_repo.iter_by_session_id.return_value = iter([])
+
+        # Act & Assert
+        with pytest.raises(DomainException, match="No transcript segments found"):
+            use_case.stream_transcript(
+                sample_session.id, sample_session.user_id, "json"
+            )
+
 
 class TestSessionTranscriptUploadUseCase:
     """Test cases for SessionTranscriptUploadUseCase."""
@@ -0,0 +1,195 @@
+"""
+Unit tests for the shared VTT/SRT transcript ingest engine.
+"""
+
+import io
+
+import pytest
+
+from coaching_assistant.transcript_ingest import (
+    SpeakerRoleResolver,
+    UnrecognizedFormatError,
+    ingest_transcript,
+    iter_cue_lines,
+    parse_cue_timing,
+    speaker_key,
+)
+
+TEAMS_VTT = (
+    "WEBVTT\r\n\r\n"
+    "3f1c2a-1\r\n"
+    "00:00:01.000 --> 00:00:02.500\r\n"
+    "<v Jolly Shih>Hello\r\nthere</v>\r\n\r\n"
+    "00:00:03.000 --> 00:00:04.000\r\n"
+    "<v 王小明>你好</v>\r\n"
+)
+
+ZOOM_VTT = (
+    "WEBVTT\n\n"
+    "1\n"
+    "00:00:00.500 --> 00:00:03.000\n"
+    "Coach: What would you like to focus on?\n\n"
+    "2\n"
+    "00:00:03.500 --> 00:00:06.000\n"
+    "Client: My career.\n"
+)
+
+SRT = (
+    "1\n"
+    "00:00:00,000 --> 00:00:05,000\n"
+    "教練: 你好嗎？\n\n"
+    "2\n"
+    "00:00:05,000 --> 00:00:10,000\n"
+    "客戶: 我很好，\n"
+    "謝謝\n"
+)
+
+
+class TestCueTiming:
+    """parse_cue_timing timestamp forms."""
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("00:00:01.000 --> 00:00:02.500", (1000, 2500)),
+            ("00:00:01,000 --> 00:00:02,500", (1000, 2500)),
+            ("1:02:03.5 --> 1:02:04.25", (3723500, 3724250)),
+            ("00:01:00 --> 00:01:30", (60000, 90000)),
+            ("01:02.000 --> 01:03.000", (62000, 63000)),
+            ("00:00:01.000 --> 00:00:02.000 align:start", (1000, 2000)),
+        ],
+    )
+    def test_supported_forms(self, line, expected):
+        assert parse_cue_timing(line) == expected
+
+    @pytest.mark.parametrize(
+        "line", ["00:00:01.000 -->", "invalid --> timestamp", "Note: 10:30 --> 11"]
+    )
+    def test_rejected_lines(self, line):
+        assert parse_cue_timing(line) is None
+
+
+class TestTokenizer:
+    """iter_cue_lines single-pass cue splitting."""
+
+    def test_skips_headers_identifiers_and_note_blocks(self):
+        content = (
+            "WEBVTT\nKind: captions\n\n"
+            "NOTE written by\n00:00:09.000 --> 00:00:10.000 inside a note\n\n"
+            "cue-1\n00:00:01.000 --> 00:00:02.000\nfirst\nsecond\n"
+        )
+
+        assert list(iter_cue_lines(content)) == [(1000, 2000, ["first", "second"])]
+
+    def test_cues_without_blank_separator(self):
+        content = (
+            "1\n00:00:01,000 --> 00:00:02,000\nfirst\n"
+            "2\n00:00:02,000 --> 00:00:03,000\nsecond\n"
+        )
+
+        assert [lines for _, _, lines in iter_cue_lines(content)] == [
+            ["first"],
+            ["second"],
+        ]
+
+    def test_byte_chunks_split_inside_characters(self):
+        data = TEAMS_VTT.encode("utf-8")
+        chunks = (data[i : i + 5] for i in range(0, len(data), 5))
+
+        assert list(iter_cue_lines(chunks)) == list(iter_cue_lines(TEAMS_VTT))
+
+    def test_invalid_utf8_rejected(self):
+        with pytest.raises(UnrecognizedFormatError):
+            list(iter_cue_lines(io.BytesIO(b"WEBVTT\n\n\xff\xfe")))
+
+
+class TestIngestTranscript:
+    """Segments produced for each supported layout."""
+
+    def test_teams_voice_tags(self):
+        segments = ingest_transcript(TEAMS_VTT)
+
+        assert [(s.speaker_name, s.content) for s in segments] == [
+            ("Jolly Shih", "Hello there"),
+            ("王小明", "你好"),
+        ]
+        assert segments[0].start_seconds == 1.0
+        assert segments[0].end_seconds == 2.5
+
+    def test_zoom_prefixes_resolve_roles(self):
+        segments = ingest_transcript(ZOOM_VTT)
+
+        assert [(s.speaker_id, s.speaker_role) for s in segments] == [
+            (1, "coach"),
+            (2, "client"),
+        ]
+        assert segments[1].content == "My career."
+
+    def test_srt_multiline_content(self):
+        segments = ingest_transcript(SRT)
+
+        assert [s.to_dict() for s in segments] == [
+            {
+                "start_seconds": 0.0,
+                "end_seconds": 5.0,
+                "content": "你好嗎？",
+                "speaker_id": 1,
+                "speaker_role": "coach",
+            },
+            {
+                "start_seconds": 5.0,
+                "end_seconds": 10.0,
+                "content": "我很好， 謝謝",
+                "speaker_id": 2,
+                "speaker_role": "client",
+            },
+        ]
+
+    def test_cue_without_speaker_defaults_to_coach(self):
+        segments = ingest_transcript("00:00:01.000 --> 00:00:02.000\nplain text\n")
+
+        assert segments[0].speaker_name is None
+        assert (segments[0].speaker_id, segments[0].content) == (1, "plain text")
+
+    def test_role_mapping_overrides_keywords(self):
+        segments = ingest_transcript(
+            TEAMS_VTT, speaker_role_mapping={"speaker_jolly_shih": "client"}
+        )
+
+        assert [s.speaker_role for s in segments] == ["client", "coach"]
+
+
+class TestSpeakerRoleResolver:
+    """Pluggable speaker role resolution."""
+
+    def test_speaker_key_matches_frontend_format(self):
+        assert speaker_key("Jolly Shih (Host)") == "speaker_jolly_shih_host"
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("學員 Amy", (2, "client")),
+            ("王老師", (1, "coach")),
+            ("Speaker 2", (2, "client")),
+            ("說話者 1", (1, "coach")),
+            ("Speaker 7", (1, "coach")),
+            (None, (1, "coach")),
+        ],
+    )
+    def test_default_resolution(self, name, expected):
+        assert SpeakerRoleResolver().resolve(name) == expected
+
+    def test_custom_keywords(self):
+        resolver = SpeakerRoleResolver(
+            keywords=[("client", ["mentee"]), ("coach", ["mentor"])]
+        )
+
+        assert resolver.resolve("Mentee Bob") == (2, "client")
+        assert resolver.resolve("Client Bob") == (1, "coach")
+
+    def test_resolutions_are_cached(self):
+        resolver = SpeakerRoleResolver()
+        resolver.resolve("Client")
+        resolver.keywords = ()
+
+        assert resolver.resolve("Client") == (2, "client")
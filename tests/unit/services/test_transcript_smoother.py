@@ -9,20 +9,27 @@ from typing import Any, Dict, List
 import pytest
 
 from coaching_assistant.services.transcript_smoother import (
+    DETECTION_SAMPLE_WORDS,
     ChineseProcessor,
     ChineseProcessorConfig,
     ChineseSmoothingConfig,
     EnglishProcessor,
     LanguageProcessorFactory,
     MissingWordsError,
+    MultiPatternMatcher,
     PunctuationRepairer,
+    SegmentRecord,
     SpeakerBoundarySmoother,
     SupportedLanguage,
     TranscriptProcessingError,
     TranscriptSmoothingService,
     UnsupportedLanguageError,
     Utterance,
+    UtteranceRecord,
+    WordRecord,
     WordTimestamp,
+    get_language_rules,
+    parse_utterances,
     smooth_and_punctuate,
 )
 
@@ -199,6 +206,65 @@ class TestEnglishProcessor:
             assert result == expected_punct, f"Failed for text: '{text}'"
 
 
+class TestLanguageRules:
+    """Test the compiled per-language rule tables."""
+
+    def test_rules_are_built_once_and_shared(self):
+        # When
+        first = get_language_rules(SupportedLanguage.CHINESE)
+        second = get_language_rules(SupportedLanguage.CHINESE)
+
+        # Then
+        assert first is second
+        assert ChineseProcessor().rules is first
+        assert LanguageProcessorFactory.create_processor(
+            SupportedLanguage.ENGLISH
+        ).rules is get_language_rules(SupportedLanguage.ENGLISH)
+
+    def test_filler_lookup(self):
+        processor = EnglishProcessor()
+
+        assert processor.is_filler("um") is True
+        assert processor.is_filler("goal") is False
+        assert processor.get_filler_words() == list(processor.rules.filler_words)
+
+    def test_multi_pattern_matcher(self):
+        matcher = MultiPatternMatcher(("什麼", "為什麼", "嗎"))
+
+        assert matcher.contains_any("你為什麼不去呢") is True
+        assert matcher.contains_any("好的") is False
+        assert matcher.find_all("為什麼要做什麼嗎") == ["為什麼", "什麼", "嗎"]
+
+    def test_empty_matcher_never_matches(self):
+        matcher = MultiPatternMatcher(())
+
+        assert matcher.contains_any("anything") is False
+        assert matcher.find_all("anything") == []
+
+    def test_unsupported_language_gets_empty_rules(self):
+        rules = get_language_rules(SupportedLanguage.JAPANESE)
+
+        assert rules.filler_set == frozenset()
+        assert rules.question_markers.contains_any("何ですか") is False
+
+    def test_detection_samples_bounded_prefix(self):
+        # Given: a long English head followed by Chinese words
+        words = [
+            WordTimestamp(text="the", start=i, end=i + 1)
+            for i in range(DETECTION_SAMPLE_WORDS)
+        ] + [WordTimestamp(text="你好", start=10_000, end=10_001)] * 1000
+        utterances = [
+            Utterance(speaker="A", start=0, end=10_001, confidence=0.9, words=words)
+        ]
+
+        # When
+        language = LanguageProcessorFactory.detect_language(utterances)
+
+        # Then: only the bounded prefix is inspected
+        assert ChineseProcessor().detect_language(utterances) is False
+        assert language == SupportedLanguage.ENGLISH
+
+
 class TestSpeakerBoundarySmoother:
     """Test speaker boundary smoothing logic."""
 
@@ -531,6 +597,153 @@ class TestTranscriptSmoothingService:
         assert len(result["segments"]) >= 1
 
 
+class TestFastPath:
+    """Test the slotted-record fast path against the pydantic path."""
+
+    TRANSCRIPT = {
+        "utterances": [
+            {
+                "speaker": "A",
+                "start": 1000.4,
+                "end": 3000,
+                "confidence": 0.9,
+                "words": [
+                    {"text": "然後", "start": 1000.4, "end": 1500},
+                    {"text": "我們", "start": 1500, "end": 2000},
+                    {"text": "就", "start": 2000, "end": 3000, "confidence": 0.7},
+                ],
+            },
+            {
+                "speaker": "B",
+                "start": 3100,
+                "end": 3600,
+                "confidence": 0.8,
+                "words": [
+                    {"text": "嗯", "start": 3100, "end": 3300},
+                    {"text": "對", "start": 3300, "end": 3600},
+                ],
+            },
+            {
+                "speaker": "B",
+                "start": 5000,
+                "end": 7000,
+                "confidence": 0.8,
+                "words": [
+                    {"text": "你", "start": 5000, "end": 5400},
+                    {"text": "覺得", "start": 5400, "end": 6000},
+                    {"text": "呢", "start": 6000, "end": 7000},
+                ],
+            },
+        ]
+    }
+
+    def test_parse_utterances_builds_records(self):
+        # When
+        utterances = parse_utterances(self.TRANSCRIPT)
+
+        # Then
+        assert len(utterances) == 3
+        assert isinstance(utterances[0], UtteranceRecord)
+        assert utterances[0].start == 1000
+        assert utterances[0].words[0] == WordRecord("然後", 1000, 1500, 1.0)
+        assert utterances[0].words[2].confidence == 0.7
+
+    def test_records_are_slotted(self):
+        word = WordRecord("hi", 0, 100)
+
+        with pytest.raises(AttributeError):
+            word.extra = True
+
+    @pytest.mark.parametrize("language", ["auto", "chinese", "english"])
+    def test_fast_path_matches_pydantic_path(self, language):
+        # Given
+        service = TranscriptSmoothingService()
+
+        # When
+        expected = service.smooth_and_punctuate(self.TRANSCRIPT, language=language)
+        actual = service.smooth_and_punctuate_fast(self.TRANSCRIPT, language=language)
+
+        # Then
+        assert all(isinstance(segment, SegmentRecord) for segment in actual.segments)
+        assert [
+            {
+                "speaker": segment.speaker,
+                "start_ms": segment.start_ms,
+                "end_ms": segment.end_ms,
+                "text": segment.text,
+                "source_utterance_indices": segment.source_utterance_indices,
+                "note": segment.note,
+            }
+            for segment in actual.segments
+        ] == [segment.model_dump() for segment in expected.segments]
+        assert actual.stats == expected.stats
+
+    def test_fast_path_missing_words_error(self):
+        service = TranscriptSmoothingService()
+        transcript_json = {
+            "utterances": [
+                {"speaker": "A", "start": 0, "end": 10, "confidence": 0.9, "words": []}
+            ]
+        }
+
+        with pytest.raises(MissingWordsError, match="Words missing in utterance 0"):
+            service.smooth_and_punctuate_fast(transcript_json)
+
+    def test_fast_path_empty_utterances_error(self):
+        service = TranscriptSmoothingService()
+
+        with pytest.raises(TranscriptProcessingError, match="Empty utterances list"):
+            service.smooth_and_punctuate_fast({"utterances": []})
+
+    def test_fast_path_invalid_timestamp_error(self):
+        transcript_json = {
+            "utterances": [
+                {
+                    "speaker": "A",
+                    "start": 0,
+                    "end": 10,
+                    "confidence": 0.9,
+                    "words": [{"text": "hi", "start": "soon", "end": 10}],
+                }
+            ]
+        }
+
+        with pytest.raises(TranscriptProcessingError, match="start in word 0"):
+            parse_utterances(transcript_json)
+
+    @pytest.mark.parametrize(
+        "utterances, message",
+        [
+            ("not a list", "Invalid utterances"),
+            (["not an object"], "Invalid utterance 0"),
+            ([None], "Invalid utterance 0"),
+            (
+                [{"speaker": "A", "confidence": 0.9, "words": "hi"}],
+                "Invalid words in utterance 0",
+            ),
+            (
+                [{"speaker": "A", "confidence": 0.9, "words": [None]}],
+                "Invalid word 0 of utterance 0",
+            ),
+            (
+                [
+                    {
+                        "speaker": "A",
+                        "confidence": 0.9,
+                        "words": [
+                            {"text": "hi", "start": 0, "end": 10, "confidence": "high"}
+                        ],
+                    }
+                ],
+                "Invalid confidence in word 0 of utterance 0",
+            ),
+        ],
+    )
+    def test_fast_path_malformed_payload_error(self, utterances, message):
+        with pytest.raises(TranscriptProcessingError, match=message):
+            parse_utterances({"utterances": utterances})
+
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
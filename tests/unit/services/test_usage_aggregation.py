@@ -0,0 +1,186 @@
+"""Tests for the SQL aggregation behind UsageAnalyticsService snapshots."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.infrastructure.db.bulk import bulk_insert
+from coaching_assistant.models import Base
+from coaching_assistant.models.session import Session as TranscriptionSession
+from coaching_assistant.models.usage_log import TranscriptionType, UsageLog
+from coaching_assistant.models.user import User, UserPlan
+from coaching_assistant.services.usage_analytics_service import (
+    UsageAnalyticsService,
+)
+
+START = datetime(2025, 3, 1)
+END = datetime(2025, 4, 1)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        session.statements.append(statement.split()[0])
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def user_id(db):
+    user_id = uuid4()
+    bulk_insert(
+        db,
+        User.__table__,
+        [
+            {
+                "id": user_id,
+                "email": "coach@example.com",
+                "name": "Coach",
+                "plan": UserPlan.FREE,
+            }
+        ],
+    )
+    db.commit()
+    return user_id
+
+
+def add_log(db, user_id, minutes=30, cost="0.48", provider="google", **kw):
+    bulk_insert(
+        db,
+        UsageLog.__table__,
+        [
+            {
+                "user_id": user_id,
+                "session_id": uuid4(),
+                "duration_minutes": minutes,
+                "duration_seconds": minutes * 60,
+                "cost_usd": Decimal(cost),
+                "stt_provider": provider,
+                "user_plan": "free",
+                "created_at": datetime(2025, 3, 2, 9, 0),
+                **kw,
+            }
+        ],
+    )
+
+
+def add_session(db, user_id, created_at, updated_at):
+    bulk_insert(
+        db,
+        TranscriptionSession.__table__,
+        [
+            {
+                "user_id": user_id,
+                "title": "Weekly",
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+        ],
+    )
+
+
+def aggregate(db, user_id):
+    db.commit()
+    db.statements.clear()
+    return UsageAnalyticsService(db)._aggregate_usage_data(user_id, START, END)
+
+
+def test_usage_logs_are_aggregated_in_one_query(db, user_id):
+    add_log(
+        db,
+        user_id,
+        transcription_started_at=datetime(2025, 3, 2, 9, 0),
+        transcription_completed_at=datetime(2025, 3, 2, 9, 2),
+    )
+    add_log(
+        db,
+        user_id,
+        minutes=20,
+        cost="0.30",
+        provider="assemblyai",
+        transcription_started_at=datetime(2025, 3, 2, 10, 0),
+        transcription_completed_at=datetime(2025, 3, 2, 10, 1),
+    )
+    add_log(
+        db,
+        user_id,
+        minutes=10,
+        cost="0",
+        is_billable=False,
+        transcription_type=TranscriptionType.RETRY_FAILED,
+        transcription_completed_at=datetime(2025, 3, 2, 11, 0),
+    )
+    add_log(
+        db, user_id, minutes=0, cost="0", transcription_type=TranscriptionType.EXPORT
+    )
+    add_log(db, user_id, created_at=datetime(2025, 2, 27, 10, 0))  # previous month
+
+    usage = aggregate(db, user_id)
+
+    # usage logs, sessions, then the user
+    assert db.statements == ["SELECT"] * 3
+    assert usage.pop("plan_limits")["minutes"] == 200
+    assert usage.pop("total_cost_usd") == pytest.approx(0.78)
+    assert usage.pop("avg_processing_time_seconds") == pytest.approx(90)
+    assert usage == {
+        "sessions_created": 0,
+        "audio_minutes_processed": 60,
+        "transcriptions_completed": 4,
+        "exports_generated": 1,
+        "storage_used_mb": 0,
+        "unique_clients": 0,
+        "api_calls_made": 4,
+        "concurrent_sessions_peak": 0,
+        "plan_name": "free",
+        "billable_transcriptions": 3,
+        "free_retries": 1,
+        "google_stt_minutes": 40,
+        "assemblyai_minutes": 20,
+        "exports_by_format": {"unknown": 1},
+        "failed_transcriptions": 1,
+    }
+
+
+def test_empty_period_reports_zeros(db, user_id):
+    usage = aggregate(db, user_id)
+
+    assert usage["transcriptions_completed"] == 0
+    assert usage["audio_minutes_processed"] == 0
+    assert usage["total_cost_usd"] == 0
+    assert usage["google_stt_minutes"] == 0
+    assert usage["avg_processing_time_seconds"] == 0
+    assert usage["exports_by_format"] == {}
+    assert usage["sessions_created"] == 0
+    assert usage["concurrent_sessions_peak"] == 0
+
+
+def test_concurrent_peak_counts_overlapping_sessions(db, user_id):
+    add_session(db, user_id, datetime(2025, 3, 2, 9, 0), datetime(2025, 3, 2, 12, 0))
+    add_session(db, user_id, datetime(2025, 3, 2, 10, 0), datetime(2025, 3, 2, 11, 0))
+    add_session(db, user_id, datetime(2025, 3, 2, 10, 30), datetime(2025, 3, 2, 13, 0))
+    add_session(db, user_id, datetime(2025, 3, 2, 14, 0), datetime(2025, 3, 2, 15, 0))
+    # Started before the period, so neither counted nor overlapping
+    add_session(db, user_id, datetime(2025, 2, 28, 9, 0), datetime(2025, 3, 2, 11, 0))
+
+    usage = aggregate(db, user_id)
+
+    assert usage["sessions_created"] == 4
+    assert usage["concurrent_sessions_peak"] == 3
+
+
+def test_sessions_that_touch_count_as_concurrent(db, user_id):
+    add_session(db, user_id, datetime(2025, 3, 2, 9, 0), datetime(2025, 3, 2, 10, 0))
+    add_session(db, user_id, datetime(2025, 3, 2, 10, 0), datetime(2025, 3, 2, 10, 0))
+
+    assert aggregate(db, user_id)["concurrent_sessions_peak"] == 2
@@ -0,0 +1,245 @@
+"""
+Unit tests for the monthly minute quota counters behind admission checks.
+
+Covers seeding from the database, increments after committed usage logs,
+reconciliation of dirty users, month-keyed expiry and the fallback to the
+database when the store fails.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.infrastructure.db.bulk import bulk_insert
+from coaching_assistant.models import Base
+from coaching_assistant.models.session import Session as TranscriptionSession
+from coaching_assistant.models.user import User, UserPlan
+from coaching_assistant.services import usage_quota, usage_tracking
+from coaching_assistant.services.plan_limits import PlanLimit
+from coaching_assistant.services.usage_quota import (
+    COUNTER_GRACE,
+    InMemoryUsageQuotaBackend,
+    RedisUsageQuotaBackend,
+    UsageQuota,
+    UsageQuotaBackend,
+    counter_key,
+    month_start,
+    next_month_start,
+)
+from coaching_assistant.services.usage_tracking import UsageTrackingService
+
+LIMITS = {
+    "free": PlanLimit(max_minutes=200, max_file_size_mb=60),
+    "enterprise": PlanLimit(max_minutes=-1, max_file_size_mb=500),
+}
+
+
+@pytest.fixture(autouse=True)
+def plan_limits(monkeypatch):
+    monkeypatch.setattr(
+        usage_quota,
+        "get_global_plan_limits",
+        lambda: SimpleNamespace(get_plan_limit=lambda plan: LIMITS[plan]),
+    )
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        session.statements.append(statement.split()[0])
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def quota():
+    return UsageQuota(InMemoryUsageQuotaBackend())
+
+
+def add_user(db, usage_minutes, current_month_start=None):
+    user_id = uuid4()
+    bulk_insert(
+        db,
+        User.__table__,
+        [
+            {
+                "id": user_id,
+                "email": f"{user_id}@example.com",
+                "name": "Coach",
+                "plan": UserPlan.FREE,
+                "usage_minutes": usage_minutes,
+                "current_month_start": current_month_start or month_start(),
+            }
+        ],
+    )
+    db.commit()
+    return user_id
+
+
+class TestUsageQuota:
+    def test_first_check_seeds_from_db_and_later_checks_skip_it(self, db, quota):
+        coach = add_user(db, usage_minutes=150)
+
+        first = quota.check_minutes(db, coach, UserPlan.FREE, requested_minutes=30)
+        db.statements.clear()
+        second = quota.check_minutes(db, coach, UserPlan.FREE, requested_minutes=60)
+
+        assert first.allowed is True
+        assert first.current == 150
+        assert first.limit == 200
+        assert second.allowed is False
+        assert "Total minutes limit exceeded" in second.message
+        assert db.statements == []
+
+    def test_minutes_from_an_earlier_month_count_as_zero(self, db, quota):
+        coach = add_user(
+            db, usage_minutes=500, current_month_start=datetime(2024, 1, 1)
+        )
+
+        assert quota.used_minutes(db, coach) == 0
+
+    def test_recorded_minutes_count_against_the_limit(self, db, quota):
+        coach = add_user(db, usage_minutes=190)
+        assert quota.check_minutes(db, coach, "free").allowed is True
+
+        quota.record(coach, 10)
+
+        check = quota.check_minutes(db, coach, "free")
+        assert check.allowed is False
+        assert check.current == 200
+
+    def test_unlimited_plan_is_always_admitted(self, db, quota):
+        coach = add_user(db, usage_minutes=10_000)
+
+        check = quota.check_minutes(
+            db, coach, UserPlan.ENTERPRISE, requested_minutes=600
+        )
+
+        assert check.allowed is True
+        assert check.limit == -1
+
+    def test_upload_reports_the_limit_that_failed(self, db, quota):
+        coach = add_user(db, usage_minutes=10)
+        maxed = add_user(db, usage_minutes=200)
+
+        too_large = quota.check_upload(db, coach, "free", file_size_mb=80)
+        out_of_minutes = quota.check_upload(db, maxed, "free", file_size_mb=10)
+        admitted = quota.check_upload(db, coach, "free", file_size_mb=10)
+
+        assert (too_large.allowed, too_large.limit_type, too_large.limit) == (
+            False,
+            "file_size",
+            60,
+        )
+        assert "exceeds plan limit of 60MB" in too_large.message
+        assert (out_of_minutes.allowed, out_of_minutes.limit_type) == (
+            False,
+            "minutes",
+        )
+        assert (admitted.allowed, admitted.limit_type) == (True, "file_size")
+
+    def test_unseeded_counter_is_not_created_by_an_increment(self, db, quota):
+        coach = add_user(db, usage_minutes=40)
+
+        quota.record(coach, 10)
+
+        assert quota.backend.get(counter_key(coach, month_start())) is None
+        assert quota.used_minutes(db, coach) == 40
+
+    def test_reconcile_rewrites_dirty_users_from_the_database(self, db, quota):
+        coach, idle = add_user(db, usage_minutes=40), add_user(db, usage_minutes=5)
+        quota.used_minutes(db, coach)
+        quota.used_minutes(db, idle)
+        quota.record(coach, 10)
+        # The committed total differs from the counter, e.g. a lost increment
+        db.query(User).filter_by(id=coach).update({"usage_minutes": 75})
+        db.commit()
+
+        assert quota.reconcile(db) == 1
+        assert quota.reconcile(db) == 0
+
+        db.statements.clear()
+        assert quota.used_minutes(db, coach) == 75
+        assert quota.used_minutes(db, idle) == 5
+        assert db.statements == []
+
+    def test_counters_are_keyed_by_month(self, db, quota):
+        coach = add_user(db, usage_minutes=30)
+        quota.used_minutes(db, coach)
+        last_month = month_start() - timedelta(days=1)
+
+        assert counter_key(coach, month_start()).endswith(
+            month_start().strftime("%Y-%m")
+        )
+        assert quota.backend.get(counter_key(coach, month_start(last_month))) is None
+
+    def test_memory_backend_entries_expire_after_ttl(self, db):
+        quota = UsageQuota(InMemoryUsageQuotaBackend(ttl_seconds=0))
+        coach = add_user(db, usage_minutes=30)
+        quota.used_minutes(db, coach)
+
+        db.statements.clear()
+        quota.used_minutes(db, coach)
+
+        assert db.statements == ["SELECT"]
+
+    def test_store_failures_fall_back_to_the_database(self, db, failing_backend):
+        quota = UsageQuota(failing_backend(UsageQuotaBackend))
+        coach = add_user(db, usage_minutes=120)
+
+        assert quota.used_minutes(db, coach) == 120
+        quota.record(coach, 10)
+        quota.invalidate(coach)
+
+    def test_create_usage_log_records_billable_minutes(self, db, quota, monkeypatch):
+        monkeypatch.setattr(usage_tracking, "get_usage_quota", lambda: quota)
+        coach = add_user(db, usage_minutes=20)
+        session = TranscriptionSession(
+            user_id=coach,
+            title="Session",
+            audio_filename="session.mp3",
+            duration_seconds=600,
+            stt_provider="google",
+        )
+        db.add(session)
+        db.commit()
+        quota.used_minutes(db, coach)
+
+        UsageTrackingService(db).create_usage_log(session)
+
+        assert quota.backend.get(counter_key(coach, month_start())) == 30
+
+
+def increment_if_seeded(client, keys, args):
+    """Python stand-in for the backend's increment script."""
+    key, dirty_key = keys
+    minutes, user_id = args
+    client.sadd(dirty_key, user_id)
+    return client.incrby(key, minutes) if client.exists(key) else None
+
+
+def test_redis_backend_counters_expire_after_their_month(fake_redis):
+    fake_redis.scripts[usage_quota._INCREMENT_SCRIPT] = increment_if_seeded
+    backend = RedisUsageQuotaBackend(fake_redis)
+    start = month_start()
+    key = counter_key("u1", start)
+    expires_at = next_month_start(start) + COUNTER_GRACE
+
+    assert backend.increment(key, 5, "u1") is None
+    assert backend.seed(key, 40, expires_at) == 40
+    assert backend.seed(key, 99, expires_at) == 40
+    assert backend.increment(key, 5, "u1") == 45
+    assert key == f"quota:minutes:u1:{start:%Y-%m}"
+    assert fake_redis.expiry[key] == expires_at
+    assert backend.pop_dirty(10) == ["u1"]
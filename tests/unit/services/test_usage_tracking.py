@@ -136,6 +136,29 @@ class TestUsageTrackingService:
         assert retry_log.is_billable is False
         assert retry_log.parent_log_id == initial_log.id
 
+    def test_create_usage_log_resets_last_months_counters(
+        self, db_session: Session, test_user: User, test_session
+    ):
+        """Test that the first log of a month restarts the monthly counters."""
+        test_user.usage_minutes = 100
+        test_user.transcription_count = 20
+        test_user.total_transcriptions_generated = 20
+        test_user.current_month_start = datetime.now(UTC) - timedelta(days=40)
+        db_session.commit()
+
+        service = UsageTrackingService(db_session)
+        service.create_usage_log(session=test_session)
+        service.create_usage_log(session=test_session)
+
+        db_session.refresh(test_user)
+        assert test_user.usage_minutes == 20
+        assert test_user.transcription_count == 2
+        assert test_user.total_transcriptions_generated == 22
+        assert test_user.current_month_start.day == 1
+
+        analytics = db_session.query(UsageAnalytics).filter_by(user_id=test_user.id)
+        assert analytics.one().transcriptions_completed == 2
+
     def test_get_user_usage_summary(
         self, db_session: Session, test_user: User, test_session
     ):
@@ -0,0 +1,301 @@
+"""
+Unit tests for the authenticated-user principal cache.
+
+Covers the in-memory and Redis backends (TTL, LRU bound, per-user
+invalidation), rebuilding a cached principal without a SELECT, and
+invalidation through the user repository and role changes.
+"""
+
+import json
+import time
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from coaching_assistant.api.v1 import auth
+from coaching_assistant.core.models.user import UserPlan as DomainUserPlan
+from coaching_assistant.infrastructure.db.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+)
+from coaching_assistant.models import Base
+from coaching_assistant.models.user import User, UserPlan, UserRole
+from coaching_assistant.services import user_principal_cache
+from coaching_assistant.services.permissions import PermissionService
+from coaching_assistant.services.user_principal_cache import (
+    InMemoryUserPrincipalBackend,
+    RedisUserPrincipalBackend,
+    UserPrincipalBackend,
+    UserPrincipalCache,
+    invalidate_user_principal,
+    restore_user,
+    snapshot_user,
+)
+
+PRINCIPAL = {"id": "u1", "email": "coach@example.com"}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Install a fresh in-memory cache as the process-wide instance."""
+    instance = UserPrincipalCache(InMemoryUserPrincipalBackend(), ttl_seconds=60)
+    monkeypatch.setattr(user_principal_cache, "_user_principal_cache", instance)
+    return instance
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def selects(engine):
+    """Record SELECT statements against the users table."""
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM user" in statement:
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.fixture
+def make_session(engine):
+    sessions = []
+    factory = sessionmaker(bind=engine)
+
+    def make():
+        sessions.append(factory())
+        return sessions[-1]
+
+    yield make
+    for session in sessions:
+        session.close()
+
+
+@pytest.fixture
+def user_id(make_session):
+    session = make_session()
+    user = User(
+        id=uuid4(),
+        email="coach@example.com",
+        name="王教練",
+        hashed_password="hash",
+        plan=UserPlan.FREE,
+        role=UserRole.USER,
+        session_count=3,
+    )
+    session.add(user)
+    session.commit()
+    return user.id
+
+
+def authenticate(db, user_id, token=None):
+    token = token or auth.create_access_token(str(user_id))
+    return auth.get_current_user_dependency(authorization=f"Bearer {token}", db=db)
+
+
+class TestInMemoryBackend:
+    def test_round_trip_and_expiry(self):
+        backend = InMemoryUserPrincipalBackend()
+        backend.set("u1", "t1", PRINCIPAL, ttl_seconds=60)
+        backend.set("u1", "t2", PRINCIPAL, ttl_seconds=0)
+
+        assert backend.get("u1", "t1") == PRINCIPAL
+        assert backend.get("u1", "t2") is None
+        assert backend.size() == 1
+
+    def test_evicts_least_recently_used_over_entry_limit(self):
+        backend = InMemoryUserPrincipalBackend(max_entries=2)
+        backend.set("u1", "t", PRINCIPAL, 60)
+        backend.set("u2", "t", PRINCIPAL, 60)
+        backend.get("u1", "t")
+
+        evicted = backend.set("u3", "t", PRINCIPAL, 60)
+
+        assert evicted == 1
+        assert backend.get("u2", "t") is None
+        assert backend.get("u1", "t") == PRINCIPAL
+
+    def test_invalidate_drops_every_token_of_a_user(self):
+        backend = InMemoryUserPrincipalBackend()
+        for token_key in ("t1", "t2"):
+            backend.set("u1", token_key, PRINCIPAL, 60)
+        backend.set("u2", "t1", PRINCIPAL, 60)
+
+        backend.invalidate("u1")
+
+        assert backend.get("u1", "t1") is None
+        assert backend.get("u1", "t2") is None
+        assert backend.get("u2", "t1") == PRINCIPAL
+
+
+class TestRedisBackend:
+    def test_round_trip_invalidate_and_size(self, fake_redis):
+        backend = RedisUserPrincipalBackend(fake_redis)
+        backend.set("u1", "t1", PRINCIPAL, 60)
+        backend.set("u1", "t2", PRINCIPAL, 60)
+        backend.set("u2", "t1", PRINCIPAL, 60)
+
+        assert backend.get("u1", "t1") == PRINCIPAL
+        assert backend.size() == 3
+
+        backend.invalidate("u1")
+
+        assert backend.get("u1", "t2") is None
+        assert backend.size() == 1
+
+    def test_expired_entry_is_a_miss(self, fake_redis):
+        backend = RedisUserPrincipalBackend(fake_redis)
+        entry = {"expires_at": time.time() - 1, "principal": PRINCIPAL}
+        fake_redis.hset("auth:principal:u1", "t1", json.dumps(entry))
+
+        assert backend.get("u1", "t1") is None
+        assert fake_redis.hlen("auth:principal:u1") == 0
+
+
+class TestUserPrincipalCache:
+    def test_counts_hits_misses_and_invalidations(self):
+        cache = UserPrincipalCache(InMemoryUserPrincipalBackend())
+
+        cache.get("u1", "t1")
+        cache.set("u1", "t1", PRINCIPAL)
+        cache.get("u1", "t1")
+        cache.invalidate("u1")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+        assert stats["invalidations"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 0
+
+    def test_backend_failures_degrade_to_misses(self, failing_backend):
+        cache = UserPrincipalCache(failing_backend(UserPrincipalBackend))
+
+        assert cache.get("u1", "t1") is None
+        cache.set("u1", "t1", PRINCIPAL)
+        cache.invalidate("u1")
+
+        stats = cache.stats()
+        assert stats["errors"] == 3
+        assert stats["misses"] == 1
+        assert stats["entries"] is None
+
+
+class TestRestoreUser:
+    def test_principal_is_attached_without_select(self, make_session, user_id, selects):
+        snapshot = snapshot_user(make_session().get(User, user_id))
+        db = make_session()
+        selects.clear()
+
+        user = restore_user(db, snapshot)
+
+        assert (user.email, user.plan, user.role) == (
+            "coach@example.com",
+            UserPlan.FREE,
+            UserRole.USER,
+        )
+        assert selects == []
+        assert user in db
+
+    def test_other_columns_load_on_access_and_writes_persist(
+        self, make_session, user_id, selects
+    ):
+        db = make_session()
+        user = restore_user(db, snapshot_user(make_session().get(User, user_id)))
+        selects.clear()
+
+        user.session_count += 1
+        db.commit()
+
+        assert len(selects) == 1
+        assert make_session().get(User, user_id).session_count == 4
+
+
+class TestCurrentUserDependency:
+    @pytest.fixture(autouse=True)
+    def require_token(self, monkeypatch):
+        monkeypatch.setattr(auth.settings, "TEST_MODE", False)
+
+    def test_repeated_requests_skip_the_user_query(
+        self, cache, make_session, user_id, selects
+    ):
+        token = auth.create_access_token(str(user_id))
+
+        first = authenticate(make_session(), user_id, token)
+        second = authenticate(make_session(), user_id, token)
+
+        assert first.id == second.id == user_id
+        assert len(selects) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_new_token_is_a_separate_entry(self, cache, make_session, user_id):
+        token = auth.create_access_token(str(user_id))
+        authenticate(make_session(), user_id, token)
+
+        # A token issued a second later carries a different "iat"
+        payload = auth.jwt.decode(
+            token, auth.settings.SECRET_KEY, algorithms=[auth.settings.JWT_ALGORITHM]
+        )
+        payload["iat"] += 1
+        later = auth.jwt.encode(
+            payload, auth.settings.SECRET_KEY, algorithm=auth.settings.JWT_ALGORITHM
+        )
+        authenticate(make_session(), user_id, later)
+
+        assert cache.stats()["misses"] == 2
+
+    def test_plan_update_is_visible_to_next_request(self, cache, make_session, user_id):
+        token = auth.create_access_token(str(user_id))
+        authenticate(make_session(), user_id, token)
+
+        db = make_session()
+        SQLAlchemyUserRepository(db).update_plan(user_id, DomainUserPlan.PRO)
+        db.commit()
+
+        assert authenticate(make_session(), user_id, token).plan == UserPlan.PRO
+
+    def test_role_change_is_visible_to_next_request(self, cache, make_session, user_id):
+        db = make_session()
+        admin = User(
+            id=uuid4(),
+            email="admin@example.com",
+            name="Admin",
+            role=UserRole.SUPER_ADMIN,
+        )
+        db.add(admin)
+        db.commit()
+        token = auth.create_access_token(str(user_id))
+        authenticate(make_session(), user_id, token)
+
+        PermissionService(db).grant_role(user_id, UserRole.STAFF, admin, "help")
+
+        assert authenticate(make_session(), user_id, token).role == UserRole.STAFF
+
+
+class TestInvalidateUserPrincipal:
+    def test_entry_cached_before_commit_is_dropped_on_commit(self, cache, make_session):
+        db = make_session()
+        invalidate_user_principal("u1", db)
+        # A concurrent request re-caches the not yet committed row
+        cache.set("u1", "t1", PRINCIPAL)
+
+        db.commit()
+
+        assert cache.get("u1", "t1") is None
+
+    def test_rollback_discards_pending_invalidation(self, cache, make_session, user_id):
+        db = make_session()
+        db.get(User, user_id).name = "新名字"
+        invalidate_user_principal("u1", db)
+        db.rollback()
+        cache.set("u1", "t1", PRINCIPAL)
+
+        db.commit()
+
+        assert cache.get("u1", "t1") == PRINCIPAL
@@ -0,0 +1,252 @@
+"""
+Parity tests for the vectorized speaker boundary smoothing engine.
+
+The vectorized engine must produce exactly the same utterances, heuristic
+statistics and final ProcessingResult as the reference SpeakerBoundarySmoother.
+"""
+
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from coaching_assistant.services.transcript_smoother import (
+    ChineseProcessor,
+    ChineseSmoothingConfig,
+    EnglishProcessor,
+    EnglishSmoothingConfig,
+    SpeakerBoundarySmoother,
+    TranscriptSmoothingService,
+    Utterance,
+    WordTimestamp,
+)
+
+pytest.importorskip("numpy")
+
+from coaching_assistant.services.vectorized_smoother import (  # noqa: E402
+    VectorizedSpeakerBoundarySmoother,
+)
+
+ENGLISH_VOCAB = [
+    "so",
+    "what",
+    "do",
+    "you",
+    "think",
+    "about",
+    "that",
+    "goal",
+    "um",
+    "uh",
+    "yeah",
+    "okay",
+    "right",
+    "well",
+    "really.",
+    "now?",
+    "great!",
+    '"focus',
+    'time"',
+    "Focus",
+]
+
+CHINESE_VOCAB = [
+    "你",
+    "覺得",
+    "這個",
+    "目標",
+    "嗯",
+    "呃",
+    "對",
+    "好",
+    "啊",
+    "可以。",
+    "嗎？",
+    '"專注',
+    '時間"',
+    "專注",
+]
+
+
+def build_transcript(
+    vocab: List[str], utterance_count: int, seed: int
+) -> Dict[str, Any]:
+    """Build a synthetic AssemblyAI payload exercising every heuristic."""
+    rng = random.Random(seed)
+    utterances = []
+    clock = 0
+
+    for index in range(utterance_count):
+        speaker = "AB"[index % 2] if rng.random() > 0.1 else "C"
+        words = []
+        for _ in range(rng.choice([1, 1, 2, 3, 5, 8, 13])):
+            start = clock + rng.randint(0, 200)
+            end = start + rng.randint(80, 700)
+            words.append(
+                {
+                    "text": rng.choice(vocab),
+                    "start": start,
+                    "end": end,
+                    "confidence": round(rng.uniform(0.7, 1.0), 2),
+                }
+            )
+            clock = end
+        utterances.append(
+            {
+                "speaker": speaker,
+                "start": words[0]["start"],
+                "end": words[-1]["end"],
+                "confidence": round(rng.uniform(0.7, 1.0), 2),
+                "words": words,
+            }
+        )
+        clock += rng.randint(0, 1500)
+
+    return {"utterances": utterances}
+
+
+def to_utterances(transcript: Dict[str, Any]) -> List[Utterance]:
+    return [Utterance(**utterance) for utterance in transcript["utterances"]]
+
+
+def dump(utterances: List[Utterance]) -> List[Dict[str, Any]]:
+    return [utterance.model_dump() for utterance in utterances]
+
+
+class TestVectorizedSmootherParity:
+    """The vectorized engine must match the reference engine exactly."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_english_parity(self, seed):
+        # Arrange
+        utterances = to_utterances(build_transcript(ENGLISH_VOCAB, 80, seed))
+        reference = SpeakerBoundarySmoother(
+            EnglishSmoothingConfig(), EnglishProcessor()
+        )
+        vectorized = VectorizedSpeakerBoundarySmoother(
+            EnglishSmoothingConfig(), EnglishProcessor()
+        )
+
+        # Act
+        expected = reference.smooth_boundaries(list(utterances))
+        actual = vectorized.smooth_boundaries(list(utterances))
+
+        # Assert
+        assert dump(actual) == dump(expected)
+        assert vectorized.stats == reference.stats
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_chinese_parity(self, seed):
+        # Arrange
+        utterances = to_utterances(build_transcript(CHINESE_VOCAB, 80, seed))
+        reference = SpeakerBoundarySmoother(
+            ChineseSmoothingConfig(), ChineseProcessor()
+        )
+        vectorized = VectorizedSpeakerBoundarySmoother(
+            ChineseSmoothingConfig(), ChineseProcessor()
+        )
+
+        # Act
+        expected = reference.smooth_boundaries(list(utterances))
+        actual = vectorized.smooth_boundaries(list(utterances))
+
+        # Assert
+        assert dump(actual) == dump(expected)
+        assert vectorized.stats == reference.stats
+
+    def test_untouched_utterances_are_reused(self):
+        # Arrange
+        utterances = [
+            Utterance(
+                speaker="A",
+                start=0,
+                end=3000,
+                confidence=0.9,
+                words=[WordTimestamp(text="done.", start=0, end=3000)],
+            ),
+            Utterance(
+                speaker="B",
+                start=3000,
+                end=6000,
+                confidence=0.9,
+                words=[WordTimestamp(text="sure", start=3000, end=6000)],
+            ),
+        ]
+        smoother = VectorizedSpeakerBoundarySmoother(
+            EnglishSmoothingConfig(), EnglishProcessor()
+        )
+
+        # Act
+        result = smoother.smooth_boundaries(utterances)
+
+        # Assert
+        assert result[0] is utterances[0]
+        assert result[1] is utterances[1]
+
+    def test_identical_words_removed_by_value(self):
+        """Duplicate words leave the next segment together, as in the reference."""
+        # Arrange
+        echo = {"text": "um", "start": 1000, "end": 1200, "confidence": 0.9}
+        transcript = {
+            "utterances": [
+                {
+                    "speaker": "A",
+                    "start": 0,
+                    "end": 900,
+                    "confidence": 0.9,
+                    "words": [{"text": "so", "start": 0, "end": 900}],
+                },
+                {
+                    "speaker": "B",
+                    "start": 1000,
+                    "end": 4000,
+                    "confidence": 0.9,
+                    "words": [
+                        echo,
+                        dict(echo),
+                        {"text": "right", "start": 1200, "end": 4000},
+                    ],
+                },
+            ]
+        }
+        utterances = to_utterances(transcript)
+        reference = SpeakerBoundarySmoother(
+            EnglishSmoothingConfig(), EnglishProcessor()
+        )
+        vectorized = VectorizedSpeakerBoundarySmoother(
+            EnglishSmoothingConfig(), EnglishProcessor()
+        )
+
+        # Act
+        expected = reference.smooth_boundaries(list(utterances))
+        actual = vectorized.smooth_boundaries(list(utterances))
+
+        # Assert
+        assert dump(actual) == dump(expected)
+
+
+class TestSmoothingEngineSelection:
+    """TranscriptSmoothingService engine option."""
+
+    @pytest.mark.parametrize(
+        "vocab,language",
+        [(ENGLISH_VOCAB, "english"), (CHINESE_VOCAB, "chinese")],
+    )
+    def test_processing_result_matches(self, vocab, language):
+        # Arrange
+        transcript = build_transcript(vocab, 120, seed=7)
+
+        # Act
+        expected = TranscriptSmoothingService().smooth_and_punctuate(
+            transcript, language=language
+        )
+        actual = TranscriptSmoothingService(
+            smoothing_engine="vectorized"
+        ).smooth_and_punctuate(transcript, language=language)
+
+        # Assert
+        assert actual.model_dump() == expected.model_dump()
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            TranscriptSmoothingService(smoothing_engine="gpu")
@@ -0,0 +1,58 @@
+"""
+Unit tests for the Celery app configuration used by the worker and beat.
+
+Task registration is checked in a fresh interpreter: importing a task module
+anywhere in the test run would register its tasks in this process, whether
+or not a worker would import it.
+"""
+
+import json
+import subprocess
+import sys
+from functools import lru_cache
+
+from coaching_assistant.core.celery_app import celery_app
+
+SWEEP_TASK = "coaching_assistant.tasks.transcription_tasks.sweep_google_stt_operations"
+ROLLUP_TASK = (
+    "coaching_assistant.tasks.analytics_rollup_tasks.reconcile_analytics_rollups"
+)
+QUOTA_TASK = "coaching_assistant.tasks.usage_quota_tasks.reconcile_usage_quotas"
+
+
+@lru_cache(maxsize=None)
+def worker_tasks() -> frozenset:
+    """Task names a worker started with -A coaching_assistant.core.celery_app has."""
+    script = (
+        "import json\n"
+        "from coaching_assistant.core.celery_app import celery_app\n"
+        "celery_app.loader.import_default_modules()\n"
+        "print(json.dumps(sorted(celery_app.tasks)))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return frozenset(json.loads(output.strip().splitlines()[-1]))
+
+
+class TestBeatSchedule:
+    def test_google_stt_sweep_is_scheduled(self):
+        entry = celery_app.conf.beat_schedule["google-stt-operation-sweep"]
+
+        assert entry["task"] == SWEEP_TASK
+        assert celery_app.conf.beat_scheduler == "celery.beat:PersistentScheduler"
+
+    def test_google_stt_sweep_is_registered(self):
+        assert SWEEP_TASK in worker_tasks()
+
+    def test_analytics_rollup_reconciliation_is_scheduled_and_registered(self):
+        entry = celery_app.conf.beat_schedule["analytics-rollup-reconciliation"]
+
+        assert entry["task"] == ROLLUP_TASK
+        assert ROLLUP_TASK in worker_tasks()
+
+    def test_usage_quota_reconciliation_is_scheduled_and_registered(self):
+        entry = celery_app.conf.beat_schedule["usage-quota-reconciliation"]
+
+        assert entry["task"] == QUOTA_TASK
+        assert QUOTA_TASK in worker_tasks()